@@ -0,0 +1,87 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Measure the client-side overhead per API call of the hand-written request style (URL f-string,
+header and parameter dicts built on every call) against the generated endpoint layer
+(client.api), with the HTTP session replaced by one returning a canned response so that only
+the work done in zvma is timed.
+
+Usage:
+    python benchmarks/bench_endpoints.py [--calls 20000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zvma import ZVMAClient
+
+
+def canned_response(*args, **kwargs):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'[]'
+    return response
+
+
+def hand_written(client, vpg_identifier, start_date):
+    url = f"https://{client.zvm_address}/v1/vpgs/{vpg_identifier}/checkpoints"
+    headers = {
+        'Content-Type': 'application/json',
+        'Authorization': f'Bearer {client.token}'
+    }
+    params = {
+        "startDate": start_date,
+        "endDate": None
+    }
+    params = {k: v for k, v in params.items() if v is not None}
+    return client.transport.get(url, headers=headers, params=params, verify=client.verify_certificate)
+
+
+def generated(client, vpg_identifier, start_date):
+    return client.api.get_vpg_checkpoint_all(vpg_identifier, start_date=start_date)
+
+
+def per_call_us(calls, function, *args):
+    started = time.perf_counter()
+    for _ in range(calls):
+        function(*args)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=20000)
+    args = parser.parse_args()
+
+    token = canned_response()
+    token._content = b'{"access_token": "token", "expires_in": 3600}'
+    with patch('requests.Session.request', return_value=token):
+        client = ZVMAClient("zvm.example.com", "zerto-api", "secret", cache_maxsize=0, coalesce=False)
+        client.authenticate()
+    client.transport.session.request = canned_response
+
+    print(f"{'style':<14} {'per call (us)':>14}")
+    for name, function in (('hand-written', hand_written), ('generated', generated)):
+        per_call_us(1000, function, client, "vpg-1", "2024-11-13T00:00:00Z")
+        print(f"{name:<14} {per_call_us(args.calls, function, client, 'vpg-1', '2024-11-13T00:00:00Z'):>14.2f}")
+    client.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Compare JSON decode time of the available zvma codecs on synthetic list responses shaped like
+VMs.list_vms, Events.list_events and RecoveryReports.list_resource_reports on a large site.
+
+Usage:
+    python benchmarks/bench_json_codec.py [--entities 20000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zvma.codec import CODECS
+
+
+def make_vm(i):
+    return {
+        "VmIdentifier": str(uuid.uuid4()), "VmName": f"vm-{i:05d}", "VpgIdentifier": str(uuid.uuid4()),
+        "VpgName": f"vpg-{i // 10}", "Status": 1, "SubStatus": 0, "Priority": 1,
+        "ProvisionedStorageInMB": 40960 + i, "UsedStorageInMB": 20480, "ThroughputInMB": 1.25,
+        "IopsStatistics": 12, "ActualRPO": 7, "SourceSite": "Site-A", "TargetSite": "Site-B",
+        "Entities": {"Protected": 0, "Recovery": 1, "Source": 2, "Target": 2},
+        "Link": {"href": f"https://zvm/v1/vms/{i}", "rel": "self", "type": "VmApi"},
+    }
+
+
+def make_event(i):
+    return {
+        "EventIdentifier": str(uuid.uuid4()), "OccurredOn": "2024-05-01T10:15:30.123Z",
+        "EventType": "VpgWizardEvent", "EventCategory": "Events", "EntityType": "VPG",
+        "Description": f"Protection group vpg-{i} settings were updated by user admin",
+        "Site": "Site-A", "VpgIdentifier": str(uuid.uuid4()), "ZorgIdentifier": None,
+        "UserName": "admin", "Alerts": [],
+    }
+
+
+def make_resource_report(i):
+    return {
+        "VmName": f"vm-{i:05d}", "VpgName": f"vpg-{i // 10}", "Zorg": "", "ServiceProfile": "Custom",
+        "ProtectedSite": {"Name": "Site-A", "Cluster": "cl-1", "Host": f"esx-{i % 32}"},
+        "RecoverySite": {"Name": "Site-B", "Cluster": "cl-2", "Host": f"esx-{i % 16}"},
+        "CpuUsedInMhz": 1200, "MemoryInMB": 8192, "StorageUsedInGB": 120.5,
+        "RecoveryJournalUsedStorageInGB": 4.75, "BandwidthInBytes": 52428800, "Iops": 54,
+        "Timestamp": "2024-05-01T10:00:00Z",
+    }
+
+
+ENDPOINTS = {
+    'VMs.list_vms': make_vm,
+    'Events.list_events': make_event,
+    'RecoveryReports.list_resource_reports': make_resource_report,
+}
+
+
+def time_decode(codec, body, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        codec.loads(body)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entities', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    codecs = {}
+    for name, codec_class in CODECS.items():
+        try:
+            codecs[name] = codec_class()
+        except ImportError as e:
+            print(f"skipping codec '{name}': {e}")
+
+    print(f"{'endpoint':40} {'size MB':>8} " + ' '.join(f"{name + ' ms':>10}" for name in codecs) + f" {'saved ms':>9}")
+    for endpoint, factory in ENDPOINTS.items():
+        body = json.dumps([factory(i) for i in range(args.entities)]).encode('utf-8')
+        timings = {name: time_decode(codec, body, args.repeat) * 1000 for name, codec in codecs.items()}
+        saved = timings['json'] - min(timings.values())
+        print(f"{endpoint:40} {len(body) / 1e6:8.1f} " + ' '.join(f"{t:10.1f}" for t in timings.values()) + f" {saved:9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Compare pulling VpgName, Status and ActualRPO out of a large list_vms response by decoding it whole
+with each available codec against LazyList.project(), for flat VMs and for VMs carrying the nested
+volume and NIC details a real ZVM returns. Reports the time and the peak memory allocated on top of
+the response body (measured with tracemalloc in a separate, untimed run).
+
+Usage:
+    python benchmarks/bench_lazy.py [--entities 20000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_json_codec import make_vm
+from zvma.codec import CODECS
+from zvma.lazy import LazyList
+
+FIELDS = ('VpgName', 'Status', 'ActualRPO')
+
+
+def make_nested_vm(i):
+    vm = make_vm(i)
+    vm["Volumes"] = [{"VolumeIdentifier": {"Id": f"{i}:{j}", "ServerIdentifier": {"Id": "srv"}},
+                      "ProvisionedStorageInMB": 10240 + j, "UsedStorageInMB": 5120, "IsSwap": False, "Type": 1,
+                      "Path": {"Datastore": {"Id": "datastore-12"}, "Path": f"[ds1] vm-{i}/disk{j}.vmdk"}}
+                     for j in range(6)]
+    vm["Nics"] = [{"NicIdentifier": f"Network adapter {j}", "Network": {"Id": "network-7"},
+                   "IpAddresses": ["10.0.0.1", "fe80::1"], "IsDhcp": True} for j in range(3)]
+    return vm
+
+
+def best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def peak_allocated(function):
+    """Peak memory in MB allocated while `function` runs."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entities', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for name, make in (('flat', make_vm), ('nested', make_nested_vm)):
+        body = json.dumps([make(i) for i in range(args.entities)]).encode('utf-8')
+        print(f"{name} VMs, {len(body) / 2**20:.1f} MB")
+        for codec_name, codec in CODECS.items():
+            if codec is None:
+                continue
+            loads = codec().loads
+            decode_all = lambda: [tuple(vm.get(field) for field in FIELDS) for vm in loads(body)]
+            project = lambda: LazyList(body, loads).project(*FIELDS)
+            full, lazy = best_of(args.repeat, decode_all), best_of(args.repeat, project)
+            full_peak, lazy_peak = peak_allocated(decode_all), peak_allocated(project)
+            print(f"  {codec_name:<8} decode all {full:8.1f} ms {full_peak:7.1f} MB   "
+                  f"project {lazy:8.1f} ms {lazy_peak:7.1f} MB   time {lazy / full:5.2f}x, memory {lazy_peak / full_peak:5.3f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Measure the logging overhead of a large list response: the old eager f-string with json.dumps
+against zvma.log.log_payload, with debug logging disabled and enabled (sampled and capped).
+
+Usage:
+    python benchmarks/bench_logging.py [--entities 20000] [--repeat 5]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zvma.log import log_payload, configure_payload_logging
+from bench_json_codec import make_vm
+
+
+def best_of(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entities', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    result = [make_vm(i) for i in range(args.entities)]
+    logger = logging.getLogger('zvma.bench')
+    logger.propagate = False
+    logger.addHandler(logging.StreamHandler(open(os.devnull, 'w')))
+
+    def eager():
+        logger.debug(f"VMs.list_vms result: {json.dumps(result, indent=4)}")
+
+    def lazy():
+        log_payload(logger, "VMs.list_vms result: %s", result)
+
+    print(f"{'debug':8} {'eager f-string ms':>18} {'log_payload ms':>15}")
+    for level, label in ((logging.INFO, 'off'), (logging.DEBUG, 'on')):
+        logger.setLevel(level)
+        print(f"{label:8} {best_of(eager, args.repeat):18.3f} {best_of(lazy, args.repeat):15.3f}")
+    configure_payload_logging(sample_rate=0.01)
+    print(f"{'on, 1%':8} {'':18} {best_of(lazy, args.repeat):15.3f}")
+
+
+if __name__ == '__main__':
+    main()
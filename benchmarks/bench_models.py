@@ -0,0 +1,65 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Compare the memory held by list responses kept as dicts against the same responses converted to
+zvma.models instances (as_models=True), and the time the conversion costs.
+
+Usage:
+    python benchmarks/bench_models.py [--entities 20000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_json_codec import make_vm, make_event
+from zvma.models import VM, Event
+
+
+def retained(build):
+    """Bytes still allocated after build() returns, with its result alive."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entities', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'response':<10} {'dicts (MB)':>11} {'models (MB)':>12} {'saved':>7} {'convert (ms)':>13}")
+    for name, make, model in (('vms', make_vm, VM), ('events', make_event, Event)):
+        body = json.dumps([make(i) for i in range(args.entities)])
+        dict_bytes, _ = retained(lambda: json.loads(body))
+        model_bytes, _ = retained(lambda: model.from_list(json.loads(body)))
+        data = json.loads(body)
+        started = time.perf_counter()
+        model.from_list(data)
+        convert_ms = (time.perf_counter() - started) * 1000
+        print(f"{name:<10} {dict_bytes / 2**20:>11.1f} {model_bytes / 2**20:>12.1f} "
+              f"{1 - model_bytes / dict_bytes:>7.0%} {convert_ms:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Measure the start-up cost paid by short-lived jobs: importing zvma, creating a ZVMAClient and
+completing the first API call (which includes authentication) against a local ZVM stand-in.
+Each sample runs in a fresh interpreter so import caches do not hide the cost.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'tests'))
+
+from zvm_standin import ZVMStandIn
+
+SAMPLE = '''
+import json, sys, time
+started = time.perf_counter()
+from zvma import ZVMAClient
+imported = time.perf_counter()
+client = ZVMAClient(sys.argv[1], "zerto-api", "secret", verify_certificate=False)
+created = time.perf_counter()
+client.vpgs.list_vpgs()
+first_request = time.perf_counter()
+client.close()
+print(json.dumps({"import": imported - started, "client": created - imported,
+                  "first_request": first_request - created, "total": first_request - started}))
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    samples = []
+    with ZVMStandIn(routes={'/v1/vpgs': [{'VpgName': 'vpg1'}]}) as zvm:
+        for _ in range(args.runs):
+            output = subprocess.run([sys.executable, '-c', SAMPLE, zvm.address], cwd=REPO_ROOT,
+                                    check=True, capture_output=True, text=True).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"{'phase':15} {'median ms':>10} {'max ms':>10}")
+    for phase in ('import', 'client', 'first_request', 'total'):
+        values = [sample[phase] * 1000 for sample in samples]
+        print(f"{phase:15} {statistics.median(values):10.1f} {max(values):10.1f}")
+
+
+if __name__ == '__main__':
+    main()
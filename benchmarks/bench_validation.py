@@ -0,0 +1,57 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Time local validation of a full VPG settings payload against the swagger schemas, the check
+create_vpg_settings and update_vpg_settings run before anything is sent to the ZVM.
+
+Usage:
+    python benchmarks/bench_validation.py [--iterations 20000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zvma.validation import validate_vpg_settings
+
+PAYLOAD = {
+    "Basic": {"Name": "vpg1", "VpgType": "Remote", "RpoInSeconds": 300, "JournalHistoryInHours": 24,
+              "Priority": "Medium", "UseWanCompression": True, "ProtectedSiteIdentifier": "site-a",
+              "RecoverySiteIdentifier": "site-b"},
+    "Journal": {"DatastoreIdentifier": "ds-1", "Limitation": {"HardLimitInMB": 153600, "WarningThresholdInMB": 115200}},
+    "Recovery": {"DefaultHostClusterIdentifier": "cluster-1", "DefaultDatastoreIdentifier": "ds-1",
+                 "DefaultFolderIdentifier": "folder-1"},
+    "Networks": {"Failover": {"Hypervisor": {"DefaultNetworkIdentifier": "net-1"}},
+                 "FailoverTest": {"Hypervisor": {"DefaultNetworkIdentifier": "net-2"}}},
+    "Vms": [{"VmIdentifier": f"vm-{i}", "Recovery": {"HostIdentifier": "host-1", "DatastoreIdentifier": "ds-1"}}
+            for i in range(10)],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=20000)
+    args = parser.parse_args()
+
+    assert validate_vpg_settings(PAYLOAD) == []
+    started = time.perf_counter()
+    for _ in range(args.iterations):
+        validate_vpg_settings(PAYLOAD)
+    elapsed = time.perf_counter() - started
+    print(f"validate_vpg_settings: {elapsed / args.iterations * 1e6:.1f} us per payload (10 VMs)")
+
+
+if __name__ == '__main__':
+    main()
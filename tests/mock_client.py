@@ -0,0 +1,32 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Helpers for the unit tests that mock requests instead of running the ZVM stand-in.
+"""
+
+from unittest.mock import patch, MagicMock
+from zvma import ZVMAClient
+
+
+def token_response(token='token', expires_in=3600):
+    """Mocked requests response of the Keycloak token endpoint."""
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"access_token": token, "expires_in": expires_in}
+    return response
+
+
+def authenticated_client(**kwargs):
+    """ZVMAClient for example.com, authenticated against a mocked token endpoint."""
+    with patch('requests.Session.request', return_value=token_response()):
+        client = ZVMAClient(zvm_address="example.com", client_id="zerto-api", client_secret="secret", **kwargs)
+        client.authenticate()
+    return client
@@ -0,0 +1,49 @@
+import asyncio
+import unittest
+from zvma.exceptions import ZVMANotFoundError
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncZVMAClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        from zvma.aio import AsyncZVMAClient
+        self.requests = []
+
+        def handler(request):
+            self.requests.append(request)
+            if request.url.path.endswith("/openid-connect/token"):
+                return httpx.Response(200, json={"access_token": "token-1", "expires_in": 3600})
+            if request.url.path == "/v1/vpgs":
+                return httpx.Response(200, json=[{"VpgName": "vpg1", "VpgIdentifier": "id1"}])
+            if request.url.path.startswith("/v1/tasks/"):
+                return httpx.Response(200, json={"Status": {"State": 6, "Progress": 100}})
+            return httpx.Response(404, json={"Message": "not found"})
+
+        self.client = AsyncZVMAClient(zvm_address="example.com", client_id="zerto-api", client_secret="secret")
+        await self.client.transport.session.aclose()
+        self.client.transport.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_concurrent_reads_share_one_token(self):
+        results = await asyncio.gather(*(self.client.vpgs.list_vpgs(vpg_name="vpg1") for _ in range(50)))
+        self.assertTrue(all(r["VpgIdentifier"] == "id1" for r in results))
+        token_requests = [r for r in self.requests if r.url.path.endswith("/token")]
+        self.assertEqual(len(token_requests), 1)
+        self.assertEqual(self.requests[-1].headers["Authorization"], "Bearer token-1")
+
+    async def test_wait_for_task_completion(self):
+        task_info = await self.client.tasks.wait_for_task_completion("task_id", interval=0)
+        self.assertEqual(task_info["Status"]["Progress"], 100)
+
+    async def test_error_status_raises(self):
+        with self.assertRaises(ZVMANotFoundError):
+            await self.client.vras.get_vra("missing")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import shutil
+import threading
+import unittest
+import warnings
+from concurrent.futures import Future
+from zvma import ZVMAClient
+from urllib3.exceptions import InsecureRequestWarning
+from zvm_standin import ZVMStandIn
+
+VPG_COUNT = 40
+
+
+@unittest.skipIf(shutil.which('openssl') is None, "openssl is needed to run the local ZVM stand-in")
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        warnings.simplefilter('ignore', InsecureRequestWarning)
+        routes = {f'/v1/vpgs/vpg-{i}/checkpoints': [{"CheckpointIdentifier": f"cp-{i}"}] for i in range(VPG_COUNT)}
+        self.zvm = ZVMStandIn(routes=routes, latency=0.02).start()
+        self.client = ZVMAClient(self.zvm.address, "zerto-api", "secret", verify_certificate=False, max_workers=8)
+        self.client.authenticate()
+
+    def tearDown(self):
+        self.client.close()
+        self.zvm.stop()
+        warnings.resetwarnings()
+
+    def list_checkpoints(self, vpg_identifier):
+        url = f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}/checkpoints"
+        return self.client.transport.get(url, headers={'Authorization': ''}).json()
+
+    def test_ordered_results_with_shared_limit(self):
+        batches = [self.client.batch(), self.client.batch()]
+        with batches[0] as first, batches[1] as second:
+            futures = first.map(self.list_checkpoints, [f"vpg-{i}" for i in range(VPG_COUNT)])
+            second.map(self.list_checkpoints, [f"vpg-{i}" for i in reversed(range(VPG_COUNT))])
+        self.assertTrue(all(isinstance(future, Future) and future.done() for future in futures))
+        self.assertEqual(first.results(), [[{"CheckpointIdentifier": f"cp-{i}"}] for i in range(VPG_COUNT)])
+        self.assertEqual(second.results()[0], [{"CheckpointIdentifier": f"cp-{VPG_COUNT - 1}"}])
+        self.assertLessEqual(self.zvm.max_in_flight, 8)
+        self.assertGreater(self.zvm.max_in_flight, 1)
+
+    def test_resource_proxy(self):
+        with self.client.batch() as batch:
+            future = batch.vpgs.list_vpgs()
+        self.assertEqual(future.result(), [])
+        self.assertEqual(batch.results(), [[]])
+
+    def test_failures(self):
+        with self.client.batch() as batch:
+            batch.submit(lambda: 1)
+            batch.submit(lambda: 1 / 0)
+        self.assertIsInstance(batch.results(return_exceptions=True)[1], ZeroDivisionError)
+        with self.assertRaises(ZeroDivisionError):
+            batch.results()
+
+    def test_nested_batches_do_not_deadlock(self):
+        def fan_out(index):
+            with self.client.batch() as inner:
+                inner.map(self.list_checkpoints, [f"vpg-{index}"] * 3)
+            return [threading.current_thread().name] + inner.results()
+
+        with self.client.batch() as outer:
+            outer.map(fan_out, range(VPG_COUNT))
+        results = outer.results(timeout=30)
+        self.assertEqual(len(results), VPG_COUNT)
+        self.assertTrue(all(result[0].startswith('zvma') for result in results))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from zvma.cache import TTLCache
+from mock_client import authenticated_client
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.client = authenticated_client(cache_ttls={'Events.list_event_types': 0})
+        self.mock_response = MagicMock(status_code=200)
+        self.mock_response.json.return_value = ["Low", "High"]
+
+    def test_static_endpoint_cached(self):
+        with patch.object(self.client.transport.session, 'request', return_value=self.mock_response) as mock_request:
+            first = self.client.alerts.get_alert_levels()
+            first.append("Mutated")
+            second = self.client.alerts.get_alert_levels()
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(second, ["Low", "High"])
+
+    def test_invalidate(self):
+        with patch.object(self.client.transport.session, 'request', return_value=self.mock_response) as mock_request:
+            self.client.vras.list_vra_statuses()
+            self.client.invalidate_cache('VRA.list_vra_statuses')
+            self.client.vras.list_vra_statuses()
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_ttl_override_disables_endpoint(self):
+        with patch.object(self.client.transport.session, 'request', return_value=self.mock_response) as mock_request:
+            self.client.events.list_event_types()
+            self.client.events.list_event_types()
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch('zvma.cache.time.monotonic')
+    def test_expiry_and_eviction(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        cache = TTLCache(maxsize=2)
+        cache.set(('a',), 1, ttl=10)
+        cache.set(('b',), 2, ttl=10)
+        cache.get(('a',))
+        cache.set(('c',), 3, ttl=10)
+        self.assertIsNone(cache.get(('b',)))
+        self.assertEqual(cache.get(('a',)), 1)
+        mock_monotonic.return_value = 111
+        self.assertIsNone(cache.get(('a',)))
+        self.assertEqual(len(cache), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+from zvma import ZVMAClient
+from zvma.breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from zvma.exceptions import ZVMACircuitOpenError, ZVMAConnectionError
+from zvma.retry import RetryPolicy
+from zvma.transport import Transport
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("zvm1", failure_threshold=3, recovery_timeout=60)
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_failure("connection refused")
+        breaker.record_success()
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_failure("connection refused")
+        self.assertEqual(breaker.state, OPEN)
+        with self.assertRaises(ZVMACircuitOpenError) as context:
+            breaker.before_call()
+        self.assertEqual(context.exception.host, "zvm1")
+        self.assertGreater(context.exception.retry_after, 50)
+
+    def test_trial_call_after_recovery_timeout(self):
+        breaker = CircuitBreaker("zvm1", failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure("timeout")
+        time.sleep(0.06)
+        breaker.before_call()
+        self.assertEqual(breaker.state, HALF_OPEN)
+        with self.assertRaises(ZVMACircuitOpenError):
+            breaker.before_call()  # only one trial at a time
+        breaker.record_failure("timeout")
+        self.assertEqual(breaker.state, OPEN)
+        time.sleep(0.06)
+        breaker.before_call()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_background_probe_closes_circuit(self):
+        probe = MagicMock(side_effect=[False, ConnectionError("down"), True])
+        breaker = CircuitBreaker("zvm1", failure_threshold=1, recovery_timeout=0.01, probe=probe)
+        breaker.record_failure("connection refused")
+        deadline = time.monotonic() + 5
+        while not breaker.healthy and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(breaker.healthy)
+        self.assertEqual(probe.call_count, 3)
+        breaker.stop()
+
+
+class TestTransportCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.transport = Transport(retry_policy=RetryPolicy(max_retries=0),
+                                   circuit_breaker={'failure_threshold': 3, 'recovery_timeout': 60})
+        self.addCleanup(self.transport.close)
+
+    def test_fails_fast_while_open(self):
+        error = requests.exceptions.ConnectionError("connection refused")
+        with patch.object(self.transport.session, 'request', side_effect=error) as mock_request:
+            for _ in range(3):
+                with self.assertRaises(ZVMAConnectionError):
+                    self.transport.get("https://zvm1/v1/vpgs")
+            with self.assertRaises(ZVMACircuitOpenError):
+                self.transport.get("https://zvm1/v1/alerts")
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(self.transport.health()["zvm1"]["state"], OPEN)
+        self.assertIsNone(self.transport.get_breaker("https://zvm2/v1/vpgs").snapshot()['open_for'])
+
+    def test_gateway_errors_count_client_errors_do_not(self):
+        with patch.object(self.transport.session, 'request', return_value=MagicMock(status_code=404)):
+            for _ in range(5):
+                self.transport.get("https://zvm1/v1/vpgs/unknown", raise_for_status=False)
+        self.assertTrue(self.transport.get_breaker("https://zvm1/").healthy)
+        with patch.object(self.transport.session, 'request', return_value=MagicMock(status_code=503)):
+            for _ in range(3):
+                self.transport.get("https://zvm1/v1/vpgs", raise_for_status=False)
+        self.assertFalse(self.transport.get_breaker("https://zvm1/").healthy)
+
+    def test_probe_uses_unauthenticated_request(self):
+        with patch.object(self.transport.session, 'request', return_value=MagicMock(status_code=401)) as mock_request:
+            self.assertTrue(self.transport.get_breaker("https://zvm1/v1/vpgs").probe())
+        self.assertEqual(mock_request.call_args.args, ('GET', "https://zvm1/v1/localsite"))
+        self.assertNotIn('headers', mock_request.call_args.kwargs)
+
+    def test_client_health(self):
+        client = ZVMAClient(zvm_address="zvm1", client_id="zerto-api", client_secret="secret", circuit_breaker=False)
+        self.assertTrue(client.is_healthy())
+        client = ZVMAClient(zvm_address="zvm1", client_id="zerto-api", client_secret="secret")
+        self.assertEqual(client.health()['state'], CLOSED)
+
+if __name__ == '__main__':
+    unittest.main()
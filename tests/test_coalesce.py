@@ -0,0 +1,75 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from zvma.coalesce import SingleFlight
+from zvma.exceptions import ZVMANotFoundError
+from zvma.transport import Transport
+
+class TestCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.transport = Transport()
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def slow_request(self, status_code=200):
+        def fake_request(method, url, **kwargs):
+            with self.lock:
+                self.calls += 1
+            time.sleep(0.2)
+            response = MagicMock(status_code=status_code, reason="Not Found")
+            response.json.return_value = [{"VpgName": "vpg1"}]
+            return response
+        return fake_request
+
+    def run_threads(self, target, count=20):
+        results = []
+        def worker():
+            try:
+                results.append(target())
+            except Exception as e:
+                results.append(e)
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_identical_gets_share_one_call_and_result(self):
+        with patch.object(self.transport.session, 'request', side_effect=self.slow_request()):
+            results = self.run_threads(lambda: self.transport.get("https://zvm/v1/vpgs", params={"name": "vpg1"}).json())
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(results), 20)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.transport.single_flight.shared, 19)
+
+    def test_errors_raised_for_every_caller(self):
+        with patch.object(self.transport.session, 'request', side_effect=self.slow_request(404)):
+            results = self.run_threads(lambda: self.transport.get("https://zvm/v1/vpgs/missing"), count=5)
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(result, ZVMANotFoundError) for result in results))
+
+    def test_different_params_and_posts_not_coalesced(self):
+        with patch.object(self.transport.session, 'request', side_effect=self.slow_request()):
+            self.run_threads(lambda: self.transport.get("https://zvm/v1/vpgs", params={"name": threading.get_ident()}), count=3)
+            self.run_threads(lambda: self.transport.post("https://zvm/v1/vpgs"), count=3)
+        self.assertEqual(self.calls, 6)
+
+    def test_follower_timeout(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        def leader():
+            started.set()
+            time.sleep(0.3)
+            return "done"
+        thread = threading.Thread(target=flight.do, args=("key", leader))
+        thread.start()
+        started.wait()
+        with self.assertRaises(TimeoutError):
+            flight.do("key", leader, timeout=0.01)
+        thread.join()
+        self.assertEqual(flight.in_flight(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+from zvma.codec import get_codec, JSONCodec, OrjsonCodec, orjson
+from zvma.transport import Transport
+
+def make_response(body, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    return response
+
+class TestCodec(unittest.TestCase):
+    def test_get_codec(self):
+        self.assertIsInstance(get_codec('json'), JSONCodec)
+        expected = OrjsonCodec if orjson is not None else JSONCodec
+        self.assertIsInstance(get_codec('auto'), expected)
+        custom = MagicMock()
+        self.assertIs(get_codec(custom), custom)
+        with self.assertRaises(ValueError):
+            get_codec('simdjson')
+
+    def test_transport_uses_codec(self):
+        codec = MagicMock()
+        codec.dumps.return_value = b'{"Name":"vpg1"}'
+        codec.loads.return_value = {"decoded": True}
+        transport = Transport(codec=codec)
+        with patch.object(transport.session, 'request', return_value=make_response(b'{"x":1}')) as mock_request:
+            response = transport.put("https://example.com/v1/vpgSettings/1", json={"Name": "vpg1"},
+                                     headers={'Content-Type': 'application/json'})
+        kwargs = mock_request.call_args.kwargs
+        self.assertNotIn('json', kwargs)
+        self.assertEqual(kwargs['data'], b'{"Name":"vpg1"}')
+        self.assertEqual(response.json(), {"decoded": True})
+        codec.loads.assert_called_once_with(b'{"x":1}')
+
+    def test_stdlib_codec_leaves_body_to_requests(self):
+        transport = Transport(codec='json')
+        with patch.object(transport.session, 'request', return_value=make_response(b'[1, 2]')) as mock_request:
+            response = transport.post("https://example.com/v1/vpgSettings/import", json={"a": 1})
+        self.assertEqual(mock_request.call_args.kwargs['json'], {"a": 1})
+        self.assertEqual(response.json(), [1, 2])
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_roundtrip(self):
+        codec = OrjsonCodec()
+        payload = {"VmIdentifier": "vm-1", "Priority": 1, "Nested": [None, True, 1.5]}
+        self.assertEqual(json.loads(codec.dumps(payload)), payload)
+        with self.assertRaises(ValueError):
+            codec.loads(b'not json')
+
+if __name__ == '__main__':
+    unittest.main()
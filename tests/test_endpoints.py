@@ -0,0 +1,118 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from zvma.endpoint import API_HEADERS, Endpoint
+from zvma.endpoints import Endpoints
+from zvma.metrics import endpoint_template
+from mock_client import authenticated_client
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def make_response(status_code=200, data=None):
+    response = MagicMock(status_code=status_code, headers={}, content=b'')
+    response.json.return_value = data
+    return response
+
+class TestEndpointLayer(unittest.TestCase):
+    def setUp(self):
+        self.client = authenticated_client(cache_maxsize=0, coalesce=False)
+
+    def call(self, method, *args, **kwargs):
+        with patch.object(self.client.transport.session, 'request', return_value=make_response(data=[])) as mock_request:
+            getattr(self.client.api, method)(*args, **kwargs)
+        return mock_request.call_args
+
+    def test_covers_every_swagger_operation(self):
+        with open(os.path.join(REPO_ROOT, '10.0_U6_Swagger.json'), encoding='utf-8') as swagger_file:
+            swagger = json.load(swagger_file)
+        operations = {(method.upper(), path) for path, item in swagger['paths'].items() for method in item}
+        endpoints = {(value.method, value.path) for value in vars(sys.modules[Endpoints.__module__]).values()
+                     if isinstance(value, Endpoint)}
+        self.assertEqual(endpoints, operations)
+        self.assertEqual(len({path for _, path in endpoints}), 169)
+
+    def test_metrics_templates_match_urls(self):
+        for value in vars(sys.modules[Endpoints.__module__]).values():
+            if isinstance(value, Endpoint):
+                url = 'https://example.com' + value.template % (('8a2f0c1e-identifier',) * value.template.count('%s'))
+                self.assertEqual(value.metrics_template, endpoint_template(url), value)
+
+    def test_path_and_query_parameters(self):
+        call = self.call('get_vpg_checkpoint_all', 'vpg-1', start_date="2024-11-13T00:00:00Z")
+        self.assertEqual(call.args, ('GET', 'https://example.com/v1/vpgs/vpg-1/checkpoints'))
+        self.assertEqual(call.kwargs['params'], {"startDate": "2024-11-13T00:00:00Z"})
+        self.assertEqual(call.kwargs['headers']['Authorization'], 'Bearer token')
+        self.assertTrue(call.kwargs['verify'])
+        call = self.call('get_vpg', 'vpg-1', timeout=5)
+        self.assertEqual(call.args[1], 'https://example.com/v1/vpgs/vpg-1')
+        self.assertNotIn('params', call.kwargs)
+        self.assertEqual(call.kwargs['timeout'], 5)
+        self.assertEqual(API_HEADERS['Authorization'], 'Bearer')
+
+    def test_bodies(self):
+        call = self.call('edit_local_site_login_banner', body={"isLoginBannerEnabled": True})
+        self.assertEqual(call.args[0], 'PUT')
+        self.assertEqual(json.loads(call.kwargs['data']), {"isLoginBannerEnabled": True})
+        call = self.call('get_auth_token', body={"grant_type": "client_credentials"})
+        self.assertEqual(call.args[1], 'https://example.com/auth/realms/zerto/protocol/openid-connect/token')
+        self.assertEqual(call.kwargs['data'], {"grant_type": "client_credentials"})
+        self.assertNotIn('Authorization', call.kwargs.get('headers') or {})
+
+    def test_multipart_upload_headers(self):
+        call = self.call('upload_file_to_scripts_directory', body={"file": ("script.ps1", b"Write-Host")})
+        self.assertEqual(call.kwargs['files'], {"file": ("script.ps1", b"Write-Host")})
+        self.assertNotIn('Content-Type', call.kwargs['headers'])
+        self.assertEqual(call.kwargs['headers']['Authorization'], 'Bearer token')
+        call = self.call('get_vpg', 'vpg-1')
+        self.assertEqual(call.kwargs['headers']['Content-Type'], 'application/json')
+
+    def test_path_parameters_are_encoded(self):
+        call = self.call('get_vpg', 'a/b c?d#e')
+        self.assertEqual(call.args[1], 'https://example.com/v1/vpgs/a%2Fb%20c%3Fd%23e')
+        call = self.call('get_virtualization_site_host', 'site 1', 42)
+        self.assertEqual(call.args[1], 'https://example.com/v1/virtualizationsites/site%201/hosts/42')
+
+    def test_iter_json(self):
+        response = make_response()
+        response.iter_content.return_value = [b'[{"VmIdentifier": "vm-1"},', b' {"VmIdentifier": "vm-2"}]']
+        with patch.object(self.client.transport.session, 'request', return_value=response) as mock_request:
+            vms = self.client.api.iter_json('get_vm_all', vpg_name="vpg1")
+            mock_request.assert_not_called()
+            self.assertEqual([vm["VmIdentifier"] for vm in vms], ["vm-1", "vm-2"])
+        self.assertEqual(mock_request.call_args.args, ('GET', 'https://example.com/v1/vms'))
+        self.assertEqual(mock_request.call_args.kwargs['params'], {"vpgName": "vpg1"})
+        self.assertTrue(mock_request.call_args.kwargs['stream'])
+
+    def test_hand_written_resources_use_layer(self):
+        with patch.object(self.client.transport.session, 'request', return_value=make_response()) as mock_request:
+            self.client.alerts.dismiss_alert("alert-1")
+        self.assertEqual(mock_request.call_args.args, ('POST', 'https://example.com/v1/alerts/alert-1/dismiss'))
+        with patch.object(self.client.transport.session, 'request', return_value=make_response(data={"SiteName": "a"})) as mock_request:
+            self.assertEqual(self.client.localsite.get_local_site(), {"SiteName": "a"})
+        self.assertFalse(mock_request.call_args.kwargs['verify'])
+        with patch.object(self.client.api, '_call', return_value=make_response(data=[])) as mock_call:
+            self.client.vms.list_vms(vpg_name="vpg1")
+            self.client.vpgs.list_vpgs(vpg_identifier="vpg-1")
+            self.client.events.list_events(event_identifier="event-1")
+            self.client.virtualization_sites.get_virtualization_site_hosts("site-1", "host-1")
+            self.client.vras.get_vra("vra-1")
+            self.client.peersites.get_peer_sites()
+            self.client.vpgs.list_vpg_settings()
+        self.assertEqual([call.args[0].operation_id for call in mock_call.call_args_list],
+                         ['getVmAll', 'getVpg', 'getEvent', 'getVirtualizationSiteHost', 'getVra', 'getPeerAll',
+                          'getVpgSettingAll'])
+
+    def test_generated_module_is_current(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'endpoints.py')
+            subprocess.run([sys.executable, os.path.join(REPO_ROOT, 'tools', 'generate_endpoints.py'), '--output', output],
+                           check=True, capture_output=True)
+            with open(output, encoding='utf-8') as generated, open(os.path.join(REPO_ROOT, 'zvma', 'endpoints.py'), encoding='utf-8') as current:
+                self.assertEqual(generated.read(), current.read())
+
+if __name__ == '__main__':
+    unittest.main()
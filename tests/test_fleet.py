@@ -0,0 +1,82 @@
+import shutil
+import time
+import unittest
+import warnings
+from unittest.mock import patch
+from zvma import ZVMAClient, ZVMAFleet
+from zvma.exceptions import ZVMAConnectionError
+from zvma.retry import RetryPolicy
+from urllib3.exceptions import InsecureRequestWarning
+from zvm_standin import ZVMStandIn
+
+SITES = 4
+
+
+@unittest.skipIf(shutil.which('openssl') is None, "openssl is needed to run the local ZVM stand-in")
+class TestFleet(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.zvms = [ZVMStandIn(routes={'/v1/vpgs': [{"VpgName": f"vpg-{i}-a"}, {"VpgName": f"vpg-{i}-b"}],
+                                        '/v1/localsite': {"SiteName": f"site-{i}"}},
+                                latency=0.2).start() for i in range(SITES)]
+
+    @classmethod
+    def tearDownClass(cls):
+        for zvm in cls.zvms:
+            zvm.stop()
+
+    def setUp(self):
+        warnings.simplefilter('ignore', InsecureRequestWarning)
+        sites = {f"site-{i}": dict(zvm_address=zvm.address, client_id="zerto-api", client_secret="secret")
+                 for i, zvm in enumerate(self.zvms)}
+        # Nothing listens on port 1: connections are refused
+        sites['dead'] = dict(zvm_address="127.0.0.1:1", client_id="zerto-api", client_secret="secret",
+                             retry_policy=RetryPolicy(max_retries=0))
+        self.fleet = ZVMAFleet(sites, verify_certificate=False)
+
+    def tearDown(self):
+        self.fleet.close()
+        warnings.resetwarnings()
+
+    def test_fan_out_with_partial_failure(self):
+        started = time.monotonic()
+        vpgs = self.fleet.vpgs.list_vpgs()
+        elapsed = time.monotonic() - started
+        self.assertFalse(vpgs.ok)
+        self.assertEqual(sorted(vpgs.results), [f"site-{i}" for i in range(SITES)])
+        self.assertIsInstance(vpgs.errors['dead'], ZVMAConnectionError)
+        merged = vpgs.merged()
+        self.assertEqual(len(merged), SITES * 2)
+        self.assertIn({"VpgName": "vpg-2-b", "Site": "site-2"}, merged)
+        # Token and list requests take 0.2s each per site; sequentially this would be over 1.6s
+        self.assertLess(elapsed, 1.2)
+
+    def test_call_selected_sites(self):
+        result = self.fleet.call(lambda client: client.localsite.get_local_site(), sites=["site-0", "site-3"])
+        self.assertTrue(result.ok)
+        self.assertEqual(result.merged(tag='Zvm'), [{"SiteName": "site-0", "Zvm": "site-0"},
+                                                    {"SiteName": "site-3", "Zvm": "site-3"}])
+        self.assertEqual(set(result.durations), {"site-0", "site-3"})
+
+    def test_existing_clients_and_health(self):
+        client = ZVMAClient(self.zvms[0].address, "zerto-api", "secret", verify_certificate=False)
+        fleet = ZVMAFleet([client])
+        self.assertIs(fleet[self.zvms[0].address], client)
+        self.assertTrue(fleet.authenticate().ok)
+        self.assertEqual(fleet.healthy_sites(), [self.zvms[0].address])
+        fleet.close()
+        client.close()
+
+    def test_close_only_closes_created_clients(self):
+        client = ZVMAClient(self.zvms[1].address, "zerto-api", "secret", verify_certificate=False)
+        fleet = ZVMAFleet({'own': dict(zvm_address=self.zvms[0].address, client_id="zerto-api", client_secret="secret"),
+                           'passed': client})
+        with patch.object(fleet['own'], 'close') as close_own, patch.object(client, 'close') as close_passed:
+            fleet.close()
+        close_own.assert_called_once_with()
+        close_passed.assert_not_called()
+        fleet['own'].close()
+        client.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import multiprocessing
+import os
+import pickle
+import shutil
+import sys
+import time
+import unittest
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch, MagicMock
+from zvma import ZVMAClient
+from urllib3.exceptions import InsecureRequestWarning
+from zvm_standin import ZVMStandIn
+from mock_client import authenticated_client, token_response
+
+FORK_AVAILABLE = sys.platform != 'win32' and 'fork' in multiprocessing.get_all_start_methods()
+
+
+def list_vpg_names(client):
+    warnings.simplefilter('ignore', InsecureRequestWarning)
+    return [vpg['VpgName'] for vpg in client.vpgs.list_vpgs()], client.token
+
+
+def use_inherited_client(client, parent_session, queue):
+    warnings.simplefilter('ignore', InsecureRequestWarning)
+    names, token = list_vpg_names(client)
+    queue.put((names, token, client.transport.session is parent_session))
+
+
+class TestPickling(unittest.TestCase):
+    def setUp(self):
+        self.client = authenticated_client(timeout=7, cache_maxsize=10)
+
+    def test_unpickled_client_reuses_token(self):
+        clone = pickle.loads(pickle.dumps(self.client))
+        vpgs_response = MagicMock(status_code=200)
+        vpgs_response.json.return_value = []
+        with patch('requests.Session.request', return_value=vpgs_response) as mock_request:
+            clone.vpgs.list_vpgs()
+        mock_request.assert_called_once()
+        self.assertEqual(mock_request.call_args.kwargs['headers']['Authorization'], "Bearer token")
+        self.assertIsNot(clone.transport, self.client.transport)
+        self.assertEqual(clone.transport.timeout, 7)
+        self.assertEqual(clone.cache.maxsize, 10)
+        self.assertAlmostEqual(clone._token_expires_at, self.client._token_expires_at, delta=1)
+
+    def test_pickle_holds_no_connection_state(self):
+        self.client.vpgs  # resources and pools are rebuilt on demand, not serialised
+        self.assertNotIn(b'Session', pickle.dumps(self.client))
+
+    def test_expired_token_refreshed_after_unpickling(self):
+        self.client._token_expires_at = time.monotonic() - 1
+        clone = pickle.loads(pickle.dumps(self.client))
+        with patch('requests.Session.request', return_value=token_response("new-token")):
+            self.assertEqual(clone.token, "new-token")
+
+
+class TestForkSafety(unittest.TestCase):
+    def test_pid_change_resets_connection_pool(self):
+        client = ZVMAClient(zvm_address="example.com", client_id="zerto-api", client_secret="secret")
+        client._token = "token"
+        session = client.transport.session
+        client.transport._pid = -1  # as if the client had been inherited through a fork
+        vpgs_response = MagicMock(status_code=200)
+        vpgs_response.json.return_value = []
+        with patch('requests.Session.request', return_value=vpgs_response):
+            client.vpgs.list_vpgs()
+        self.assertIsNot(client.transport.session, session)
+        self.assertEqual(client.transport._pid, os.getpid())
+        self.assertEqual(client.token, "token")
+
+
+@unittest.skipIf(shutil.which('openssl') is None, "openssl is needed to run the local ZVM stand-in")
+@unittest.skipUnless(FORK_AVAILABLE, "needs the fork start method")
+class TestWorkerProcesses(unittest.TestCase):
+    def setUp(self):
+        warnings.simplefilter('ignore', InsecureRequestWarning)
+        self.zvm = ZVMStandIn(routes={'/v1/vpgs': [{"VpgName": "vpg1"}]}).start()
+        self.client = ZVMAClient(self.zvm.address, "zerto-api", "secret", verify_certificate=False)
+        self.client.vpgs.list_vpgs()  # parent holds an authenticated keep-alive connection
+
+    def tearDown(self):
+        self.client.close()
+        self.zvm.stop()
+        warnings.resetwarnings()
+
+    def test_forked_child_gets_fresh_pool_and_same_token(self):
+        context = multiprocessing.get_context('fork')
+        queue = context.Queue()
+        process = context.Process(target=use_inherited_client, args=(self.client, self.client.transport.session, queue))
+        process.start()
+        names, token, shared_session = queue.get(timeout=30)
+        process.join(timeout=30)
+        self.assertEqual(names, ["vpg1"])
+        self.assertEqual(token, self.client.token)
+        self.assertFalse(shared_session)
+        self.assertEqual(self.zvm.tokens_issued, 1)
+        self.assertEqual(self.client.vpgs.list_vpgs()[0]['VpgName'], "vpg1")
+
+    def test_process_pool_workers_skip_keycloak(self):
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('fork')) as executor:
+            results = list(executor.map(list_vpg_names, [self.client] * 4))
+        self.assertEqual(results, [(["vpg1"], self.client.token)] * 4)
+        self.assertEqual(self.zvm.tokens_issued, 1)
+
+if __name__ == '__main__':
+    unittest.main()
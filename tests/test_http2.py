@@ -0,0 +1,102 @@
+import json
+import shutil
+import unittest
+import warnings
+from unittest.mock import patch
+from zvma import ZVMAClient
+from zvma.exceptions import ZVMAConnectionError
+from zvma.http2 import HTTPXSession, h2, httpx
+from zvma.transport import Transport
+from urllib3.exceptions import InsecureRequestWarning
+from zvm_standin import ZVMStandIn
+
+VMS = [{"VmIdentifier": f"vm-{i}", "VmName": f"vm-{i}", "VpgName": "vpg1", "Status": "MeetingSLA"} for i in range(500)]
+
+
+@unittest.skipIf(shutil.which('openssl') is None, "openssl is needed to run the local ZVM stand-in")
+class TestCompressedTransfer(unittest.TestCase):
+    def setUp(self):
+        warnings.simplefilter('ignore', InsecureRequestWarning)
+        self.zvm = ZVMStandIn(routes={'/v1/vms': VMS}, compress=True).start()
+
+    def tearDown(self):
+        self.zvm.stop()
+        warnings.resetwarnings()
+
+    def assert_compressed_transfer(self, client):
+        self.assertEqual(client.vms.list_vms(), VMS)
+        summary = client.metrics.transfer_summary()
+        self.assertLess(summary['wire_bytes'], summary['decoded_bytes'] / 5)
+        self.assertGreater(summary['compression_ratio'], 5)
+        self.assertIn('zvma_response_wire_bytes_total{', client.metrics.to_prometheus())
+
+    def test_requests_backend_reports_wire_bytes(self):
+        with ZVMAClient(self.zvm.address, "zerto-api", "secret", verify_certificate=False) as client:
+            self.assert_compressed_transfer(client)
+
+    def test_httpx_backend(self):
+        with ZVMAClient(self.zvm.address, "zerto-api", "secret", verify_certificate=False,
+                        http_backend='httpx') as client:
+            self.assertIsInstance(client.transport.session, HTTPXSession)
+            self.assert_compressed_transfer(client)
+            self.assertEqual(list(client.vms.iter_vms()), VMS)
+            self.assertEqual(self.zvm.tokens_issued, 1)
+
+    def test_httpx_backend_replays_rejected_token(self):
+        with ZVMAClient(self.zvm.address, "zerto-api", "secret", verify_certificate=False,
+                        http_backend='httpx') as client:
+            client.authenticate()
+            self.zvm.tokens.clear()
+            self.assertEqual(client.vms.list_vms(), VMS)
+        self.assertEqual(self.zvm.tokens_issued, 2)
+
+
+class TestHTTPXSession(unittest.TestCase):
+    def test_connection_errors_use_the_transport_exceptions(self):
+        transport = Transport(http_backend='httpx', retry_policy=None)
+        with patch('time.sleep'), patch('zvma.tracing.sleep'):
+            with self.assertRaises(ZVMAConnectionError):
+                transport.get("http://127.0.0.1:1/v1/vpgs")
+        transport.close()
+
+    def test_file_upload(self):
+        received = []
+
+        def respond(data):
+            # A streamed body, as from the network: httpx sets `elapsed` once it has been read
+            return httpx.Response(200, headers={'Content-Type': 'application/json'},
+                                  stream=httpx.ByteStream(json.dumps(data).encode('utf-8')))
+
+        def handler(request):
+            if request.url.path.endswith('/openid-connect/token'):
+                return respond({"access_token": "token", "expires_in": 3600})
+            received.append(request)
+            return respond({})
+
+        with ZVMAClient("example.com", "zerto-api", "secret", http_backend='httpx') as client:
+            client.transport.session.clients[True] = httpx.Client(transport=httpx.MockTransport(handler))
+            client.api.upload_file_to_scripts_directory(body={"file": ("script.ps1", b"Write-Host 'ok'")})
+        request = received[0]
+        self.assertTrue(request.headers['Content-Type'].startswith('multipart/form-data; boundary='))
+        self.assertEqual(request.headers['Authorization'], 'Bearer token')
+        self.assertIn(b'filename="script.ps1"', request.content)
+        self.assertIn(b"Write-Host 'ok'", request.content)
+
+    def test_unsupported_arguments_are_refused(self):
+        session = HTTPXSession()
+        with self.assertRaises(TypeError):
+            session.request('GET', 'https://example.com/v1/vpgs', cookies={'a': 'b'})
+        session.close()
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            Transport(http_backend='pycurl')
+
+    @unittest.skipIf(h2 is not None, "h2 is installed")
+    def test_http2_requires_h2(self):
+        with self.assertRaises(ImportError):
+            HTTPXSession(http2=True)
+        self.assertFalse(HTTPXSession().http2)
+
+if __name__ == '__main__':
+    unittest.main()
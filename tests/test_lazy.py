@@ -0,0 +1,91 @@
+import io
+import json
+import unittest
+from unittest.mock import patch
+import requests
+from zvma.lazy import LazyList, LazyRecord, lazy_response, MAX_NESTING
+from mock_client import authenticated_client
+
+def make_response(data):
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(json.dumps(data).encode('utf-8'))
+    return response
+
+RECORDS = [
+    {"VpgName": "vpg1", "Status": 1, "ActualRPO": 7, "Link": {"href": "https://zvm/v1/vpgs/1", "rel": "self"},
+     "Entities": {"Protected": 0, "Recovery": 1}, "Volumes": [{"Status": 9, "Tags": [[], {}]}]},
+    {"Note": "tricky ,\"Status\": 5 {[ \\\" }", "Status": 0, "VpgName": "vpg-é", "Empty": ""},
+    {"VpgName": "vpg3", "ActualRPO": None, "Flag": True, "Ratio": -1.5e3},
+]
+
+class TestLazyList(unittest.TestCase):
+    def setUp(self):
+        self.body = json.dumps(RECORDS, indent=1).encode('utf-8')
+
+    def test_records_decode_on_access(self):
+        records = LazyList(self.body)
+        self.assertEqual(len(records), 3)
+        self.assertIsInstance(records[0], LazyRecord)
+        self.assertEqual([dict(record) for record in records], RECORDS)
+        self.assertEqual(records[1]["Note"], RECORDS[1]["Note"])
+        self.assertEqual(records[-1].to_dict(), RECORDS[2])
+        with self.assertRaises(KeyError):
+            records[2]["Status"]
+
+    def test_project_reads_top_level_fields_only(self):
+        rows = LazyList(self.body).project("VpgName", "Status", "ActualRPO")
+        self.assertEqual(rows, [("vpg1", 1, 7), ("vpg-é", 0, None), ("vpg3", None, None)])
+        self.assertEqual(LazyList(self.body).column("Status", default=-1), [1, 0, -1])
+        self.assertEqual(LazyList(self.body).column("Link")[0], RECORDS[0]["Link"])
+
+    def test_deeper_nesting_falls_back_to_full_decode(self):
+        deep = {"Status": 2, "Nested": {"Status": 3}}
+        for _ in range(MAX_NESTING + 2):
+            deep["Nested"] = [deep["Nested"]]
+        body = json.dumps([deep, RECORDS[0]]).encode('utf-8')
+        self.assertEqual(LazyList(body).column("Status"), [2, 1])
+        self.assertEqual(LazyList(body)[0]["Nested"], deep["Nested"])
+        self.assertEqual(len(LazyList(body)), 2)
+
+    def test_value_nested_past_the_limit_is_not_taken_for_a_scalar(self):
+        body = b'[{"B":1,"E":[{"D":{"A":{"B":{"A":[[[[{"D":{"D":{"B":{}}}}]]]]}}},"B":2}],"D":3}]'
+        expected = json.loads(body)
+        self.assertEqual(LazyList(body).project("B", "E", "D"), [(1, expected[0]["E"], 3)])
+        self.assertEqual(dict(LazyList(body)[0]), expected[0])
+        self.assertEqual(LazyList(body)[0]["D"], 3)
+        self.assertEqual(dict(lazy_response(body[1:-1])), expected[0])
+
+    def test_empty_and_non_object_elements(self):
+        self.assertEqual(len(LazyList(b' [ ] ')), 0)
+        self.assertEqual(LazyList(b'[1, "a", {"Status": 4}]').column("Status"), [None, None, 4])
+        self.assertEqual(LazyList(b'[1, "a"]')[1], "a")
+        with self.assertRaises(ValueError):
+            LazyList(b'{"Status": 1}').project("Status")
+
+    def test_lazy_response(self):
+        self.assertIsInstance(lazy_response(self.body), LazyList)
+        record = lazy_response(b'{"VpgName": "vpg1"}')
+        self.assertEqual(record["VpgName"], "vpg1")
+        self.assertIsNone(lazy_response(b'null'))
+
+class TestLazyEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.client = authenticated_client(cache_maxsize=0)
+
+    def test_list_vpgs_lazy(self):
+        with patch.object(self.client.transport.session, 'request', return_value=make_response(RECORDS)):
+            vpgs = self.client.vpgs.list_vpgs(lazy=True)
+        self.assertEqual(vpgs.project("VpgName", "Status"), [("vpg1", 1), ("vpg-é", 0), ("vpg3", None)])
+        with patch.object(self.client.transport.session, 'request', return_value=make_response(RECORDS)):
+            self.assertEqual(self.client.vpgs.list_vpgs(vpg_name="vpg3", lazy=True)["Flag"], True)
+        with patch.object(self.client.transport.session, 'request', return_value=make_response(RECORDS)):
+            self.assertEqual(self.client.vpgs.list_vpgs(vpg_name="missing", lazy=True), {})
+
+    def test_list_vms_lazy(self):
+        with patch.object(self.client.transport.session, 'request', return_value=make_response(RECORDS)):
+            vms = self.client.vms.list_vms(lazy=True)
+        self.assertEqual(vms.column("ActualRPO"), [7, None, None])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+from zvma import ZVMAClient
+from mock_client import token_response
+
+class TestLazyClient(unittest.TestCase):
+    def test_import_has_no_side_effects(self):
+        code = ("import logging, sys, zvma; "
+                "print(len(logging.getLogger().handlers), 'zvma.vpgs' in sys.modules, 'zvma.zvma' in sys.modules)")
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['0', 'False', 'False'])
+
+    def test_authentication_deferred_to_first_request(self):
+        vpgs_response = MagicMock(status_code=200)
+        vpgs_response.json.return_value = []
+        with patch('requests.Session.request', side_effect=[token_response(), vpgs_response]) as mock_request:
+            client = ZVMAClient(zvm_address="example.com", client_id="zerto-api", client_secret="secret")
+            self.assertEqual(mock_request.call_count, 0)
+            client.vpgs.list_vpgs()
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertTrue(mock_request.call_args_list[0].args[1].endswith("/openid-connect/token"))
+        self.assertEqual(mock_request.call_args.kwargs['headers']['Authorization'], "Bearer token")
+
+    def test_resources_created_on_first_access(self):
+        client = ZVMAClient(zvm_address="example.com", client_id="zerto-api", client_secret="secret")
+        self.assertNotIn('vras', vars(client))
+        vras = client.vras
+        self.assertIs(client.vras, vras)
+        self.assertIs(vras.client, client)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from zvma.limiter import AdaptiveConcurrencyLimiter
+from zvma.transport import Transport
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+    def test_additive_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=10)
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(0.01)
+        self.assertGreater(limiter.limit, 2)
+        self.assertLessEqual(limiter.limit, 10)
+
+    def test_multiplicative_decrease_on_errors(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10, decrease_factor=0.5)
+        limiter.acquire()
+        limiter.release(0.01, success=False)
+        self.assertEqual(limiter.limit, 5)
+
+    def test_slow_response_is_congestion(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10, decrease_factor=0.5)
+        limiter.acquire()
+        limiter.release(0.01)
+        limiter._last_decrease = 0
+        limiter.acquire()
+        limiter.release(1.0)
+        self.assertEqual(limiter.limit, 5)
+
+    def test_limit_recovers_after_latency_step(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10)
+        clock = [1000.0]
+
+        def run(latency, count):
+            for _ in range(count):
+                clock[0] += latency
+                limiter.acquire()
+                limiter.release(latency)
+
+        with patch('zvma.limiter.time.monotonic', side_effect=lambda: clock[0]):
+            run(0.05, 200)
+            self.assertEqual(limiter.limit, 10)
+            run(0.3, 20)
+            self.assertLess(limiter.limit, 10)
+            run(0.3, 300)
+        # The baseline moved to the new latency and the limit grew back
+        self.assertAlmostEqual(limiter.snapshot()['baseline_latency'], 0.3, places=2)
+        self.assertEqual(limiter.limit, 10)
+
+    def test_acquire_times_out_when_full(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        self.assertTrue(limiter.acquire())
+        self.assertFalse(limiter.acquire(timeout=0.01))
+
+    def test_transport_caps_concurrency_per_host(self):
+        transport = Transport(pool_maxsize=3)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_request(method, url, **kwargs):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+            return MagicMock(status_code=200)
+
+        with patch.object(transport.session, 'request', side_effect=fake_request):
+            threads = [threading.Thread(target=transport.get, args=("https://zvm1/v1/vpgs",)) for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertLessEqual(max(peak), 3)
+        self.assertEqual(transport.get_limiter("https://zvm1/v1/vms").in_flight, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import logging
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch, MagicMock
+from zvma import ZVMAClient
+from zvma.log import Payload, log_payload, configure_payload_logging, DEFAULT_PAYLOAD_MAX_CHARS
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestLogging(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger('zvma.tests')
+        self.handler = ListHandler()
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+        self.addCleanup(self.logger.setLevel, logging.NOTSET)
+        self.addCleanup(configure_payload_logging, sample_rate=1.0, max_chars=DEFAULT_PAYLOAD_MAX_CHARS)
+
+    def test_library_silent_without_logging_configuration(self):
+        code = ("import logging, sys, zvma.transport; zvma.transport.Transport(); "
+                "logging.getLogger('zvma.transport').warning('hidden'); "
+                "print(len(logging.getLogger().handlers))")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(), ['0'])
+        self.assertEqual(result.stderr, '')
+
+    def test_payload_not_rendered_when_level_disabled(self):
+        self.logger.setLevel(logging.INFO)
+        with patch('zvma.log.Payload') as payload:
+            log_payload(self.logger, "result: %s", [{"VmName": "vm1"}])
+        payload.assert_not_called()
+        self.assertEqual(self.handler.messages, [])
+
+    def test_payload_capped(self):
+        self.logger.setLevel(logging.DEBUG)
+        configure_payload_logging(max_chars=100)
+        log_payload(self.logger, "result: %s", [{"VmName": f"vm-{i}"} for i in range(1000)])
+        message, = self.handler.messages
+        self.assertLess(len(message), 160)
+        self.assertTrue(message.startswith('result: [{"VmName": "vm-0"}'))
+        self.assertIn("more items", message)
+        self.assertEqual(str(Payload({"Key": "x" * 50}, max_chars=10)), '{"Key": "x... (51 more characters)')
+
+    def test_payload_sampled(self):
+        self.logger.setLevel(logging.DEBUG)
+        configure_payload_logging(sample_rate=0)
+        log_payload(self.logger, "result: %s", [1, 2, 3])
+        self.assertEqual(self.handler.messages, [])
+        with self.assertRaises(ValueError):
+            configure_payload_logging(sample_rate=2)
+
+    def test_resource_payload_logging_is_lazy(self):
+        client = ZVMAClient(zvm_address="example.com", client_id="zerto-api", client_secret="secret")
+        client._token = "token"
+        response = MagicMock(status_code=200)
+        response.json.return_value = [{"VolumeIdentifier": f"v{i}"} for i in range(1000)]
+        logging.getLogger('zvma').setLevel(logging.INFO)
+        self.addCleanup(logging.getLogger('zvma').setLevel, logging.NOTSET)
+        with patch('requests.Session.request', return_value=response), patch('zvma.log.json.dumps') as dumps:
+            client.encryptiondetection.list_suspected_volumes()
+        dumps.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
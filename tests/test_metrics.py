@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import urllib.request
+from zvma.metrics import ClientMetrics, endpoint_template, render_prometheus, start_prometheus_exporter
+from mock_client import authenticated_client
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.client = authenticated_client()
+        self.client.metrics.reset()
+
+    def test_endpoint_template(self):
+        self.assertEqual(endpoint_template("https://zvm/v1/vpgs/8a2f-41c2/checkpoints?startDate=x"),
+                         "/v1/vpgs/{id}/checkpoints")
+        self.assertEqual(endpoint_template("https://zvm/v1/vras/vra-1/changerecoveryvra/validate"),
+                         "/v1/vras/{id}/changerecoveryvra/validate")
+
+    @patch('zvma.transport.time.sleep')
+    def test_records_status_retries_and_size(self, mock_sleep):
+        unavailable = MagicMock(status_code=503, headers={})
+        ok = MagicMock(status_code=200, content=b'[{"CheckpointIdentifier": "c1"}]')
+        ok.json.return_value = []
+        with patch.object(self.client.transport.session, 'request', side_effect=[unavailable, ok]):
+            self.client.transport.get("https://example.com/v1/vpgs/vpg-1/checkpoints",
+                                      headers={'Authorization': 'Bearer x'})
+        stats = self.client.metrics.snapshot()[("example.com", "GET", "/v1/vpgs/{id}/checkpoints")]
+        self.assertEqual(stats['requests'], 1)
+        self.assertEqual(stats['retries'], 1)
+        self.assertEqual(stats['status_codes'], {200: 1})
+        self.assertEqual(stats['response_bytes'], 32)
+
+    def test_prometheus_exposition(self):
+        metrics = ClientMetrics(latency_buckets=(0.1, 1.0))
+        metrics.record("GET", "https://zvm/v1/vpgs", 200, 0.05, 100)
+        metrics.record("GET", "https://zvm/v1/vpgs", None, 2.0)
+        text = metrics.to_prometheus()
+        labels = 'zvm="zvm",method="GET",endpoint="/v1/vpgs"'
+        self.assertIn(f'zvma_requests_total{{{labels},status="200"}} 1', text)
+        self.assertIn(f'zvma_requests_total{{{labels},status="error"}} 1', text)
+        self.assertIn(f'zvma_request_duration_seconds_bucket{{{labels},le="1"}} 1', text)
+        self.assertIn(f'zvma_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', text)
+        self.assertIn(f'zvma_request_duration_seconds_count{{{labels}}} 2', text)
+
+    def test_several_sources_share_family_headers(self):
+        first, second = ClientMetrics(), ClientMetrics()
+        first.record("GET", "https://zvm1/v1/vpgs", 200, 0.05)
+        second.record("GET", "https://zvm2/v1/vpgs", 200, 0.05)
+        text = render_prometheus([first, second])
+        self.assertEqual(text.count('# HELP zvma_requests_total '), 1)
+        self.assertEqual(text.count('# TYPE zvma_request_duration_seconds histogram'), 1)
+        lines = text.splitlines()
+        help_line = lines.index('# HELP zvma_request_retries_total Retried attempts of ZVM API calls.')
+        self.assertTrue(lines[help_line - 1].startswith('zvma_requests_total{zvm="zvm2"'))
+
+    def test_exporter_listens_on_loopback(self):
+        metrics = ClientMetrics()
+        metrics.record("GET", "https://zvm/v1/vpgs", 200, 0.05)
+        server = start_prometheus_exporter([metrics, ClientMetrics()], port=0)
+        try:
+            address, port = server.server_address
+            self.assertEqual(address, '127.0.0.1')
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/metrics') as response:
+                text = response.read().decode('utf-8')
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(text, metrics.to_prometheus())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import io
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+import requests
+from zvma.common import ZertoVPGStatus, ZertoVPGSubstatus, ZertoVPGPriority, ZertoAlertLevel, ZertoEventCategory, ZertoTaskStates, ZertoTaskTypes
+from zvma.models import VPG, VM, Alert, Event, Task, Checkpoint, convert
+from mock_client import authenticated_client
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def make_response(data):
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(json.dumps(data).encode('utf-8'))
+    return response
+
+VPG_DATA = {"VpgIdentifier": "vpg-1", "VpgName": "vpg1", "Status": 1, "SubStatus": 0, "Priority": 2,
+            "ActualRPO": 7, "IOPs": 12, "Entities": {"Protected": 0, "Recovery": 0}}
+
+class TestModels(unittest.TestCase):
+    def test_vpg_fields_and_enums(self):
+        vpg = VPG.from_dict(VPG_DATA)
+        self.assertEqual(vpg.vpg_identifier, "vpg-1")
+        self.assertEqual(vpg.vpg_name, "vpg1")
+        self.assertIs(vpg.status, ZertoVPGStatus.MeetingSLA)
+        self.assertIs(vpg.sub_status, ZertoVPGSubstatus.NONE)
+        self.assertIs(vpg.priority, ZertoVPGPriority(2))
+        self.assertEqual(vpg.actual_rpo, 7)
+        self.assertEqual(vpg.iops, 12)
+        self.assertEqual(vpg.entities, {"Protected": 0, "Recovery": 0})
+        self.assertIsNone(vpg.vpg_description)
+        self.assertFalse(hasattr(vpg, '__dict__'))
+
+    def test_unknown_enum_values_are_kept(self):
+        vpg = VPG.from_dict({"Status": 99, "SubStatus": None})
+        self.assertEqual(vpg.status, 99)
+        self.assertIsNone(vpg.sub_status)
+        self.assertEqual(Alert.from_dict({"Level": "Catastrophic"}).level, "Catastrophic")
+
+    def test_enums_by_name(self):
+        alert = Alert.from_dict({"AlertIdentifier": "a1", "Level": "Warning"})
+        self.assertIs(alert.level, ZertoAlertLevel.Warning)
+        event = Event.from_dict({"EventIdentifier": "e1", "EventCategory": "Events", "EventType": 0})
+        self.assertIs(event.event_category, ZertoEventCategory.Events)
+        task = Task.from_dict({"TaskIdentifier": "t1", "Type": "CreateProtectionGroup", "Status": {"State": 6, "Progress": 100}})
+        self.assertIs(task.type, ZertoTaskTypes.CreateProtectionGroup)
+        self.assertIs(task.status.state, ZertoTaskStates.Completed)
+        self.assertEqual(task.status.progress, 100)
+
+    def test_to_dict_round_trip(self):
+        vpg = VPG.from_dict(VPG_DATA)
+        self.assertEqual(VPG.from_dict(vpg.to_dict()), vpg)
+        self.assertEqual({k: v for k, v in vpg.to_dict().items() if v is not None}, VPG_DATA)
+        alert = Alert.from_dict({"Level": "Error", "Entity": "Zvm"})
+        self.assertEqual(alert.to_dict()["Level"], "Error")
+        task = Task.from_dict({"Type": "CreateProtectionGroup", "Status": {"State": 6, "Progress": 100}})
+        self.assertEqual(task.to_dict()["Status"], {"State": 6, "Progress": 100})
+        self.assertEqual(task.to_dict()["Type"], "CreateProtectionGroup")
+
+    def test_pickle_and_repr(self):
+        vm = VM.from_dict({"VmIdentifier": "vm-1", "VmName": "vm1", "Status": 0})
+        self.assertEqual(pickle.loads(pickle.dumps(vm)), vm)
+        self.assertIn("vm_name='vm1'", repr(vm))
+
+    def test_convert(self):
+        self.assertEqual(convert(Checkpoint, [{"CheckpointIdentifier": "c1"}])[0].checkpoint_identifier, "c1")
+        self.assertEqual(convert(Checkpoint, {"Tag": "t"}).tag, "t")
+        self.assertEqual(convert(Checkpoint, {}), {})
+        self.assertIsNone(convert(Checkpoint, None))
+
+    def test_generated_module_is_current(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'models.py')
+            subprocess.run([sys.executable, os.path.join(REPO_ROOT, 'tools', 'generate_models.py'), '--output', output],
+                           check=True, capture_output=True)
+            with open(output, encoding='utf-8') as generated, open(os.path.join(REPO_ROOT, 'zvma', 'models.py'), encoding='utf-8') as current:
+                self.assertEqual(generated.read(), current.read())
+
+class TestAsModels(unittest.TestCase):
+    def setUp(self):
+        self.client = authenticated_client(cache_maxsize=0)
+
+    def test_list_vpgs(self):
+        with patch.object(self.client.transport.session, 'request', return_value=make_response([VPG_DATA])):
+            vpgs = self.client.vpgs.list_vpgs(as_models=True)
+        self.assertEqual([vpg.vpg_name for vpg in vpgs], ["vpg1"])
+        with patch.object(self.client.transport.session, 'request', return_value=make_response([VPG_DATA])):
+            vpg = self.client.vpgs.list_vpgs(vpg_name="vpg1", as_models=True)
+        self.assertIs(vpg.status, ZertoVPGStatus.MeetingSLA)
+        with patch.object(self.client.transport.session, 'request', return_value=make_response([VPG_DATA])):
+            self.assertEqual(self.client.vpgs.list_vpgs(), [VPG_DATA])
+
+    def test_iter_vms(self):
+        vms = [{"VmIdentifier": f"vm-{i}", "Status": 1} for i in range(3)]
+        with patch.object(self.client.transport.session, 'request', return_value=make_response(vms)):
+            models = list(self.client.vms.iter_vms(as_models=True, vpg_name="vpg1"))
+        self.assertEqual([vm.vm_identifier for vm in models], ["vm-0", "vm-1", "vm-2"])
+        self.assertTrue(all(vm.status is ZertoVPGStatus.MeetingSLA for vm in models))
+
+    def test_get_alerts_and_events(self):
+        with patch.object(self.client.transport.session, 'request', return_value=make_response([{"Level": "Warning"}])):
+            self.assertIs(self.client.alerts.get_alerts(as_models=True)[0].level, ZertoAlertLevel.Warning)
+        with patch.object(self.client.transport.session, 'request', return_value=make_response([{"EventType": 0}])):
+            self.assertIsInstance(self.client.events.list_events(as_models=True)[0], Event)
+
+    def test_list_and_get_tasks(self):
+        task = {"TaskIdentifier": "t1", "Type": "FailOver", "Status": {"State": 6, "Progress": 100}}
+        with patch.object(self.client.transport.session, 'request', return_value=make_response([task])) as request:
+            tasks = self.client.tasks.list_tasks(task_type="FailOver", as_models=True)
+        self.assertEqual(request.call_args[1]['params'], {'type': 'FailOver'})
+        self.assertIsInstance(tasks[0], Task)
+        self.assertIs(tasks[0].type, ZertoTaskTypes.FailOver)
+        self.assertIs(tasks[0].status.state, ZertoTaskStates.Completed)
+        with patch.object(self.client.transport.session, 'request', return_value=make_response(task)) as request:
+            self.assertEqual(self.client.tasks.get_task("t1", as_models=True).task_identifier, "t1")
+        self.assertTrue(request.call_args[0][1].endswith('/v1/tasks/t1'))
+        with patch.object(self.client.transport.session, 'request', return_value=make_response(task)):
+            self.assertEqual(self.client.tasks.get_task("t1"), task)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from zvma import ZVMAClient
+from zvma.limiter import AdaptiveConcurrencyLimiter
+from zvma.priority import RequestPriority, current_priority, get_priority, request_priority
+from zvma.transport import Transport
+
+class TestPriorityLimiter(unittest.TestCase):
+    def test_critical_waiter_admitted_first(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1, critical_reserve=0)
+        self.assertTrue(limiter.acquire())
+        order = []
+
+        def waiter(priority):
+            limiter.acquire(priority=priority)
+            order.append(priority)
+            limiter.release(0.01)
+
+        threads = [threading.Thread(target=waiter, args=(RequestPriority.BACKGROUND,)) for _ in range(3)]
+        threads.append(threading.Thread(target=waiter, args=(RequestPriority.CRITICAL,)))
+        for thread in threads:
+            thread.start()
+        while sum(limiter.snapshot()['waiting'].values()) < 4:
+            time.sleep(0.001)
+        limiter.release(0.01)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(order[0], RequestPriority.CRITICAL)
+        self.assertEqual(len(order), 4)
+
+    def test_slots_reserved_for_critical_requests(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3, critical_reserve=1)
+        self.assertTrue(limiter.acquire(priority=RequestPriority.BACKGROUND))
+        self.assertTrue(limiter.acquire())
+        self.assertFalse(limiter.acquire(timeout=0.01))
+        self.assertTrue(limiter.acquire(timeout=0.01, priority=RequestPriority.CRITICAL))
+
+    def test_priority_names(self):
+        self.assertEqual(get_priority('critical'), RequestPriority.CRITICAL)
+        self.assertEqual(get_priority(2), RequestPriority.BACKGROUND)
+        with self.assertRaises(ValueError):
+            get_priority('urgent')
+
+
+class TestRequestPriority(unittest.TestCase):
+    def test_context_priority_reaches_limiter(self):
+        transport = Transport()
+        limiter = transport.get_limiter("https://zvm1/v1/alerts")
+        with patch.object(transport.session, 'request', return_value=MagicMock(status_code=200)), \
+                patch.object(limiter, 'acquire', wraps=limiter.acquire) as acquire:
+            with request_priority('background'):
+                transport.get("https://zvm1/v1/alerts")
+            transport.get("https://zvm1/v1/alerts", priority='critical')
+            transport.get("https://zvm1/v1/alerts")
+        self.assertEqual([call.kwargs['priority'] for call in acquire.call_args_list],
+                         [RequestPriority.BACKGROUND, RequestPriority.CRITICAL, RequestPriority.NORMAL])
+
+    def test_failover_operations_are_critical(self):
+        client = ZVMAClient(zvm_address="example.com", client_id="zerto-api", client_secret="secret")
+        client._token = "token"
+        seen = []
+
+        def request(method, url, **kwargs):
+            seen.append(current_priority())
+            return MagicMock(status_code=200, json=MagicMock(return_value="task-1"))
+
+        with patch.object(client.vpgs, 'list_vpgs', return_value={'VpgIdentifier': "v1"}), \
+                patch.object(client.transport, 'request', side_effect=request):
+            with client.priority('background'):
+                client.vpgs.rollback_failover("vpg1", sync=False)
+                self.assertEqual(current_priority(), RequestPriority.BACKGROUND)
+        self.assertEqual(seen, [RequestPriority.CRITICAL])
+
+if __name__ == '__main__':
+    unittest.main()
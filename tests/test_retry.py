@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+from zvma.transport import Transport
+from zvma.retry import RetryPolicy, parse_retry_after
+from zvma.exceptions import ZVMAServerError, ZVMANotFoundError, ZVMAConnectionError, ZVMADeadlineExceededError
+
+def make_response(status_code, headers=None, json_body=None):
+    response = MagicMock(status_code=status_code, reason="reason", headers=headers or {})
+    response.json.return_value = json_body or {}
+    return response
+
+class TestRetry(unittest.TestCase):
+    def setUp(self):
+        self.transport = Transport(retry_policy=RetryPolicy(max_retries=3, backoff_factor=0.01))
+        sleep_patcher = patch('zvma.transport.time.sleep')
+        self.mock_sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def test_get_retried_on_503(self):
+        responses = [make_response(503), make_response(502), make_response(200)]
+        with patch.object(self.transport.session, 'request', side_effect=responses) as mock_request:
+            response = self.transport.get("https://zvm/v1/vpgs")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_post_not_retried(self):
+        with patch.object(self.transport.session, 'request', return_value=make_response(503)) as mock_request:
+            with self.assertRaises(ZVMAServerError):
+                self.transport.post("https://zvm/v1/vpgSettings")
+        self.assertEqual(mock_request.call_count, 1)
+
+    def test_retry_after_honoured(self):
+        responses = [make_response(429, headers={'Retry-After': '2'}), make_response(200)]
+        with patch.object(self.transport.session, 'request', side_effect=responses):
+            self.transport.get("https://zvm/v1/alerts")
+        self.mock_sleep.assert_called_once_with(2.0)
+
+    def test_connection_reset_retried_then_typed(self):
+        error = requests.exceptions.ConnectionError("reset")
+        with patch.object(self.transport.session, 'request', side_effect=error) as mock_request:
+            with self.assertRaises(ZVMAConnectionError):
+                self.transport.get("https://zvm/v1/vms")
+        self.assertEqual(mock_request.call_count, 4)
+
+    def test_typed_error_keeps_requests_compatibility(self):
+        response = make_response(404, json_body={"Message": "VPG not found"})
+        with patch.object(self.transport.session, 'request', return_value=response):
+            with self.assertRaises(requests.exceptions.RequestException) as ctx:
+                self.transport.get("https://zvm/v1/vpgs/missing")
+        self.assertIsInstance(ctx.exception, ZVMANotFoundError)
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertIn("VPG not found", str(ctx.exception))
+
+    def test_deadline_stops_retries(self):
+        responses = [make_response(503, headers={'Retry-After': '10'}), make_response(200)]
+        with patch.object(self.transport.session, 'request', side_effect=responses):
+            with self.assertRaises(ZVMAServerError):
+                self.transport.get("https://zvm/v1/vpgs", deadline=1)
+        self.mock_sleep.assert_not_called()
+
+    def test_expired_deadline(self):
+        with patch('zvma.transport.time.monotonic', side_effect=[0, 5, 5]):
+            with self.assertRaises(ZVMADeadlineExceededError):
+                self.transport.get("https://zvm/v1/vpgs", deadline=1)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
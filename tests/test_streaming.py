@@ -0,0 +1,56 @@
+import io
+import json
+import unittest
+from unittest.mock import patch
+import requests
+from zvma.streaming import iter_json_array
+from mock_client import authenticated_client
+
+def make_stream_response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+class TestIterJsonArray(unittest.TestCase):
+    def test_elements_split_across_chunks(self):
+        data = [{"VmName": f"vm-{i}", "Note": "quote \" and ] { inside", "Tags": [i, None, True]} for i in range(50)]
+        data += [1, 2.5, "text", None, []]
+        body = json.dumps(data).encode('utf-8')
+        for size in (1, 7, 100, len(body)):
+            chunks = [body[i:i + size] for i in range(0, len(body), size)]
+            self.assertEqual(list(iter_json_array(chunks)), data)
+
+    def test_single_object_and_empty_array(self):
+        self.assertEqual(list(iter_json_array([b'{"VmIdentifier":', b' "vm-1"}'])), [{"VmIdentifier": "vm-1"}])
+        self.assertEqual(list(iter_json_array([b' [', b' ] '])), [])
+
+    def test_truncated_array(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'[{"a": 1}, {"b"']))
+
+class TestIterEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.client = authenticated_client()
+
+    def test_iter_vms_streams_response(self):
+        vms = [{"VmIdentifier": f"vm-{i}"} for i in range(3)]
+        response = make_stream_response(json.dumps(vms).encode('utf-8'))
+        with patch.object(self.client.transport.session, 'request', return_value=response) as mock_request:
+            iterator = self.client.vms.iter_vms(vpg_name="vpg1")
+            self.assertEqual(next(iterator), vms[0])
+            self.assertEqual(list(iterator), vms[1:])
+        kwargs = mock_request.call_args.kwargs
+        self.assertTrue(kwargs['stream'])
+        self.assertEqual(kwargs['params'], {"vpgName": "vpg1", "includeMountedVms": True})
+        self.assertTrue(response.raw.closed)
+
+    def test_iter_events_single_event(self):
+        response = make_stream_response(b'{"EventIdentifier": "e1"}')
+        with patch.object(self.client.transport.session, 'request', return_value=response) as mock_request:
+            events = list(self.client.events.iter_events(event_identifier="e1"))
+        self.assertEqual(events, [{"EventIdentifier": "e1"}])
+        self.assertEqual(mock_request.call_args.args[1], "https://example.com/v1/events/e1")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import shutil
+import threading
+import time
+import unittest
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from zvma import ZVMAClient
+from urllib3.exceptions import InsecureRequestWarning
+from zvm_standin import ZVMStandIn
+
+THREADS = 200
+CALLS_PER_THREAD = 3
+
+@unittest.skipIf(shutil.which('openssl') is None, "openssl is needed to run the local ZVM stand-in")
+class TestThreadSafety(unittest.TestCase):
+    def setUp(self):
+        warnings.simplefilter('ignore', InsecureRequestWarning)
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def test_shared_client_under_load(self):
+        routes = {
+            '/v1/vpgs': [{"VpgName": "vpg1", "VpgIdentifier": "v1"}],
+            '/v1/alerts': [{"AlertIdentifier": "a1"}],
+            '/v1/alerts/levels': ["Warning", "Error"],
+            '/v1/tasks/t1': {"Status": {"State": 6, "Progress": 100}},
+        }
+        with ZVMStandIn(routes=routes, latency=0.002, token_lifetime=3) as zvm:
+            client = ZVMAClient(zvm.address, "zerto-api", "secret", verify_certificate=False,
+                                max_workers=16, token_refresh_margin=2.5)
+            start = threading.Barrier(THREADS)
+
+            def worker(index):
+                start.wait()
+                results = []
+                for call in range(CALLS_PER_THREAD):
+                    # Distinct filters per call, so requests are neither coalesced nor cached
+                    results.append(client.vpgs.list_vpgs(zorg_identifier=f"zorg-{index}-{call}"))
+                    results.append(client.alerts.get_alerts(level=f"level-{index}-{call}"))
+                    results.append(client.alerts.get_alert_levels())
+                    results.append(client.tasks.wait_for_task_completion("t1", interval=0) if index % 10 == 0 else None)
+                    time.sleep(0.01)
+                return results
+
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                all_results = list(executor.map(worker, range(THREADS)))
+            client.close()
+
+        for results in all_results:
+            self.assertEqual(results[0], routes['/v1/vpgs'])
+            self.assertEqual(results[1], routes['/v1/alerts'])
+            self.assertEqual(results[2], routes['/v1/alerts/levels'])
+        # Tokens only live half a second here, so the run needs several refreshes, but never one per thread
+        self.assertGreater(zvm.tokens_issued, 1)
+        self.assertLess(zvm.tokens_issued, 50)
+        limiter = client.transport.get_limiter(f"https://{zvm.address}/")
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertGreaterEqual(len(zvm.requests), THREADS * CALLS_PER_THREAD * 2)
+        self.assertLessEqual(zvm.max_in_flight, 16)
+        errors = {key: stats['errors'] for key, stats in client.metrics.snapshot().items() if stats['errors']}
+        self.assertEqual(errors, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import multiprocessing
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+import unittest
+import warnings
+from unittest.mock import patch
+from zvma import ZVMAClient
+from zvma.token_cache import FileTokenCache
+from urllib3.exceptions import InsecureRequestWarning
+from zvm_standin import ZVMStandIn
+from mock_client import token_response
+
+
+
+def start_job(address, directory, queue):
+    warnings.simplefilter('ignore', InsecureRequestWarning)
+    client = ZVMAClient(address, "zerto-api", "secret", verify_certificate=False, token_cache=directory)
+    queue.put(client.authenticate())
+
+
+class TestFileTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = os.path.join(tempfile.mkdtemp(), 'zvma')
+
+    def tearDown(self):
+        shutil.rmtree(os.path.dirname(self.directory), ignore_errors=True)
+
+    def new_client(self, client_id="zerto-api"):
+        return ZVMAClient(zvm_address="example.com", client_id=client_id, client_secret="secret",
+                          token_cache=self.directory)
+
+    def test_token_reused_by_next_process(self):
+        with patch('requests.Session.request', return_value=token_response("token-1")) as mock_request:
+            self.assertEqual(self.new_client().authenticate(), "token-1")
+            client = self.new_client()
+            self.assertEqual(client.authenticate(), "token-1")
+        mock_request.assert_called_once()
+        self.assertGreater(client._token_expires_at - time.monotonic(), 3500)
+
+    def test_cache_files_private(self):
+        with patch('requests.Session.request', return_value=token_response("token-1")):
+            self.new_client().authenticate()
+        self.assertEqual(stat.S_IMODE(os.stat(self.directory).st_mode), 0o700)
+        files = [name for name in os.listdir(self.directory) if name.endswith('.json')]
+        self.assertEqual(len(files), 1)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(self.directory, files[0])).st_mode), 0o600)
+        with open(os.path.join(self.directory, files[0])) as cache_file:
+            self.assertNotIn("secret", cache_file.read())
+
+    def test_keyed_by_client_id(self):
+        with patch('requests.Session.request', side_effect=[token_response("token-1"), token_response("token-2")]):
+            self.assertEqual(self.new_client().authenticate(), "token-1")
+            self.assertEqual(self.new_client(client_id="other").authenticate(), "token-2")
+
+    def test_token_close_to_expiry_refreshed(self):
+        with patch('requests.Session.request', side_effect=[token_response("token-1", 30), token_response("token-2")]):
+            self.new_client().authenticate()
+            self.assertEqual(self.new_client().authenticate(), "token-2")
+        self.assertEqual(FileTokenCache(self.directory).load("example.com", "zerto-api")['access_token'], "token-2")
+
+    def test_rejected_token_not_reused(self):
+        with patch('requests.Session.request', side_effect=[token_response("token-1"), token_response("token-2")]):
+            client = self.new_client()
+            client.authenticate()
+            self.assertEqual(client.refresh_token(stale_token="token-1"), "token-2")
+
+    @unittest.skipIf(sys.platform == 'win32', "POSIX permissions")
+    def test_file_readable_by_others_ignored(self):
+        cache = FileTokenCache(self.directory)
+        cache.store("example.com", "zerto-api", "token-1", 3600)
+        os.chmod(cache._path("example.com", "zerto-api", '.json'), 0o644)
+        self.assertIsNone(cache.load("example.com", "zerto-api"))
+
+
+@unittest.skipIf(shutil.which('openssl') is None, "openssl is needed to run the local ZVM stand-in")
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), "needs the fork start method")
+class TestConcurrentStarters(unittest.TestCase):
+    def test_one_refresh_for_many_processes(self):
+        warnings.simplefilter('ignore', InsecureRequestWarning)
+        directory = tempfile.mkdtemp()
+        context = multiprocessing.get_context('fork')
+        queue = context.Queue()
+        with ZVMStandIn(latency=0.2) as zvm:
+            processes = [context.Process(target=start_job, args=(zvm.address, directory, queue)) for _ in range(8)]
+            for process in processes:
+                process.start()
+            tokens = [queue.get(timeout=30) for _ in processes]
+            for process in processes:
+                process.join(timeout=30)
+            self.assertEqual(zvm.tokens_issued, 1)
+        self.assertEqual(set(tokens), {"token-1"})
+        shutil.rmtree(directory, ignore_errors=True)
+        warnings.resetwarnings()
+
+if __name__ == '__main__':
+    unittest.main()
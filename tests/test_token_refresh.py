@@ -0,0 +1,49 @@
+import unittest
+import threading
+from unittest.mock import patch, MagicMock
+from zvma import ZVMAClient
+from mock_client import token_response
+
+class TestTokenRefresh(unittest.TestCase):
+    def setUp(self):
+        with patch('requests.Session.request', return_value=token_response("token-1")):
+            self.client = ZVMAClient(zvm_address="example.com", client_id="zerto-api", client_secret="secret")
+            self.client.authenticate()
+
+    def test_token_refreshed_before_expiry(self):
+        self.client._token_expires_at = 0
+        with patch.object(self.client.transport.session, 'request', return_value=token_response("token-2")) as mock_request:
+            self.assertEqual(self.client.token, "token-2")
+            self.assertEqual(self.client.token, "token-2")
+        self.assertEqual(mock_request.call_count, 1)
+
+    def test_localsite_uses_current_token(self):
+        self.client._token = "token-3"
+        self.assertEqual(self.client.localsite.headers["Authorization"], "Bearer token-3")
+
+    def test_401_is_replayed_once_with_new_token(self):
+        unauthorized = MagicMock(status_code=401)
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"Status": {"State": 0, "Progress": 100}}
+        responses = [unauthorized, token_response("token-2"), ok]
+        with patch.object(self.client.transport.session, 'request', side_effect=responses) as mock_request:
+            self.client.sessions.get_sessions()
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(mock_request.call_args.kwargs['headers']['Authorization'], "Bearer token-2")
+
+    def test_concurrent_refresh_is_shared(self):
+        calls = []
+        def fake_request(method, url, **kwargs):
+            calls.append(url)
+            return token_response("token-2")
+        with patch.object(self.client.transport.session, 'request', side_effect=fake_request):
+            threads = [threading.Thread(target=self.client.refresh_token, kwargs={"stale_token": "token-1"}) for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.client.token, "token-2")
+
+if __name__ == '__main__':
+    unittest.main()
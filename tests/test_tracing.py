@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from zvma import tracing
+from mock_client import authenticated_client
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+except ImportError:
+    trace = None
+
+def task_response(state, progress):
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"Status": {"State": state, "Progress": progress}}
+    return response
+
+@unittest.skipIf(trace is None, "opentelemetry-sdk is not installed")
+class TestTracing(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(cls.exporter))
+        trace.set_tracer_provider(provider)
+
+    def setUp(self):
+        self.exporter.clear()
+        self.client = authenticated_client()
+        self.exporter.clear()
+
+    @patch('time.sleep')
+    def test_task_wait_spans(self, mock_sleep):
+        responses = [task_response(1, 50), task_response(6, 100)]
+        with patch.object(self.client.transport.session, 'request', side_effect=responses):
+            self.client.tasks.wait_for_task_completion("task-1", interval=2)
+
+        spans = {span.context.span_id: span for span in self.exporter.get_finished_spans()}
+        parent = next(span for span in spans.values() if span.name == "Tasks.wait_for_task_completion")
+        children = [span for span in spans.values() if span.parent and span.parent.span_id == parent.context.span_id]
+        self.assertEqual([span.name for span in children],
+                         ["Tasks.wait_for_task_completion.poll", "zvma.sleep"] * 2)
+        http_spans = [span for span in spans.values() if span.name == "HTTP GET"]
+        self.assertEqual(len(http_spans), 2)
+        self.assertEqual(http_spans[0].attributes["url.template"], "/v1/tasks/{id}")
+        self.assertEqual(http_spans[0].attributes["http.response.status_code"], 200)
+        self.assertEqual(spans[http_spans[0].parent.span_id].name, "Tasks.wait_for_task_completion.poll")
+        self.assertEqual(children[1].attributes["zvma.sleep.seconds"], 2)
+
+class TestTracingDisabled(unittest.TestCase):
+    def test_span_without_opentelemetry(self):
+        with patch.object(tracing, 'otel_trace', None):
+            with tracing.span('noop', attribute=1) as current_span:
+                tracing.set_attributes(current_span, other=2)
+        self.assertIsNone(current_span)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from zvma import ZVMAClient
+from zvma.transport import Transport
+from mock_client import authenticated_client
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.client = authenticated_client(verify_certificate=False, pool_maxsize=4)
+
+    def test_adapter_pool_settings(self):
+        adapter = self.client.transport.session.get_adapter("https://example.com/v1/vpgs")
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_pool_sized_for_workers(self):
+        client = ZVMAClient(zvm_address="example.com", client_id="zerto-api", client_secret="secret", max_workers=32)
+        adapter = client.transport.session.get_adapter("https://example.com/v1/vpgs")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(client.transport.get_limiter("https://example.com/v1/vpgs").limit, 32)
+
+    def test_resource_classes_share_session(self):
+        mock_response = MagicMock(status_code=200)
+        mock_response.json.return_value = [{"AlertIdentifier": "a1"}]
+        with patch.object(self.client.transport.session, 'request', return_value=mock_response) as mock_request:
+            self.client.alerts.get_alerts()
+            self.client.localsite.get_local_site()
+        self.assertEqual(mock_request.call_count, 2)
+        method, url = mock_request.call_args_list[0].args
+        self.assertEqual((method, url), ("GET", "https://example.com/v1/alerts"))
+        self.assertFalse(mock_request.call_args_list[0].kwargs['verify'])
+
+    def test_verify_default(self):
+        transport = Transport(verify_certificate=True)
+        with patch.object(transport.session, 'request', return_value=MagicMock(status_code=200)) as mock_request:
+            transport.get("https://example.com/v1/tasks")
+        self.assertTrue(mock_request.call_args.kwargs['verify'])
+
+if __name__ == '__main__':
+    unittest.main()
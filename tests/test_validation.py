@@ -0,0 +1,115 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from zvma.exceptions import ZVMAValidationError
+from zvma.validation import validate_vpg_settings, check_vpg_settings, get_validator
+from mock_client import authenticated_client
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASIC = {"Name": "vpg1", "VpgType": "Remote", "RpoInSeconds": 300, "JournalHistoryInHours": 24, "Priority": "Medium",
+         "UseWanCompression": True, "ProtectedSiteIdentifier": "site-a", "RecoverySiteIdentifier": "site-b"}
+JOURNAL = {"DatastoreIdentifier": "ds-1", "Limitation": {"HardLimitInMB": 153600, "WarningThresholdInMB": 115200}}
+RECOVERY = {"DefaultHostClusterIdentifier": "cluster-1", "DefaultDatastoreIdentifier": "ds-1", "DefaultFolderIdentifier": "folder-1"}
+NETWORKS = {"Failover": {"Hypervisor": {"DefaultNetworkIdentifier": "net-1"}},
+            "FailoverTest": {"Hypervisor": {"DefaultNetworkIdentifier": "net-2"}}}
+PAYLOAD = {"Basic": BASIC, "Journal": JOURNAL, "Recovery": RECOVERY, "Networks": NETWORKS}
+# Recovery section as built by main.py and examples/vpg_vms_example.py / vpg_failover_example.py
+EXAMPLE_RECOVERY = {"DefaultHostIdentifier": "host-1", "DefaultDatastoreIdentifier": "ds-1",
+                    "DefaultResourcePoolIdentifier": "rp-1", "DefaultFolderIdentifier": "folder-1"}
+
+class TestValidation(unittest.TestCase):
+    def test_valid_payload(self):
+        self.assertEqual(validate_vpg_settings(PAYLOAD), [])
+        self.assertEqual(validate_vpg_settings({"vpgIdentifier": "vpg-1", "basic": {"name": "vpg1"}, "Journal": None}), [])
+        self.assertEqual(get_validator('VpgSettingsBasicApi')(BASIC), [])
+
+    def test_reports_all_errors(self):
+        payload = {"Basic": dict(BASIC, Name=1, RpoInSecond=300, JournalHistoryInHours="24"),
+                   "Journal": {"Limitation": {"HardLimitInMB": 2 ** 40}},
+                   "Networks": [],
+                   "Vms": [{"VmIdentifier": 3}]}
+        warnings = []
+        self.assertEqual(validate_vpg_settings(payload, warnings=warnings), [
+            "Basic.Name: expected a string, got int",
+            "Basic.JournalHistoryInHours: expected an integer, got str",
+            "Journal.Limitation.HardLimitInMB: 1099511627776 is out of the int32 range",
+            "Networks: expected an object, got list",
+            "Vms[0].VmIdentifier: expected a string, got int",
+        ])
+        self.assertEqual(warnings, ["Basic.RpoInSecond: unknown field (did you mean 'rpoInSeconds'?)"])
+        self.assertIn("Basic.RpoInSecond: unknown field (did you mean 'rpoInSeconds'?)",
+                      validate_vpg_settings(payload, strict=True))
+        self.assertEqual(validate_vpg_settings([]), ["<payload>: expected an object, got list"])
+
+    def test_booleans_and_nulls(self):
+        self.assertEqual(validate_vpg_settings({"LongTermRetention": {"Enabled": None, "SchedulerPolicy": None}}),
+                         ["LongTermRetention.Enabled: must not be null"])
+        self.assertEqual(validate_vpg_settings({"Basic": {"RpoInSeconds": True}}),
+                         ["Basic.RpoInSeconds: expected an integer, got bool"])
+
+    def test_zvm_returned_settings(self):
+        with open(os.path.join(REPO_ROOT, 'vpg_settings_example.json'), encoding='utf-8') as f:
+            settings = json.load(f)[0]
+        warnings = []
+        self.assertEqual(validate_vpg_settings(settings, warnings=warnings), [])
+        self.assertEqual(warnings, ["Vms[0].Volumes[0].IsSwap: unknown field", "Vms[1].Volumes[0].IsSwap: unknown field"])
+        self.assertEqual(len(validate_vpg_settings(settings, strict=True)), 2)
+
+    def test_example_payloads(self):
+        payload = {"Basic": BASIC, "Journal": JOURNAL, "Recovery": EXAMPLE_RECOVERY, "Networks": NETWORKS}
+        self.assertEqual(validate_vpg_settings(payload), [])
+        self.assertEqual(validate_vpg_settings(payload, strict=True),
+                         ["Recovery.DefaultResourcePoolIdentifier: unknown field (did you mean 'resourcePoolIdentifier'?)"])
+
+    def test_check_raises_with_errors(self):
+        with self.assertLogs('zvma.validation', 'WARNING'):
+            check_vpg_settings({"Basic": {"Nmae": "vpg1"}})
+        with self.assertRaises(ZVMAValidationError) as context:
+            check_vpg_settings({"Basic": {"Nmae": "vpg1"}}, strict=True)
+        self.assertEqual(len(context.exception.errors), 1)
+        self.assertIsInstance(context.exception, ValueError)
+
+    def test_fast(self):
+        validate_vpg_settings(PAYLOAD)
+        started = time.perf_counter()
+        for _ in range(1000):
+            validate_vpg_settings(PAYLOAD)
+        self.assertLess((time.perf_counter() - started) / 1000, 0.001)
+
+    def test_generated_module_is_current(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'schemas.py')
+            subprocess.run([sys.executable, os.path.join(REPO_ROOT, 'tools', 'generate_schemas.py'), '--output', output],
+                           check=True, capture_output=True)
+            with open(output, encoding='utf-8') as generated, open(os.path.join(REPO_ROOT, 'zvma', 'schemas.py'), encoding='utf-8') as current:
+                self.assertEqual(generated.read(), current.read())
+
+class TestVpgSettingsValidation(unittest.TestCase):
+    def setUp(self):
+        self.client = authenticated_client()
+
+    def test_invalid_payload_is_not_sent(self):
+        with patch.object(self.client.transport.session, 'request') as mock_request:
+            with self.assertRaises(ZVMAValidationError):
+                self.client.vpgs.create_vpg_settings(basic={"Name": 5}, journal=JOURNAL, recovery=RECOVERY, networks=NETWORKS)
+            with self.assertRaises(ZVMAValidationError):
+                self.client.vpgs.update_vpg_settings("settings-1", {"Basic": {"Name": 5}})
+        mock_request.assert_not_called()
+
+    def test_valid_payload_is_sent(self):
+        response = MagicMock(status_code=200, headers={}, content=b'"settings-1"')
+        response.json.return_value = "settings-1"
+        with patch.object(self.client.transport.session, 'request', return_value=response) as mock_request:
+            self.assertEqual(self.client.vpgs.create_vpg_settings(BASIC, JOURNAL, RECOVERY, NETWORKS), "settings-1")
+            self.client.vpgs.create_vpg_settings(BASIC, JOURNAL, EXAMPLE_RECOVERY, NETWORKS)
+            self.client.vpgs.update_vpg_settings("settings-1", {"Basic": {"Name": 5}}, validate=False)
+        self.assertEqual(mock_request.call_count, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Minimal local stand-in for a ZVM used by the stress tests and benchmarks.
+
+Serves the Keycloak token endpoint and canned JSON for any other path over HTTPS with a throwaway
+self-signed certificate (created with the `openssl` command line tool). Clients must be created
+with verify_certificate=False.
+
+Usage:
+    with ZVMStandIn(routes={'/v1/vpgs': [{'VpgName': 'vpg1'}]}, latency=0.005) as zvm:
+        client = ZVMAClient(zvm.address, 'client-id', 'secret', verify_certificate=False)
+"""
+
+import gzip
+import json
+import os
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TOKEN_PATH = '/auth/realms/zerto/protocol/openid-connect/token'
+
+
+def create_self_signed_certificate(directory):
+    """Write cert.pem/key.pem for localhost into `directory` and return their paths."""
+    if shutil.which('openssl') is None:
+        raise RuntimeError("The ZVM stand-in needs the 'openssl' command line tool to create a certificate")
+    cert_file = os.path.join(directory, 'cert.pem')
+    key_file = os.path.join(directory, 'key.pem')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                    '-subj', '/CN=localhost', '-keyout', key_file, '-out', cert_file],
+                   check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return cert_file, key_file
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self):
+        standin = self.server.standin
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        path = self.path.split('?', 1)[0]
+        with standin.lock:
+            standin.requests.append((self.command, path))
+            standin.in_flight += 1
+            standin.max_in_flight = max(standin.max_in_flight, standin.in_flight)
+        try:
+            if standin.latency:
+                time.sleep(standin.latency)
+
+            if path == TOKEN_PATH:
+                with standin.lock:
+                    standin.tokens_issued += 1
+                    token = f"token-{standin.tokens_issued}"
+                    standin.tokens[token] = time.monotonic() + standin.token_lifetime
+                status, payload = 200, {'access_token': token, 'expires_in': standin.token_lifetime}
+            elif not standin.is_valid(self.headers.get('Authorization')):
+                status, payload = 401, {'Message': 'Missing, unknown or expired bearer token'}
+            else:
+                status, payload = 200, standin.routes.get(path, [])
+        finally:
+            with standin.lock:
+                standin.in_flight -= 1
+
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+        compress = standin.compress and 'gzip' in self.headers.get('Accept-Encoding', '')
+        if compress:
+            body = gzip.compress(body)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if compress:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+
+class ZVMStandIn:
+    """
+    Threaded HTTPS server answering like a ZVM.
+
+    :param routes: {path: JSON-serialisable payload or raw bytes} returned for GET/POST/PUT/DELETE of that path.
+    :param latency: Seconds each request is delayed, to emulate a busy appliance.
+    :param token_lifetime: `expires_in` of issued tokens.
+    :param compress: gzip response bodies for clients that accept it.
+    """
+
+    def __init__(self, routes=None, latency=0.0, token_lifetime=3600, compress=False):
+        self.routes = dict(routes or {})
+        self.compress = compress
+        self.latency = latency
+        self.token_lifetime = token_lifetime
+        self.lock = threading.Lock()
+        self.requests = []
+        self.tokens = {}
+        self.tokens_issued = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._tempdir = None
+        self._server = None
+        self._thread = None
+
+    def is_valid(self, authorization):
+        token = (authorization or '').replace('Bearer ', '', 1)
+        with self.lock:
+            valid = self.tokens.get(token, 0) > time.monotonic()
+            if not valid:
+                self.rejected += 1
+        return valid
+
+    @property
+    def address(self):
+        """host:port to pass as zvm_address."""
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self):
+        self._tempdir = tempfile.mkdtemp(prefix='zvm-standin-')
+        cert_file, key_file = create_self_signed_certificate(self._tempdir)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_file, key_file)
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 1024
+        self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+        self._server.standin = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._tempdir is not None:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,147 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Generate zvma/endpoints.py, the low-level endpoint layer with one method per operation of
+10.0_U6_Swagger.json. The runtime it builds on is the hand-written zvma/endpoint.py.
+
+Usage:
+    python tools/generate_endpoints.py [--swagger 10.0_U6_Swagger.json] [--output zvma/endpoints.py]
+"""
+
+import argparse
+import collections
+import json
+import os
+import re
+import textwrap
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+METHODS = ('get', 'post', 'put', 'patch', 'delete')
+TYPES = {'string': 'str', 'boolean': 'bool', 'integer': 'int', 'number': 'float'}
+BODY_ARGUMENTS = {'application/json': 'json', 'application/x-www-form-urlencoded': 'data', 'multipart/form-data': 'files'}
+
+
+def snake_case(name):
+    return re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name).replace('-', '_').lower()
+
+
+def legal_header():
+    with open(os.path.join(REPO_ROOT, 'zvma', 'common.py'), encoding='utf-8') as common:
+        return ''.join(common.readlines()[:10]).rstrip('\n')
+
+
+def operations(swagger):
+    """Yield (method name, http method, path, operation) with unique method names."""
+    found = [(method, path, operation) for path, item in swagger['paths'].items()
+             for method, operation in item.items() if method in METHODS]
+    counts = collections.Counter(operation['operationId'] for _, _, operation in found)
+    for method, path, operation in found:
+        name = snake_case(operation['operationId'])
+        if counts[operation['operationId']] > 1:
+            name = f"{name}_{method}"
+        yield name, method.upper(), path, operation
+
+
+def tuple_source(items):
+    return f"({', '.join(items)},)" if len(items) == 1 else f"({', '.join(items)})"
+
+
+def annotation(parameter):
+    return TYPES.get(parameter.get('schema', {}).get('type'), 'str')
+
+
+def docstring(operation, method, path):
+    summary = (operation.get('summary') or operation['operationId']).replace('\\', '\\\\').replace('"""', "'''")
+    lines = textwrap.wrap(summary, 100) + ['', f"{method} {path}"]
+    return ['        """'] + [f"        {line}" if line else '' for line in lines] + ['        """']
+
+
+def generate(swagger):
+    constants = []
+    methods = []
+    tag = None
+    for name, method, path, operation in operations(swagger):
+        parameters = operation.get('parameters', [])
+        path_params = sorted((p for p in parameters if p['in'] == 'path'), key=lambda p: path.index('{' + p['name'] + '}'))
+        query_params = [p for p in parameters if p['in'] == 'query']
+        body = None
+        if 'requestBody' in operation:
+            body = next(BODY_ARGUMENTS[content] for content in operation['requestBody']['content'] if content in BODY_ARGUMENTS)
+        authenticated = not path.startswith('/auth/')
+        constant = f"_{name.upper()}"
+
+        arguments = [f"{snake_case(p['name'])}: {annotation(p)}" for p in path_params]
+        arguments += [f"{snake_case(p['name'])}: {annotation(p)}" for p in query_params if p.get('required')]
+        arguments += [f"{snake_case(p['name'])}: {annotation(p)} = None" for p in query_params if not p.get('required')]
+        if body:
+            arguments.append('body: dict = None')
+        names = [argument.split(':')[0] for argument in arguments]
+        assert len(names) == len(set(names)), (path, names)
+        arguments.append('**options')
+
+        endpoint = [repr(method), repr(path), repr(operation['operationId'])]
+        if query_params or body or not authenticated:
+            endpoint.append(tuple_source([repr(p['name']) for p in query_params]))
+        if body or not authenticated:
+            endpoint.append(repr(body))
+        if not authenticated:
+            endpoint.append('authenticated=False')
+        constants.append(f"{constant} = Endpoint({', '.join(endpoint)})")
+
+        path_values = tuple_source([snake_case(p['name']) for p in path_params]) if path_params else 'None'
+        query_values = tuple_source([snake_case(p['name']) for p in query_params]) if query_params else 'None'
+        operation_tag = (operation.get('tags') or ['Other'])[0]
+        if operation_tag != tag:
+            tag = operation_tag
+            methods.append(f"    # {tag}")
+            methods.append('')
+        methods.append(f"    def {name}(self, {', '.join(arguments)}):")
+        methods.extend(docstring(operation, method, path))
+        methods.append(f"        return self._call({constant}, {path_values}, {query_values}, {'body' if body else 'None'}, options)")
+        methods.append('')
+
+    out = [legal_header(), '',
+           '# Generated from 10.0_U6_Swagger.json by tools/generate_endpoints.py; do not edit by hand.', '',
+           '"""',
+           'Low-level endpoint layer with one method per operation of the ZVM REST API.',
+           '',
+           'Methods are named after the swagger operationId and take the path parameters positionally,',
+           'then the query parameters and the request body as keywords; parameters left as None are not',
+           'sent. Any other keyword (timeout, deadline, priority, stream, ...) goes to Transport.request.',
+           'Every method returns the requests.Response.',
+           '',
+           '    response = client.api.get_vpg(vpg_identifier)',
+           '    checkpoints = client.api.get_vpg_checkpoint_all(vpg_identifier, start_date="2024-11-13T00:00:00Z").json()',
+           '"""', '',
+           'from .endpoint import Endpoint, EndpointLayer', '']
+    out += constants
+    out += ['', '',
+            'class Endpoints(EndpointLayer):',
+            f'    """All {len(constants)} operations of the ZVM REST API; available as client.api."""', '']
+    out += methods
+    return '\n'.join(out).rstrip('\n') + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--swagger', default=os.path.join(REPO_ROOT, '10.0_U6_Swagger.json'))
+    parser.add_argument('--output', default=os.path.join(REPO_ROOT, 'zvma', 'endpoints.py'))
+    args = parser.parse_args()
+    with open(args.swagger, encoding='utf-8') as swagger_file:
+        source = generate(json.load(swagger_file))
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        output_file.write(source)
+    print(f"wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
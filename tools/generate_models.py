@@ -0,0 +1,191 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Generate zvma/models.py, the slotted response models of the core ZVM entities, from the
+response schemas in 10.0_U6_Swagger.json.
+
+Usage:
+    python tools/generate_models.py [--swagger 10.0_U6_Swagger.json] [--output zvma/models.py]
+"""
+
+import argparse
+import json
+import os
+import re
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_PREFIX = 'Zerto.Zvm.Api.Interfaces.'
+
+# (class name, schema, {property: converter}, description). Converters are either
+# ('value', Enum) for integer enums, ('name', Enum) for enums sent by name, or ('model', ClassName).
+MODELS = [
+    ('TaskStatus', 'Tasks.TaskStatusApi', {'state': ('value', 'ZertoTaskStates')},
+     'State and progress of a task.'),
+    ('Task', 'Tasks.TaskApi', {'type': ('name', 'ZertoTaskTypes'), 'status': ('model', 'TaskStatus')},
+     'Task as returned by GET /v1/tasks.'),
+    ('VPG', 'Vpgs.VpgApi', {'status': ('value', 'ZertoVPGStatus'), 'subStatus': ('value', 'ZertoVPGSubstatus'),
+                            'priority': ('value', 'ZertoVPGPriority')},
+     'VPG as returned by VPGs.list_vpgs.'),
+    ('VM', 'Vms.VmApi', {'status': ('value', 'ZertoVPGStatus'), 'subStatus': ('value', 'ZertoVPGSubstatus'),
+                         'priority': ('value', 'ZertoVPGPriority')},
+     'Protected VM as returned by VMs.list_vms.'),
+    ('Alert', 'Alerts.AlertApi', {'level': ('name', 'ZertoAlertLevel'), 'entity': ('name', 'ZertoAlertEntity'),
+                                  'helpIdentifier': ('name', 'ZertoAlertHelpIdentifier')},
+     'Alert as returned by Alerts.get_alerts.'),
+    ('Event', 'Events.EventApi', {'eventType': ('value', 'ZertoEventType'),
+                                  'eventCategory': ('name', 'ZertoEventCategory')},
+     'Event as returned by Events.list_events.'),
+    ('Checkpoint', 'Vpgs.CheckpointApi', {},
+     'Checkpoint as returned by VPGs.list_checkpoints.'),
+]
+
+# The swagger schemas leave out the identifiers every list response carries.
+EXTRA_PROPERTIES = {
+    'Task': ['taskIdentifier'],
+    'VPG': ['vpgIdentifier'],
+    'VM': ['vmIdentifier', 'vpgIdentifier'],
+    'Alert': ['alertIdentifier'],
+    'Event': ['eventIdentifier'],
+}
+
+# Properties whose JSON key or attribute name is not the plain case conversion.
+KEY_OVERRIDES = {'ioPs': 'IOPs'}
+SLOT_OVERRIDES = {'ioPs': 'iops'}
+
+
+def snake_case(name):
+    return SLOT_OVERRIDES.get(name) or re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+
+
+def pascal_case(name):
+    return KEY_OVERRIDES.get(name) or name[0].upper() + name[1:]
+
+
+def legal_header():
+    # Generated modules carry the same disclaimer as the hand-written ones.
+    with open(os.path.join(REPO_ROOT, 'zvma', 'common.py'), encoding='utf-8') as common:
+        return ''.join(line for line in common.readlines()[:10]).rstrip('\n')
+
+
+def generate(swagger):
+    schemas = swagger['components']['schemas']
+    enums = sorted({converter[1] for _, _, converters, _ in MODELS for converter in converters.values()
+                    if converter[0] != 'model'})
+    out = [legal_header(), '',
+           '# Generated from 10.0_U6_Swagger.json by tools/generate_models.py; do not edit by hand.', '',
+           '"""',
+           'Slotted response models of the core ZVM entities.',
+           '',
+           'Resource methods return them instead of dicts when called with `as_models=True`. Fields use',
+           'snake_case names of the swagger properties, status-like fields are parsed into the enums of',
+           'zvma.common (values the enum does not know are kept as-is), and other nested objects stay dicts.',
+           'Only the fields of the swagger schema are kept; `to_dict()` rebuilds the API representation.',
+           '"""', '',
+           'from enum import Enum',
+           f'from .common import {", ".join(enums)}', '', '',
+           'def _by_value(enum):',
+           '    members = {member.value: member for member in enum}',
+           '    return lambda value: members.get(value, value)', '', '',
+           'def _by_name(enum):',
+           '    members = dict(enum.__members__)',
+           '    return lambda value: members.get(value, value) if isinstance(value, str) else value', '', '',
+           'class Model:',
+           '    """Base class of the generated models."""',
+           '    __slots__ = ()',
+           '    _keys = ()',
+           '    _named_enums = frozenset()', '',
+           '    @classmethod',
+           '    def from_dict(cls, data):',
+           '        raise NotImplementedError', '',
+           '    @classmethod',
+           '    def from_list(cls, items):',
+           '        """Convert a list response; None (e.g. a failed lookup) becomes an empty list."""',
+           '        from_dict = cls.from_dict',
+           '        return [from_dict(item) for item in items or ()]', '',
+           '    def to_dict(self):',
+           '        """The entity as the API represents it, with PascalCase keys."""',
+           '        data = {}',
+           '        for slot, key in zip(self.__slots__, self._keys):',
+           '            value = getattr(self, slot)',
+           '            if isinstance(value, Enum):',
+           '                value = value.name if slot in self._named_enums else value.value',
+           '            elif isinstance(value, Model):',
+           '                value = value.to_dict()',
+           '            data[key] = value',
+           '        return data', '',
+           '    def __eq__(self, other):',
+           '        if type(other) is not type(self):',
+           '            return NotImplemented',
+           '        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)', '',
+           '    def __repr__(self):',
+           "        fields = ', '.join(f'{slot}={getattr(self, slot)!r}' for slot in self.__slots__)",
+           "        return f'{self.__class__.__name__}({fields})'", '', '',
+           'def convert(model, result):',
+           '    """Convert a response (a list of entities or a single one) into `model` instances."""',
+           '    if isinstance(result, list):',
+           '        return model.from_list(result)',
+           '    if isinstance(result, dict) and result:',
+           '        return model.from_dict(result)',
+           '    return result', '', '']
+    converters_defined = set()
+    for class_name, schema_name, converters, description in MODELS:
+        properties = EXTRA_PROPERTIES.get(class_name, []) + list(schemas[SCHEMA_PREFIX + schema_name]['properties'])
+        for prop, (kind, target) in converters.items():
+            if kind != 'model' and (kind, target) not in converters_defined:
+                converters_defined.add((kind, target))
+                out.insert(out.index('class Model:'), f'_{kind}_{target} = _by_{kind}({target})')
+        slots = [snake_case(prop) for prop in properties]
+        keys = [pascal_case(prop) for prop in properties]
+        named = sorted(snake_case(prop) for prop, (kind, _) in converters.items() if kind == 'name')
+        out.append(f'class {class_name}(Model):')
+        out.append(f'    """{description} ({SCHEMA_PREFIX}{schema_name})"""')
+        out.append(f'    __slots__ = ({", ".join(repr(slot) for slot in slots)},)')
+        out.append(f'    _keys = ({", ".join(repr(key) for key in keys)},)')
+        if named:
+            out.append(f'    _named_enums = frozenset(({", ".join(repr(slot) for slot in named)},))')
+        out.append('')
+        out.append('    @classmethod')
+        out.append('    def from_dict(cls, data):')
+        out.append('        self = cls.__new__(cls)')
+        out.append('        get = data.get')
+        for prop, slot, key in zip(properties, slots, keys):
+            converter = converters.get(prop)
+            if converter is None:
+                out.append(f"        self.{slot} = get({key!r})")
+            elif converter[0] == 'model':
+                out.append(f"        {slot} = get({key!r})")
+                out.append(f"        self.{slot} = {converter[1]}.from_dict({slot}) if isinstance({slot}, dict) else {slot}")
+            else:
+                out.append(f"        self.{slot} = _{converter[0]}_{converter[1]}(get({key!r}))")
+        out.append('        return self')
+        out.append('')
+        out.append('')
+    model_index = out.index('class Model:')
+    out.insert(model_index, '')
+    out.insert(model_index, '')
+    return '\n'.join(out).rstrip('\n') + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--swagger', default=os.path.join(REPO_ROOT, '10.0_U6_Swagger.json'))
+    parser.add_argument('--output', default=os.path.join(REPO_ROOT, 'zvma', 'models.py'))
+    args = parser.parse_args()
+    with open(args.swagger, encoding='utf-8') as swagger_file:
+        source = generate(json.load(swagger_file))
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        output_file.write(source)
+    print(f"wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Generate zvma/schemas.py, the request schemas zvma.validation compiles into local validators, from
+10.0_U6_Swagger.json. Only the schemas reachable from ROOTS are kept, reduced to the keywords the
+validators understand.
+
+Usage:
+    python tools/generate_schemas.py [--swagger 10.0_U6_Swagger.json] [--output zvma/schemas.py]
+"""
+
+import argparse
+import json
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REF_PREFIX = '#/components/schemas/'
+ROOTS = ['Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsApi']
+KEYWORDS = ('$ref', 'type', 'format', 'nullable', 'enum', 'items', 'properties', 'additionalProperties')
+
+
+def legal_header():
+    with open(os.path.join(REPO_ROOT, 'zvma', 'common.py'), encoding='utf-8') as common:
+        return ''.join(common.readlines()[:10]).rstrip('\n')
+
+
+def reduce(schema, pending):
+    """Keep the validation keywords of `schema`, queueing the schemas it references."""
+    reduced = {}
+    for keyword in KEYWORDS:
+        if keyword not in schema:
+            continue
+        value = schema[keyword]
+        if keyword == '$ref':
+            value = value[len(REF_PREFIX):]
+            pending.append(value)
+        elif keyword == 'items':
+            value = reduce(value, pending)
+        elif keyword == 'properties':
+            value = {name: reduce(property_schema, pending) for name, property_schema in value.items()}
+        elif keyword == 'additionalProperties' and isinstance(value, dict):
+            value = reduce(value, pending)
+        reduced[keyword] = value
+    return reduced
+
+
+def format_schema(schema):
+    lines = ['{']
+    for keyword, value in schema.items():
+        if keyword == 'properties':
+            lines.append("        'properties': {")
+            lines += [f"            {name!r}: {property_schema!r}," for name, property_schema in value.items()]
+            lines.append('        },')
+        else:
+            lines.append(f"        {keyword!r}: {value!r},")
+    lines.append('    }')
+    return '\n'.join(lines)
+
+
+def generate(swagger):
+    schemas = swagger['components']['schemas']
+    pending = list(ROOTS)
+    reduced = {}
+    while pending:
+        name = pending.pop()
+        if name not in reduced:
+            reduced[name] = reduce(schemas[name], pending)
+    body = '\n'.join(f"    {name!r}: {format_schema(schema)}," for name, schema in sorted(reduced.items()))
+    return '\n'.join([
+        legal_header(), '',
+        '# Generated from 10.0_U6_Swagger.json by tools/generate_schemas.py; do not edit by hand.', '',
+        '"""Request schemas of the VPG settings API, reduced to what zvma.validation checks."""', '',
+        f"ROOTS = {ROOTS!r}", '',
+        'SCHEMAS = {', body, '}', ''])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--swagger', default=os.path.join(REPO_ROOT, '10.0_U6_Swagger.json'))
+    parser.add_argument('--output', default=os.path.join(REPO_ROOT, 'zvma', 'schemas.py'))
+    args = parser.parse_args()
+    with open(args.swagger, encoding='utf-8') as swagger_file:
+        source = generate(json.load(swagger_file))
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        output_file.write(source)
+    print(f"wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
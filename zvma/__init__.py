@@ -1 +1,17 @@
-from .zvma import ZVMAClient
\ No newline at end of file
+import logging
+
+# Silent unless the application configures logging; see zvma.log
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Submodules are imported on first use so that `import zvma` has no side effects and stays cheap
+__all__ = ['ZVMAClient', 'ZVMAFleet']
+
+
+def __getattr__(name):
+    if name == 'ZVMAClient':
+        from .zvma import ZVMAClient
+        return ZVMAClient
+    if name == 'ZVMAFleet':
+        from .fleet import ZVMAFleet
+        return ZVMAFleet
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,67 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncAlerts:
+    def __init__(self, client):
+        self.client = client
+
+    async def get_alerts(self, start_date=None, end_date=None, vpg_name=None, zorg_identifier=None,
+                         site_identifier=None, level=None, entity=None, help_identifier=None, is_dismissed=None,
+                         alert_identifier=None):
+        """
+        Fetches alerts with optional filters or a specific alert if `alert_identifier` is provided.
+        See zvma.alerts.Alerts.get_alerts for the parameters.
+        """
+        if alert_identifier:
+            return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/alerts/{alert_identifier}")
+
+        params = {
+            'startDate': start_date,
+            'endDate': end_date,
+            'zorgIdentifier': zorg_identifier,
+            'siteIdentifier': site_identifier,
+            'level': level,
+            'entity': entity,
+            'helpIdentifier': help_identifier,
+            'isDismissed': str(is_dismissed).lower() if is_dismissed is not None else None
+        }
+        if vpg_name:
+            vpg = await self.client.vpgs.list_vpgs(vpg_name=vpg_name)
+            if not vpg:
+                logger.warning("VPG with name %s not found", vpg_name)
+                return []
+            params['vpgIdentifier'] = vpg.get('VpgIdentifier')
+
+        alerts = await self.client.transport.get(f"https://{self.client.zvm_address}/v1/alerts", params=params)
+        return alerts or []
+
+    async def dismiss_alert(self, alert_identifier):
+        logger.info('AsyncAlerts.dismiss_alert(alert_identifier=%s)', alert_identifier)
+        await self.client.transport.post(f"https://{self.client.zvm_address}/v1/alerts/{alert_identifier}/dismiss")
+        return f"Alert {alert_identifier} dismissed successfully."
+
+    async def undismiss_alert(self, alert_identifier):
+        logger.info('AsyncAlerts.undismiss_alert(alert_identifier=%s)', alert_identifier)
+        await self.client.transport.post(f"https://{self.client.zvm_address}/v1/alerts/{alert_identifier}/undismiss")
+        return f"Alert {alert_identifier} undismissed successfully."
+
+    async def get_alert_levels(self):
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/alerts/levels") or []
+
+    async def get_alert_entities(self):
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/alerts/entities") or []
+
+    async def get_alert_help_identifiers(self):
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/alerts/helpidentifiers") or []
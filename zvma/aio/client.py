@@ -0,0 +1,135 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import asyncio
+import logging
+import time
+
+from .transport import AsyncTransport, DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_KEEPALIVE_CONNECTIONS, DEFAULT_TIMEOUT
+from .tasks import AsyncTasks
+from .vpgs import AsyncVPGs
+from .vms import AsyncVMs
+from .alerts import AsyncAlerts
+from .events import AsyncEvents
+from .virtualization_sites import AsyncVirtualizationSites
+from .vras import AsyncVRA
+from .recovery_reports import AsyncRecoveryReports
+from ..zvma import DEFAULT_TOKEN_REFRESH_MARGIN
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncZVMAClient:
+    """
+    asyncio client for the ZVM API.
+
+    Mirrors ZVMAClient for the resource classes used by monitoring and orchestration
+    services (VPGs, VMs, Tasks, Alerts, Events, VirtualizationSites, VRA, RecoveryReports).
+    All coroutines share one non-blocking connection pool, so hundreds of concurrent reads
+    and task waits can run on a single event loop.
+
+    Usage:
+        async with AsyncZVMAClient(zvm_address, client_id, client_secret) as client:
+            vpgs = await client.vpgs.list_vpgs()
+    """
+
+    def __init__(self, zvm_address, client_id, client_secret, verify_certificate=True,
+                 max_connections=DEFAULT_MAX_CONNECTIONS, max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                 token_refresh_margin=DEFAULT_TOKEN_REFRESH_MARGIN, retry_policy=None, timeout=DEFAULT_TIMEOUT,
+                 deadline=None, codec='auto', metrics=True, http2=None):
+        self.zvm_address = zvm_address
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.verify_certificate = verify_certificate
+        self.token_refresh_margin = token_refresh_margin
+        self.transport = AsyncTransport(verify_certificate=verify_certificate,
+                                        max_connections=max_connections,
+                                        max_keepalive_connections=max_keepalive_connections,
+                                        auth=self,
+                                        retry_policy=retry_policy,
+                                        timeout=timeout,
+                                        deadline=deadline,
+                                        codec=codec,
+                                        metrics=metrics,
+                                        http2=http2)
+        self.token = None
+        self.token_expiry = None
+        self._token_expires_at = None
+        self._token_lock = asyncio.Lock()
+        self.tasks = AsyncTasks(self)
+        self.vpgs = AsyncVPGs(self)
+        self.vms = AsyncVMs(self)
+        self.alerts = AsyncAlerts(self)
+        self.events = AsyncEvents(self)
+        self.virtualization_sites = AsyncVirtualizationSites(self)
+        self.vras = AsyncVRA(self)
+        self.recovery_reports = AsyncRecoveryReports(self)
+
+    async def __aenter__(self):
+        await self.get_token()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    @property
+    def metrics(self):
+        """Per-endpoint request metrics (zvma.metrics.ClientMetrics), or None if disabled."""
+        return self.transport.metrics
+
+    async def aclose(self):
+        """Release the pooled connections held by this client."""
+        await self.transport.aclose()
+
+    def _token_needs_refresh(self):
+        if self._token_expires_at is None:
+            return False
+        return time.monotonic() >= self._token_expires_at - self.token_refresh_margin
+
+    async def get_token(self):
+        """Return the current bearer token, fetching or refreshing it when needed."""
+        if self.token is None or self._token_needs_refresh():
+            await self.refresh_token(stale_token=self.token)
+        return self.token
+
+    async def refresh_token(self, stale_token=None):
+        """
+        Fetch a new token from Keycloak. Concurrent coroutines share a single refresh.
+
+        :param stale_token: The token the caller found to be expired or rejected.
+        :return: The current token.
+        """
+        async with self._token_lock:
+            if self.token is not None and self.token != stale_token and not self._token_needs_refresh():
+                return self.token
+            return await self._get_keycloak_token()
+
+    async def _get_keycloak_token(self):
+        logger.debug('AsyncZVMAClient._get_keycloak_token(zvm_address=%s)', self.zvm_address)
+        keycloak_uri = f"https://{self.zvm_address}/auth/realms/zerto/protocol/openid-connect/token"
+        body = {
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'grant_type': 'client_credentials',
+            'expires_in': 3600
+        }
+        logger.info("Connecting to Keycloak to get token...")
+        try:
+            response = await self.transport.request('POST', keycloak_uri, authorized=False, idempotent=True, data=body)
+        except Exception as e:
+            logger.error("Error retrieving token: %s", e)
+            raise
+        token_data = response.json()
+        self.token = token_data.get('access_token')
+        self.token_expiry = token_data.get('expires_in')
+        self._token_expires_at = time.monotonic() + self.token_expiry if self.token_expiry else None
+        logger.info("Successfully retrieved token, expires in %s seconds.", self.token_expiry)
+        return self.token
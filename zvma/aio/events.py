@@ -0,0 +1,54 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncEvents:
+    def __init__(self, client):
+        self.client = client
+
+    async def list_events(self, event_identifier=None, start_date=None, end_date=None, vpg_identifier=None,
+                          site_name=None, site_identifier=None, zorg_identifier=None, event_type=None,
+                          entity_type=None, category=None, user_name=None, alert_identifier=None):
+        """
+        Fetches a list of events or a specific event with optional filters.
+        See zvma.events.Events.list_events for the parameters.
+        """
+        if event_identifier:
+            return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/events/{event_identifier}")
+
+        params = {
+            'startDate': start_date,
+            'endDate': end_date,
+            'vpgIdentifier': vpg_identifier,
+            'siteName': site_name,
+            'siteIdentifier': site_identifier,
+            'zorgIdentifier': zorg_identifier,
+            'eventType': event_type,
+            'entityType': entity_type,
+            'category': category,
+            'userName': user_name,
+            'alertIdentifier': alert_identifier
+        }
+        logger.info("AsyncEvents.list_events: Fetching events with params: %s", params)
+        events = await self.client.transport.get(f"https://{self.client.zvm_address}/v1/events", params=params)
+        return events or []
+
+    async def list_event_types(self):
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/events/types") or []
+
+    async def list_event_entities(self):
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/events/entities") or []
+
+    async def list_event_categories(self):
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/events/categories") or []
@@ -0,0 +1,74 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncRecoveryReports:
+    def __init__(self, client):
+        self.client = client
+
+    async def get_recovery_reports(self, recovery_operation_identifier=None, page_number=1, page_size=1000,
+                                   vpg_name=None, recovery_type=None, state=None, start_time=None, end_time=None):
+        """
+        Generate a recovery report. See zvma.recovery_reports.RecoveryReports.get_recovery_reports
+        for the parameters.
+        """
+        if recovery_operation_identifier:
+            url = f"https://{self.client.zvm_address}/v1/reports/recovery/{recovery_operation_identifier}"
+            return await self.client.transport.get(url)
+
+        params = {
+            "startTime": start_time,
+            "endTime": end_time,
+            "pageNumber": page_number,
+            "pageSize": page_size,
+            "vpgName": vpg_name,
+            "recoveryType": recovery_type,
+            "state": state
+        }
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/reports/recovery", params=params)
+
+    async def list_resource_reports(self, start_time=None, end_time=None, page_number=None, page_size=None,
+                                    zorg_name=None, vpg_name=None, vm_name=None, protected_site_name=None,
+                                    protected_cluster_name=None, protected_host_name=None, protected_org_vdc=None,
+                                    protected_vcd_org=None, recovery_site_name=None, recovery_cluster_name=None,
+                                    recovery_host_name=None, recovery_org_vdc=None, recovery_vcd_org=None):
+        params = {
+            'startTime': start_time,
+            'endTime': end_time,
+            'pageNumber': page_number,
+            'pageSize': page_size,
+            'zorgName': zorg_name,
+            'vpgName': vpg_name,
+            'vmName': vm_name,
+            'protectedSiteName': protected_site_name,
+            'protectedClusterName': protected_cluster_name,
+            'protectedHostName': protected_host_name,
+            'protectedOrgVdc': protected_org_vdc,
+            'protectedVcdOrg': protected_vcd_org,
+            'recoverySiteName': recovery_site_name,
+            'recoveryClusterName': recovery_cluster_name,
+            'recoveryHostName': recovery_host_name,
+            'recoveryOrgVdc': recovery_org_vdc,
+            'recoveryVcdOrg': recovery_vcd_org
+        }
+        reports = await self.client.transport.get(f"https://{self.client.zvm_address}/v1/reports/resources", params=params)
+        return reports or []
+
+    async def get_latest_failover_test_report(self, vpg_name):
+        logger.info("AsyncRecoveryReports.get_latest_failover_test_report VPG: %s", vpg_name)
+        reports = await self.get_recovery_reports(vpg_name=vpg_name, recovery_type="FailoverTest", page_size=1000)
+        if not reports:
+            logger.warning("No failover test reports found for VPG: %s", vpg_name)
+            return None
+        return max(reports, key=lambda x: x["General"].get("EndTime", ""))
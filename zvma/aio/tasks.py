@@ -0,0 +1,53 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import asyncio
+import logging
+import time
+from ..common import ZertoTaskStates
+
+logger = logging.getLogger(__name__)
+
+class AsyncTasks:
+    def __init__(self, client):
+        self.client = client
+
+    async def get_task(self, task_identifier):
+        url = f"https://{self.client.zvm_address}/v1/tasks/{task_identifier}"
+        return await self.client.transport.get(url)
+
+    async def wait_for_task_completion(self, task_identifier, timeout=600, interval=5, expected_task_state: ZertoTaskStates = ZertoTaskStates.Completed):
+        logger.debug('AsyncTasks.wait_for_task_completion(zvm_address=%s, task_identifier=%s, timeout=%s, interval=%s)',
+                     self.client.zvm_address, task_identifier, timeout, interval)
+        start_time = time.time()
+
+        while True:
+            # Check if we've exceeded the timeout
+            if time.time() - start_time > timeout:
+                logger.error('Task ID=%s timed out after %s seconds', task_identifier, timeout)
+                raise TimeoutError(f"Task did not complete within {timeout} seconds")
+
+            task_info = await self.get_task(task_identifier)
+            state = task_info.get("Status", {}).get("State", -1)
+            progress = task_info.get("Status", {}).get("Progress", 0)
+            logger.debug('Task response: status=%s, progress=%s', ZertoTaskStates.get_name_by_value(state), progress)
+
+            if state == expected_task_state.value and progress == 100:
+                logger.info("Task completed successfully.")
+                await asyncio.sleep(interval)
+                return task_info
+            elif state == ZertoTaskStates.InProgress.value:
+                await asyncio.sleep(interval)
+                continue
+            else:
+                logger.error('Task ID=%s failed. task state=%s',
+                             task_identifier, ZertoTaskStates.get_name_by_value(state))
+                raise Exception(f"Task failed: {task_info.get('CompleteReason', 'No reason provided')}")
@@ -0,0 +1,201 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import asyncio
+import logging
+import time
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+from ..exceptions import error_for_status, ZVMAConnectionError, ZVMATimeoutError, ZVMADeadlineExceededError
+from ..retry import RetryPolicy
+from ..codec import get_codec, encode_json_body
+from ..metrics import ClientMetrics
+from .. import tracing
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_TIMEOUT = 60
+
+
+class AsyncTransport:
+    """
+    Non-blocking counterpart of zvma.transport.Transport built on httpx.AsyncClient.
+
+    One connection pool is shared by the AsyncZVMAClient and all of its resource classes.
+    Every request carries the client's current bearer token, a 401 response is replayed
+    once after a token refresh, and transient failures of idempotent calls are retried
+    with the same RetryPolicy and typed exceptions as the sync transport.
+
+    :param verify_certificate: Verify the ZVM TLS certificate.
+    :param max_connections: Maximum number of concurrent connections in the pool.
+    :param max_keepalive_connections: Maximum number of idle connections kept alive.
+    :param auth: Token owner exposing `async get_token()` and `async refresh_token(stale_token)`.
+    :param retry_policy: RetryPolicy deciding which failures are retried and how long to wait.
+    :param timeout: Default timeout in seconds for a single HTTP attempt.
+    :param deadline: Default time budget in seconds for a whole call, retries included.
+    :param codec: JSON codec used for request bodies and decoded responses; see zvma.codec.get_codec.
+    :param metrics: ClientMetrics recording per-endpoint request metrics; True (default) creates one, False disables it.
+    :param http2: Negotiate HTTP/2 (requires the 'h2' package). None (default) uses it when 'h2' is installed.
+    """
+
+    def __init__(self, verify_certificate=True, max_connections=DEFAULT_MAX_CONNECTIONS,
+                 max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS, auth=None,
+                 retry_policy=None, timeout=DEFAULT_TIMEOUT, deadline=None, codec='auto',
+                 metrics=True, http2=None):
+        if httpx is None:
+            raise ImportError("AsyncZVMAClient requires the 'httpx' package: pip install httpx")
+        self.auth = auth
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.timeout = timeout
+        self.deadline = deadline
+        self.codec = get_codec(codec)
+        self.metrics = ClientMetrics() if metrics is True else (metrics or None)
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive_connections)
+        if http2 is None:
+            http2 = h2 is not None
+        elif http2 and h2 is None:
+            raise ImportError("HTTP/2 requires the 'h2' package: pip install httpx[http2]")
+        self.session = httpx.AsyncClient(verify=verify_certificate, limits=self.limits, timeout=timeout, http2=http2)
+
+    async def request(self, method, url, authorized=True, deadline=None, idempotent=None, raise_for_status=True, **kwargs):
+        """
+        Send a request through the pipeline.
+
+        Accepts the same keyword arguments as httpx.AsyncClient.request. When `authorized`
+        is True the JSON content headers and the current bearer token are added.
+
+        :param deadline: Time budget in seconds for this call including retries.
+        :param idempotent: Force (True) or forbid (False) retries regardless of the HTTP method.
+        :param raise_for_status: Raise a ZVMAHTTPError subclass for 4xx/5xx responses.
+        """
+        if kwargs.get('params'):
+            kwargs['params'] = {k: v for k, v in kwargs['params'].items() if v is not None}
+        encode_json_body(self.codec, kwargs, body_argument='content')
+        deadline = deadline if deadline is not None else self.deadline
+        started = time.monotonic()
+        expires_at = started + deadline if deadline else None
+        policy = self.retry_policy
+        retryable = policy.is_retryable_method(method, idempotent)
+        attempt = 0
+        response = None
+
+        with tracing.http_span(method, url) as current_span:
+            try:
+                while True:
+                    response = None
+                    if expires_at is not None:
+                        remaining = expires_at - time.monotonic()
+                        if remaining <= 0:
+                            raise ZVMADeadlineExceededError(f"{method} {url} did not complete within the {deadline}s deadline")
+                        kwargs['timeout'] = min(self.timeout, remaining) if self.timeout else remaining
+
+                    try:
+                        response = await self._send(method, url, authorized, **kwargs)
+                    except httpx.TransportError as e:
+                        if retryable and attempt < policy.max_retries and await self._backoff(method, url, attempt, expires_at, reason=e):
+                            attempt += 1
+                            continue
+                        error_class = ZVMATimeoutError if isinstance(e, httpx.TimeoutException) else ZVMAConnectionError
+                        logger.error("%s %s failed after %s attempt(s): %s", method, url, attempt + 1, e)
+                        raise error_class(str(e)) from e
+
+                    if (retryable and attempt < policy.max_retries and policy.is_retryable_status(response.status_code)
+                            and await self._backoff(method, url, attempt, expires_at, response=response)):
+                        await response.aclose()
+                        attempt += 1
+                        continue
+
+                    if raise_for_status:
+                        self.raise_for_status(method, url, response)
+                    return response
+            finally:
+                if self.metrics is not None:
+                    size = len(response.content) if response is not None else 0
+                    wire_size = response.num_bytes_downloaded if response is not None else 0
+                    self.metrics.record(method, url, response.status_code if response is not None else None,
+                                        time.monotonic() - started, size, attempt, wire_bytes=wire_size)
+                tracing.set_attributes(current_span, **{
+                    'http.response.status_code': response.status_code if response is not None else None,
+                    'http.request.resend_count': attempt or None})
+
+    async def _send(self, method, url, authorized, **kwargs):
+        if not authorized or self.auth is None:
+            return await self.session.request(method, url, **kwargs)
+
+        headers = {'Content-Type': 'application/json', **(kwargs.pop('headers', None) or {})}
+        token = await self.auth.get_token()
+        response = await self.session.request(method, url, headers={**headers, 'Authorization': f'Bearer {token}'}, **kwargs)
+        if response.status_code != 401:
+            return response
+
+        logger.warning("AsyncTransport.request: %s %s returned 401, refreshing token and retrying once", method, url)
+        await response.aclose()
+        token = await self.auth.refresh_token(stale_token=token)
+        return await self.session.request(method, url, headers={**headers, 'Authorization': f'Bearer {token}'}, **kwargs)
+
+    async def _backoff(self, method, url, attempt, expires_at, response=None, reason=None):
+        """Sleep before the next attempt. Returns False if the wait would overrun the deadline."""
+        delay = self.retry_policy.get_backoff(attempt, response)
+        if expires_at is not None and time.monotonic() + delay >= expires_at:
+            return False
+        reason = reason if reason is not None else f"status {response.status_code}"
+        logger.warning("%s %s attempt %s failed (%s), retrying in %.2fs", method, url, attempt + 1, reason, delay)
+        await asyncio.sleep(delay)
+        return True
+
+    @staticmethod
+    def raise_for_status(method, url, response):
+        """Log an error response once and raise the matching ZVMAHTTPError subclass."""
+        if response.status_code < 400:
+            return
+        try:
+            message = response.json().get('Message', 'No detailed error message available')
+        except (ValueError, AttributeError):
+            message = response.text[:1000]
+        logger.error("HTTPError: %s %s - %s %s - %s",
+                     method, url, response.status_code, response.reason_phrase, message)
+        error_class = error_for_status(response.status_code)
+        raise error_class(f"{response.status_code} {response.reason_phrase} for {method} {url}: {message}",
+                          response=response, method=method, url=url)
+
+    async def request_json(self, method, url, **kwargs):
+        """Send a request and return the decoded JSON body, or None when the response has no content."""
+        response = await self.request(method, url, **kwargs)
+        if not response.content.strip():
+            return None
+        return self.codec.loads(response.content)
+
+    async def get(self, url, **kwargs):
+        return await self.request_json('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request_json('POST', url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request_json('PUT', url, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request_json('DELETE', url, **kwargs)
+
+    async def aclose(self):
+        await self.session.aclose()
@@ -0,0 +1,104 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncVirtualizationSites:
+    def __init__(self, client):
+        self.client = client
+
+    async def _get_site_resource(self, site_identifier, resource, params=None):
+        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/{resource}"
+        logger.info("AsyncVirtualizationSites: Fetching %s for site %s...", resource, site_identifier)
+        return await self.client.transport.get(url, params=params)
+
+    async def get_virtualization_sites(self, site_identifier=None):
+        url = f"https://{self.client.zvm_address}/v1/virtualizationsites"
+        if site_identifier:
+            url = f"{url}/{site_identifier}"
+        return await self.client.transport.get(url)
+
+    async def get_virtualization_site_vms(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "vms")
+
+    async def get_virtualization_site_vcd_vapps(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "vcdvapps")
+
+    async def get_virtualization_site_datastores(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "datastores")
+
+    async def get_virtualization_site_folders(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "folders")
+
+    async def get_virtualization_site_datastore_clusters(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "datastoreclusters")
+
+    async def get_virtualization_site_resource_pools(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "resourcepools")
+
+    async def get_virtualization_site_org_vdcs(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "orgvdcs")
+
+    async def get_virtualization_site_networks(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "networks")
+
+    async def get_virtualization_site_hosts(self, site_identifier, host_identifier=None):
+        resource = f"hosts/{host_identifier}" if host_identifier else "hosts"
+        return await self._get_site_resource(site_identifier, resource)
+
+    async def get_virtualization_site_repositories(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "repositories")
+
+    async def get_virtualization_site_host_clusters(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "hostclusters")
+
+    async def get_virtualization_site_org_vdc_networks(self, site_identifier, org_vdc_identifier):
+        return await self._get_site_resource(site_identifier, f"orgvdcs/{org_vdc_identifier}/networks")
+
+    async def get_virtualization_site_org_vdc_storage_policies(self, site_identifier, org_vdc_identifier):
+        return await self._get_site_resource(site_identifier, f"orgvdcs/{org_vdc_identifier}/storagepolicies")
+
+    async def get_virtualization_site_devices(self, site_identifier, host_identifier=None, device_name=None):
+        params = {
+            'hostIdentifier': host_identifier,
+            'deviceName': device_name
+        }
+        return await self._get_site_resource(site_identifier, "devices", params=params)
+
+    async def get_virtualization_site_public_cloud_networks(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "publiccloud/virtualNetworks")
+
+    async def get_virtualization_site_public_cloud_subnets(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "publiccloud/subnets")
+
+    async def get_virtualization_site_public_cloud_security_groups(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "publiccloud/securityGroups")
+
+    async def get_virtualization_site_public_cloud_vm_instance_types(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "publiccloud/vmInstanceTypes")
+
+    async def get_virtualization_site_public_cloud_resource_groups(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "publiccloud/resourceGroups")
+
+    async def get_virtualization_site_public_cloud_keys_containers(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "publiccloud/keyscontainers")
+
+    async def get_virtualization_site_public_cloud_encryption_keys(self, site_identifier, encryption_key_id=None):
+        resource = f"publiccloud/encryptionkeys/{encryption_key_id}" if encryption_key_id else "publiccloud/encryptionkeys"
+        return await self._get_site_resource(site_identifier, resource)
+
+    async def get_virtualization_site_public_cloud_managed_identities(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "publiccloud/managedidentities")
+
+    async def get_virtualization_site_public_cloud_disk_encryption_keys(self, site_identifier):
+        return await self._get_site_resource(site_identifier, "publiccloud/diskencryptionkeys")
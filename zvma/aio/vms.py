@@ -0,0 +1,91 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncVMs:
+    def __init__(self, client):
+        self.client = client
+
+    async def list_vms(self, vm_identifier=None, vpg_name=None, vm_name=None, status=None, sub_status=None,
+                       protected_site_type=None, recovery_site_type=None, protected_site_identifier=None,
+                       recovery_site_identifier=None, organization_name=None, priority=None,
+                       vpg_identifier=None, include_backuped_vms=None, include_mounted_vms=True):
+        """
+        Get information about protected virtual machines. See zvma.vms.VMs.list_vms for the parameters.
+
+        Returns:
+            dict or list: Details of a specific VM if vm_identifier is provided,
+                         otherwise an array of protected VMs matching the filter criteria
+        """
+        base_url = f"https://{self.client.zvm_address}/v1/vms"
+        if vm_identifier:
+            url = f"{base_url}/{vm_identifier}"
+            params = {
+                'vpgIdentifier': vpg_identifier,
+                'includeBackupedVms': include_backuped_vms,
+                'includeMountedVms': include_mounted_vms
+            }
+        else:
+            url = base_url
+            params = {
+                'vpgName': vpg_name,
+                'vmName': vm_name,
+                'status': status,
+                'subStatus': sub_status,
+                'protectedSiteType': protected_site_type,
+                'recoverySiteType': recovery_site_type,
+                'protectedSiteIdentifier': protected_site_identifier,
+                'recoverySiteIdentifier': recovery_site_identifier,
+                'organizationName': organization_name,
+                'priority': priority,
+                'includeBackupedVms': include_backuped_vms,
+                'includeMountedVms': include_mounted_vms
+            }
+        logger.info("AsyncVMs.list_vms: Fetching VMs with params: %s", params)
+        return await self.client.transport.get(url, params=params)
+
+    async def restore_vm(self, vm_identifier, vpg_identifier, restored_vm_name, checkpoint_identifier,
+                         journal_vm_restore_settings, commit_policy=0, shutdown_policy=0,
+                         time_to_wait_before_continue_in_seconds=0):
+        data = {
+            "vpgIdentifier": vpg_identifier,
+            "restoredVmName": restored_vm_name,
+            "checkpointIdentifier": checkpoint_identifier,
+            "commitPolicy": commit_policy,
+            "shutdownPolicy": shutdown_policy,
+            "timeToWaitBeforeContinueInSeconds": time_to_wait_before_continue_in_seconds,
+            "journalVMRestoreSettings": journal_vm_restore_settings
+        }
+        logger.info("AsyncVMs.restore_vm: Restoring VM %s from checkpoint %s", vm_identifier, checkpoint_identifier)
+        return await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vms/{vm_identifier}/Restore", json=data)
+
+    async def restore_vm_commit(self, vm_identifier):
+        logger.info("AsyncVMs.restore_vm_commit: Committing restored VM %s", vm_identifier)
+        return await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vms/{vm_identifier}/RestoreCommit")
+
+    async def restore_vm_rollback(self, vm_identifier):
+        logger.info("AsyncVMs.restore_vm_rollback: Rolling back restored VM %s", vm_identifier)
+        return await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vms/{vm_identifier}/RestoreRollback")
+
+    async def list_vm_points_in_time(self, vm_identifier, vpg_identifier=None, start_date=None, end_date=None):
+        params = {
+            'vpgIdentifier': vpg_identifier,
+            'startDate': start_date,
+            'endDate': end_date
+        }
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/vms/{vm_identifier}/pointsInTime", params=params)
+
+    async def list_vm_points_in_time_stats(self, vm_identifier, vpg_identifier=None):
+        params = {'vpgIdentifier': vpg_identifier}
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/vms/{vm_identifier}/pointsInTime/stats", params=params)
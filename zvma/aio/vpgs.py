@@ -0,0 +1,284 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import asyncio
+import logging
+import time
+from ..validation import check_vpg_settings
+from ..common import ZertoVPGStatus, ZertoVPGSubstatus, ZertoProtectedSiteType, ZertoRecoverySiteType, ZertoVPGPriority
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+class AsyncVPGs:
+    def __init__(self, client):
+        self.client = client
+        self.tasks = client.tasks
+
+    async def list_vpgs(self,
+                        vpg_name: str = None,
+                        vpg_identifier: str = None,
+                        status: ZertoVPGStatus = None,
+                        sub_status: ZertoVPGSubstatus = None,
+                        protected_site_type: ZertoProtectedSiteType = None,
+                        recovery_site_type: ZertoRecoverySiteType = None,
+                        protected_site_identifier: str = None,
+                        recovery_site_identifier: str = None,
+                        organization_name: str = None,
+                        zorg_identifier: str = None,
+                        priority: ZertoVPGPriority = None,
+                        service_profile_identifier: str = None,
+                        backup_enabled: bool = None) -> Dict | List[Dict]:
+        """
+        Get information about VPGs. See zvma.vpgs.VPGs.list_vpgs for the parameters.
+
+        Returns:
+            Dict: When vpg_identifier or vpg_name is provided
+            List[Dict]: When filtering VPGs without specific identifier
+        """
+        if vpg_identifier:
+            logger.info("AsyncVPGs.list_vpgs: Fetching VPG %s", vpg_identifier)
+            return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}")
+
+        params = {
+            'name': vpg_name,
+            'status': status.get_name_by_value(status.value) if status else None,
+            'subStatus': sub_status.get_name_by_value(sub_status.value) if sub_status else None,
+            'protectedSiteType': protected_site_type.get_name_by_value(protected_site_type.value) if protected_site_type else None,
+            'recoverySiteType': recovery_site_type.get_name_by_value(recovery_site_type.value) if recovery_site_type else None,
+            'protectedSiteIdentifier': protected_site_identifier,
+            'recoverySiteIdentifier': recovery_site_identifier,
+            'organizationName': organization_name,
+            'zorgIdentifier': zorg_identifier,
+            'priority': priority.get_name_by_value(priority.value) if priority else None,
+            'serviceProfileIdentifier': service_profile_identifier,
+            'backupEnabled': backup_enabled
+        }
+        logger.info("AsyncVPGs.list_vpgs: Fetching VPGs with parameters: %s", params)
+        result = await self.client.transport.get(f"https://{self.client.zvm_address}/v1/vpgs", params=params)
+
+        # If we're querying by name, return the first matching VPG
+        if vpg_name and isinstance(result, list):
+            matching_vpg = next((vpg for vpg in result if vpg.get("VpgName") == vpg_name), None)
+            if matching_vpg:
+                return matching_vpg
+            logger.warning("No VPG found with name %s", vpg_name)
+            return {}
+        return result
+
+    async def _get_vpg_identifier(self, vpg_name):
+        vpg_info = await self.list_vpgs(vpg_name=vpg_name)
+        if not vpg_info:
+            raise ValueError(f"VPG with name '{vpg_name}' not found")
+        return vpg_info['VpgIdentifier']
+
+    async def commit_vpg(self, vpg_settings_id, vpg_name, sync=False, expected_status=ZertoVPGStatus.Initializing, timeout=30, interval=5):
+        logger.info('AsyncVPGs.commit_vpg(zvm_address=%s, vpg_settings_id=%s, vpg_name=%s, sync=%s)',
+                    self.client.zvm_address, vpg_settings_id, vpg_name, sync)
+        task_id = await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vpgSettings/{vpg_settings_id}/commit")
+        logger.info("VPGSettings %s successfully committed, %s is created, task_id=%s",
+                    vpg_settings_id, vpg_name, task_id)
+        if sync:
+            await self.tasks.wait_for_task_completion(task_id, timeout=timeout, interval=interval)
+            await self.wait_for_vpg_ready(vpg_name=vpg_name, timeout=30, interval=5, expected_status=expected_status)
+        return task_id
+
+    async def create_vpg(self, basic, journal, recovery, networks, sync=True, status: ZertoVPGStatus = ZertoVPGStatus.Initializing, timeout=30, interval=5):
+        vpg_name = basic.get("Name")
+        logger.info('AsyncVPGs.create_vpg(zvm_address=%s, vpg_name=%s, sync=%s)',
+                    self.client.zvm_address, vpg_name, sync)
+        vpg_settings_id = await self.create_vpg_settings(basic, journal, recovery, networks, vpg_identifier=None)
+        return await self.commit_vpg(vpg_settings_id, vpg_name, sync, expected_status=status, timeout=timeout, interval=interval)
+
+    async def wait_for_vpg_ready(self, vpg_name, timeout=180, interval=5, expected_status=ZertoVPGStatus.Initializing):
+        logger.debug('AsyncVPGs.wait_for_vpg_ready(vpg_name=%s, timeout=%s, interval=%s, expected_status=%s)',
+                     vpg_name, timeout, interval, expected_status.name)
+        start_time = time.time()
+
+        while True:
+            await asyncio.sleep(interval)
+            vpg_info = await self.list_vpgs(vpg_name=vpg_name)
+            vpg_status = ZertoVPGStatus(vpg_info.get("Status"))
+
+            # If VPG is in the expected status or passed the Initializing status too quickly and is in another status
+            if vpg_status == expected_status or (expected_status == ZertoVPGStatus.Initializing and vpg_status.value > ZertoVPGStatus.Initializing.value):
+                logger.info("VPG %s is now in the expected state: %s", vpg_name, vpg_status.name)
+                return vpg_info
+
+            if time.time() - start_time > timeout:
+                raise TimeoutError(f"VPG {vpg_name} did not reach the {expected_status.name} state within the allotted time. Current status: {vpg_status.name}")
+
+    async def add_vm_to_vpg(self, vpg_name, vm_list_payload):
+        logger.info('AsyncVPGs.add_vm_to_vpg(zvm_address=%s, vpg_name=%s)', self.client.zvm_address, vpg_name)
+        vpg_identifier = await self._get_vpg_identifier(vpg_name)
+        new_vpg_settings_id = await self.create_vpg_settings(basic=None, journal=None, recovery=None, networks=None, vpg_identifier=vpg_identifier)
+        await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vpgSettings/{new_vpg_settings_id}/vms", json=vm_list_payload)
+        logger.info("Successfully added VMs to VPG %s.", new_vpg_settings_id)
+        await self.commit_vpg(new_vpg_settings_id, vpg_name, sync=True, expected_status=ZertoVPGStatus.Initializing)
+
+    async def remove_vm_from_vpg(self, vpg_name, vm_identifier):
+        logger.info('AsyncVPGs.remove_vm_from_vpg(zvm_address=%s, vpg_name=%s, vm_identifier=%s)',
+                    self.client.zvm_address, vpg_name, vm_identifier)
+        vpg_identifier = await self._get_vpg_identifier(vpg_name)
+        new_vpg_settings_id = await self.create_vpg_settings(basic=None, journal=None, recovery=None, networks=None, vpg_identifier=vpg_identifier)
+        await self.client.transport.delete(f"https://{self.client.zvm_address}/v1/vpgSettings/{new_vpg_settings_id}/vms/{vm_identifier}")
+        logger.info("VM %s successfully removed from VPG '%s' (ID: %s).", vm_identifier, vpg_name, new_vpg_settings_id)
+        await self.commit_vpg(new_vpg_settings_id, vpg_name, sync=True, expected_status=ZertoVPGStatus.Initializing)
+
+    async def failover_test(self, vpg_name, checkpoint_identifier=None, vm_name_list=None, sync=True):
+        logger.info('AsyncVPGs.failover_test(zvm_address=%s, vpg_name=%s, checkpoint_identifier=%s, vm_name_list=%s, sync=%s)',
+                    self.client.zvm_address, vpg_name, checkpoint_identifier, vm_name_list, sync)
+        vpg_identifier = await self._get_vpg_identifier(vpg_name)
+
+        payload = {}
+        if checkpoint_identifier:
+            payload['CheckpointIdentifier'] = checkpoint_identifier
+
+        vm_identifier_list = []
+        for vm in vm_name_list or []:
+            vm_info = await self.client.vms.list_vms(vm_name=vm)
+            if not vm_info:
+                logger.error('failover_test vm=%s not found', vm)
+                return
+            vm_identifier_list.append(vm_info[0]['VmIdentifier'])
+        payload['VmIdentifiers'] = vm_identifier_list
+
+        task_id = await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}/FailoverTest", json=payload)
+        logger.info("Failover test initiated for VPG %s, task_id = %s", vpg_name, task_id)
+        if sync:
+            await self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
+        return task_id
+
+    async def stop_failover_test(self, vpg_name, failoverTestSuccess=True, failoverTestSummary=None, sync=True):
+        logger.info('AsyncVPGs.stop_failover_test(zvm_address=%s, vpg_name=%s, sync=%s)',
+                    self.client.zvm_address, vpg_name, sync)
+        vpg_identifier = await self._get_vpg_identifier(vpg_name)
+        body = {
+            "FailoverTestSuccess": failoverTestSuccess,
+            "FailoverTestSummary": failoverTestSummary
+        }
+        task_id = await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}/FailoverTestStop", json=body)
+        logger.info("Failover test stopping for VPG %s, task_id = %s", vpg_name, task_id)
+        if sync:
+            await self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
+        return task_id
+
+    async def rollback_failover(self, vpg_name, sync=True):
+        logger.info('AsyncVPGs.rollback_failover(zvm_address=%s, vpg_name=%s, sync=%s)',
+                    self.client.zvm_address, vpg_name, sync)
+        vpg_identifier = await self._get_vpg_identifier(vpg_name)
+        task_id = await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}/FailoverRollback")
+        logger.info("Rollback failover for VPG %s, task_id = %s", vpg_name, task_id)
+        if sync:
+            await self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
+        return task_id
+
+    async def delete_vpg(self, vpg_name, force=False, keep_recovery_volumes=True):
+        logger.info("AsyncVPGs.delete_vpg(zvm_address=%s, vpg_name=%s, force=%s, keep_recovery_volumes=%s)",
+                    self.client.zvm_address, vpg_name, force, keep_recovery_volumes)
+        vpg_identifier = await self._get_vpg_identifier(vpg_name)
+        payload = {
+            "keepRecoveryVolumes": keep_recovery_volumes,
+            "force": force
+        }
+        await self.client.transport.delete(f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}", json=payload)
+        logger.info("Successfully deleted VPG '%s' (ID: %s).", vpg_name, vpg_identifier)
+        return f"VPG '{vpg_name}' deleted successfully."
+
+    async def list_vpg_settings(self):
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/vpgSettings")
+
+    async def get_vpg_settings_by_id(self, vpg_settings_id):
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/vpgSettings/{vpg_settings_id}")
+
+    async def update_vpg_settings(self, vpg_settings_id, payload, validate=True, strict=False):
+        if validate:
+            check_vpg_settings(payload, strict)
+        logger.info("AsyncVPGs.update_vpg_settings: Updating VPG settings for ID: %s", vpg_settings_id)
+        return await self.client.transport.put(f"https://{self.client.zvm_address}/v1/vpgSettings/{vpg_settings_id}", json=payload)
+
+    async def delete_vpg_settings(self, vpg_settings_id):
+        return await self.client.transport.delete(f"https://{self.client.zvm_address}/v1/vpgSettings/{vpg_settings_id}")
+
+    async def create_vpg_settings(self, basic, journal, recovery, networks, vpg_identifier=None, validate=True, strict=False):
+        logger.info('AsyncVPGs.create_vpg_settings(zvm_address=%s, vpg_identifier=%s)',
+                    self.client.zvm_address, vpg_identifier)
+        payload = {}
+        if vpg_identifier:
+            payload["vpgIdentifier"] = vpg_identifier
+        if basic:
+            payload["Basic"] = basic
+        if journal:
+            payload["Journal"] = journal
+        if recovery:
+            payload["Recovery"] = recovery
+        if networks:
+            payload["Networks"] = networks
+        if validate:
+            check_vpg_settings(payload, strict)
+        vpg_settings_id = await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vpgSettings", json=payload)
+        logger.info("VPG Settings ID: %s created", vpg_settings_id)
+        return vpg_settings_id
+
+    async def list_checkpoints(self, vpg_name, start_date=None, endd_date=None, latest=None):
+        """
+        Fetches a list of checkpoints for a VPG, or only the latest checkpoint when `latest` is True.
+        """
+        logger.info('AsyncVPGs.list_checkpoints(vpg_name=%s, start_date=%s, endd_date=%s, latest=%s)',
+                    vpg_name, start_date, endd_date, latest)
+        vpg_identifier = await self._get_vpg_identifier(vpg_name)
+        params = {
+            "startDate": start_date,
+            "endDate": endd_date
+        }
+        checkpoints = await self.client.transport.get(f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}/checkpoints", params=params)
+        if not checkpoints:
+            logger.warning("No checkpoints found.")
+            return []
+        if latest:
+            return max(checkpoints, key=lambda x: x.get("TimeStamp"))
+        return checkpoints
+
+    async def create_checkpoint(self, checkpoint_name: str, vpg_identifier: str = None, vpg_name: str = None) -> str:
+        if not vpg_identifier and not vpg_name:
+            raise ValueError("Either vpg_identifier or vpg_name must be provided")
+        if vpg_name and not vpg_identifier:
+            vpg_identifier = await self._get_vpg_identifier(vpg_name)
+
+        logger.info("AsyncVPGs.create_checkpoint: Creating checkpoint '%s' for VPG %s", checkpoint_name, vpg_identifier)
+        task_id = await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}/checkpoints",
+                                                   json={"CheckpointName": checkpoint_name})
+        logger.info("Successfully initiated checkpoint creation, task_id=%s", task_id)
+        return task_id
+
+    async def export_vpg_settings(self, vpg_names: List[str]) -> dict:
+        logger.info("AsyncVPGs.export_vpg_settings: Exporting settings for VPGs: %s", vpg_names)
+        return await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vpgSettings/exportSettings",
+                                                json={"vpgNames": vpg_names})
+
+    async def list_exported_vpg_settings(self) -> List[Dict]:
+        return await self.client.transport.get(f"https://{self.client.zvm_address}/v1/vpgSettings/exportedSettings")
+
+    async def read_exported_vpg_settings(self, timestamp: str, vpg_names: List[str] = None) -> dict:
+        logger.info("AsyncVPGs.read_exported_vpg_settings: Reading exported VPG settings for timestamp: %s", timestamp)
+        payload = {'vpgNames': vpg_names} if vpg_names else {}
+        return await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vpgSettings/exportedSettings/{timestamp}", json=payload, idempotent=True)
+
+    async def import_vpg_settings(self, settings: Dict) -> dict:
+        if not isinstance(settings, dict):
+            raise ValueError("Settings must be a dictionary")
+        if 'ExportedVpgSettingsApi' not in settings:
+            raise ValueError("Settings must contain 'ExportedVpgSettingsApi' key")
+
+        logger.info("AsyncVPGs.import_vpg_settings: Importing settings for %s VPGs",
+                    len(settings['ExportedVpgSettingsApi']))
+        return await self.client.transport.post(f"https://{self.client.zvm_address}/v1/vpgSettings/import",
+                                                json={"ExportedVpgSettingsApi": settings['ExportedVpgSettingsApi']})
@@ -0,0 +1,90 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import logging
+from typing import List, Dict
+
+logger = logging.getLogger(__name__)
+
+class AsyncVRA:
+    def __init__(self, client):
+        self.client = client
+
+    def _url(self, path=""):
+        return f"https://{self.client.zvm_address}/v1/vras{path}"
+
+    async def _wait(self, task_id, sync):
+        if sync:
+            await self.client.tasks.wait_for_task_completion(task_id, timeout=300, interval=5)
+        return task_id
+
+    async def list_vras(self) -> List[Dict]:
+        """List all VRAs."""
+        return await self.client.transport.get(self._url())
+
+    async def create_vra(self, payload: Dict, sync: bool = True) -> Dict:
+        logger.info("AsyncVRA.create_vra(zvm_address=%s, sync=%s)", self.client.zvm_address, sync)
+        task_id = await self.client.transport.post(self._url(), json=payload)
+        return await self._wait(task_id, sync)
+
+    async def get_vra(self, vra_identifier: str) -> Dict:
+        return await self.client.transport.get(self._url(f"/{vra_identifier}"))
+
+    async def delete_vra(self, vra_identifier: str, sync: bool = True) -> Dict:
+        logger.info("AsyncVRA.delete_vra(vra_identifier=%s, sync=%s)", vra_identifier, sync)
+        task_id = await self.client.transport.delete(self._url(f"/{vra_identifier}"))
+        return await self._wait(task_id, sync)
+
+    async def update_vra(self, vra_identifier: str, payload: Dict, sync: bool = True) -> Dict:
+        logger.info("AsyncVRA.update_vra(vra_identifier=%s, sync=%s)", vra_identifier, sync)
+        task_id = await self.client.transport.put(self._url(f"/{vra_identifier}"), json=payload)
+        return await self._wait(task_id, sync)
+
+    async def create_vra_cluster(self, payload: Dict, sync: bool = True) -> Dict:
+        logger.info("AsyncVRA.create_vra_cluster(sync=%s)", sync)
+        task_id = await self.client.transport.post(self._url("/clusters"), json=payload)
+        return await self._wait(task_id, sync)
+
+    async def delete_vra_cluster(self, cluster_identifier: str) -> Dict:
+        return await self.client.transport.delete(self._url(f"/clusters/{cluster_identifier}"))
+
+    async def update_vra_cluster(self, cluster_identifier: str, payload: Dict) -> Dict:
+        return await self.client.transport.put(self._url(f"/clusters/{cluster_identifier}"), json=payload)
+
+    async def cleanup_vras(self) -> Dict:
+        return await self.client.transport.delete(self._url("/cleanup"))
+
+    async def upgrade_vra(self, vra_identifier: str) -> Dict:
+        return await self.client.transport.post(self._url(f"/{vra_identifier}/upgrade"))
+
+    async def get_vra_cluster_settings(self, cluster_identifier: str) -> Dict:
+        return await self.client.transport.get(self._url(f"/clusters/{cluster_identifier}/settings"))
+
+    async def create_vra_cluster_settings(self, cluster_identifier: str, payload: Dict) -> Dict:
+        return await self.client.transport.post(self._url(f"/clusters/{cluster_identifier}/settings"), json=payload)
+
+    async def list_vra_statuses(self) -> List[Dict]:
+        return await self.client.transport.get(self._url("/statuses"))
+
+    async def list_ip_configuration_types(self) -> List[Dict]:
+        return await self.client.transport.get(self._url("/ipconfigurationtypes"))
+
+    async def list_potential_recovery_vras(self, vra_identifier: str) -> List[Dict]:
+        return await self.client.transport.get(self._url(f"/{vra_identifier}/changerecoveryvra/potentials"))
+
+    async def execute_recovery_vra_change(self, vra_identifier: str, payload: Dict) -> Dict:
+        return await self.client.transport.post(self._url(f"/{vra_identifier}/changerecoveryvra/execute"), json=payload)
+
+    async def validate_recovery_vra_change(self, vra_identifier, payload):
+        return await self.client.transport.post(self._url(f"/{vra_identifier}/changerecoveryvra/validate"), json=payload, idempotent=True)
+
+    async def recommend_recovery_vra_change(self, vra_identifier, payload):
+        return await self.client.transport.post(self._url(f"/{vra_identifier}/changerecoveryvra/recommendation"), json=payload, idempotent=True)
@@ -9,8 +9,11 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
+from . import models
+from .cache import cached_response
+
+logger = logging.getLogger(__name__)
 
 class Alerts:
     def __init__(self, client):
@@ -19,7 +22,7 @@ class Alerts:
     #      Manage ZVM Alerts
     def get_alerts(self, start_date=None, end_date=None, vpg_name=None, zorg_identifier=None,
                    site_identifier=None, level=None, entity=None, help_identifier=None, is_dismissed=None,
-                   alert_identifier=None):
+                   alert_identifier=None, as_models=False):
         """
         Fetches alerts from the Zerto API with optional filters or a specific alert if `alert_identifier` is provided.
 
@@ -33,78 +36,67 @@ class Alerts:
         :param help_identifier: The alert help identifier associated with the alert.
         :param is_dismissed: True if alert was dismissed.
         :param alert_identifier: The specific alert identifier to retrieve a single alert.
+        :param as_models: Return zvma.models.Alert instances instead of dicts.
         :return: List of alerts or a specific alert based on the provided filters.
         """
-        if alert_identifier:
-            alerts_uri = f"https://{self.client.zvm_address}/v1/alerts/{alert_identifier}"
-        else:
-            alerts_uri = f"https://{self.client.zvm_address}/v1/alerts"
-
-        logging.info(f'Alerts.get_alerts(alert_identifier={alert_identifier}, start_date={start_date}, end_date={end_date}, '
-                      f'vpg_name={vpg_name}, zorg_identifier={zorg_identifier}, site_identifier={site_identifier}, '
-                      f'level={level}, entity={entity}, help_identifier={help_identifier}, is_dismissed={is_dismissed})')
-        
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        # Building query parameters for general alerts retrieval
-        params = {}
-        if not alert_identifier:
-            if start_date:
-                params['startDate'] = start_date
-            if end_date:
-                params['endDate'] = end_date
-            if vpg_name:
-                # Get VPG identifier from name
-                vpg = self.client.vpgs.get_vpg_by_name(vpg_name)
-                if vpg:
-                    params['vpgIdentifier'] = vpg.get('VpgIdentifier')
-                    logging.info(f"Found VPG identifier {params['vpgIdentifier']} for VPG name {vpg_name}")
-                else:
-                    logging.warning(f"VPG with name {vpg_name} not found")
-                    return []
-            if zorg_identifier:
-                params['zorgIdentifier'] = zorg_identifier
-            if site_identifier:
-                params['siteIdentifier'] = site_identifier
-            if level:
-                params['level'] = level
-            if entity:
-                params['entity'] = entity
-            if help_identifier:
-                params['helpIdentifier'] = help_identifier
-            if is_dismissed is not None:
-                params['isDismissed'] = str(is_dismissed).lower()
-
-        try:
-            logging.info("Fetching alerts...")
-            response = requests.get(alerts_uri, headers=headers, params=params, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            alerts = response.json()
-
-            if not alerts:
-                logging.warning("No alerts found.")
-                return []
-
-            return alerts
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        call = self._get_alerts_call(start_date=start_date, end_date=end_date, vpg_name=vpg_name,
+            zorg_identifier=zorg_identifier, site_identifier=site_identifier, level=level, entity=entity,
+            help_identifier=help_identifier, is_dismissed=is_dismissed, alert_identifier=alert_identifier)
+        if call is None:
+            return []
+        operation, args, kwargs = call
+        response = getattr(self.client.api, operation)(*args, **kwargs)
+        alerts = response.json()
+
+        if not alerts:
+            logger.warning("No alerts found.")
+            return []
+
+        return models.convert(models.Alert, alerts) if as_models else alerts
+
+    def iter_alerts(self, as_models=False, **filters):
+        """
+        Iterates over alerts one at a time, parsing the response incrementally so that memory use
+        stays flat however many alerts match the filters.
 
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        :param as_models: Yield zvma.models.Alert instances instead of dicts.
+        :param filters: The same keyword arguments as get_alerts.
+        :return: Generator yielding one alert at a time.
+        """
+        call = self._get_alerts_call(**filters)
+        if call is None:
+            return iter(())
+        operation, args, kwargs = call
+        alerts = self.client.api.iter_json(operation, *args, **kwargs)
+        return map(models.Alert.from_dict, alerts) if as_models else alerts
+
+    def _get_alerts_call(self, start_date=None, end_date=None, vpg_name=None, zorg_identifier=None,
+                         site_identifier=None, level=None, entity=None, help_identifier=None, is_dismissed=None,
+                         alert_identifier=None):
+        """Return the client.api operation, positional and keyword arguments for get_alerts/iter_alerts, or None."""
+        logger.info('Alerts.get_alerts(alert_identifier=%s, start_date=%s, end_date=%s, vpg_name=%s, zorg_identifier=%s, site_identifier=%s, level=%s, entity=%s, help_identifier=%s, is_dismissed=%s)',
+                    alert_identifier, start_date, end_date, vpg_name, zorg_identifier, site_identifier, level, entity, help_identifier, is_dismissed)
+
+        logger.info("Fetching alerts...")
+        if alert_identifier:
+            return 'get_alert', (alert_identifier,), {}
+
+        vpg_identifier = None
+        if vpg_name:
+            # Get VPG identifier from name
+            vpg = self.client.vpgs.get_vpg_by_name(vpg_name)
+            if not vpg:
+                logger.warning("VPG with name %s not found", vpg_name)
+                return None
+            vpg_identifier = vpg.get('VpgIdentifier')
+            logger.info("Found VPG identifier %s for VPG name %s", vpg_identifier, vpg_name)
+
+        # Empty filters are left out of the query
+        return 'get_alert_all', (), {
+            'start_date': start_date or None, 'end_date': end_date or None, 'vpg_identifier': vpg_identifier,
+            'zorg_identifier': zorg_identifier or None, 'site_identifier': site_identifier or None,
+            'level': level or None, 'entity': entity or None, 'help_identifier': help_identifier or None,
+            'is_dismissed': None if is_dismissed is None else str(is_dismissed).lower()}
 
     def dismiss_alert(self, alert_identifier):
         """
@@ -113,42 +105,17 @@ class Alerts:
         :param alert_identifier: The identifier of the alert to be dismissed.
         :return: Success message if the alert was dismissed, else an error message.
         """
-        logging.info(f'Alerts.dismiss_alert(alert_identifier={alert_identifier})')
+        logger.info('Alerts.dismiss_alert(alert_identifier=%s)', alert_identifier)
         
-        # Construct the URL for dismissing the alert
-        dismiss_uri = f"https://{self.client.zvm_address}/v1/alerts/{alert_identifier}/dismiss"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        try:
-            logging.info(f"Attempting to dismiss alert with ID: {alert_identifier}")
-            response = requests.post(dismiss_uri, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-
-            if response.status_code == 200:
-                logging.info(f"Alert {alert_identifier} successfully dismissed.")
-                return f"Alert {alert_identifier} dismissed successfully."
-            else:
-                logging.warning(f"Unexpected response code: {response.status_code}")
-                return f"Alert {alert_identifier} dismissal returned an unexpected status."
+        logger.info("Attempting to dismiss alert with ID: %s", alert_identifier)
+        response = self.client.api.remove_alert(alert_identifier)
 
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        if response.status_code == 200:
+            logger.info("Alert %s successfully dismissed.", alert_identifier)
+            return f"Alert {alert_identifier} dismissed successfully."
+        else:
+            logger.warning("Unexpected response code: %s", response.status_code)
+            return f"Alert {alert_identifier} dismissal returned an unexpected status."
 
     def undismiss_alert(self, alert_identifier):
         """
@@ -157,168 +124,71 @@ class Alerts:
         :param alert_identifier: The identifier of the alert to be dismissed.
         :return: Success message if the alert was dismissed, else an error message.
         """
-        logging.info(f'Alerts.undismiss_alert(alert_identifier={alert_identifier})')
+        logger.info('Alerts.undismiss_alert(alert_identifier=%s)', alert_identifier)
         
-        # Construct the URL for dismissing the alert
-        undismiss_uri = f"https://{self.client.zvm_address}/v1/alerts/{alert_identifier}/undismiss"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        try:
-            logging.info(f"Attempting to undismiss alert with ID: {alert_identifier}")
-            response = requests.post(undismiss_uri, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-
-            if response.status_code == 200:
-                logging.info(f"Alert {alert_identifier} successfully undismissed.")
-                return f"Alert {alert_identifier} undismissed successfully."
-            else:
-                logging.warning(f"Unexpected response code: {response.status_code}")
-                return f"Alert {alert_identifier} undismissal returned an unexpected status."
+        logger.info("Attempting to undismiss alert with ID: %s", alert_identifier)
+        response = self.client.api.reset_alert(alert_identifier)
 
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        if response.status_code == 200:
+            logger.info("Alert %s successfully undismissed.", alert_identifier)
+            return f"Alert {alert_identifier} undismissed successfully."
+        else:
+            logger.warning("Unexpected response code: %s", response.status_code)
+            return f"Alert {alert_identifier} undismissal returned an unexpected status."
 
+    @cached_response()
     def get_alert_levels(self):
         """
         Fetches the available alert levels from the Zerto API.
 
         :return: List of alert levels or an error message if the request fails.
         """
-        logging.info('Alerts.get_alert_levels()')
+        logger.info('Alerts.get_alert_levels()')
         
-        # Construct the URL for fetching alert levels
-        alert_levels_uri = f"https://{self.client.zvm_address}/v1/alerts/levels"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        try:
-            logging.info("Fetching available alert levels...")
-            response = requests.get(alert_levels_uri, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            alert_levels = response.json()
-
-            if not alert_levels:
-                logging.warning("No alert levels found.")
-                return []
+        logger.info("Fetching available alert levels...")
+        response = self.client.api.get_alert_level_all()
+        alert_levels = response.json()
 
-            return alert_levels
+        if not alert_levels:
+            logger.warning("No alert levels found.")
+            return []
 
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        return alert_levels
 
+    @cached_response()
     def get_alert_entities(self):
         """
         Fetches the available alert entities from the Zerto API.
 
         :return: List of alert entities or an error message if the request fails.
         """
-        logging.info('Alerts.get_alert_entities()')
+        logger.info('Alerts.get_alert_entities()')
         
-        # Construct the URL for fetching alert entities
-        alert_entities_uri = f"https://{self.client.zvm_address}/v1/alerts/entities"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        try:
-            logging.info("Fetching available alert entities...")
-            response = requests.get(alert_entities_uri, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            alert_entities = response.json()
-
-            if not alert_entities:
-                logging.warning("No alert entities found.")
-                return []
-
-            return alert_entities
+        logger.info("Fetching available alert entities...")
+        response = self.client.api.get_alert_entity_all()
+        alert_entities = response.json()
 
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        if not alert_entities:
+            logger.warning("No alert entities found.")
+            return []
 
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        return alert_entities
 
+    @cached_response()
     def get_alert_help_identifiers(self):
         """
         Fetches the available alert help identifiers from the Zerto API.
 
         :return: List of alert help identifiers or an error message if the request fails.
         """
-        logging.info('Alerts.get_alert_help_identifiers()')
+        logger.info('Alerts.get_alert_help_identifiers()')
         
-        # Construct the URL for fetching alert help identifiers
-        help_identifiers_uri = f"https://{self.client.zvm_address}/v1/alerts/helpidentifiers"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        try:
-            logging.info("Fetching available alert help identifiers...")
-            response = requests.get(help_identifiers_uri, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            help_identifiers = response.json()
-
-            if not help_identifiers:
-                logging.warning("No alert help identifiers found.")
-                return []
-
-            return help_identifiers
+        logger.info("Fetching available alert help identifiers...")
+        response = self.client.api.get_alert_help_id_all()
+        help_identifiers = response.json()
 
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        if not help_identifiers:
+            logger.warning("No alert help identifiers found.")
+            return []
 
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        return help_identifiers
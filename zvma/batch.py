@@ -0,0 +1,120 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Marks threads of a client executor, so that calls batched from inside a batched call run inline
+# instead of waiting for a worker that may never become free
+_worker = threading.local()
+
+
+def create_executor(max_workers):
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='zvma')
+
+
+def _run_in_worker(function, args, kwargs):
+    _worker.active = True
+    try:
+        return function(*args, **kwargs)
+    finally:
+        _worker.active = False
+
+
+class _BatchNamespace:
+    """Resource namespace proxy: `batch.vpgs.list_checkpoints(...)` submits the call and returns its Future."""
+
+    def __init__(self, batch, resource):
+        self._batch = batch
+        self._resource = resource
+
+    def __getattr__(self, name):
+        method = getattr(self._resource, name)
+        if not callable(method):
+            return method
+        return lambda *args, **kwargs: self._batch.submit(method, *args, **kwargs)
+
+
+class Batch:
+    """
+    Group of API calls running concurrently on the client's shared executor.
+
+    Calls start as soon as they are submitted; leaving the `with` block waits for all of them.
+    Because every batch of a client uses the same executor, the total number of calls in flight
+    is bounded by the client's `max_workers` however many batches run at once.
+
+    Usage:
+        with client.batch() as batch:
+            for vpg_name in vpg_names:
+                batch.vpgs.list_checkpoints(vpg_name)
+        checkpoints = batch.results()  # in submission order
+    """
+
+    def __init__(self, client, executor):
+        self.client = client
+        self.executor = executor
+        self.futures = []
+
+    def submit(self, function, *args, **kwargs):
+        """Schedule `function(*args, **kwargs)` and return its concurrent.futures.Future."""
+        if getattr(_worker, 'active', False):
+            future = Future()
+            try:
+                future.set_result(function(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            # Run in the caller's context so trace spans of the call nest under the caller's span
+            context = contextvars.copy_context()
+            future = self.executor.submit(context.run, _run_in_worker, function, args, kwargs)
+        self.futures.append(future)
+        return future
+
+    def map(self, function, *iterables):
+        """Submit `function` for every set of arguments taken from `iterables`; returns the futures in order."""
+        return [self.submit(function, *args) for args in zip(*iterables)]
+
+    def results(self, timeout=None, return_exceptions=False):
+        """
+        Wait for all submitted calls and return their results in submission order.
+
+        :param timeout: Seconds to wait for each call; None waits indefinitely.
+        :param return_exceptions: Put the exception of a failed call in its slot instead of raising it.
+        :raises: The exception of the first failed call, unless `return_exceptions` is set.
+        """
+        results = []
+        for future in self.futures:
+            if return_exceptions:
+                error = future.exception(timeout)
+                results.append(error if error is not None else future.result())
+            else:
+                results.append(future.result(timeout))
+        return results
+
+    def wait(self):
+        for future in self.futures:
+            if not future.cancelled():
+                future.exception()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _BatchNamespace(self, getattr(self.client, name))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            for future in self.futures:
+                future.cancel()
+        self.wait()
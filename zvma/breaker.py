@@ -0,0 +1,131 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import logging
+import threading
+import time
+from .exceptions import ZVMACircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Health state of one ZVM, failing calls fast while the ZVM is unreachable.
+
+    `failure_threshold` consecutive failures (connection errors, timeouts, 502/503/504) open the
+    breaker: calls then raise ZVMACircuitOpenError at once instead of waiting out TCP and TLS
+    timeouts. While open, `probe` is called from a background thread every `recovery_timeout`
+    seconds and closes the breaker as soon as it reports the ZVM healthy. Without a probe, the
+    first call after `recovery_timeout` is let through as a trial (half-open) and closes or
+    re-opens the breaker depending on its outcome.
+
+    :param name: ZVM host, used in errors and logs.
+    :param failure_threshold: Consecutive failures that open the breaker.
+    :param recovery_timeout: Seconds between recovery probes, and before a trial call is allowed.
+    :param probe: Optional callable returning True when the ZVM answers again.
+    """
+
+    def __init__(self, name, failure_threshold=5, recovery_timeout=10.0, probe=None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.probe = probe
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.last_error = None
+        self.opened_at = None
+        self._trial_started = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._probe_thread = None
+
+    def before_call(self):
+        """Raise ZVMACircuitOpenError unless a call may be sent now."""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = time.monotonic()
+            if self.state == OPEN and now - self.opened_at >= self.recovery_timeout:
+                self.state = HALF_OPEN
+                self._trial_started = None
+            if self.state == HALF_OPEN and (self._trial_started is None
+                                            or now - self._trial_started >= self.recovery_timeout):
+                self._trial_started = now
+                return
+            retry_after = max(0.0, self.opened_at + self.recovery_timeout - now)
+            last_error = self.last_error
+        raise ZVMACircuitOpenError(f"Circuit breaker for ZVM {self.name} is open after repeated failures "
+                                   f"({last_error}); retry in {retry_after:.1f}s", host=self.name,
+                                   retry_after=retry_after)
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            if self.state != CLOSED:
+                logger.info("CircuitBreaker: ZVM %s is reachable again, closing the circuit", self.name)
+                self.state = CLOSED
+                self.opened_at = None
+
+    def record_failure(self, error):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_error = str(error)
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.consecutive_failures >= self.failure_threshold):
+                logger.warning("CircuitBreaker: opening the circuit for ZVM %s after %s consecutive failure(s): %s",
+                               self.name, self.consecutive_failures, error)
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self._start_probe()
+
+    def _start_probe(self):
+        if self.probe is None or self._stopped.is_set():
+            return
+        if self._probe_thread is not None and self._probe_thread.is_alive():
+            return
+        self._probe_thread = threading.Thread(target=self._probe_loop, name=f'zvma-probe-{self.name}', daemon=True)
+        self._probe_thread.start()
+
+    def _probe_loop(self):
+        while not self._stopped.wait(self.recovery_timeout):
+            if self.state == CLOSED:
+                return
+            try:
+                healthy = self.probe()
+            except Exception as e:
+                logger.debug("CircuitBreaker: recovery probe of ZVM %s failed: %s", self.name, e)
+                healthy = False
+            if healthy:
+                self.record_success()
+                return
+
+    @property
+    def healthy(self):
+        return self.state == CLOSED
+
+    def snapshot(self):
+        """Current health state, for monitoring and routing decisions."""
+        with self._lock:
+            return {
+                'state': self.state,
+                'healthy': self.state == CLOSED,
+                'consecutive_failures': self.consecutive_failures,
+                'last_error': self.last_error,
+                'open_for': time.monotonic() - self.opened_at if self.opened_at is not None else None,
+            }
+
+    def stop(self):
+        """Stop the background recovery probe."""
+        self._stopped.set()
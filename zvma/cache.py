@@ -0,0 +1,115 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import copy
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_CACHE_MAXSIZE = 256
+# Lookup endpoints (types, levels, statuses) only change with a ZVM upgrade
+STATIC_TTL = 3600
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded response cache with a time-to-live per entry.
+
+    Entries are evicted least-recently-used first once `maxsize` is reached and ignored once
+    their TTL has passed. Keys start with the endpoint name (e.g. 'Alerts.get_alert_levels'),
+    so a whole endpoint can be dropped with `invalidate(endpoint)`.
+
+    :param maxsize: Maximum number of cached responses.
+    :param ttl_overrides: Optional {endpoint: seconds} mapping overriding the TTL declared by
+                          `cached_response`; 0 disables caching for that endpoint.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_MAXSIZE, ttl_overrides=None):
+        self.maxsize = maxsize
+        self.ttl_overrides = dict(ttl_overrides or {})
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _after_fork_in_child(self):
+        self._lock = threading.Lock()
+
+    def get_ttl(self, endpoint, default):
+        return self.ttl_overrides.get(endpoint, default)
+
+    def get(self, key):
+        """Return the cached value for `key`, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint=None):
+        """
+        Drop cached responses.
+
+        :param endpoint: Endpoint name such as 'VRA.list_vra_statuses'; None clears the whole cache.
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == endpoint]:
+                del self._entries[key]
+
+    def clear(self):
+        self.invalidate()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def cached_response(ttl=STATIC_TTL):
+    """
+    Cache the result of a resource method in its client's TTLCache.
+
+    The cache key is the endpoint name plus the call arguments. Callers receive a deep copy,
+    so mutating a returned list does not corrupt the cache. Falsy results are not cached.
+    """
+    def decorator(method):
+        endpoint = method.__qualname__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self.client, 'cache', None)
+            entry_ttl = cache.get_ttl(endpoint, ttl) if cache is not None else 0
+            if not entry_ttl:
+                return method(self, *args, **kwargs)
+            key = (endpoint, args, tuple(sorted(kwargs.items())))
+            result = cache.get(key)
+            if result is None:
+                result = method(self, *args, **kwargs)
+                if not result:
+                    return result
+                cache.set(key, result, entry_ttl)
+            return copy.deepcopy(result)
+        return wrapper
+    return decorator
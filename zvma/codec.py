@@ -0,0 +1,88 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class JSONCodec:
+    """
+    Standard library JSON codec. Subclasses swap in a faster implementation of `loads`/`dumps`.
+
+    `loads` accepts bytes or str and raises a ValueError subclass on invalid input, like
+    json.loads; `dumps` returns UTF-8 encoded bytes ready to be sent as a request body.
+    """
+    name = 'json'
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, obj):
+        return json.dumps(obj, allow_nan=False).encode('utf-8')
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson, typically several times faster on large list responses."""
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The 'orjson' codec requires the 'orjson' package: pip install orjson")
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+
+CODECS = {'json': JSONCodec, 'orjson': OrjsonCodec}
+
+
+def get_codec(codec='auto'):
+    """
+    Resolve a codec setting to a codec instance.
+
+    :param codec: 'auto' (orjson when installed, else the standard library), a name from CODECS,
+                  or any object providing `loads(data)` and `dumps(obj) -> bytes`.
+    """
+    if codec is None or codec == 'auto':
+        return OrjsonCodec() if orjson is not None else JSONCodec()
+    if isinstance(codec, str):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown JSON codec '{codec}', expected one of: auto, {', '.join(CODECS)}")
+        return CODECS[codec]()
+    return codec
+
+
+def encode_json_body(codec, kwargs, body_argument='data'):
+    """
+    Move a `json=` request argument into a raw body encoded with `codec`.
+    Plain JSONCodec bodies are left to the HTTP library.
+
+    :param body_argument: Keyword the HTTP library expects raw bytes in ('data' for requests, 'content' for httpx).
+    """
+    if kwargs.get('json') is None or type(codec) is JSONCodec:
+        return kwargs
+    payload = kwargs.pop('json')
+    kwargs[body_argument] = codec.dumps(payload)
+    headers = dict(kwargs.get('headers') or {})
+    if not any(name.lower() == 'content-type' for name in headers):
+        headers['Content-Type'] = 'application/json'
+    kwargs['headers'] = headers
+    return kwargs
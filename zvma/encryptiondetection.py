@@ -9,10 +9,12 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
-import json
+from .log import log_payload
 from typing import List, Dict
+from .cache import cached_response
+
+logger = logging.getLogger(__name__)
 
 class EncryptionDetection:
     def __init__(self, client):
@@ -24,22 +26,9 @@ class EncryptionDetection:
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
-        logging.info(f"EncryptionDetection.get_encryption_detections(zvm_address={self.client.zvm_address})")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("EncryptionDetection.get_encryption_detections(zvm_address=%s)", self.client.zvm_address)
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        return response.json()
 
     def get_encryption_detection(self, detection_identifier):
         url = f"https://{self.client.zvm_address}/v1/encryptiondetection/{detection_identifier}"
@@ -47,45 +36,21 @@ class EncryptionDetection:
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
-        logging.info(f"EncryptionDetection.get_encryption_detection(zvm_address={self.client.zvm_address}, detection_identifier={detection_identifier})")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("EncryptionDetection.get_encryption_detection(zvm_address=%s, detection_identifier=%s)",
+                    self.client.zvm_address, detection_identifier)
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        return response.json()
 
+    @cached_response()
     def get_encryption_detection_types(self):
         url = f"https://{self.client.zvm_address}/v1/encryptiondetection/types"
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
-        logging.info(f"EncryptionDetection.get_encryption_detection_types(zvm_address={self.client.zvm_address})")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("EncryptionDetection.get_encryption_detection_types(zvm_address=%s)", self.client.zvm_address)
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        return response.json()
 
     def list_suspected_volumes(self) -> List[Dict]:
         """List all suspected encrypted volumes.
@@ -96,29 +61,9 @@ class EncryptionDetection:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"EncryptionDetection.list_suspected_volumes(zvm_address={self.client.zvm_address})")
-        url = f"https://{self.client.zvm_address}/v1/encryptiondetection/suspected/volumes"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully retrieved {len(result)} suspected encrypted volumes")
-            logging.debug(f"EncryptionDetection.list_suspected_volumes result: {json.dumps(result, indent=4)}")
-            return result
-            
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
\ No newline at end of file
+        logger.info("EncryptionDetection.list_suspected_volumes(zvm_address=%s)", self.client.zvm_address)
+        response = self.client.api.suspected_volumes()
+        result = response.json()
+        logger.info("Successfully retrieved %s suspected encrypted volumes", len(result))
+        log_payload(logger, "EncryptionDetection.list_suspected_volumes result: %s", result)
+        return result
\ No newline at end of file
@@ -0,0 +1,110 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Runtime of the generated endpoint layer (zvma/endpoints.py).
+
+Each swagger operation is described once, at import time, by an `Endpoint` holding its method, a
+precompiled %-style URL template and the wire names of its query parameters. Calls go through
+`EndpointLayer._call`, which only fills in the template and the query parameters that were given
+and hands the request to the client transport, so every generated call shares the transport
+pipeline: authentication, retries, limiter, circuit breakers, coalescing, metrics and tracing.
+The endpoint template is passed along, so metrics and tracing do not re-derive it from the URL.
+"""
+
+import re
+from urllib.parse import quote
+from .metrics import endpoint_template
+
+# Shared by every authenticated call and never mutated: Transport._send replaces the placeholder
+# Authorization value with the current bearer token on a copy.
+API_HEADERS = {'Content-Type': 'application/json', 'Accept': 'application/json', 'Authorization': 'Bearer'}
+# Form and multipart bodies: requests sets the Content-Type, including the multipart boundary
+FORM_HEADERS = {'Accept': 'application/json', 'Authorization': 'Bearer'}
+
+_PATH_PARAMETER = re.compile(r'\{[^}]+\}')
+
+
+class Endpoint:
+    """A swagger operation: method, URL template and parameter names, precomputed."""
+    __slots__ = ('method', 'path', 'operation_id', 'query_params', 'body', 'authenticated', 'headers', 'template',
+                 'metrics_template')
+
+    def __init__(self, method, path, operation_id, query_params=(), body=None, authenticated=True):
+        """
+        :param method: HTTP method, e.g. 'GET'.
+        :param path: Swagger path, e.g. '/v1/vpgs/{vpgIdentifier}'.
+        :param operation_id: Swagger operationId.
+        :param query_params: Wire names of the query parameters, in the order the generated method passes them.
+        :param body: How the request body is sent: 'json', 'data' (form fields), 'files' (multipart) or None.
+        :param authenticated: Whether the call carries the bearer token.
+        """
+        self.method = method
+        self.path = path
+        self.operation_id = operation_id
+        self.query_params = query_params
+        self.body = body
+        self.authenticated = authenticated
+        if authenticated:
+            self.headers = API_HEADERS if body in (None, 'json') else FORM_HEADERS
+        else:
+            self.headers = None
+        self.template = _PATH_PARAMETER.sub('%s', path.replace('%', '%%'))
+        # Metrics and tracing key calls by this; computing it once spares the transport a URL parse per call
+        self.metrics_template = endpoint_template(path)
+
+    def __repr__(self):
+        return f"Endpoint({self.method} {self.path})"
+
+
+class EndpointLayer:
+    """Base class of the generated `Endpoints`; binds the endpoint descriptions to a client."""
+
+    def __init__(self, client):
+        self.client = client
+        self.transport = client.transport
+        self.base_url = f"https://{client.zvm_address}"
+
+    def _call(self, endpoint, path_values, query_values, body, options):
+        """
+        Send `endpoint` through the client transport.
+
+        :param path_values: Tuple of path parameter values, in template order; they are percent-encoded.
+        :param query_values: Tuple of query parameter values matching endpoint.query_params; None values are left out.
+        :param body: Request body, or None.
+        :param options: Extra keyword arguments for Transport.request (timeout, deadline, priority, stream, ...).
+        :return: The requests.Response.
+        """
+        if path_values:
+            url = self.base_url + endpoint.template % tuple(quote(str(value), safe='') for value in path_values)
+        else:
+            url = self.base_url + endpoint.template
+        if query_values:
+            params = {name: value for name, value in zip(endpoint.query_params, query_values) if value is not None}
+            if params:
+                options['params'] = params
+        if body is not None:
+            options[endpoint.body] = body
+        if endpoint.headers is not None:
+            options.setdefault('headers', endpoint.headers)
+        if options.pop('_iter_json', False):
+            return self.transport.iter_json(endpoint.method, url, template=endpoint.metrics_template, **options)
+        return self.transport.request(endpoint.method, url, template=endpoint.metrics_template, **options)
+
+    def iter_json(self, operation, *args, **kwargs):
+        """
+        Call the generated method `operation` with the given arguments and yield the elements of the
+        JSON array it returns one at a time, parsed incrementally (Transport.iter_json).
+
+        :param operation: Name of a generated method, e.g. 'get_vm_all'.
+        :return: Generator yielding one element at a time; the request is sent on first iteration.
+        """
+        return getattr(self, operation)(*args, _iter_json=True, **kwargs)
@@ -0,0 +1,2074 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+# Generated from 10.0_U6_Swagger.json by tools/generate_endpoints.py; do not edit by hand.
+
+"""
+Low-level endpoint layer with one method per operation of the ZVM REST API.
+
+Methods are named after the swagger operationId and take the path parameters positionally,
+then the query parameters and the request body as keywords; parameters left as None are not
+sent. Any other keyword (timeout, deadline, priority, stream, ...) goes to Transport.request.
+Every method returns the requests.Response.
+
+    response = client.api.get_vpg(vpg_identifier)
+    checkpoints = client.api.get_vpg_checkpoint_all(vpg_identifier, start_date="2024-11-13T00:00:00Z").json()
+"""
+
+from .endpoint import Endpoint, EndpointLayer
+
+_GET_ALERT_ALL = Endpoint('GET', '/v1/alerts', 'getAlertAll', ('startDate', 'endDate', 'vpgIdentifier', 'zorgIdentifier', 'siteIdentifier', 'level', 'entity', 'helpIdentifier', 'isDismissed'))
+_GET_ALERT = Endpoint('GET', '/v1/alerts/{alertIdentifier}', 'getAlert')
+_REMOVE_ALERT = Endpoint('POST', '/v1/alerts/{alertIdentifier}/dismiss', 'removeAlert')
+_RESET_ALERT = Endpoint('POST', '/v1/alerts/{alertIdentifier}/undismiss', 'resetAlert')
+_GET_ALERT_LEVEL_ALL = Endpoint('GET', '/v1/alerts/levels', 'getAlertLevelAll')
+_GET_ALERT_ENTITY_ALL = Endpoint('GET', '/v1/alerts/entities', 'getAlertEntityAll')
+_GET_ALERT_HELP_ID_ALL = Endpoint('GET', '/v1/alerts/helpidentifiers', 'getAlertHelpIdAll')
+_GET_DATASTORE_ALL = Endpoint('GET', '/v1/datastores', 'getDatastoreAll')
+_GET_DATASTORE = Endpoint('GET', '/v1/datastores/{datastoreIdentifier}', 'getDatastore')
+_SUSPECTED_VOLUMES = Endpoint('GET', '/v1/encryptionDetection/suspected/volumes', 'suspectedVolumes')
+_SUSPECTED_VMS = Endpoint('GET', '/v1/encryptionDetection/suspected/vms', 'suspectedVms')
+_SUSPECTED_VPGS = Endpoint('GET', '/v1/encryptionDetection/suspected/vpgs', 'suspectedVpgs')
+_METRICS_VOLUMES = Endpoint('GET', '/v1/encryptionDetection/metrics/volumes', 'metricsVolumes')
+_METRICS_VMS = Endpoint('GET', '/v1/encryptionDetection/metrics/vms', 'metricsVms')
+_METRICS_VPGS = Endpoint('GET', '/v1/encryptionDetection/metrics/vpgs', 'metricsVpgs')
+_DISMISS_EVENT = Endpoint('POST', '/v1/encryptionDetection/dismissEvent', 'dismissEvent', (), 'json')
+_ENCRYPTION_DETECTION_ENABLED_GET = Endpoint('GET', '/v1/encryptionDetection/state', 'encryptionDetectionEnabled')
+_ENCRYPTION_DETECTION_ENABLED_POST = Endpoint('POST', '/v1/encryptionDetection/state', 'encryptionDetectionEnabled', (), 'json')
+_GET_EVENT_ALL = Endpoint('GET', '/v1/events', 'getEventAll', ('startDate', 'endDate', 'vpg', 'vpgIdentifier', 'siteName', 'siteIdentifier', 'zorgIdentifier', 'eventType', 'entityType', 'category', 'eventCategory', 'userName', 'alertIdentifier'))
+_GET_EVENT = Endpoint('GET', '/v1/events/{eventIdentifier}', 'getEvent')
+_GET_EVENT_TYPE_ALL = Endpoint('GET', '/v1/events/types', 'getEventTypeAll')
+_GET_EVENT_ENTITY_ALL = Endpoint('GET', '/v1/events/entities', 'getEventEntityAll')
+_GET_EVENT_CATEGORY_ALL = Endpoint('GET', '/v1/events/categories', 'getEventCategoryAll')
+_GET_EXPORTED_SETTINGS = Endpoint('POST', '/v1/vpgSettings/exportedSettings/{timeStamp}', 'getExportedSettings', (), 'json')
+_EXPORT_SETTINGS = Endpoint('POST', '/v1/vpgSettings/exportSettings', 'exportSettings', (), 'json')
+_GET_EXPORTED_SETTINGS_VPGS = Endpoint('GET', '/v1/vpgSettings/exportedSettings/{timeStamp}/vpgsinfo', 'getExportedSettingsVpgs')
+_GET_EXPORTED_SETTINGS_INFO = Endpoint('GET', '/v1/vpgSettings/exportedSettings', 'getExportedSettingsInfo')
+_IMPORT_VPG = Endpoint('POST', '/v1/vpgSettings/import', 'importVpg', (), 'json')
+_GET_LTR_CATALOG_VM_ALL = Endpoint('GET', '/v1/ltr/catalog/vms', 'getLtrCatalogVmAll')
+_GET_LTR_CATALOG_FULL_RETENTION_SETS = Endpoint('GET', '/v1/ltr/catalog/fullretentionsets', 'GetLtrCatalogFullRetentionSets', ('repositoryIdentifier', 'vpgIdentifier', 'zorgIdentifier'))
+_GET_LTR_CATALOG_INCREMENTALS_OF_RETENTION_SET = Endpoint('GET', '/v1/ltr/catalog/fullretentionsets/{retentionSetIdentifier}/incrementals', 'GetLtrCatalogIncrementalsOfRetentionSet')
+_DELETE_LTR_CATALOG_RETENTION_SETS = Endpoint('POST', '/v1/ltr/catalog/deleteretentionsets', 'DeleteLtrCatalogRetentionSets', (), 'json')
+_GET_LTR_CATALOG_VM_RETENTION_SETS = Endpoint('GET', '/v1/ltr/catalog/vms/{vmIdentifier}/retentionsets', 'GetLtrCatalogVmRetentionSets')
+_GET_LTR_CATALOG_VM_ORIGINAL_SETTINGS_FOR_RETENTION_SET = Endpoint('GET', '/v1/ltr/catalog/vms/{vmIdentifier}/retentionsets/{retentionSetIdentifier}/settings', 'GetLtrCatalogVmOriginalSettingsForRetentionSet')
+_START_LTR_RESTORE_VM = Endpoint('POST', '/v1/ltr/restore/vm', 'StartLtrRestoreVm', (), 'json')
+_GET_LTR_VPG_HEALTH_ALL = Endpoint('GET', '/v1/ltr/health/vpgs', 'getLtrVpgHealthAll')
+_RETENTION_START = Endpoint('POST', '/v1/ltr/vpgs/{vpgIdentifier}/retentionstart', 'RetentionStart', (), 'json')
+_RETENTION_ABORT = Endpoint('POST', '/v1/ltr/vpgs/{vpgIdentifier}/retentionabort', 'RetentionAbort')
+_NEW_REPOSITORY = Endpoint('POST', '/v1/ltr/repositories', 'newRepository', (), 'json')
+_GET_ALL_REPOSITORIES = Endpoint('GET', '/v1/ltr/repositories', 'getAllRepositories', ('connectionType', 'repositoryName'))
+_EDIT_REPOSITORY = Endpoint('PUT', '/v1/ltr/repositories/{repositoryIdentifier}', 'editRepository', (), 'json')
+_REMOVE_REPOSITORY = Endpoint('DELETE', '/v1/ltr/repositories/{repositoryIdentifier}', 'removeRepository')
+_GET_REPOSITORY_BY_ID = Endpoint('GET', '/v1/ltr/repositories/{repositoryId}', 'getRepositoryById')
+_MOUNT_FLR = Endpoint('POST', '/v1/flrs', 'mountFlr', (), 'json')
+_GET_FLR_ALL = Endpoint('GET', '/v1/flrs', 'getFlrAll', ('vmIdentifier',))
+_DISMOUNT_FLR = Endpoint('DELETE', '/v1/flrs/{flrSessionIdentifier}', 'dismountFlr')
+_GET_FLR = Endpoint('GET', '/v1/flrs/{flrSessionIdentifier}', 'getFlr')
+_GET_FLR_PATH_INFO = Endpoint('POST', '/v1/flrs/{flrSessionIdentifier}/browse', 'getFlrPathInfo', (), 'json')
+_GET_FLR_DOWNLOAD = Endpoint('POST', '/v1/flrs/{flrSessionIdentifier}/download', 'getFlrDownload', (), 'json')
+_GET_LICENSE = Endpoint('GET', '/v1/license', 'getLicense')
+_SET_LICENSE = Endpoint('PUT', '/v1/license', 'setLicense', (), 'json')
+_REMOVE_LICENSE = Endpoint('DELETE', '/v1/license', 'removeLicense')
+_GET_LOCAL_SITE_ALL = Endpoint('GET', '/v1/localsite', 'getLocalSiteAll')
+_GET_LOCAL_SITE_PAIRING_STATUS_ALL = Endpoint('GET', '/v1/localsite/pairingstatuses', 'getLocalSitePairingStatusAll')
+_SEND_LOCAL_SITE_BILLING_USAGE_DATA = Endpoint('POST', '/v1/localsite/billing/sendUsage', 'sendLocalSiteBillingUsageData')
+_EDIT_LOCAL_SITE_LOGIN_BANNER = Endpoint('PUT', '/v1/localsite/settings/loginBanner', 'editLocalSiteLoginBanner', (), 'json')
+_GET_LOCAL_SITE_LOGIN_BANNER = Endpoint('GET', '/v1/localsite/settings/loginBanner', 'getLocalSiteLoginBanner')
+_GET_PEER_ALL = Endpoint('GET', '/v1/peersites', 'getPeerAll', ('peerName', 'pairingStatus', 'location', 'hostName', 'port'))
+_START_PAIR = Endpoint('POST', '/v1/peersites', 'startPair', (), 'json')
+_GET_PEER = Endpoint('GET', '/v1/peersites/{siteIdentifier}', 'getPeer')
+_START_UNPAIR = Endpoint('DELETE', '/v1/peersites/{siteIdentifier}', 'startUnpair', (), 'json')
+_GET_PEER_STATUS_ALL = Endpoint('GET', '/v1/peersites/pairingstatuses', 'getPeerStatusAll')
+_GET_PAIRING_TOKEN = Endpoint('POST', '/v1/peersites/generatetoken', 'getPairingToken')
+_GET_RECOVERY_REPORT_ALL = Endpoint('GET', '/v1/reports/recovery', 'getRecoveryReportAll', ('startTime', 'endTime', 'pageNumber', 'pageSize', 'vpgName', 'recoveryType', 'state'))
+_GET_RECOVERY_REPORT = Endpoint('GET', '/v1/reports/recovery/{recoveryOperationIdentifier}', 'getRecoveryReport')
+_GET_RESOURCE_REPORT_ALL = Endpoint('GET', '/v1/reports/resources', 'getResourceReportAll', ('startTime', 'endTime', 'pageNumber', 'pageSize', 'zorgName', 'vpgName', 'vmName', 'protectedSiteName', 'protectedClusterName', 'protectedHostName', 'protectedOrgVdc', 'protectedVcdOrg', 'recoverySiteName', 'recoveryClusterName', 'recoveryHostName', 'recoveryOrgVdc', 'recoveryVcdOrg'))
+_DOWNLOAD_FILE_FROM_OUTPUT_DIRECTORY = Endpoint('GET', '/v1/recoveryScripts/output/files', 'downloadFileFromOutputDirectory', ('path',))
+_DELETE_OUTPUT_FILE = Endpoint('DELETE', '/v1/recoveryScripts/output/files', 'deleteOutputFile', ('path',))
+_DELETE_OUTPUT_FOLDER = Endpoint('DELETE', '/v1/recoveryScripts/output/folders', 'deleteOutputFolder', ('path', 'deleteIfNotEmpty'))
+_CREATE_OUTPUT_FOLDER = Endpoint('POST', '/v1/recoveryScripts/output/folders', 'createOutputFolder', (), 'json')
+_LIST_OUTPUT_ITEMS = Endpoint('GET', '/v1/recoveryScripts/output/items', 'listOutputItems', ('path', 'search'))
+_UPLOAD_FILE_TO_SCRIPTS_DIRECTORY = Endpoint('POST', '/v1/recoveryScripts/repository/files', 'uploadFileToScriptsDirectory', (), 'files')
+_DOWNLOAD_FILE_FROM_SCRIPTS_DIRECTORY = Endpoint('GET', '/v1/recoveryScripts/repository/files', 'downloadFileFromScriptsDirectory', ('path',))
+_DELETE_SCRIPTS_FILE = Endpoint('DELETE', '/v1/recoveryScripts/repository/files', 'deleteScriptsFile', ('path',))
+_DELETE_SCRIPTS_FOLDER = Endpoint('DELETE', '/v1/recoveryScripts/repository/folders', 'deleteScriptsFolder', ('path', 'deleteIfNotEmpty'))
+_CREATE_SCRIPTS_FOLDER = Endpoint('POST', '/v1/recoveryScripts/repository/folders', 'createScriptsFolder', (), 'json')
+_LIST_SCRIPTS_ITEMS = Endpoint('GET', '/v1/recoveryScripts/repository/items', 'listScriptsItems', ('path', 'search'))
+_SYSTEM_DATE_TIME_SERVICE_GET_DATE_TIME_LOCAL = Endpoint('GET', '/v1/serverDateTime/serverDateTimeLocal', 'SystemDateTimeService_GetDateTimeLocal')
+_SYSTEM_DATE_TIME_SERVICE_GET_DATE_TIME_UTC = Endpoint('GET', '/v1/serverDateTime/serverDateTimeUtc', 'SystemDateTimeService_GetDateTimeUtc')
+_SYSTEM_DATE_TIME_SERVICE_POST = Endpoint('GET', '/v1/serverDateTime/dateTimeArgument', 'SystemDateTimeService_Post', ('dateTime',))
+_GET_SERVICE_PROFILE_ALL = Endpoint('GET', '/v1/serviceprofiles', 'getServiceProfileAll', ('siteIdentifier',))
+_GET_SERVICE_PROFILE = Endpoint('GET', '/v1/serviceprofiles/{serviceProfileIdentifier}', 'getServiceProfile')
+_GET_VM_STATISTIC_ALL = Endpoint('GET', '/v1/statistics/vms', 'getVmStatisticAll')
+_GET_TASK_ALL = Endpoint('GET', '/v1/tasks', 'getTaskAll', ('startedBeforeDate', 'startedAfterDate', 'completedBeforeDate', 'completedAfterDate', 'type', 'status'))
+_GET_TASK = Endpoint('GET', '/v1/tasks/{taskIdentifier}', 'getTask')
+_GET_TASK_TYPE_ALL = Endpoint('GET', '/v1/tasks/types', 'getTaskTypeAll')
+_GET_VMS_WITHOUT_MOREF_ID = Endpoint('GET', '/v1/vcd/vmsWithoutMorefId', 'GetVmsWithoutMorefId')
+_GET_VALID_ORG_VDCS = Endpoint('GET', '/v1/vcd/validOrgVdcs', 'GetValidOrgVdcs')
+_GET_VM_ALL = Endpoint('GET', '/v1/vms', 'getVmAll', ('vpgName', 'vmName', 'status', 'subStatus', 'protectedSiteType', 'recoverySiteType', 'sourceType', 'targetType', 'protectedSiteIdentifier', 'recoverySiteIdentifier', 'sourceSite', 'targetSite', 'organizationName', 'priority', 'vmIdentifier', 'includeBackupedVms', 'includeMountedVms'))
+_GET_VM = Endpoint('GET', '/v1/vms/{vmIdentifier}', 'getVm', ('vpgIdentifier', 'includeBackupedVms', 'includeMountedVms'))
+_RESTORE_VM = Endpoint('POST', '/v1/vms/{vmIdentifier}/Restore', 'restoreVm', (), 'json')
+_COMMIT_VM = Endpoint('POST', '/v1/vms/{vmIdentifier}/RestoreCommit', 'commitVm', (), 'json')
+_ROLLBACK_VM = Endpoint('POST', '/v1/vms/{vmIdentifier}/RestoreRollback', 'rollbackVm', (), 'json')
+_POINTS_IN_TIME = Endpoint('GET', '/v1/vms/{vmIdentifier}/pointsInTime', 'pointsInTime', ('vpgIdentifier', 'startDate', 'endDate'))
+_POINTS_IN_TIME_STATS = Endpoint('GET', '/v1/vms/{vmIdentifier}/pointsInTime/stats', 'pointsInTimeStats', ('vpgIdentifier',))
+_GET_VIRTUALIZATION_SITE_ALL = Endpoint('GET', '/v1/virtualizationsites', 'getVirtualizationSiteAll')
+_GET_VIRTUALIZATION_SITE = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}', 'getVirtualizationSite')
+_GET_VIRTUALIZATION_SITE_VM_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/vms', 'getVirtualizationSiteVmAll')
+_GET_VIRTUALIZATION_SITE_VM_VCD_VAPP_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/vcdvapps', 'getVirtualizationSiteVmVcdVappAll')
+_GET_VIRTUALIZATION_SITE_DATASTORE_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/datastores', 'getVirtualizationSiteDatastoreAll')
+_GET_VIRTUALIZATION_SITE_FOLDER_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/folders', 'getVirtualizationSiteFolderAll')
+_GET_VIRTUALIZATION_SITE_DATASTORE_CLUSTER_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/datastoreclusters', 'getVirtualizationSiteDatastoreClusterAll')
+_GET_VIRTUALIZATION_SITE_RESOURCE_POOL_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/resourcepools', 'getVirtualizationSiteResourcePoolAll')
+_GET_VIRTUALIZATION_SITE_ORG_VDC_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/orgvdcs', 'getVirtualizationSiteOrgVdcAll')
+_GET_VIRTUALIZATION_SITE_NETWORK_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/networks', 'getVirtualizationSiteNetworkAll')
+_GET_VIRTUALIZATION_SITE_HOST_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/hosts', 'getVirtualizationSiteHostAll')
+_GET_VIRTUALIZATION_SITE_HOST_CLUSTER_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/hostclusters', 'getVirtualizationSiteHostClusterAll')
+_GET_VIRTUALIZATION_SITE_HOST = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/hosts/{hostIdentifier}', 'getVirtualizationSiteHost')
+_GET_VIRTUALIZATION_SITE_REPOSITORY_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/repositories', 'getVirtualizationSiteRepositoryAll')
+_GET_VIRTUALIZATION_SITE_ORG_VDC_NETWORK_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/orgvdcs/{orgVdcIdentifier}/networks', 'getVirtualizationSiteOrgVdcNetworkAll')
+_GET_VIRTUALIZATION_SITE_STORAGE_POLICY_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/orgvdcs/{orgVdcIdentifier}/storagepolicies', 'getVirtualizationSiteStoragePolicyAll')
+_GET_VIRTUALIZATION_SITE_DEVICE_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/devices', 'getVirtualizationSiteDeviceAll', ('hostIdentifier', 'deviceName'))
+_GET_PUBLIC_CLOUD_NETWORK_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/publiccloud/virtualNetworks', 'getPublicCloudNetworkAll', ('virtualNetworkIdentifier',))
+_GET_PUBLIC_CLOUD_SUBNET_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/publiccloud/subnets', 'getPublicCloudSubnetAll', ('virtualNetworkIdentifier',))
+_GET_PUBLIC_CLOUD_SECURITY_GROUP_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/publiccloud/securityGroups', 'getPublicCloudSecurityGroupAll')
+_GET_PUBLIC_CLOUD_VM_INSTANCE_TYPE_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/publiccloud/vmInstanceTypes', 'getPublicCloudVmInstanceTypeAll')
+_GET_PUBLIC_CLOUD_RESOURCE_GROUPS_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/publiccloud/resourceGroups', 'getPublicCloudResourceGroupsAll')
+_GET_PUBLIC_CLOUD_KEYS_CONTAINERS = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/publiccloud/keyscontainers', 'getPublicCloudKeysContainers')
+_GET_PUBLIC_CLOUD_ENCRYPTION_KEY = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/publiccloud/encryptionkeys/{encryptionKeyId}', 'getPublicCloudEncryptionKey')
+_GET_PUBLIC_CLOUD_ENCRYPTION_KEYS_ALL = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/publiccloud/encryptionkeys', 'getPublicCloudEncryptionKeysAll', ('keysContainerId',))
+_GET_PUBLIC_CLOUD_MANAGED_IDENTITIES = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/publiccloud/managedidentities', 'getPublicCloudManagedIdentities')
+_GET_PUBLIC_CLOUD_DISK_ENCRYPTION_KEYS = Endpoint('GET', '/v1/virtualizationsites/{siteIdentifier}/publiccloud/diskencryptionkeys', 'getPublicCloudDiskEncryptionKeys')
+_GET_VOLUME_ALL = Endpoint('GET', '/v1/volumes', 'getVolumeAll', ('volumeType', 'vpgIdentifier', 'datastoreIdentifier', 'protectedVmIdentifier', 'owningVmIdentifier'))
+_NEW_VPG_SETTING = Endpoint('POST', '/v1/vpgSettings', 'newVpgSetting', ('repopulateSettings',), 'json')
+_GET_VPG_SETTING_ALL = Endpoint('GET', '/v1/vpgSettings', 'getVpgSettingAll')
+_COPY_VPG_SETTING = Endpoint('POST', '/v1/vpgSettings/copyVpgSettings', 'copyVpgSetting', (), 'json')
+_EDIT_VPG_SETTING = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}', 'editVpgSetting', (), 'json')
+_REMOVE_VPG_SETTING = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}', 'removeVpgSetting')
+_GET_VPG_SETTING = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}', 'getVpgSetting')
+_EDIT_VPG_SETTING_BASIC = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/basic', 'editVpgSettingBasic', (), 'json')
+_REMOVE_VPG_SETTINGS_BASIC = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}/basic', 'removeVpgSettingsBasic')
+_GET_VPG_SETTING_BASIC = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/basic', 'getVpgSettingBasic')
+_EDIT_VPG_SETTING_BASIC_BOOT_GROUP = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/bootgroup', 'editVpgSettingBasicBootGroup', (), 'json')
+_DELETE_VPG_SETTING_BOOT_GROUP = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}/bootgroup', 'deleteVpgSettingBootGroup')
+_GET_VPG_SETTING_BOOT_GROUP = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/bootgroup', 'getVpgSettingBootGroup')
+_EDIT_VPG_SETTING_SCRIPT = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/scripting', 'editVpgSettingScript', (), 'json')
+_DELETE_VPG_SETTING_SCRIPT = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}/scripting', 'deleteVpgSettingScript')
+_GET_VPG_SETTING_SCRIPT = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/scripting', 'getVpgSettingScript')
+_EDIT_VPG_SETTING_RECOVERY = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/recovery', 'editVpgSettingRecovery', (), 'json')
+_REMOVE_VPG_SETTING_RECOVERY = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}/recovery', 'removeVpgSettingRecovery')
+_GET_VPG_SETTING_RECOVERY = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/recovery', 'getVpgSettingRecovery')
+_EDIT_VPG_SETTING_JOURNAL = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/journal', 'editVpgSettingJournal', (), 'json')
+_REMOVE_VPG_SETTING_JOURNAL = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}/journal', 'removeVpgSettingJournal')
+_GET_VPG_SETTING_JOURNAL = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/journal', 'getVpgSettingJournal')
+_EDIT_VPG_SETTING_SCRATCH = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/scratch', 'editVpgSettingScratch', (), 'json')
+_REMOVE_VPG_SETTING_SCRATCH = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}/scratch', 'removeVpgSettingScratch')
+_GET_VPG_SETTING_SCRATCH = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/scratch', 'getVpgSettingScratch')
+_GET_VPG_SETTING_LTR = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/ltr', 'getVpgSettingLtr')
+_NEW_VPG_SETTING_LTR = Endpoint('POST', '/v1/vpgSettings/{vpgSettingsIdentifier}/ltr', 'newVpgSettingLtr', (), 'json')
+_EDIT_VPG_SETTING_LTR = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/ltr', 'editVpgSettingLtr', (), 'json')
+_REMOVE_VPG_SETTING_LTR = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}/ltr', 'removeVpgSettingLtr')
+_EDIT_VPG_SETTING_LTR_NETWORK = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/networks', 'editVpgSettingLtrNetwork', (), 'json')
+_REMOVE_VPG_SETTING_LTR_NETWORK = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}/networks', 'removeVpgSettingLtrNetwork')
+_GET_VPG_SETTING_LTR_NETWORK_ALL = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/networks', 'getVpgSettingLtrNetworkAll')
+_NEW_VPG_SETTING_VM = Endpoint('POST', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms', 'newVpgSettingVm', (), 'json')
+_GET_VPG_SETTING_VM_ALL = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms', 'getVpgSettingVmAll')
+_EDIT_VPG_SETTING_VM = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}', 'editVpgSettingVm', (), 'json')
+_REMOVE_VPG_SETTING_VM = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}', 'removeVpgSettingVm')
+_GET_VPG_SETTING_VM = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}', 'getVpgSettingVm')
+_GET_VPG_SETTING_VM_VOLUME_ALL = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/volumes', 'getVpgSettingVmVolumeAll')
+_EDIT_VPG_SETTING_VM_VOLUME = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/volumes/{volumeIdentifier}', 'editVpgSettingVmVolume', (), 'json')
+_GET_VPG_SETTING_VM_VOLUME = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/volumes/{volumeIdentifier}', 'getVpgSettingVmVolume')
+_GET_VPG_SETTING_VM_NIC_ALL = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/nics', 'getVpgSettingVmNicAll')
+_EDIT_VPG_SETTING_VM_NIC = Endpoint('PUT', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/nics/{nicIdentifier}', 'editVpgSettingVmNic', (), 'json')
+_REMOVE_VPG_SETTING_VM_NIC = Endpoint('DELETE', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/nics/{nicIdentifier}', 'removeVpgSettingVmNic')
+_GET_VPG_SETTING_VM_NIC = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/nics/{nicIdentifier}', 'getVpgSettingVmNic')
+_START_VPG_SETTING_COMMIT = Endpoint('POST', '/v1/vpgSettings/{vpgSettingsIdentifier}/commit', 'startVpgSettingCommit')
+_GET_VPG_SETTING_POSSIBLE_PRIORITY_ALL = Endpoint('GET', '/v1/vpgSettings/{vpgSettingsIdentifier}/priority', 'getVpgSettingPossiblePriorityAll')
+_GET_VPG_ALL = Endpoint('GET', '/v1/vpgs', 'getVpgAll', ('name', 'status', 'subStatus', 'protectedSiteType', 'recoverySiteType', 'protectedSiteIdentifier', 'recoverySiteIdentifier', 'sourceSite', 'targetSite', 'sourceType', 'targetType', 'organizationName', 'zorgIdentifier', 'priority', 'serviceProfileIdentifier', 'backupEnabled'))
+_GET_VPG = Endpoint('GET', '/v1/vpgs/{vpgIdentifier}', 'getVpg')
+_START_VPG_DELETE = Endpoint('DELETE', '/v1/vpgs/{vpgIdentifier}', 'startVpgDelete', (), 'json')
+_GET_VPG_CHECKPOINT_ALL = Endpoint('GET', '/v1/vpgs/{vpgIdentifier}/checkpoints', 'getVpgCheckpointAll', ('startDate', 'endDate'))
+_START_VPG_TAGGED_CHECKPOINT_INSERT = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/checkpoints', 'startVpgTaggedCheckpointInsert', (), 'json')
+_GET_VPG_CHECKPOINT_STAT_ALL = Endpoint('GET', '/v1/vpgs/{vpgIdentifier}/checkpoints/stats', 'getVpgCheckpointStatAll')
+_START_VPG_FAILOVER_TEST = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/FailoverTest', 'startVpgFailoverTest', (), 'json')
+_STOP_VPG_FAILOVER_TEST = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/FailoverTestStop', 'stopVpgFailoverTest', (), 'json')
+_START_VPG_FAILOVER = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/Failover', 'startVpgFailover', (), 'json')
+_START_VPG_MOVE = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/Move', 'startVpgMove', (), 'json')
+_START_VPG_MOVE_ROLLBACK = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/moveRollback', 'startVpgMoveRollback')
+_START_VPG_MOVE_COMMIT = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/MoveCommit', 'startVpgMoveCommit', (), 'json')
+_START_VPG_FAILOVER_COMMIT = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/FailoverCommit', 'startVpgFailoverCommit', (), 'json')
+_START_VPG_FAILOVER_ROLLBACK = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/FailoverRollback', 'startVpgFailoverRollback')
+_START_VPG_CLONE = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/CloneStart', 'startVpgClone', (), 'json')
+_STOP_VPG_CLONE = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/CloneAbort', 'stopVpgClone')
+_GET_VPG_RETENTION_POLICY_ALL = Endpoint('GET', '/v1/vpgs/retentionpolicies', 'getVpgRetentionPolicyAll')
+_GET_VPG_PRIORITY_ALL = Endpoint('GET', '/v1/vpgs/priorities', 'getVpgPriorityAll')
+_GET_VPG_ENTITY_TYPE_ALL = Endpoint('GET', '/v1/vpgs/entitytypes', 'getVpgEntityTypeAll')
+_GET_VPG_STATUS_ALL = Endpoint('GET', '/v1/vpgs/statuses', 'getVpgStatusAll')
+_GET_VPG_SUB_STATUS_ALL = Endpoint('GET', '/v1/vpgs/substatuses', 'getVpgSubStatusAll')
+_GET_VPG_FAILOVER_SHUTDOWN_POLICY_ALL = Endpoint('GET', '/v1/vpgs/failovershutdownpolicies', 'getVpgFailoverShutdownPolicyAll')
+_GET_VPG_FAILOVER_COMMIT_POLICY_ALL = Endpoint('GET', '/v1/vpgs/failovercommitpolicies', 'getVpgFailoverCommitPolicyAll')
+_START_VPG_PAUSE = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/pause', 'startVpgPause')
+_START_VPG_RESUME = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/resume', 'startVpgResume')
+_START_VPG_FORCE_SYNC = Endpoint('POST', '/v1/vpgs/{vpgIdentifier}/forcesync', 'startVpgForceSync')
+_GET_VRA_ALL = Endpoint('GET', '/v1/vras', 'getVraAll', ('vraName', 'status', 'vraVersion', 'hostVersion', 'ipAddress', 'vraGroup', 'datastoreName', 'datastoreClusterName', 'networkName', 'vraIpConfigurationTypeApi'))
+_START_VRA_INSTALL = Endpoint('POST', '/v1/vras', 'startVraInstall', (), 'json')
+_GET_VRA = Endpoint('GET', '/v1/vras/{vraIdentifier}', 'getVra')
+_START_VRA_UNINSTALL = Endpoint('DELETE', '/v1/vras/{vraIdentifier}', 'startVraUninstall')
+_START_VRA_EDIT = Endpoint('PUT', '/v1/vras/{vraIdentifier}', 'startVraEdit', (), 'json')
+_START_VRAS_ON_CLUSTER_INSTALL = Endpoint('POST', '/v1/vras/clusters', 'startVrasOnClusterInstall', (), 'json')
+_START_CLUSTER_VRAS_UNINSTALL = Endpoint('DELETE', '/v1/vras/clusters/{clusterIdentifier}', 'startClusterVrasUninstall', ('vaioAllowMaintenanceMode',))
+_START_CLUSTER_VRAS_UPGRADE = Endpoint('PUT', '/v1/vras/clusters/{clusterIdentifier}', 'startClusterVrasUpgrade', ('vaioAllowMaintenanceMode',))
+_START_VRA_CLEANUP = Endpoint('DELETE', '/v1/vras/cleanup', 'startVraCleanup', ('vaioAllowMaintenanceMode',))
+_START_VRA_UPGRADE = Endpoint('POST', '/v1/vras/{vraIdentifier}/upgrade', 'startVraUpgrade')
+_GET_VRA_CLUSTER_SETTINGS = Endpoint('GET', '/v1/vras/clusters/{clusterIdentifier}/settings', 'getVraClusterSettings')
+_START_SET_VRA_CLUSTER_SETTINGS = Endpoint('POST', '/v1/vras/clusters/{clusterIdentifier}/settings', 'startSetVraClusterSettings', (), 'json')
+_GET_VRA_STATUS_ALL = Endpoint('GET', '/v1/vras/statuses', 'getVraStatusAll')
+_GET_VRA_CONFIGURATION_TYPE_ALL = Endpoint('GET', '/v1/vras/ipconfigurationtypes', 'getVraConfigurationTypeAll')
+_GET_VRA_CHANGE_RECOVERY_HOST_POTENTIAL = Endpoint('GET', '/v1/vras/{vraIdentifier}/changerecoveryvra/potentials', 'getVraChangeRecoveryHostPotential', ('vmIdentifier',))
+_START_VRA_CHANGE_RECOVERY_HOST = Endpoint('POST', '/v1/vras/{vraIdentifier}/changerecoveryvra/execute', 'startVraChangeRecoveryHost', (), 'json')
+_TEST_VRA_CHANGE_RECOVERY_HOST_SETTING = Endpoint('POST', '/v1/vras/{vraIdentifier}/changerecoveryvra/validate', 'testVraChangeRecoveryHostSetting', (), 'json')
+_GET_VRA_CHANGE_RECOVERY_HOST_RECOMMENDATION = Endpoint('POST', '/v1/vras/{vraIdentifier}/changerecoveryvra/recommendation', 'getVraChangeRecoveryHostRecommendation', (), 'json')
+_GET_ZORG_ALL = Endpoint('GET', '/v1/zorgs', 'getZorgAll')
+_GET_ZORG = Endpoint('GET', '/v1/zorgs/{zorgIdentifier}', 'getZorg')
+_CONNECT_ZSSP = Endpoint('POST', '/v1/zsspsessions', 'connectZssp', (), 'json')
+_GET_ZSSP_SESSION_ALL = Endpoint('GET', '/v1/zsspsessions', 'getZsspSessionAll')
+_GET_ZSSP_SESSION = Endpoint('GET', '/v1/zsspsessions/{zsspSessionIdentifier}', 'getZsspSession')
+_DISCONNECT_ZSSP = Endpoint('DELETE', '/v1/zsspsessions/{zsspSessionIdentifier}', 'disconnectZssp')
+_GET_AUTH_TOKEN = Endpoint('POST', '/auth/realms/zerto/protocol/openid-connect/token', 'getAuthToken', (), 'data', authenticated=False)
+
+
+class Endpoints(EndpointLayer):
+    """All 219 operations of the ZVM REST API; available as client.api."""
+
+    # Alerts
+
+    def get_alert_all(self, start_date: str = None, end_date: str = None, vpg_identifier: str = None, zorg_identifier: str = None, site_identifier: str = None, level: str = None, entity: str = None, help_identifier: str = None, is_dismissed: bool = None, **options):
+        """
+        Get a list of latest Zerto alerts. You can filter the results with additional parameters. (Auth)
+
+        GET /v1/alerts
+        """
+        return self._call(_GET_ALERT_ALL, None, (start_date, end_date, vpg_identifier, zorg_identifier, site_identifier, level, entity, help_identifier, is_dismissed), None, options)
+
+    def get_alert(self, alert_identifier: str, **options):
+        """
+        Get information about the specific Zerto alert. (Auth)
+
+        GET /v1/alerts/{alertIdentifier}
+        """
+        return self._call(_GET_ALERT, (alert_identifier,), None, None, options)
+
+    def remove_alert(self, alert_identifier: str, **options):
+        """
+        Dismiss a specific alert. (Auth)
+
+        POST /v1/alerts/{alertIdentifier}/dismiss
+        """
+        return self._call(_REMOVE_ALERT, (alert_identifier,), None, None, options)
+
+    def reset_alert(self, alert_identifier: str, **options):
+        """
+        Undismiss a specific alert. (Auth)
+
+        POST /v1/alerts/{alertIdentifier}/undismiss
+        """
+        return self._call(_RESET_ALERT, (alert_identifier,), None, None, options)
+
+    def get_alert_level_all(self, **options):
+        """
+        Get a list of all available alert levels. (Auth)
+
+        GET /v1/alerts/levels
+        """
+        return self._call(_GET_ALERT_LEVEL_ALL, None, None, None, options)
+
+    def get_alert_entity_all(self, **options):
+        """
+        Get a list of all available alert entities. (Auth)
+
+        GET /v1/alerts/entities
+        """
+        return self._call(_GET_ALERT_ENTITY_ALL, None, None, None, options)
+
+    def get_alert_help_id_all(self, **options):
+        """
+        Get a list of all available alert help identifiers. (Auth)
+
+        GET /v1/alerts/helpidentifiers
+        """
+        return self._call(_GET_ALERT_HELP_ID_ALL, None, None, None, options)
+
+    # Datastores
+
+    def get_datastore_all(self, **options):
+        """
+        Get a list of datastore info available on the current site (Auth)
+
+        GET /v1/datastores
+        """
+        return self._call(_GET_DATASTORE_ALL, None, None, None, options)
+
+    def get_datastore(self, datastore_identifier: str, **options):
+        """
+        Get information about a specific datastore (Auth)
+
+        GET /v1/datastores/{datastoreIdentifier}
+        """
+        return self._call(_GET_DATASTORE, (datastore_identifier,), None, None, options)
+
+    # Encryption Detection
+
+    def suspected_volumes(self, **options):
+        """
+        Get a list of Volumes that are suspected to have an encryption event (Auth)
+
+        GET /v1/encryptionDetection/suspected/volumes
+        """
+        return self._call(_SUSPECTED_VOLUMES, None, None, None, options)
+
+    def suspected_vms(self, **options):
+        """
+        Get a list of VMs that are suspected to have an encryption event (Auth)
+
+        GET /v1/encryptionDetection/suspected/vms
+        """
+        return self._call(_SUSPECTED_VMS, None, None, None, options)
+
+    def suspected_vpgs(self, **options):
+        """
+        Get a list of VPGs that are suspected to have an encryption event (Auth)
+
+        GET /v1/encryptionDetection/suspected/vpgs
+        """
+        return self._call(_SUSPECTED_VPGS, None, None, None, options)
+
+    def metrics_volumes(self, **options):
+        """
+        Get a list of volumes with encryption data (Auth)
+
+        GET /v1/encryptionDetection/metrics/volumes
+        """
+        return self._call(_METRICS_VOLUMES, None, None, None, options)
+
+    def metrics_vms(self, **options):
+        """
+        Get a list of VMs with encryption data (Auth)
+
+        GET /v1/encryptionDetection/metrics/vms
+        """
+        return self._call(_METRICS_VMS, None, None, None, options)
+
+    def metrics_vpgs(self, **options):
+        """
+        Get a list of VPGs with encryption data (Auth)
+
+        GET /v1/encryptionDetection/metrics/vpgs
+        """
+        return self._call(_METRICS_VPGS, None, None, None, options)
+
+    def dismiss_event(self, body: dict = None, **options):
+        """
+        Dismiss encryption event (resolve alert, clear tag checkpoint) (Auth)
+
+        POST /v1/encryptionDetection/dismissEvent
+        """
+        return self._call(_DISMISS_EVENT, None, None, body, options)
+
+    def encryption_detection_enabled_get(self, **options):
+        """
+        Get the state of the encryption detection (enabled/disabled).  This API will be deprecated starting
+        Zerto 10.0_U6. Use the following new API for Site Setting configuration:
+        /management/api/settings/v1/settings (Auth)
+
+        GET /v1/encryptionDetection/state
+        """
+        return self._call(_ENCRYPTION_DETECTION_ENABLED_GET, None, None, None, options)
+
+    def encryption_detection_enabled_post(self, body: dict = None, **options):
+        """
+        Set the state of the encryption detection (enabled/disabled).  This API will be deprecated starting
+        Zerto 10.0_U6. Use the following new API for Site Setting configuration:
+        /management/api/settings/v1/settings (Auth)
+
+        POST /v1/encryptionDetection/state
+        """
+        return self._call(_ENCRYPTION_DETECTION_ENABLED_POST, None, None, body, options)
+
+    # Events
+
+    def get_event_all(self, start_date: str = None, end_date: str = None, vpg: str = None, vpg_identifier: str = None, site_name: str = None, site_identifier: str = None, zorg_identifier: str = None, event_type: str = None, entity_type: str = None, category: str = None, event_category: str = None, user_name: str = None, alert_identifier: str = None, **options):
+        """
+        Get a list of latest Zerto events. You can filter the results with additional parameters. (Auth)
+
+        GET /v1/events
+        """
+        return self._call(_GET_EVENT_ALL, None, (start_date, end_date, vpg, vpg_identifier, site_name, site_identifier, zorg_identifier, event_type, entity_type, category, event_category, user_name, alert_identifier), None, options)
+
+    def get_event(self, event_identifier: str, **options):
+        """
+        Get data for a single event on the site processing the API. (Auth)
+
+        GET /v1/events/{eventIdentifier}
+        """
+        return self._call(_GET_EVENT, (event_identifier,), None, None, options)
+
+    def get_event_type_all(self, **options):
+        """
+        Get a list of all available event types (Auth)
+
+        GET /v1/events/types
+        """
+        return self._call(_GET_EVENT_TYPE_ALL, None, None, None, options)
+
+    def get_event_entity_all(self, **options):
+        """
+        Get a list of all available event entities. (Auth)
+
+        GET /v1/events/entities
+        """
+        return self._call(_GET_EVENT_ENTITY_ALL, None, None, None, options)
+
+    def get_event_category_all(self, **options):
+        """
+        Get a list of all available event categories. (Auth)
+
+        GET /v1/events/categories
+        """
+        return self._call(_GET_EVENT_CATEGORY_ALL, None, None, None, options)
+
+    # Export Import VPG(Virtual Protection Group) Settings
+
+    def get_exported_settings(self, time_stamp: str, body: dict = None, **options):
+        """
+        Read exported settings from a file of given timestamp. (Auth)
+
+        POST /v1/vpgSettings/exportedSettings/{timeStamp}
+        """
+        return self._call(_GET_EXPORTED_SETTINGS, (time_stamp,), None, body, options)
+
+    def export_settings(self, body: dict = None, **options):
+        """
+        Export all current VPGs settings. (Auth)
+
+        POST /v1/vpgSettings/exportSettings
+        """
+        return self._call(_EXPORT_SETTINGS, None, None, body, options)
+
+    def get_exported_settings_vpgs(self, time_stamp: str, **options):
+        """
+        Get list of VPGs from exported settings file. (Auth)
+
+        GET /v1/vpgSettings/exportedSettings/{timeStamp}/vpgsinfo
+        """
+        return self._call(_GET_EXPORTED_SETTINGS_VPGS, (time_stamp,), None, None, options)
+
+    def get_exported_settings_info(self, **options):
+        """
+        Get all available exported settings files. (Auth)
+
+        GET /v1/vpgSettings/exportedSettings
+        """
+        return self._call(_GET_EXPORTED_SETTINGS_INFO, None, None, None, options)
+
+    def import_vpg(self, body: dict = None, **options):
+        """
+        Import VPGs. (Auth)
+
+        POST /v1/vpgSettings/import
+        """
+        return self._call(_IMPORT_VPG, None, None, body, options)
+
+    # Extended Journal Copy
+
+    def get_ltr_catalog_vm_all(self, **options):
+        """
+        Get a list of available VMs in a Retention set (Auth)
+
+        GET /v1/ltr/catalog/vms
+        """
+        return self._call(_GET_LTR_CATALOG_VM_ALL, None, None, None, options)
+
+    def get_ltr_catalog_full_retention_sets(self, repository_identifier: str = None, vpg_identifier: str = None, zorg_identifier: str = None, **options):
+        """
+        Get a list of full Retention sets (Auth)
+
+        GET /v1/ltr/catalog/fullretentionsets
+        """
+        return self._call(_GET_LTR_CATALOG_FULL_RETENTION_SETS, None, (repository_identifier, vpg_identifier, zorg_identifier), None, options)
+
+    def get_ltr_catalog_incrementals_of_retention_set(self, retention_set_identifier: str, **options):
+        """
+        Get a list of incremental Retention sets (Auth)
+
+        GET /v1/ltr/catalog/fullretentionsets/{retentionSetIdentifier}/incrementals
+        """
+        return self._call(_GET_LTR_CATALOG_INCREMENTALS_OF_RETENTION_SET, (retention_set_identifier,), None, None, options)
+
+    def delete_ltr_catalog_retention_sets(self, body: dict = None, **options):
+        """
+        Delete Retention sets (Auth)
+
+        POST /v1/ltr/catalog/deleteretentionsets
+        """
+        return self._call(_DELETE_LTR_CATALOG_RETENTION_SETS, None, None, body, options)
+
+    def get_ltr_catalog_vm_retention_sets(self, vm_identifier: str, **options):
+        """
+        Get a list of the available Retention sets for a VM in all Repositories in the site (Auth)
+
+        GET /v1/ltr/catalog/vms/{vmIdentifier}/retentionsets
+        """
+        return self._call(_GET_LTR_CATALOG_VM_RETENTION_SETS, (vm_identifier,), None, None, options)
+
+    def get_ltr_catalog_vm_original_settings_for_retention_set(self, vm_identifier: str, retention_set_identifier: str, **options):
+        """
+        Get the original settings for a VM in a Retention set (Auth)
+
+        GET /v1/ltr/catalog/vms/{vmIdentifier}/retentionsets/{retentionSetIdentifier}/settings
+        """
+        return self._call(_GET_LTR_CATALOG_VM_ORIGINAL_SETTINGS_FOR_RETENTION_SET, (vm_identifier, retention_set_identifier), None, None, options)
+
+    def start_ltr_restore_vm(self, body: dict = None, **options):
+        """
+        Restore the VM from the Repository at the recovery site. Returns a token. (Auth)
+
+        POST /v1/ltr/restore/vm
+        """
+        return self._call(_START_LTR_RESTORE_VM, None, None, body, options)
+
+    def get_ltr_vpg_health_all(self, **options):
+        """
+        Get a list of Extended Journal Copy VPGs (Auth)
+
+        GET /v1/ltr/health/vpgs
+        """
+        return self._call(_GET_LTR_VPG_HEALTH_ALL, None, None, None, options)
+
+    def retention_start(self, vpg_identifier: str, body: dict = None, **options):
+        """
+        Start the Manual Retention process (Auth)
+
+        POST /v1/ltr/vpgs/{vpgIdentifier}/retentionstart
+        """
+        return self._call(_RETENTION_START, (vpg_identifier,), None, body, options)
+
+    def retention_abort(self, vpg_identifier: str, **options):
+        """
+        End the Manual Retention process (Auth)
+
+        POST /v1/ltr/vpgs/{vpgIdentifier}/retentionabort
+        """
+        return self._call(_RETENTION_ABORT, (vpg_identifier,), None, None, options)
+
+    def new_repository(self, body: dict = None, **options):
+        """
+        Create new repository (Auth)
+
+        POST /v1/ltr/repositories
+        """
+        return self._call(_NEW_REPOSITORY, None, None, body, options)
+
+    def get_all_repositories(self, connection_type: str = None, repository_name: str = None, **options):
+        """
+        Get All Repositories (Auth)
+
+        GET /v1/ltr/repositories
+        """
+        return self._call(_GET_ALL_REPOSITORIES, None, (connection_type, repository_name), None, options)
+
+    def edit_repository(self, repository_identifier: str, body: dict = None, **options):
+        """
+        Edit existing repository (Auth)
+
+        PUT /v1/ltr/repositories/{repositoryIdentifier}
+        """
+        return self._call(_EDIT_REPOSITORY, (repository_identifier,), None, body, options)
+
+    def remove_repository(self, repository_identifier: str, **options):
+        """
+        Delete existing repository (Auth)
+
+        DELETE /v1/ltr/repositories/{repositoryIdentifier}
+        """
+        return self._call(_REMOVE_REPOSITORY, (repository_identifier,), None, None, options)
+
+    def get_repository_by_id(self, repository_id: str, **options):
+        """
+        Get Repository By Id (Auth)
+
+        GET /v1/ltr/repositories/{repositoryId}
+        """
+        return self._call(_GET_REPOSITORY_BY_ID, (repository_id,), None, None, options)
+
+    # File-level Restore
+
+    def mount_flr(self, body: dict = None, **options):
+        """
+        Create a new Mount Session. Mount a disk with specified parameters. Get the FLR session identifier.
+        (Auth)
+
+        POST /v1/flrs
+        """
+        return self._call(_MOUNT_FLR, None, None, body, options)
+
+    def get_flr_all(self, vm_identifier: str = None, **options):
+        """
+        Get all mounted volumes. Results can be filtered by a VM identifier. (Auth)
+
+        GET /v1/flrs
+        """
+        return self._call(_GET_FLR_ALL, None, (vm_identifier,), None, options)
+
+    def dismount_flr(self, flr_session_identifier: str, **options):
+        """
+        Unmount a previously mounted disk. (Auth)
+
+        DELETE /v1/flrs/{flrSessionIdentifier}
+        """
+        return self._call(_DISMOUNT_FLR, (flr_session_identifier,), None, None, options)
+
+    def get_flr(self, flr_session_identifier: str, **options):
+        """
+        Get information about a single mounted disk. (Auth)
+
+        GET /v1/flrs/{flrSessionIdentifier}
+        """
+        return self._call(_GET_FLR, (flr_session_identifier,), None, None, options)
+
+    def get_flr_path_info(self, flr_session_identifier: str, body: dict = None, **options):
+        """
+        Browse a list of files and folders in a specific path in the mounted disk. (Auth)
+
+        POST /v1/flrs/{flrSessionIdentifier}/browse
+        """
+        return self._call(_GET_FLR_PATH_INFO, (flr_session_identifier,), None, body, options)
+
+    def get_flr_download(self, flr_session_identifier: str, body: dict = None, **options):
+        """
+        Get URL link to download all the files from the specified paths. (Auth)
+
+        POST /v1/flrs/{flrSessionIdentifier}/download
+        """
+        return self._call(_GET_FLR_DOWNLOAD, (flr_session_identifier,), None, body, options)
+
+    # Licensing
+
+    def get_license(self, **options):
+        """
+        Get license details of the ZVM (Auth)
+
+        GET /v1/license
+        """
+        return self._call(_GET_LICENSE, None, None, None, options)
+
+    def set_license(self, body: dict = None, **options):
+        """
+        Add a new license or update an existing one. (Auth)
+
+        PUT /v1/license
+        """
+        return self._call(_SET_LICENSE, None, None, body, options)
+
+    def remove_license(self, **options):
+        """
+        Delete the license from the ZVM (Auth)
+
+        DELETE /v1/license
+        """
+        return self._call(_REMOVE_LICENSE, None, None, None, options)
+
+    # Local Site
+
+    def get_local_site_all(self, **options):
+        """
+        Get information about the local site (Auth)
+
+        GET /v1/localsite
+        """
+        return self._call(_GET_LOCAL_SITE_ALL, None, None, None, options)
+
+    def get_local_site_pairing_status_all(self, **options):
+        """
+        Get the list of acceptable values for site pairing status (Auth)
+
+        GET /v1/localsite/pairingstatuses
+        """
+        return self._call(_GET_LOCAL_SITE_PAIRING_STATUS_ALL, None, None, None, options)
+
+    def send_local_site_billing_usage_data(self, **options):
+        """
+        Send billing data to the billing server (Auth)
+
+        POST /v1/localsite/billing/sendUsage
+        """
+        return self._call(_SEND_LOCAL_SITE_BILLING_USAGE_DATA, None, None, None, options)
+
+    def edit_local_site_login_banner(self, body: dict = None, **options):
+        """
+        Set the login banner settings of the current site.  This API will be deprecated starting Zerto
+        10.0_U6. Use the following new API for Site Setting configuration:
+        /management/api/settings/v1/settings (Auth)
+
+        PUT /v1/localsite/settings/loginBanner
+        """
+        return self._call(_EDIT_LOCAL_SITE_LOGIN_BANNER, None, None, body, options)
+
+    def get_local_site_login_banner(self, **options):
+        """
+        Get the login banner settings of the current site.
+
+        GET /v1/localsite/settings/loginBanner
+        """
+        return self._call(_GET_LOCAL_SITE_LOGIN_BANNER, None, None, None, options)
+
+    # Peer Sites
+
+    def get_peer_all(self, peer_name: str = None, pairing_status: str = None, location: str = None, host_name: str = None, port: int = None, **options):
+        """
+        Get a list of all peer sites (Auth)
+
+        GET /v1/peersites
+        """
+        return self._call(_GET_PEER_ALL, None, (peer_name, pairing_status, location, host_name, port), None, options)
+
+    def start_pair(self, body: dict = None, **options):
+        """
+        Add a peer site (start pairing). (Auth)
+
+        POST /v1/peersites
+        """
+        return self._call(_START_PAIR, None, None, body, options)
+
+    def get_peer(self, site_identifier: str, **options):
+        """
+        Get information about the specified peer site (Auth)
+
+        GET /v1/peersites/{siteIdentifier}
+        """
+        return self._call(_GET_PEER, (site_identifier,), None, None, options)
+
+    def start_unpair(self, site_identifier: str, body: dict = None, **options):
+        """
+        Unpair a peer site (Auth)
+
+        DELETE /v1/peersites/{siteIdentifier}
+        """
+        return self._call(_START_UNPAIR, (site_identifier,), None, body, options)
+
+    def get_peer_status_all(self, **options):
+        """
+        Get the list of acceptable values for site pairing status (Auth)
+
+        GET /v1/peersites/pairingstatuses
+        """
+        return self._call(_GET_PEER_STATUS_ALL, None, None, None, options)
+
+    def get_pairing_token(self, **options):
+        """
+        Generate a token for pairing (Auth)
+
+        POST /v1/peersites/generatetoken
+        """
+        return self._call(_GET_PAIRING_TOKEN, None, None, None, options)
+
+    # Recovery & Resources Reports
+
+    def get_recovery_report_all(self, start_time: str = None, end_time: str = None, page_number: int = None, page_size: int = None, vpg_name: str = None, recovery_type: str = None, state: str = None, **options):
+        """
+        Generate a recovery report and view information about recovery operations (Auth)
+
+        GET /v1/reports/recovery
+        """
+        return self._call(_GET_RECOVERY_REPORT_ALL, None, (start_time, end_time, page_number, page_size, vpg_name, recovery_type, state), None, options)
+
+    def get_recovery_report(self, recovery_operation_identifier: str, **options):
+        """
+        Get a specific recovery report. (Auth)
+
+        GET /v1/reports/recovery/{recoveryOperationIdentifier}
+        """
+        return self._call(_GET_RECOVERY_REPORT, (recovery_operation_identifier,), None, None, options)
+
+    def get_resource_report_all(self, start_time: str = None, end_time: str = None, page_number: int = None, page_size: int = None, zorg_name: str = None, vpg_name: str = None, vm_name: str = None, protected_site_name: str = None, protected_cluster_name: str = None, protected_host_name: str = None, protected_org_vdc: str = None, protected_vcd_org: str = None, recovery_site_name: str = None, recovery_cluster_name: str = None, recovery_host_name: str = None, recovery_org_vdc: str = None, recovery_vcd_org: str = None, **options):
+        """
+        Get VM resource reports. (Auth)
+
+        GET /v1/reports/resources
+        """
+        return self._call(_GET_RESOURCE_REPORT_ALL, None, (start_time, end_time, page_number, page_size, zorg_name, vpg_name, vm_name, protected_site_name, protected_cluster_name, protected_host_name, protected_org_vdc, protected_vcd_org, recovery_site_name, recovery_cluster_name, recovery_host_name, recovery_org_vdc, recovery_vcd_org), None, options)
+
+    # Recovery Scripts
+
+    def download_file_from_output_directory(self, path: str = None, **options):
+        """
+        Download a file from output directory (Auth)
+
+        GET /v1/recoveryScripts/output/files
+        """
+        return self._call(_DOWNLOAD_FILE_FROM_OUTPUT_DIRECTORY, None, (path,), None, options)
+
+    def delete_output_file(self, path: str = None, **options):
+        """
+        Delete a file in output directory (Auth)
+
+        DELETE /v1/recoveryScripts/output/files
+        """
+        return self._call(_DELETE_OUTPUT_FILE, None, (path,), None, options)
+
+    def delete_output_folder(self, path: str = None, delete_if_not_empty: bool = None, **options):
+        """
+        Delete a folder in output directory (Auth)
+
+        DELETE /v1/recoveryScripts/output/folders
+        """
+        return self._call(_DELETE_OUTPUT_FOLDER, None, (path, delete_if_not_empty), None, options)
+
+    def create_output_folder(self, body: dict = None, **options):
+        """
+        Create a folder in output directory (Auth)
+
+        POST /v1/recoveryScripts/output/folders
+        """
+        return self._call(_CREATE_OUTPUT_FOLDER, None, None, body, options)
+
+    def list_output_items(self, path: str = None, search: str = None, **options):
+        """
+        Get a list of items (Auth)
+
+        GET /v1/recoveryScripts/output/items
+        """
+        return self._call(_LIST_OUTPUT_ITEMS, None, (path, search), None, options)
+
+    def upload_file_to_scripts_directory(self, body: dict = None, **options):
+        """
+        Upload a file to scripts directory (Auth)
+
+        POST /v1/recoveryScripts/repository/files
+        """
+        return self._call(_UPLOAD_FILE_TO_SCRIPTS_DIRECTORY, None, None, body, options)
+
+    def download_file_from_scripts_directory(self, path: str = None, **options):
+        """
+        Download a file from scripts directory (Auth)
+
+        GET /v1/recoveryScripts/repository/files
+        """
+        return self._call(_DOWNLOAD_FILE_FROM_SCRIPTS_DIRECTORY, None, (path,), None, options)
+
+    def delete_scripts_file(self, path: str = None, **options):
+        """
+        Delete a file in scripts directory (Auth)
+
+        DELETE /v1/recoveryScripts/repository/files
+        """
+        return self._call(_DELETE_SCRIPTS_FILE, None, (path,), None, options)
+
+    def delete_scripts_folder(self, path: str = None, delete_if_not_empty: bool = None, **options):
+        """
+        Delete a folder in scripts directory (Auth)
+
+        DELETE /v1/recoveryScripts/repository/folders
+        """
+        return self._call(_DELETE_SCRIPTS_FOLDER, None, (path, delete_if_not_empty), None, options)
+
+    def create_scripts_folder(self, body: dict = None, **options):
+        """
+        Create a folder in scripts directory (Auth)
+
+        POST /v1/recoveryScripts/repository/folders
+        """
+        return self._call(_CREATE_SCRIPTS_FOLDER, None, None, body, options)
+
+    def list_scripts_items(self, path: str = None, search: str = None, **options):
+        """
+        Get a list of items (Auth)
+
+        GET /v1/recoveryScripts/repository/items
+        """
+        return self._call(_LIST_SCRIPTS_ITEMS, None, (path, search), None, options)
+
+    # Server Date-Time
+
+    def system_date_time_service_get_date_time_local(self, **options):
+        """
+        Get current system date-time in a Local time zone (Auth)
+
+        GET /v1/serverDateTime/serverDateTimeLocal
+        """
+        return self._call(_SYSTEM_DATE_TIME_SERVICE_GET_DATE_TIME_LOCAL, None, None, None, options)
+
+    def system_date_time_service_get_date_time_utc(self, **options):
+        """
+        Get current system date-time in UTC format (Auth)
+
+        GET /v1/serverDateTime/serverDateTimeUtc
+        """
+        return self._call(_SYSTEM_DATE_TIME_SERVICE_GET_DATE_TIME_UTC, None, None, None, options)
+
+    def system_date_time_service_post(self, date_time: str = None, **options):
+        """
+        Check system date time casting from parameters. Specify the date and check the return value to prove
+        your expectations. (Auth)
+
+        GET /v1/serverDateTime/dateTimeArgument
+        """
+        return self._call(_SYSTEM_DATE_TIME_SERVICE_POST, None, (date_time,), None, options)
+
+    # Service Profiles
+
+    def get_service_profile_all(self, site_identifier: str = None, **options):
+        """
+        Get the list of all service profiles for the site processing the API. (Auth)
+
+        GET /v1/serviceprofiles
+        """
+        return self._call(_GET_SERVICE_PROFILE_ALL, None, (site_identifier,), None, options)
+
+    def get_service_profile(self, service_profile_identifier: str, **options):
+        """
+        Get details of a specified service profile at the site processing the API. (Auth)
+
+        GET /v1/serviceprofiles/{serviceProfileIdentifier}
+        """
+        return self._call(_GET_SERVICE_PROFILE, (service_profile_identifier,), None, None, options)
+
+    # Statistics
+
+    def get_vm_statistic_all(self, **options):
+        """
+        Get statistics for all protected VMs (Auth)
+
+        GET /v1/statistics/vms
+        """
+        return self._call(_GET_VM_STATISTIC_ALL, None, None, None, options)
+
+    # Tasks
+
+    def get_task_all(self, started_before_date: str = None, started_after_date: str = None, completed_before_date: str = None, completed_after_date: str = None, type: str = None, status: str = None, **options):
+        """
+        Get information about tasks run on this site. (Auth)
+
+        GET /v1/tasks
+        """
+        return self._call(_GET_TASK_ALL, None, (started_before_date, started_after_date, completed_before_date, completed_after_date, type, status), None, options)
+
+    def get_task(self, task_identifier: str, **options):
+        """
+        Get details of a specific task running on the site processing the API. (Auth)
+
+        GET /v1/tasks/{taskIdentifier}
+        """
+        return self._call(_GET_TASK, (task_identifier,), None, None, options)
+
+    def get_task_type_all(self, **options):
+        """
+        Get the list of acceptable values for task types. (Auth)
+
+        GET /v1/tasks/types
+        """
+        return self._call(_GET_TASK_TYPE_ALL, None, None, None, options)
+
+    # Virtual Cloud Director
+
+    def get_vms_without_moref_id(self, **options):
+        """
+        Get VCD VMs without MorefId (Auth)
+
+        GET /v1/vcd/vmsWithoutMorefId
+        """
+        return self._call(_GET_VMS_WITHOUT_MOREF_ID, None, None, None, options)
+
+    def get_valid_org_vdcs(self, **options):
+        """
+        Get Org VDCs with valid configuration (Auth)
+
+        GET /v1/vcd/validOrgVdcs
+        """
+        return self._call(_GET_VALID_ORG_VDCS, None, None, None, options)
+
+    # Virtual Machines
+
+    def get_vm_all(self, vpg_name: str = None, vm_name: str = None, status: str = None, sub_status: str = None, protected_site_type: str = None, recovery_site_type: str = None, source_type: str = None, target_type: str = None, protected_site_identifier: str = None, recovery_site_identifier: str = None, source_site: str = None, target_site: str = None, organization_name: str = None, priority: str = None, vm_identifier: str = None, include_backuped_vms: bool = None, include_mounted_vms: bool = None, **options):
+        """
+        Get information about protected virtual machines. You can filter the results with additional
+        parameters. (Auth)
+
+        GET /v1/vms
+        """
+        return self._call(_GET_VM_ALL, None, (vpg_name, vm_name, status, sub_status, protected_site_type, recovery_site_type, source_type, target_type, protected_site_identifier, recovery_site_identifier, source_site, target_site, organization_name, priority, vm_identifier, include_backuped_vms, include_mounted_vms), None, options)
+
+    def get_vm(self, vm_identifier: str, vpg_identifier: str = None, include_backuped_vms: bool = None, include_mounted_vms: bool = None, **options):
+        """
+        Get information about a single protected VM. VpgId may be required if VM is protected by more than
+        one VPG. (Auth)
+
+        GET /v1/vms/{vmIdentifier}
+        """
+        return self._call(_GET_VM, (vm_identifier,), (vpg_identifier, include_backuped_vms, include_mounted_vms), None, options)
+
+    def restore_vm(self, vm_identifier: str, body: dict = None, **options):
+        """
+        Starts Journal Vm restore operation. Returns command task identifier of the operation. (Auth)
+
+        POST /v1/vms/{vmIdentifier}/Restore
+        """
+        return self._call(_RESTORE_VM, (vm_identifier,), None, body, options)
+
+    def commit_vm(self, vm_identifier: str, body: dict = None, **options):
+        """
+        Commits a restored journal VM. (Auth)
+
+        POST /v1/vms/{vmIdentifier}/RestoreCommit
+        """
+        return self._call(_COMMIT_VM, (vm_identifier,), None, body, options)
+
+    def rollback_vm(self, vm_identifier: str, body: dict = None, **options):
+        """
+        Rolls back a restored journal VM. (Auth)
+
+        POST /v1/vms/{vmIdentifier}/RestoreRollback
+        """
+        return self._call(_ROLLBACK_VM, (vm_identifier,), None, body, options)
+
+    def points_in_time(self, vm_identifier: str, vpg_identifier: str = None, start_date: str = None, end_date: str = None, **options):
+        """
+        Get all the relevant points in time for the VM. VpgId may be required if the VM is protected in more
+        than one VPG. (Auth)
+
+        GET /v1/vms/{vmIdentifier}/pointsInTime
+        """
+        return self._call(_POINTS_IN_TIME, (vm_identifier,), (vpg_identifier, start_date, end_date), None, options)
+
+    def points_in_time_stats(self, vm_identifier: str, vpg_identifier: str = None, **options):
+        """
+        Get the earliest and latest points in time for the VM. VpgId may be required if the VM is protected
+        by more than one VPG. (Auth)
+
+        GET /v1/vms/{vmIdentifier}/pointsInTime/stats
+        """
+        return self._call(_POINTS_IN_TIME_STATS, (vm_identifier,), (vpg_identifier,), None, options)
+
+    # Virtualization Sites
+
+    def get_virtualization_site_all(self, **options):
+        """
+        Get a list of virtual sites connected to this site and all peer sites. (Auth)
+
+        GET /v1/virtualizationsites
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_ALL, None, None, None, options)
+
+    def get_virtualization_site(self, site_identifier: str, **options):
+        """
+        Get details of the site. (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_vm_all(self, site_identifier: str, **options):
+        """
+        Get the list of eligible VMs for protection that are not currently protected at the site. (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/vms
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_VM_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_vm_vcd_vapp_all(self, site_identifier: str, **options):
+        """
+        Get the list of unprotected VCD vApps at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/vcdvapps
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_VM_VCD_VAPP_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_datastore_all(self, site_identifier: str, **options):
+        """
+        Get information about datastores at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/datastores
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_DATASTORE_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_folder_all(self, site_identifier: str, **options):
+        """
+        Get the list of folders for the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/folders
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_FOLDER_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_datastore_cluster_all(self, site_identifier: str, **options):
+        """
+        Get the list of datastore clusters for the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/datastoreclusters
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_DATASTORE_CLUSTER_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_resource_pool_all(self, site_identifier: str, **options):
+        """
+        Get the list of resource pools for the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/resourcepools
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_RESOURCE_POOL_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_org_vdc_all(self, site_identifier: str, **options):
+        """
+        Get the list of organization VDC at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/orgvdcs
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_ORG_VDC_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_network_all(self, site_identifier: str, **options):
+        """
+        Get the list of networks (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/networks
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_NETWORK_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_host_all(self, site_identifier: str, **options):
+        """
+        Get information about hosts at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/hosts
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_HOST_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_host_cluster_all(self, site_identifier: str, **options):
+        """
+        Get the list of host clusters at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/hostclusters
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_HOST_CLUSTER_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_host(self, site_identifier: str, host_identifier: str, **options):
+        """
+        Get information about specific host at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/hosts/{hostIdentifier}
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_HOST, (site_identifier, host_identifier), None, None, options)
+
+    def get_virtualization_site_repository_all(self, site_identifier: str, **options):
+        """
+        Get the list of Repositories at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/repositories
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_REPOSITORY_ALL, (site_identifier,), None, None, options)
+
+    def get_virtualization_site_org_vdc_network_all(self, site_identifier: str, org_vdc_identifier: str, **options):
+        """
+        Get list of virtualization site networks for a specified org vDc (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/orgvdcs/{orgVdcIdentifier}/networks
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_ORG_VDC_NETWORK_ALL, (site_identifier, org_vdc_identifier), None, None, options)
+
+    def get_virtualization_site_storage_policy_all(self, site_identifier: str, org_vdc_identifier: str, **options):
+        """
+        Get the list of storage policies at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/orgvdcs/{orgVdcIdentifier}/storagepolicies
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_STORAGE_POLICY_ALL, (site_identifier, org_vdc_identifier), None, None, options)
+
+    def get_virtualization_site_device_all(self, site_identifier: str, host_identifier: str = None, device_name: str = None, **options):
+        """
+        Get a list of all avaialable devices for all available hosts in the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/devices
+        """
+        return self._call(_GET_VIRTUALIZATION_SITE_DEVICE_ALL, (site_identifier,), (host_identifier, device_name), None, options)
+
+    def get_public_cloud_network_all(self, site_identifier: str, virtual_network_identifier: str = None, **options):
+        """
+        Get the list of virtual networks at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/publiccloud/virtualNetworks
+        """
+        return self._call(_GET_PUBLIC_CLOUD_NETWORK_ALL, (site_identifier,), (virtual_network_identifier,), None, options)
+
+    def get_public_cloud_subnet_all(self, site_identifier: str, virtual_network_identifier: str = None, **options):
+        """
+        Get the list of subnets at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/publiccloud/subnets
+        """
+        return self._call(_GET_PUBLIC_CLOUD_SUBNET_ALL, (site_identifier,), (virtual_network_identifier,), None, options)
+
+    def get_public_cloud_security_group_all(self, site_identifier: str, **options):
+        """
+        Get the list of security groups at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/publiccloud/securityGroups
+        """
+        return self._call(_GET_PUBLIC_CLOUD_SECURITY_GROUP_ALL, (site_identifier,), None, None, options)
+
+    def get_public_cloud_vm_instance_type_all(self, site_identifier: str, **options):
+        """
+        Get the list of virtual machine instance types at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/publiccloud/vmInstanceTypes
+        """
+        return self._call(_GET_PUBLIC_CLOUD_VM_INSTANCE_TYPE_ALL, (site_identifier,), None, None, options)
+
+    def get_public_cloud_resource_groups_all(self, site_identifier: str, **options):
+        """
+        Get the list of resource groups at the site (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/publiccloud/resourceGroups
+        """
+        return self._call(_GET_PUBLIC_CLOUD_RESOURCE_GROUPS_ALL, (site_identifier,), None, None, options)
+
+    def get_public_cloud_keys_containers(self, site_identifier: str, **options):
+        """
+        Get the list of KeysContainers for the specified site. (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/publiccloud/keyscontainers
+        """
+        return self._call(_GET_PUBLIC_CLOUD_KEYS_CONTAINERS, (site_identifier,), None, None, options)
+
+    def get_public_cloud_encryption_key(self, site_identifier: str, encryption_key_id: str, **options):
+        """
+        Get an EncryptionKey object based on the given EncryptionKeyId (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/publiccloud/encryptionkeys/{encryptionKeyId}
+        """
+        return self._call(_GET_PUBLIC_CLOUD_ENCRYPTION_KEY, (site_identifier, encryption_key_id), None, None, options)
+
+    def get_public_cloud_encryption_keys_all(self, site_identifier: str, keys_container_id: str, **options):
+        """
+        Get the list of CMKs for the specified site and keys container. (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/publiccloud/encryptionkeys
+        """
+        return self._call(_GET_PUBLIC_CLOUD_ENCRYPTION_KEYS_ALL, (site_identifier,), (keys_container_id,), None, options)
+
+    def get_public_cloud_managed_identities(self, site_identifier: str, **options):
+        """
+        Get the list of managed identities. (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/publiccloud/managedidentities
+        """
+        return self._call(_GET_PUBLIC_CLOUD_MANAGED_IDENTITIES, (site_identifier,), None, None, options)
+
+    def get_public_cloud_disk_encryption_keys(self, site_identifier: str, **options):
+        """
+        Get the list of DiskEncryptionKeys. (Auth)
+
+        GET /v1/virtualizationsites/{siteIdentifier}/publiccloud/diskencryptionkeys
+        """
+        return self._call(_GET_PUBLIC_CLOUD_DISK_ENCRYPTION_KEYS, (site_identifier,), None, None, options)
+
+    # Volumes
+
+    def get_volume_all(self, volume_type: str = None, vpg_identifier: str = None, datastore_identifier: str = None, protected_vm_identifier: str = None, owning_vm_identifier: str = None, **options):
+        """
+        Get a list of volumes info in the current site. For ZSSP users, the information retrieved is for
+        Protected entities only. (Auth)
+
+        GET /v1/volumes
+        """
+        return self._call(_GET_VOLUME_ALL, None, (volume_type, vpg_identifier, datastore_identifier, protected_vm_identifier, owning_vm_identifier), None, options)
+
+    # VPG(Virtual Protection Group) Settings
+
+    def new_vpg_setting(self, repopulate_settings: bool = None, body: dict = None, **options):
+        """
+        Create a new VPG settings object, returns the settings object identifier (Auth)
+
+        POST /v1/vpgSettings
+        """
+        return self._call(_NEW_VPG_SETTING, None, (repopulate_settings,), body, options)
+
+    def get_vpg_setting_all(self, **options):
+        """
+        Get all VPG settings. (Auth)
+
+        GET /v1/vpgSettings
+        """
+        return self._call(_GET_VPG_SETTING_ALL, None, None, None, options)
+
+    def copy_vpg_setting(self, body: dict = None, **options):
+        """
+        Create a new VPG settings object from an existing VPG, returns the settings object identifier (Auth)
+
+        POST /v1/vpgSettings/copyVpgSettings
+        """
+        return self._call(_COPY_VPG_SETTING, None, None, body, options)
+
+    def edit_vpg_setting(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Edit the VPG settings. (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}
+        """
+        return self._call(_EDIT_VPG_SETTING, (vpg_settings_identifier,), None, body, options)
+
+    def remove_vpg_setting(self, vpg_settings_identifier: str, **options):
+        """
+        Delete VPG settings. (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}
+        """
+        return self._call(_REMOVE_VPG_SETTING, (vpg_settings_identifier,), None, None, options)
+
+    def get_vpg_setting(self, vpg_settings_identifier: str, **options):
+        """
+        Get VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}
+        """
+        return self._call(_GET_VPG_SETTING, (vpg_settings_identifier,), None, None, options)
+
+    def edit_vpg_setting_basic(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Edit VPG settings with basic settings (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/basic
+        """
+        return self._call(_EDIT_VPG_SETTING_BASIC, (vpg_settings_identifier,), None, body, options)
+
+    def remove_vpg_settings_basic(self, vpg_settings_identifier: str, **options):
+        """
+        Delete Basic VPG settings. (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}/basic
+        """
+        return self._call(_REMOVE_VPG_SETTINGS_BASIC, (vpg_settings_identifier,), None, None, options)
+
+    def get_vpg_setting_basic(self, vpg_settings_identifier: str, **options):
+        """
+        Get Basic VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/basic
+        """
+        return self._call(_GET_VPG_SETTING_BASIC, (vpg_settings_identifier,), None, None, options)
+
+    def edit_vpg_setting_basic_boot_group(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Edit VPG settings with Bootgroups settings (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/bootgroup
+        """
+        return self._call(_EDIT_VPG_SETTING_BASIC_BOOT_GROUP, (vpg_settings_identifier,), None, body, options)
+
+    def delete_vpg_setting_boot_group(self, vpg_settings_identifier: str, **options):
+        """
+        Delete Bootgroups VPG settings (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}/bootgroup
+        """
+        return self._call(_DELETE_VPG_SETTING_BOOT_GROUP, (vpg_settings_identifier,), None, None, options)
+
+    def get_vpg_setting_boot_group(self, vpg_settings_identifier: str, **options):
+        """
+        Get Bootgroups VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/bootgroup
+        """
+        return self._call(_GET_VPG_SETTING_BOOT_GROUP, (vpg_settings_identifier,), None, None, options)
+
+    def edit_vpg_setting_script(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Update Scripting VPG settings (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/scripting
+        """
+        return self._call(_EDIT_VPG_SETTING_SCRIPT, (vpg_settings_identifier,), None, body, options)
+
+    def delete_vpg_setting_script(self, vpg_settings_identifier: str, **options):
+        """
+        Delete Scripting VPG settings (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}/scripting
+        """
+        return self._call(_DELETE_VPG_SETTING_SCRIPT, (vpg_settings_identifier,), None, None, options)
+
+    def get_vpg_setting_script(self, vpg_settings_identifier: str, **options):
+        """
+        Get Scripting VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/scripting
+        """
+        return self._call(_GET_VPG_SETTING_SCRIPT, (vpg_settings_identifier,), None, None, options)
+
+    def edit_vpg_setting_recovery(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Update Recovery VPG settings (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/recovery
+        """
+        return self._call(_EDIT_VPG_SETTING_RECOVERY, (vpg_settings_identifier,), None, body, options)
+
+    def remove_vpg_setting_recovery(self, vpg_settings_identifier: str, **options):
+        """
+        Delete Recovery VPG settings (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}/recovery
+        """
+        return self._call(_REMOVE_VPG_SETTING_RECOVERY, (vpg_settings_identifier,), None, None, options)
+
+    def get_vpg_setting_recovery(self, vpg_settings_identifier: str, **options):
+        """
+        Get Recovery VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/recovery
+        """
+        return self._call(_GET_VPG_SETTING_RECOVERY, (vpg_settings_identifier,), None, None, options)
+
+    def edit_vpg_setting_journal(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Update VPG Journal settings (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/journal
+        """
+        return self._call(_EDIT_VPG_SETTING_JOURNAL, (vpg_settings_identifier,), None, body, options)
+
+    def remove_vpg_setting_journal(self, vpg_settings_identifier: str, **options):
+        """
+        Delete VPG Journal settings (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}/journal
+        """
+        return self._call(_REMOVE_VPG_SETTING_JOURNAL, (vpg_settings_identifier,), None, None, options)
+
+    def get_vpg_setting_journal(self, vpg_settings_identifier: str, **options):
+        """
+        Get VPG Journal settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/journal
+        """
+        return self._call(_GET_VPG_SETTING_JOURNAL, (vpg_settings_identifier,), None, None, options)
+
+    def edit_vpg_setting_scratch(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Update VPG Scratch settings (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/scratch
+        """
+        return self._call(_EDIT_VPG_SETTING_SCRATCH, (vpg_settings_identifier,), None, body, options)
+
+    def remove_vpg_setting_scratch(self, vpg_settings_identifier: str, **options):
+        """
+        Delete VPG Scratch settings (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}/scratch
+        """
+        return self._call(_REMOVE_VPG_SETTING_SCRATCH, (vpg_settings_identifier,), None, None, options)
+
+    def get_vpg_setting_scratch(self, vpg_settings_identifier: str, **options):
+        """
+        Get VPG Scratch settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/scratch
+        """
+        return self._call(_GET_VPG_SETTING_SCRATCH, (vpg_settings_identifier,), None, None, options)
+
+    def get_vpg_setting_ltr(self, vpg_settings_identifier: str, **options):
+        """
+        Get Extended Journal Copy VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/ltr
+        """
+        return self._call(_GET_VPG_SETTING_LTR, (vpg_settings_identifier,), None, None, options)
+
+    def new_vpg_setting_ltr(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Create Extended Journal Copy VPG settings (Auth)
+
+        POST /v1/vpgSettings/{vpgSettingsIdentifier}/ltr
+        """
+        return self._call(_NEW_VPG_SETTING_LTR, (vpg_settings_identifier,), None, body, options)
+
+    def edit_vpg_setting_ltr(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Edit Extended Journal Copy VPG settings (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/ltr
+        """
+        return self._call(_EDIT_VPG_SETTING_LTR, (vpg_settings_identifier,), None, body, options)
+
+    def remove_vpg_setting_ltr(self, vpg_settings_identifier: str, **options):
+        """
+        Delete Extended Journal Copy VPG settings (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}/ltr
+        """
+        return self._call(_REMOVE_VPG_SETTING_LTR, (vpg_settings_identifier,), None, None, options)
+
+    def edit_vpg_setting_ltr_network(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Update Network VPG settings (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/networks
+        """
+        return self._call(_EDIT_VPG_SETTING_LTR_NETWORK, (vpg_settings_identifier,), None, body, options)
+
+    def remove_vpg_setting_ltr_network(self, vpg_settings_identifier: str, **options):
+        """
+        Delete Network VPG settings (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}/networks
+        """
+        return self._call(_REMOVE_VPG_SETTING_LTR_NETWORK, (vpg_settings_identifier,), None, None, options)
+
+    def get_vpg_setting_ltr_network_all(self, vpg_settings_identifier: str, **options):
+        """
+        Get Network VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/networks
+        """
+        return self._call(_GET_VPG_SETTING_LTR_NETWORK_ALL, (vpg_settings_identifier,), None, None, options)
+
+    def new_vpg_setting_vm(self, vpg_settings_identifier: str, body: dict = None, **options):
+        """
+        Add new VMs to VPG settings (Auth)
+
+        POST /v1/vpgSettings/{vpgSettingsIdentifier}/vms
+        """
+        return self._call(_NEW_VPG_SETTING_VM, (vpg_settings_identifier,), None, body, options)
+
+    def get_vpg_setting_vm_all(self, vpg_settings_identifier: str, **options):
+        """
+        Get VMs from VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/vms
+        """
+        return self._call(_GET_VPG_SETTING_VM_ALL, (vpg_settings_identifier,), None, None, options)
+
+    def edit_vpg_setting_vm(self, vpg_settings_identifier: str, vm_identifier: str, body: dict = None, **options):
+        """
+        Edit the VPG settings of a single VM (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}
+        """
+        return self._call(_EDIT_VPG_SETTING_VM, (vpg_settings_identifier, vm_identifier), None, body, options)
+
+    def remove_vpg_setting_vm(self, vpg_settings_identifier: str, vm_identifier: str, **options):
+        """
+        Delete the VPG settings of a single VM (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}
+        """
+        return self._call(_REMOVE_VPG_SETTING_VM, (vpg_settings_identifier, vm_identifier), None, None, options)
+
+    def get_vpg_setting_vm(self, vpg_settings_identifier: str, vm_identifier: str, **options):
+        """
+        Get VPG settings of a single VM (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}
+        """
+        return self._call(_GET_VPG_SETTING_VM, (vpg_settings_identifier, vm_identifier), None, None, options)
+
+    def get_vpg_setting_vm_volume_all(self, vpg_settings_identifier: str, vm_identifier: str, **options):
+        """
+        Get Volumes of specific VM in VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/volumes
+        """
+        return self._call(_GET_VPG_SETTING_VM_VOLUME_ALL, (vpg_settings_identifier, vm_identifier), None, None, options)
+
+    def edit_vpg_setting_vm_volume(self, vpg_settings_identifier: str, vm_identifier: str, volume_identifier: str, body: dict = None, **options):
+        """
+        Update Volume details of specific VM in VPG settings (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/volumes/{volumeIdentifier}
+        """
+        return self._call(_EDIT_VPG_SETTING_VM_VOLUME, (vpg_settings_identifier, vm_identifier, volume_identifier), None, body, options)
+
+    def get_vpg_setting_vm_volume(self, vpg_settings_identifier: str, vm_identifier: str, volume_identifier: str, **options):
+        """
+        Get the Volume details of specific VM in VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/volumes/{volumeIdentifier}
+        """
+        return self._call(_GET_VPG_SETTING_VM_VOLUME, (vpg_settings_identifier, vm_identifier, volume_identifier), None, None, options)
+
+    def get_vpg_setting_vm_nic_all(self, vpg_settings_identifier: str, vm_identifier: str, **options):
+        """
+        Get NICs of specific VM in VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/nics
+        """
+        return self._call(_GET_VPG_SETTING_VM_NIC_ALL, (vpg_settings_identifier, vm_identifier), None, None, options)
+
+    def edit_vpg_setting_vm_nic(self, vpg_settings_identifier: str, vm_identifier: str, nic_identifier: str, body: dict = None, **options):
+        """
+        Edit NICs details of specific VM in VPG settings (Auth)
+
+        PUT /v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/nics/{nicIdentifier}
+        """
+        return self._call(_EDIT_VPG_SETTING_VM_NIC, (vpg_settings_identifier, vm_identifier, nic_identifier), None, body, options)
+
+    def remove_vpg_setting_vm_nic(self, vpg_settings_identifier: str, vm_identifier: str, nic_identifier: str, **options):
+        """
+        Delete NICs of specific VM in VPG settings (Auth)
+
+        DELETE /v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/nics/{nicIdentifier}
+        """
+        return self._call(_REMOVE_VPG_SETTING_VM_NIC, (vpg_settings_identifier, vm_identifier, nic_identifier), None, None, options)
+
+    def get_vpg_setting_vm_nic(self, vpg_settings_identifier: str, vm_identifier: str, nic_identifier: str, **options):
+        """
+        Get the NIC details of specific VM in VPG settings (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/vms/{vmIdentifier}/nics/{nicIdentifier}
+        """
+        return self._call(_GET_VPG_SETTING_VM_NIC, (vpg_settings_identifier, vm_identifier, nic_identifier), None, None, options)
+
+    def start_vpg_setting_commit(self, vpg_settings_identifier: str, **options):
+        """
+        Commit and deploy the VPG settings. Returns the command task identifier. (Auth)
+
+        POST /v1/vpgSettings/{vpgSettingsIdentifier}/commit
+        """
+        return self._call(_START_VPG_SETTING_COMMIT, (vpg_settings_identifier,), None, None, options)
+
+    def get_vpg_setting_possible_priority_all(self, vpg_settings_identifier: str, **options):
+        """
+        Get values for Priority. (Auth)
+
+        GET /v1/vpgSettings/{vpgSettingsIdentifier}/priority
+        """
+        return self._call(_GET_VPG_SETTING_POSSIBLE_PRIORITY_ALL, (vpg_settings_identifier,), None, None, options)
+
+    # VPGs (Virtual Protection Groups)
+
+    def get_vpg_all(self, name: str = None, status: str = None, sub_status: str = None, protected_site_type: str = None, recovery_site_type: str = None, protected_site_identifier: str = None, recovery_site_identifier: str = None, source_site: str = None, target_site: str = None, source_type: str = None, target_type: str = None, organization_name: str = None, zorg_identifier: str = None, priority: str = None, service_profile_identifier: str = None, backup_enabled: bool = None, **options):
+        """
+        Get information about all VPGs. (Auth)
+
+        GET /v1/vpgs
+        """
+        return self._call(_GET_VPG_ALL, None, (name, status, sub_status, protected_site_type, recovery_site_type, protected_site_identifier, recovery_site_identifier, source_site, target_site, source_type, target_type, organization_name, zorg_identifier, priority, service_profile_identifier, backup_enabled), None, options)
+
+    def get_vpg(self, vpg_identifier: str, **options):
+        """
+        Get information about the VPG. (Auth)
+
+        GET /v1/vpgs/{vpgIdentifier}
+        """
+        return self._call(_GET_VPG, (vpg_identifier,), None, None, options)
+
+    def start_vpg_delete(self, vpg_identifier: str, body: dict = None, **options):
+        """
+        Delete the VPG (Auth)
+
+        DELETE /v1/vpgs/{vpgIdentifier}
+        """
+        return self._call(_START_VPG_DELETE, (vpg_identifier,), None, body, options)
+
+    def get_vpg_checkpoint_all(self, vpg_identifier: str, start_date: str = None, end_date: str = None, **options):
+        """
+        Get a list of checkpoints for the VPG. You can filter the results with additional parameters. (Auth)
+
+        GET /v1/vpgs/{vpgIdentifier}/checkpoints
+        """
+        return self._call(_GET_VPG_CHECKPOINT_ALL, (vpg_identifier,), (start_date, end_date), None, options)
+
+    def start_vpg_tagged_checkpoint_insert(self, vpg_identifier: str, body: dict = None, **options):
+        """
+        Create a tagged checkpoint for the VPG. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/checkpoints
+        """
+        return self._call(_START_VPG_TAGGED_CHECKPOINT_INSERT, (vpg_identifier,), None, body, options)
+
+    def get_vpg_checkpoint_stat_all(self, vpg_identifier: str, **options):
+        """
+        Get checkpoints statistics for a VPG. (Auth)
+
+        GET /v1/vpgs/{vpgIdentifier}/checkpoints/stats
+        """
+        return self._call(_GET_VPG_CHECKPOINT_STAT_ALL, (vpg_identifier,), None, None, options)
+
+    def start_vpg_failover_test(self, vpg_identifier: str, body: dict = None, **options):
+        """
+        Start a failover test using a specific checkpoint or the latest checkpoint if one is not . (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/FailoverTest
+        """
+        return self._call(_START_VPG_FAILOVER_TEST, (vpg_identifier,), None, body, options)
+
+    def stop_vpg_failover_test(self, vpg_identifier: str, body: dict = None, **options):
+        """
+        Stops a failover test. Specify if test was successful and provide a summary. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/FailoverTestStop
+        """
+        return self._call(_STOP_VPG_FAILOVER_TEST, (vpg_identifier,), None, body, options)
+
+    def start_vpg_failover(self, vpg_identifier: str, body: dict = None, **options):
+        """
+        Starts a Failover of a VPG using a checkpoint. Returns the TaskIdentifier of the operation, which
+        can be used to monitor the operation. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/Failover
+        """
+        return self._call(_START_VPG_FAILOVER, (vpg_identifier,), None, body, options)
+
+    def start_vpg_move(self, vpg_identifier: str, body: dict = None, **options):
+        """
+        Starts a Move of a VPG using a checkpoint. Returns the TaskIdentifier of the operation, which can be
+        used to monitor the operation. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/Move
+        """
+        return self._call(_START_VPG_MOVE, (vpg_identifier,), None, body, options)
+
+    def start_vpg_move_rollback(self, vpg_identifier: str, **options):
+        """
+        Rolls back the VPG after Move. Returns the TaskIdentifier of the operation, which can be used to
+        monitor the operation. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/moveRollback
+        """
+        return self._call(_START_VPG_MOVE_ROLLBACK, (vpg_identifier,), None, None, options)
+
+    def start_vpg_move_commit(self, vpg_identifier: str, body: dict = None, **options):
+        """
+        Commits the VPG. Returns the TaskIdentifier of the operation, which can be used to monitor the
+        operation. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/MoveCommit
+        """
+        return self._call(_START_VPG_MOVE_COMMIT, (vpg_identifier,), None, body, options)
+
+    def start_vpg_failover_commit(self, vpg_identifier: str, body: dict = None, **options):
+        """
+        Commits the Failover of a VPG. Returns the TaskIdentifier of the operation, which can be used to
+        monitor the operation. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/FailoverCommit
+        """
+        return self._call(_START_VPG_FAILOVER_COMMIT, (vpg_identifier,), None, body, options)
+
+    def start_vpg_failover_rollback(self, vpg_identifier: str, **options):
+        """
+        Rolls back the VPG after Failover. Returns the TaskIdentifier of the operation, which can be used to
+        monitor the operation. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/FailoverRollback
+        """
+        return self._call(_START_VPG_FAILOVER_ROLLBACK, (vpg_identifier,), None, None, options)
+
+    def start_vpg_clone(self, vpg_identifier: str, body: dict = None, **options):
+        """
+        Clone a VPG using a specific checkpoint or the latest checkpoint if one is not (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/CloneStart
+        """
+        return self._call(_START_VPG_CLONE, (vpg_identifier,), None, body, options)
+
+    def stop_vpg_clone(self, vpg_identifier: str, **options):
+        """
+        Abort cloning of the VPG (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/CloneAbort
+        """
+        return self._call(_STOP_VPG_CLONE, (vpg_identifier,), None, None, options)
+
+    def get_vpg_retention_policy_all(self, **options):
+        """
+        Get the list of values for VPG retention policy. (Auth)
+
+        GET /v1/vpgs/retentionpolicies
+        """
+        return self._call(_GET_VPG_RETENTION_POLICY_ALL, None, None, None, options)
+
+    def get_vpg_priority_all(self, **options):
+        """
+        Get the list of values for VPG priority. (Auth)
+
+        GET /v1/vpgs/priorities
+        """
+        return self._call(_GET_VPG_PRIORITY_ALL, None, None, None, options)
+
+    def get_vpg_entity_type_all(self, **options):
+        """
+        Get the list of values for VPG entity. (Auth)
+
+        GET /v1/vpgs/entitytypes
+        """
+        return self._call(_GET_VPG_ENTITY_TYPE_ALL, None, None, None, options)
+
+    def get_vpg_status_all(self, **options):
+        """
+        Get the list of values for VPG status. (Auth)
+
+        GET /v1/vpgs/statuses
+        """
+        return self._call(_GET_VPG_STATUS_ALL, None, None, None, options)
+
+    def get_vpg_sub_status_all(self, **options):
+        """
+        Get the list of values for VPG sub status. (Auth)
+
+        GET /v1/vpgs/substatuses
+        """
+        return self._call(_GET_VPG_SUB_STATUS_ALL, None, None, None, options)
+
+    def get_vpg_failover_shutdown_policy_all(self, **options):
+        """
+        Get the list of values for VPG failover shutdown policy. (Auth)
+
+        GET /v1/vpgs/failovershutdownpolicies
+        """
+        return self._call(_GET_VPG_FAILOVER_SHUTDOWN_POLICY_ALL, None, None, None, options)
+
+    def get_vpg_failover_commit_policy_all(self, **options):
+        """
+        Get the list of values for VPG failover commit policy. (Auth)
+
+        GET /v1/vpgs/failovercommitpolicies
+        """
+        return self._call(_GET_VPG_FAILOVER_COMMIT_POLICY_ALL, None, None, None, options)
+
+    def start_vpg_pause(self, vpg_identifier: str, **options):
+        """
+        Pause the protection of the VPG. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/pause
+        """
+        return self._call(_START_VPG_PAUSE, (vpg_identifier,), None, None, options)
+
+    def start_vpg_resume(self, vpg_identifier: str, **options):
+        """
+        Resume the protection of the VPG. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/resume
+        """
+        return self._call(_START_VPG_RESUME, (vpg_identifier,), None, None, options)
+
+    def start_vpg_force_sync(self, vpg_identifier: str, **options):
+        """
+        Force synchronization of the VPG. (Auth)
+
+        POST /v1/vpgs/{vpgIdentifier}/forcesync
+        """
+        return self._call(_START_VPG_FORCE_SYNC, (vpg_identifier,), None, None, options)
+
+    # VRAs (Virtual Replication Appliances)
+
+    def get_vra_all(self, vra_name: str = None, status: str = None, vra_version: str = None, host_version: str = None, ip_address: str = None, vra_group: str = None, datastore_name: str = None, datastore_cluster_name: str = None, network_name: str = None, vra_ip_configuration_type_api: str = None, **options):
+        """
+        Get information about all VRAs. (Auth)
+
+        GET /v1/vras
+        """
+        return self._call(_GET_VRA_ALL, None, (vra_name, status, vra_version, host_version, ip_address, vra_group, datastore_name, datastore_cluster_name, network_name, vra_ip_configuration_type_api), None, options)
+
+    def start_vra_install(self, body: dict = None, **options):
+        """
+        Install VRA. Returns TaskIdentifier. (Auth)
+
+        POST /v1/vras
+        """
+        return self._call(_START_VRA_INSTALL, None, None, body, options)
+
+    def get_vra(self, vra_identifier: str, **options):
+        """
+        Get information about the VRA. (Auth)
+
+        GET /v1/vras/{vraIdentifier}
+        """
+        return self._call(_GET_VRA, (vra_identifier,), None, None, options)
+
+    def start_vra_uninstall(self, vra_identifier: str, **options):
+        """
+        UnInstall VRA. Returns TaskIdentifier (Auth)
+
+        DELETE /v1/vras/{vraIdentifier}
+        """
+        return self._call(_START_VRA_UNINSTALL, (vra_identifier,), None, None, options)
+
+    def start_vra_edit(self, vra_identifier: str, body: dict = None, **options):
+        """
+        Edit VRA. Returns TaskIdentifier (Auth)
+
+        PUT /v1/vras/{vraIdentifier}
+        """
+        return self._call(_START_VRA_EDIT, (vra_identifier,), None, body, options)
+
+    def start_vras_on_cluster_install(self, body: dict = None, **options):
+        """
+        Installs VRAs on cluster. Returns TaskIdentifier (Auth)
+
+        POST /v1/vras/clusters
+        """
+        return self._call(_START_VRAS_ON_CLUSTER_INSTALL, None, None, body, options)
+
+    def start_cluster_vras_uninstall(self, cluster_identifier: str, vaio_allow_maintenance_mode: bool = None, **options):
+        """
+        UnInstall VRAs from cluster. Returns TaskIdentifier (Auth)
+
+        DELETE /v1/vras/clusters/{clusterIdentifier}
+        """
+        return self._call(_START_CLUSTER_VRAS_UNINSTALL, (cluster_identifier,), (vaio_allow_maintenance_mode,), None, options)
+
+    def start_cluster_vras_upgrade(self, cluster_identifier: str, vaio_allow_maintenance_mode: bool = None, **options):
+        """
+        Upgrade VRA on cluster. Returns TaskIdentifier (Auth)
+
+        PUT /v1/vras/clusters/{clusterIdentifier}
+        """
+        return self._call(_START_CLUSTER_VRAS_UPGRADE, (cluster_identifier,), (vaio_allow_maintenance_mode,), None, options)
+
+    def start_vra_cleanup(self, vaio_allow_maintenance_mode: bool = None, **options):
+        """
+        UnInstall all VRAs from all clusters. Returns list of TaskIdentifiers for each cluster (Auth)
+
+        DELETE /v1/vras/cleanup
+        """
+        return self._call(_START_VRA_CLEANUP, None, (vaio_allow_maintenance_mode,), None, options)
+
+    def start_vra_upgrade(self, vra_identifier: str, **options):
+        """
+        Upgrade VRA. Returns TaskIdentifier (Auth)
+
+        POST /v1/vras/{vraIdentifier}/upgrade
+        """
+        return self._call(_START_VRA_UPGRADE, (vra_identifier,), None, None, options)
+
+    def get_vra_cluster_settings(self, cluster_identifier: str, **options):
+        """
+        Get VRA cluster install settings. (Auth)
+
+        GET /v1/vras/clusters/{clusterIdentifier}/settings
+        """
+        return self._call(_GET_VRA_CLUSTER_SETTINGS, (cluster_identifier,), None, None, options)
+
+    def start_set_vra_cluster_settings(self, cluster_identifier: str, body: dict = None, **options):
+        """
+        Store VRA install settings for a cluster. (Auth)
+
+        POST /v1/vras/clusters/{clusterIdentifier}/settings
+        """
+        return self._call(_START_SET_VRA_CLUSTER_SETTINGS, (cluster_identifier,), None, body, options)
+
+    def get_vra_status_all(self, **options):
+        """
+        Get the list of values for VRA status (Auth)
+
+        GET /v1/vras/statuses
+        """
+        return self._call(_GET_VRA_STATUS_ALL, None, None, None, options)
+
+    def get_vra_configuration_type_all(self, **options):
+        """
+        Get the list of values for VRA IP configuration type (Auth)
+
+        GET /v1/vras/ipconfigurationtypes
+        """
+        return self._call(_GET_VRA_CONFIGURATION_TYPE_ALL, None, None, None, options)
+
+    def get_vra_change_recovery_host_potential(self, vra_identifier: str, vm_identifier: str = None, **options):
+        """
+        Get potential replacement hosts for a change recovery host operation.   Returns a list for a
+        specified VmIdentifer. (Auth)
+
+        GET /v1/vras/{vraIdentifier}/changerecoveryvra/potentials
+        """
+        return self._call(_GET_VRA_CHANGE_RECOVERY_HOST_POTENTIAL, (vra_identifier,), (vm_identifier,), None, options)
+
+    def start_vra_change_recovery_host(self, vra_identifier: str, body: dict = None, **options):
+        """
+        Change recovery host. (Auth)
+
+        POST /v1/vras/{vraIdentifier}/changerecoveryvra/execute
+        """
+        return self._call(_START_VRA_CHANGE_RECOVERY_HOST, (vra_identifier,), None, body, options)
+
+    def test_vra_change_recovery_host_setting(self, vra_identifier: str, body: dict = None, **options):
+        """
+        Validate change recovery host settings. (Auth)
+
+        POST /v1/vras/{vraIdentifier}/changerecoveryvra/validate
+        """
+        return self._call(_TEST_VRA_CHANGE_RECOVERY_HOST_SETTING, (vra_identifier,), None, body, options)
+
+    def get_vra_change_recovery_host_recommendation(self, vra_identifier: str, body: dict = None, **options):
+        """
+        Get recommendations for evacuate operation. (Auth)
+
+        POST /v1/vras/{vraIdentifier}/changerecoveryvra/recommendation
+        """
+        return self._call(_GET_VRA_CHANGE_RECOVERY_HOST_RECOMMENDATION, (vra_identifier,), None, body, options)
+
+    # ZORGS (Zerto Organizations)
+
+    def get_zorg_all(self, **options):
+        """
+        Get the list of all the ZORGs defined in the Zerto Cloud Manager for this site. (Auth)
+
+        GET /v1/zorgs
+        """
+        return self._call(_GET_ZORG_ALL, None, None, None, options)
+
+    def get_zorg(self, zorg_identifier: str, **options):
+        """
+        Get details of a specific ZORG. (Auth)
+
+        GET /v1/zorgs/{zorgIdentifier}
+        """
+        return self._call(_GET_ZORG, (zorg_identifier,), None, None, options)
+
+    # ZSSP (Zerto Self Service Portal) Sessions
+
+    def connect_zssp(self, body: dict = None, **options):
+        """
+        Create a ZSSP session. (Auth)
+
+        POST /v1/zsspsessions
+        """
+        return self._call(_CONNECT_ZSSP, None, None, body, options)
+
+    def get_zssp_session_all(self, **options):
+        """
+        Get details of all ZSSP sessions (Auth)
+
+        GET /v1/zsspsessions
+        """
+        return self._call(_GET_ZSSP_SESSION_ALL, None, None, None, options)
+
+    def get_zssp_session(self, zssp_session_identifier: str, **options):
+        """
+        Get details of a ZSSP session (Auth)
+
+        GET /v1/zsspsessions/{zsspSessionIdentifier}
+        """
+        return self._call(_GET_ZSSP_SESSION, (zssp_session_identifier,), None, None, options)
+
+    def disconnect_zssp(self, zssp_session_identifier: str, **options):
+        """
+        Delete a ZSSP session. (Auth)
+
+        DELETE /v1/zsspsessions/{zsspSessionIdentifier}
+        """
+        return self._call(_DISCONNECT_ZSSP, (zssp_session_identifier,), None, None, options)
+
+    # Sessions
+
+    def get_auth_token(self, body: dict = None, **options):
+        """
+        Get new auth token
+
+        POST /auth/realms/zerto/protocol/openid-connect/token
+        """
+        return self._call(_GET_AUTH_TOKEN, None, None, body, options)
@@ -11,6 +11,10 @@
 
 import requests
 import logging
+from . import models
+from .cache import cached_response
+
+logger = logging.getLogger(__name__)
 
 class Events:
     def __init__(self, client):
@@ -18,7 +22,7 @@ class Events:
 
     def list_events(self, event_identifier=None, start_date=None, end_date=None, vpg_identifier=None,
                     site_name=None, site_identifier=None, zorg_identifier=None, event_type=None,
-                    entity_type=None, category=None, user_name=None, alert_identifier=None):
+                    entity_type=None, category=None, user_name=None, alert_identifier=None, as_models=False):
         """
         Fetches a list of events or a specific event from the Zerto API with optional filters.
 
@@ -34,208 +38,107 @@ class Events:
         :param category: The event category to return.
         :param user_name: The username for which the event occurred.
         :param alert_identifier: The alert identifier.
+        :param as_models: Return zvma.models.Event instances instead of dicts.
         :return: List of events or a specific event based on provided filters.
         """
-        logging.info(f'Events.list_events(event_identifier={event_identifier}, start_date={start_date}, end_date={end_date}, '
-                    f'vpg_identifier={vpg_identifier}, site_name={site_name}, site_identifier={site_identifier}, '
-                    f'zorg_identifier={zorg_identifier}, event_type={event_type}, entity_type={entity_type}, '
-                    f'category={category}, user_name={user_name}, alert_identifier={alert_identifier})')
-        
-        # Determine endpoint based on whether event_identifier is provided
-        if event_identifier:
-            events_uri = f"https://{self.client.zvm_address}/v1/events/{event_identifier}"
-        else:
-            events_uri = f"https://{self.client.zvm_address}/v1/events"
-
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        # Building query parameters
-        params = {}
-        if start_date:
-            params['startDate'] = start_date
-        if end_date:
-            params['endDate'] = end_date
-        if vpg_identifier:
-            params['vpgIdentifier'] = vpg_identifier
-        if site_name:
-            params['siteName'] = site_name
-        if site_identifier:
-            params['siteIdentifier'] = site_identifier
-        if zorg_identifier:
-            params['zorgIdentifier'] = zorg_identifier
-        if event_type:
-            params['eventType'] = event_type
-        if entity_type:
-            params['entityType'] = entity_type
-        if category:
-            params['category'] = category
-        if user_name:
-            params['userName'] = user_name
-        if alert_identifier:
-            params['alertIdentifier'] = alert_identifier
-
-        try:
-            logging.info("Fetching events with specified filters...")
-            response = requests.get(events_uri, headers=headers, params=params, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            events = response.json()
+        operation, args, kwargs = self._list_events_call(
+            event_identifier=event_identifier, start_date=start_date, end_date=end_date, vpg_identifier=vpg_identifier, site_name=site_name, site_identifier=site_identifier,
+            zorg_identifier=zorg_identifier, event_type=event_type, entity_type=entity_type, category=category,
+            user_name=user_name, alert_identifier=alert_identifier)
+        response = getattr(self.client.api, operation)(*args, **kwargs)
+        events = response.json()
 
-            if not events:
-                logging.warning("No events found.")
-                return []
+        if not events:
+            logger.warning("No events found.")
+            return []
 
-            return events
+        return models.convert(models.Event, events) if as_models else events
 
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+    def iter_events(self, as_models=False, **filters):
+        """
+        Iterates over events one at a time, parsing the response incrementally so that memory use
+        stays flat however many events match the filters.
 
+        :param as_models: Yield zvma.models.Event instances instead of dicts.
+        :param filters: The same keyword arguments as list_events.
+        :return: Generator yielding one event at a time.
+        """
+        operation, args, kwargs = self._list_events_call(**filters)
+        events = self.client.api.iter_json(operation, *args, **kwargs)
+        return map(models.Event.from_dict, events) if as_models else events
+
+    def _list_events_call(self, event_identifier=None, start_date=None, end_date=None, vpg_identifier=None,
+                          site_name=None, site_identifier=None, zorg_identifier=None, event_type=None,
+                          entity_type=None, category=None, user_name=None, alert_identifier=None):
+        """Return the client.api operation, positional and keyword arguments for list_events/iter_events."""
+        logger.info('Events.list_events(event_identifier=%s, start_date=%s, end_date=%s, vpg_identifier=%s, site_name=%s, site_identifier=%s, zorg_identifier=%s, event_type=%s, entity_type=%s, category=%s, user_name=%s, alert_identifier=%s)',
+                    event_identifier, start_date, end_date, vpg_identifier, site_name, site_identifier, zorg_identifier, event_type, entity_type, category, user_name, alert_identifier)
+
+        logger.info("Fetching events with specified filters...")
+        if event_identifier:
+            return 'get_event', (event_identifier,), {}
+        # Empty filters are left out of the query
+        return 'get_event_all', (), {
+            'start_date': start_date or None, 'end_date': end_date or None, 'vpg_identifier': vpg_identifier or None,
+            'site_name': site_name or None, 'site_identifier': site_identifier or None,
+            'zorg_identifier': zorg_identifier or None, 'event_type': event_type or None,
+            'entity_type': entity_type or None, 'category': category or None, 'user_name': user_name or None,
+            'alert_identifier': alert_identifier or None}
+
+    @cached_response()
     def list_event_types(self):
         """
         Fetches a list of event types from the Zerto API.
 
         :return: List of event types.
         """
-        logging.info(f'Events.list_event_types(zvm_address={self.client.zvm_address})')
-        event_types_uri = f"https://{self.client.zvm_address}/v1/events/types"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
+        logger.info('Events.list_event_types(zvm_address=%s)', self.client.zvm_address)
+        logger.info("Fetching event types...")
+        response = self.client.api.get_event_type_all()
+        event_types = response.json()
 
-        try:
-            logging.info("Fetching event types...")
-            response = requests.get(event_types_uri, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            event_types = response.json()
-
-            if not event_types:
-                logging.warning("No event types found.")
-                return []
+        if not event_types:
+            logger.warning("No event types found.")
+            return []
 
-            return event_types
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        return event_types
 
+    @cached_response()
     def list_event_entities(self):
         """
         Fetches a list of event entities from the Zerto API.
 
         :return: List of event entities.
         """
-        logging.info(f'Events.list_event_entities(zvm_address={self.client.zvm_address})')
-        event_entities_uri = f"https://{self.client.zvm_address}/v1/events/entities"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        try:
-            logging.info("Fetching event entities...")
-            response = requests.get(event_entities_uri, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            event_entities = response.json()
+        logger.info('Events.list_event_entities(zvm_address=%s)', self.client.zvm_address)
+        logger.info("Fetching event entities...")
+        response = self.client.api.get_event_entity_all()
+        event_entities = response.json()
 
-            if not event_entities:
-                logging.warning("No event entities found.")
-                return []
+        if not event_entities:
+            logger.warning("No event entities found.")
+            return []
 
-            return event_entities
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        return event_entities
 
+    @cached_response()
     def list_event_categories(self):
         """
         Fetches a list of event categories from the Zerto API.
 
         :return: List of event categories.
         """
-        logging.info(f'Events.list_event_categories(zvm_address={self.client.zvm_address})')
-        event_categories_uri = f"https://{self.client.zvm_address}/v1/events/categories"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
+        logger.info('Events.list_event_categories(zvm_address=%s)', self.client.zvm_address)
         try:
-            response = requests.get(event_categories_uri, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
+            response = self.client.api.get_event_category_all()
             event_categories = response.json()
 
             if not event_categories:
-                logging.warning("No event categories found.")
+                logger.warning("No event categories found.")
                 return []
 
             return event_categories
 
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching event categories: {e}")
+            logger.error("Error fetching event categories: %s", e)
             return None
-
-        url = f"https://{self.client.zvm_address}/v1/events/types"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
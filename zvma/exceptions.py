@@ -0,0 +1,107 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import requests
+
+
+class ZVMAError(Exception):
+    """Base class for all errors raised by the zvma request pipeline."""
+
+
+class ZVMAHTTPError(ZVMAError, requests.exceptions.HTTPError):
+    """
+    The ZVM answered with an error status.
+
+    Subclasses requests.exceptions.HTTPError, so existing `except RequestException`
+    handlers keep working and `e.response` is still available.
+    """
+
+    def __init__(self, message, response=None, request=None, method=None, url=None):
+        super().__init__(message, response=response, request=request)
+        self.status_code = response.status_code if response is not None else None
+        self.method = method
+        self.url = url
+
+
+class ZVMABadRequestError(ZVMAHTTPError):
+    """400 - the ZVM rejected the request payload or parameters."""
+
+
+class ZVMAAuthenticationError(ZVMAHTTPError):
+    """401 - the token was rejected even after a refresh."""
+
+
+class ZVMAPermissionError(ZVMAHTTPError):
+    """403 - the client is not allowed to perform the operation."""
+
+
+class ZVMANotFoundError(ZVMAHTTPError):
+    """404 - the requested entity does not exist."""
+
+
+class ZVMAConflictError(ZVMAHTTPError):
+    """409 - the operation conflicts with the current state of the entity."""
+
+
+class ZVMARateLimitError(ZVMAHTTPError):
+    """429 - the ZVM is throttling requests."""
+
+
+class ZVMAServerError(ZVMAHTTPError):
+    """5xx - the ZVM failed to process the request."""
+
+
+class ZVMAConnectionError(ZVMAError, requests.exceptions.ConnectionError):
+    """The ZVM could not be reached or the connection was reset."""
+
+
+class ZVMACircuitOpenError(ZVMAConnectionError):
+    """The ZVM failed repeatedly and its circuit breaker rejects calls until it recovers."""
+
+    def __init__(self, message, host=None, retry_after=None):
+        super().__init__(message)
+        self.host = host
+        self.retry_after = retry_after
+
+
+class ZVMATimeoutError(ZVMAError, requests.exceptions.Timeout):
+    """A single request to the ZVM timed out."""
+
+
+class ZVMADeadlineExceededError(ZVMATimeoutError):
+    """The per-call deadline expired before the request (including retries) completed."""
+
+
+class ZVMAValidationError(ZVMAError, ValueError):
+    """A request payload failed local validation; nothing was sent to the ZVM."""
+
+    def __init__(self, message, errors):
+        super().__init__(f"{message}: " + "; ".join(errors))
+        self.errors = errors
+
+
+_STATUS_ERRORS = {
+    400: ZVMABadRequestError,
+    401: ZVMAAuthenticationError,
+    403: ZVMAPermissionError,
+    404: ZVMANotFoundError,
+    409: ZVMAConflictError,
+    429: ZVMARateLimitError,
+}
+
+
+def error_for_status(status_code):
+    """Return the ZVMAHTTPError subclass matching an HTTP status code."""
+    if status_code in _STATUS_ERRORS:
+        return _STATUS_ERRORS[status_code]
+    if status_code >= 500:
+        return ZVMAServerError
+    return ZVMAHTTPError
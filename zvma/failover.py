@@ -9,13 +9,13 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
-import logging
+from .priority import RequestPriority, with_priority
 
 class Failover:
     def __init__(self, client):
         self.client = client
 
+    @with_priority(RequestPriority.CRITICAL)
     def failover(self, vpg_name, checkpoint_identifier=None, vm_name_list=None, commit_policy=0, time_to_wait_before_shutdown_sec=3600, shutdown_policy=0, is_reverse_protection=False, sync=None):
         # Implementation of failover method
         pass
\ No newline at end of file
@@ -0,0 +1,191 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import contextvars
+import logging
+import time
+from .zvma import ZVMAClient
+from .batch import create_executor
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLEET_WORKERS = 32
+
+
+class FleetResult:
+    """
+    Outcome of one call fanned out over a fleet.
+
+    :ivar results: {site: return value} of the sites where the call succeeded.
+    :ivar errors: {site: exception} of the sites where it failed.
+    :ivar durations: {site: seconds} spent on each site.
+    """
+
+    def __init__(self, results, errors, durations):
+        self.results = results
+        self.errors = errors
+        self.durations = durations
+
+    @property
+    def ok(self):
+        """True if the call succeeded on every site."""
+        return not self.errors
+
+    def merged(self, tag='Site'):
+        """
+        Concatenate the results of all sites into one list tagged with their site.
+
+        List results contribute one entry per item, other results one entry. Dict items are copied
+        with an extra `tag` key; other values become {tag: site, 'Value': value}.
+        """
+        merged = []
+        for site, result in self.results.items():
+            for item in (result if isinstance(result, list) else [result]):
+                merged.append({**item, tag: site} if isinstance(item, dict) else {tag: site, 'Value': item})
+        return merged
+
+    def raise_for_errors(self):
+        """Raise the error of the first failed site, if any."""
+        for site, error in self.errors.items():
+            raise error
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(succeeded={list(self.results)}, failed={list(self.errors)})'
+
+
+class _FleetNamespace:
+    """Resource namespace proxy: `fleet.vpgs.list_vpgs(...)` runs the method on every site."""
+
+    def __init__(self, fleet, name):
+        self._fleet = fleet
+        self._name = name
+
+    def __getattr__(self, method_name):
+        name = self._name
+        return lambda *args, **kwargs: self._fleet.call(
+            lambda client: getattr(getattr(client, name), method_name)(*args, **kwargs),
+            name=f'{name}.{method_name}')
+
+
+class ZVMAFleet:
+    """
+    Many ZVMAClient instances queried concurrently.
+
+    Usage:
+        with ZVMAFleet({'site-a': dict(zvm_address='zvm-a', client_id=cid, client_secret=secret),
+                        'site-b': existing_client}) as fleet:
+            vpgs = fleet.vpgs.list_vpgs()
+            for vpg in vpgs.merged():
+                print(vpg['Site'], vpg['VpgName'])
+            for site, error in vpgs.errors.items():
+                print(f"{site} failed: {error}")
+
+    A failing or unreachable site is reported in FleetResult.errors and does not abort the call on
+    the other sites; the per-ZVM circuit breakers make dead sites fail fast.
+
+    :param sites: {site name: ZVMAClient or dict of ZVMAClient keyword arguments}, or a list of
+                  ZVMAClient instances named by their zvm_address. close() closes only the clients
+                  the fleet created from dicts; clients passed in remain the caller's to close.
+    :param max_workers: Sites queried at the same time; defaults to the number of sites, at most 32.
+    :param client_defaults: Keyword arguments applied to every client created from a dict, e.g.
+                            verify_certificate=False or token_cache=True.
+    """
+
+    def __init__(self, sites, max_workers=None, **client_defaults):
+        if not isinstance(sites, dict):
+            sites = {client.zvm_address: client for client in sites}
+        self.clients = {name: site if isinstance(site, ZVMAClient) else ZVMAClient(**{**client_defaults, **site})
+                        for name, site in sites.items()}
+        # Clients passed in stay the caller's to close
+        self._owned = [self.clients[name] for name, site in sites.items() if not isinstance(site, ZVMAClient)]
+        self.max_workers = max_workers or max(1, min(len(self.clients), DEFAULT_FLEET_WORKERS))
+        self._executor = None
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = create_executor(self.max_workers)
+        return self._executor
+
+    def call(self, function, sites=None, timeout=None, name=None):
+        """
+        Run `function(client)` for every site concurrently.
+
+        :param sites: Names of the sites to query; all sites by default.
+        :param timeout: Seconds to wait for each site; a site still running afterwards is reported
+                        with a TimeoutError (the call itself is not interrupted).
+        :param name: Label of the call in logs and trace spans.
+        :return: FleetResult with results and errors keyed by site.
+        """
+        name = name or getattr(function, '__qualname__', 'call')
+        selected = list(sites) if sites is not None else list(self.clients)
+        with tracing.span(f'ZVMAFleet.{name}', **{'zvma.fleet.sites': len(selected)}):
+            futures = {}
+            for site in selected:
+                client = self.clients[site]
+                context = contextvars.copy_context()
+                futures[site] = self.executor.submit(context.run, self._run, site, client, function)
+            results, errors, durations = {}, {}, {}
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            for site, future in futures.items():
+                remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+                try:
+                    results[site], durations[site] = future.result(remaining)
+                except Exception as e:
+                    if isinstance(e, TimeoutError) and not future.done():
+                        e = TimeoutError(f"Site {site} did not answer {name} within {timeout}s")
+                    logger.warning("ZVMAFleet.%s: site %s failed: %s", name, site, e)
+                    errors[site] = e
+        return FleetResult(results, errors, durations)
+
+    @staticmethod
+    def _run(site, client, function):
+        started = time.monotonic()
+        with tracing.span('ZVMAFleet.site', **{'zvma.fleet.site': site, 'zvma.zvm_address': client.zvm_address}):
+            return function(client), time.monotonic() - started
+
+    def authenticate(self):
+        """Fetch the tokens of all sites concurrently; failures are reported per site."""
+        return self.call(lambda client: client.authenticate(), name='authenticate')
+
+    def health(self):
+        """{site: circuit breaker state} of every site, without contacting the ZVMs."""
+        return {site: client.health() for site, client in self.clients.items()}
+
+    def healthy_sites(self):
+        """Names of the sites whose circuit breaker is closed."""
+        return [site for site, client in self.clients.items() if client.is_healthy()]
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _FleetNamespace(self, name)
+
+    def __getitem__(self, site):
+        return self.clients[site]
+
+    def __len__(self):
+        return len(self.clients)
+
+    def close(self):
+        """Stop the fan-out threads and close the clients the fleet created; clients passed in are left open."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for client in self._owned:
+            client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
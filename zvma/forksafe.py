@@ -0,0 +1,30 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import os
+import weakref
+
+# Live objects holding sockets or locks that must be rebuilt in a forked child process
+_objects = weakref.WeakSet()
+
+
+def register(obj):
+    """Call `obj._after_fork_in_child()` in the child process after every os.fork()."""
+    _objects.add(obj)
+
+
+def _after_fork_in_child():
+    for obj in list(_objects):
+        obj._after_fork_in_child()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
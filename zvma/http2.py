@@ -0,0 +1,140 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Optional httpx backend for the sync Transport, for ZVMs behind high-latency links.
+
+HTTPXSession stands in for the requests.Session used by Transport: it negotiates HTTP/2 (one multiplexed
+connection per ZVM instead of a pool of HTTP/1.1 connections) and compressed responses, and returns
+ordinary requests.Response objects, so the retry, token and error handling pipeline is unchanged.
+"""
+
+import datetime
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+
+class _HTTPXRaw:
+    """File-like `response.raw` of a converted response; `tell()` reports bytes received on the wire."""
+
+    def __init__(self, response):
+        self._response = response
+        self._chunks = None
+        self._buffer = b''
+        self.http_version = response.http_version
+
+    def read(self, amt=None):
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes()
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def tell(self):
+        return self._response.num_bytes_downloaded
+
+    def close(self):
+        self._response.close()
+
+
+class HTTPXSession:
+    """
+    requests.Session look-alike backed by httpx.Client. request() takes the arguments the Transport
+    passes (params, data, json, files, headers, verify, timeout, stream, allow_redirects) and raises
+    TypeError for any other requests argument.
+
+    :param verify_certificate: Default for the per-request `verify` argument.
+    :param pool_maxsize: Maximum number of connections per ZVM (HTTP/2 normally needs just one).
+    :param http2: Negotiate HTTP/2. None (default) enables it when the 'h2' package is installed.
+    """
+
+    def __init__(self, verify_certificate=True, pool_maxsize=10, http2=None):
+        if httpx is None:
+            raise ImportError("The 'httpx' transport backend requires the 'httpx' package: pip install httpx")
+        if http2 and h2 is None:
+            raise ImportError("HTTP/2 requires the 'h2' package: pip install httpx[http2]")
+        self.verify_certificate = verify_certificate
+        self.http2 = h2 is not None if http2 is None else bool(http2)
+        self.limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize)
+        # httpx fixes certificate verification per client, so keep one client per `verify` value
+        self.clients = {}
+
+    def _get_client(self, verify):
+        client = self.clients.get(verify)
+        if client is None:
+            client = self.clients.setdefault(verify, httpx.Client(verify=verify, http2=self.http2, limits=self.limits))
+        return client
+
+    def request(self, method, url, params=None, data=None, headers=None, json=None, verify=None, timeout=None,
+                stream=False, files=None, allow_redirects=True, **kwargs):
+        if kwargs:
+            # Refuse rather than drop arguments that would change the request
+            raise TypeError(f"HTTPXSession.request() does not support: {', '.join(sorted(kwargs))}")
+        client = self._get_client(self.verify_certificate if verify is None else verify)
+        if params:
+            # requests drops None-valued parameters, httpx would send them as empty strings
+            params = {k: v for k, v in params.items() if v is not None}
+        if isinstance(data, (bytes, str)):
+            body = {'content': data}
+        else:
+            body = {'data': data, 'json': json, 'files': files}
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        try:
+            request = client.build_request(method, url, params=params, headers=headers, timeout=timeout, **body)
+            response = client.send(request, stream=stream, follow_redirects=allow_redirects)
+            if not stream:
+                response.read()
+        except httpx.TimeoutException as e:
+            error_class = requests.exceptions.ConnectTimeout if isinstance(e, httpx.ConnectTimeout) else requests.exceptions.ReadTimeout
+            raise error_class(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        return self._to_requests_response(response, stream)
+
+    @staticmethod
+    def _to_requests_response(response, stream):
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.url = str(response.url)
+        result.encoding = get_encoding_from_headers(result.headers)
+        result.raw = _HTTPXRaw(response)
+        if not stream:
+            result._content = response.content
+            result.elapsed = response.elapsed
+        else:
+            result.elapsed = datetime.timedelta(0)
+        return result
+
+    def close(self):
+        for client in list(self.clients.values()):
+            client.close()
+        self.clients.clear()
@@ -0,0 +1,271 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Lazy views over raw JSON list responses.
+
+`LazyList` keeps the response body as bytes and decodes nothing up front. Indexing it gives a
+`LazyRecord`, a read-only mapping that decodes a top-level field the first time it is read, and
+`LazyList.project()` pulls a few fields out of every record in one pass over the buffer without
+building the rest of each record. The bytes take far less memory than the decoded dicts
+(benchmarks/bench_lazy.py: under 5 MB instead of 33-267 MB at peak for 20,000 VMs); scanning them in
+Python is slower than a full C decode of flat records, so this is a memory saving for very large
+responses rather than a speed-up.
+
+Unwanted values are skipped by regular expressions that match nested objects and arrays up to
+MAX_NESTING levels deep inside the regex engine; a record the patterns cannot match completely, e.g.
+one nested deeper, is decoded whole instead.
+The scanner relies on the body being valid JSON, as returned by the ZVM; it does not validate it.
+"""
+
+import json
+import re
+from collections.abc import Mapping, Sequence
+from .streaming import _find_value_end
+
+MAX_NESTING = 12
+
+# Patterns are written in the "unrolled loop" form (plain text, then any number of token + plain text)
+# so each position can be matched only one way and a failed match backtracks in linear time without
+# the possessive quantifiers only Python 3.11+ supports.
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_PLAIN = rb'[^"\[\]{}]*'
+
+
+def _nested_pattern(levels):
+    """Pattern matching any JSON object or array nested at most `levels` deep."""
+    pattern = rb'[\[{]' + _PLAIN + rb'(?:' + _STRING + _PLAIN + rb')*[\]}]'
+    for _ in range(levels - 1):
+        pattern = rb'[\[{]' + _PLAIN + rb'(?:(?:' + _STRING + rb'|' + pattern + rb')' + _PLAIN + rb')*[\]}]'
+    return pattern
+
+
+_NESTED = _nested_pattern(MAX_NESTING)
+# A scalar never starts an object, array or string: a value nested deeper than MAX_NESTING must fail
+# to match rather than be taken for a scalar
+_VALUE = rb'(?:' + _STRING + rb'|' + _NESTED + rb'|[^"\[\]{},\s]+)'
+# One top-level "key": value pair of an object, with the separators before it
+_PAIR = re.compile(rb'[\s,]*"([^"\\]*(?:\\.[^"\\]*)*)"\s*:\s*(' + _VALUE + rb')', re.DOTALL)
+_OBJECT = re.compile(rb'\{' + _PLAIN + rb'(?:(?:' + _STRING + rb'|' + _NESTED + rb')' + _PLAIN + rb')*\}', re.DOTALL)
+_OBJECT_END = re.compile(rb'\s*\}\s*')
+_SEPARATORS = re.compile(rb'[\s,]*')
+_WHITESPACE = re.compile(rb'\s*')
+
+
+def _decode_key(raw):
+    return raw.decode('utf-8') if b'\\' not in raw else json.loads(b'"' + raw + b'"')
+
+
+def _index_object(buffer, pos, end):
+    """Map every top-level key of the object in buffer[pos:end] to the (start, end) span of its value."""
+    index = {}
+    pos += 1
+    match_pair = _PAIR.match
+    while True:
+        match = match_pair(buffer, pos, end)
+        if match is None:
+            break
+        index[_decode_key(match.group(1))] = match.span(2)
+        pos = match.end()
+    # Anything but the closing brace left over means a value the patterns could not match
+    match = _OBJECT_END.match(buffer, pos, end)
+    return index if match is not None and match.end() == end else None
+
+
+class LazyRecord(Mapping):
+    """
+    Read-only mapping over one JSON object inside a raw buffer. The top-level keys are located on
+    first access and each value is decoded, then cached, the first time it is read.
+    """
+    __slots__ = ('_buffer', '_start', '_end', '_loads', '_index', '_values')
+
+    def __init__(self, buffer, start=0, end=None, loads=json.loads):
+        self._buffer = buffer
+        self._start = _WHITESPACE.match(buffer, start).end()
+        self._end = len(buffer) if end is None else end
+        self._loads = loads
+        self._index = None
+        self._values = None
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = _index_object(self._buffer, self._start, self._end)
+            if self._index is None:
+                # Nested deeper than the patterns reach
+                self._values = self.to_dict()
+                self._index = dict.fromkeys(self._values)
+            elif self._values is None:
+                self._values = {}
+        return self._index
+
+    def __getitem__(self, key):
+        index = self._get_index()
+        try:
+            return self._values[key]
+        except KeyError:
+            start, end = index[key]
+            value = self._values[key] = self._loads(self._buffer[start:end])
+            return value
+
+    def __iter__(self):
+        return iter(self._get_index())
+
+    def __len__(self):
+        return len(self._get_index())
+
+    def raw(self):
+        """The undecoded bytes of the record."""
+        return bytes(self._buffer[self._start:self._end])
+
+    def to_dict(self):
+        """Decode the whole record."""
+        return self._loads(self._buffer[self._start:self._end])
+
+    def __repr__(self):
+        return f"LazyRecord({self.raw().decode('utf-8', 'replace')[:200]})"
+
+
+class LazyList(Sequence):
+    """
+    Sequence of `LazyRecord` over a raw JSON array. Record boundaries are found in one pass on first
+    access; nothing is decoded until a field is read.
+    """
+
+    def __init__(self, buffer, loads=json.loads):
+        self._buffer = buffer
+        self._loads = loads
+        self._spans = None
+        self._projections = {}
+
+    def _iter_elements(self):
+        """Yield the start offset of each array element; the caller advances to its end via send()."""
+        buffer = self._buffer
+        pos = _WHITESPACE.match(buffer).end()
+        if buffer[pos:pos + 1] != b'[':
+            raise ValueError("Response body is not a JSON array")
+        pos += 1
+        while True:
+            pos = _SEPARATORS.match(buffer, pos).end()
+            first = buffer[pos:pos + 1]
+            if first == b']':
+                return
+            if not first:
+                raise ValueError("Unexpected end of JSON array")
+            pos = yield pos
+
+    def _element_end(self, pos):
+        if self._buffer[pos:pos + 1] == b'{':
+            match = _OBJECT.match(self._buffer, pos)
+            if match is not None:
+                return match.end()
+        return _find_value_end(self._buffer, pos, True)
+
+    def _get_spans(self):
+        if self._spans is None:
+            spans = []
+            elements = self._iter_elements()
+            try:
+                start = next(elements)
+                while True:
+                    end = self._element_end(start)
+                    spans.append((start, end))
+                    start = elements.send(end)
+            except StopIteration:
+                pass
+            self._spans = spans
+        return self._spans
+
+    def __len__(self):
+        return len(self._get_spans())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        start, end = self._get_spans()[index]
+        if self._buffer[start:start + 1] != b'{':
+            return self._loads(self._buffer[start:end])
+        return LazyRecord(self._buffer, start, end, self._loads)
+
+    def _projection_pattern(self, fields):
+        pattern = self._projections.get(fields)
+        if pattern is None:
+            keys = b'|'.join(re.escape(json.dumps(field)[1:-1].encode('utf-8')) for field in fields)
+            # Skip unwanted pairs inside the regex engine; stop at a wanted key or at the closing brace
+            skip = rb'(?:[\s,]*(?!"(?:' + keys + rb')"\s*:)' + _STRING + rb'\s*:\s*' + _VALUE + rb')*'
+            pattern = self._projections[fields] = re.compile(
+                skip + rb'[\s,]*(?:"(' + keys + rb')"\s*:\s*(' + _VALUE + rb')|(\}))', re.DOTALL)
+        return pattern
+
+    def project(self, *fields, default=None):
+        """
+        Decode only `fields` of every record, in a single pass over the buffer.
+
+        :param fields: Top-level keys to extract, e.g. 'VpgName', 'Status', 'ActualRPO'.
+        :param default: Value used for a field a record does not have.
+        :return: List with one tuple of the field values per record, in the order of `fields`.
+        """
+        buffer = self._buffer
+        loads = self._loads
+        positions = {field: position for position, field in enumerate(fields)}
+        match_field = self._projection_pattern(fields).match
+        rows = []
+        spans = []
+        elements = self._iter_elements()
+        try:
+            start = next(elements)
+            while True:
+                row = [default] * len(fields)
+                end = None
+                if buffer[start:start + 1] == b'{':
+                    pos = start + 1
+                    while True:
+                        match = match_field(buffer, pos)
+                        if match is None:
+                            break
+                        if match.group(3) is not None:
+                            end = match.end()
+                            break
+                        row[positions[_decode_key(match.group(1))]] = loads(match.group(2))
+                        pos = match.end()
+                if end is None:
+                    # Not an object, or nested deeper than the patterns reach
+                    end = _find_value_end(buffer, start, True)
+                    record = loads(buffer[start:end])
+                    if isinstance(record, dict):
+                        row = [record.get(field, default) for field in fields]
+                rows.append(tuple(row))
+                spans.append((start, end))
+                start = elements.send(end)
+        except StopIteration:
+            pass
+        self._spans = spans
+        return rows
+
+    def column(self, field, default=None):
+        """Values of one top-level field across all records."""
+        return [row[0] for row in self.project(field, default=default)]
+
+    def to_list(self):
+        """Decode the whole response."""
+        return self._loads(self._buffer)
+
+    def __repr__(self):
+        return f"LazyList({len(self)} records, {len(self._buffer)} bytes)"
+
+
+def lazy_response(buffer, loads=json.loads):
+    """Wrap a response body: a JSON array becomes a `LazyList`, a single object a `LazyRecord`."""
+    first = buffer[_WHITESPACE.match(buffer).end():][:1]
+    if first == b'[':
+        return LazyList(buffer, loads)
+    if first == b'{':
+        return LazyRecord(buffer, 0, len(buffer), loads)
+    return loads(buffer)
@@ -9,9 +9,10 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
 
+logger = logging.getLogger(__name__)
+
 class License:
     def __init__(self, client):
         self.client = client
@@ -23,46 +24,22 @@ class License:
         Returns:
             dict: The license information from the Zerto server, or an empty dictionary if no content is returned.
         """
-        logging.info(f'License.get_license(zvm_address={self.client.zvm_address})')
+        logger.info('License.get_license(zvm_address=%s)', self.client.zvm_address)
 
-        url = f"https://{self.client.zvm_address}/v1/license"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
+        logger.info("Fetching license information...")
+        response = self.client.api.get_license()
+
+        # Handle 204 No Content
+        if response.status_code == 204:
+            logger.info("No license information available.")
+            return {}
 
-        try:
-            logging.info("Fetching license information...")
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-
-            # Handle 204 No Content
-            if response.status_code == 204:
-                logging.info("No license information available.")
-                return {}
-
-            # Raise an error for other non-successful HTTP status codes
-            response.raise_for_status()
-
-            # Parse the response JSON
-            license_info = response.json()
-            logging.info("Successfully fetched license information.")
-            return license_info
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error details: {json.dumps(error_details, indent=2)}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error while fetching license information: {e}")
-            raise
+        # Raise an error for other non-successful HTTP status codes
+
+        # Parse the response JSON
+        license_info = response.json()
+        logger.info("Successfully fetched license information.")
+        return license_info
 
     def put_license(self, license_key):
         """
@@ -74,49 +51,26 @@ class License:
         Returns:
             dict: The response from the Zerto server, or an empty dictionary if no content is returned.
         """
-        logging.info(f'License.put_license(zvm_address={self.client.zvm_address}, license_key={license_key})')
+        logger.info('License.put_license(zvm_address=%s, license_key=%s)', self.client.zvm_address, license_key)
 
-        url = f"https://{self.client.zvm_address}/v1/license"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
         payload = {
             "licenseKey": license_key
         }
 
-        try:
-            logging.info("Adding or updating license...")
-            response = requests.put(url, json=payload, headers=headers, verify=self.client.verify_certificate)
-
-            # Handle empty response with 200 status code
-            if response.status_code == 200 and not response.content:
-                logging.info("License successfully added or updated with no content returned.")
-                return {}
+        logger.info("Adding or updating license...")
+        response = self.client.api.set_license(body=payload)
 
-            # Raise an error for other non-successful HTTP status codes
-            response.raise_for_status()
+        # Handle empty response with 200 status code
+        if response.status_code == 200 and not response.content:
+            logger.info("License successfully added or updated with no content returned.")
+            return {}
 
-            # Parse the response JSON
-            response_data = response.json()
-            logging.info("Successfully added or updated license.")
-            return response_data
+        # Raise an error for other non-successful HTTP status codes
 
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error details: {json.dumps(error_details, indent=2)}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error while adding or updating license: {e}")
-            raise
+        # Parse the response JSON
+        response_data = response.json()
+        logger.info("Successfully added or updated license.")
+        return response_data
 
     def delete_license(self):
         """
@@ -125,40 +79,19 @@ class License:
         Returns:
             dict: The response from the Zerto server.
         """
-        logging.info(f'License.delete_license(zvm_address={self.client.zvm_address})')
+        logger.info('License.delete_license(zvm_address=%s)', self.client.zvm_address)
 
-        url = f"https://{self.client.zvm_address}/v1/license"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
+        logger.info("Deleting license...")
+        response = self.client.api.remove_license()
 
-        try:
-            logging.info("Deleting license...")
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
-
-            # Raise an error for non-successful HTTP status codes
-            response.raise_for_status()
-
-            # Parse the response JSON if available
-            if response.content:
-                response_data = response.json()
-                logging.info("License successfully deleted.")
-                return response_data
-            else:
-                logging.info("License successfully deleted with no content returned.")
-                return {}
-
-        except requests.exceptions.RequestException as e:
-            logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-            try:
-                error_details = e.response.json()
-                logging.error(f"Error details: {json.dumps(error_details, indent=2)}")
-            except ValueError:
-                logging.error(f"Response content: {e.response.text}")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error while deleting license: {e}")
-            raise
+        # Raise an error for non-successful HTTP status codes
+
+        # Parse the response JSON if available
+        if response.content:
+            response_data = response.json()
+            logger.info("License successfully deleted.")
+            return response_data
+        else:
+            logger.info("License successfully deleted with no content returned.")
+            return {}
     
\ No newline at end of file
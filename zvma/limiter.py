@@ -0,0 +1,124 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import logging
+import threading
+import time
+from .priority import RequestPriority
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Caps the number of concurrent requests to one ZVM and adapts the cap with AIMD
+    (additive increase, multiplicative decrease).
+
+    Every successful, fast response raises the limit by 1/limit (about +1 per round of `limit`
+    requests). A 429/5xx, a connection failure or a latency above `latency_tolerance` times the
+    observed baseline cuts the limit by `decrease_factor`, at most once per baseline latency so a
+    single burst of slow responses does not collapse it. The baseline follows the latency of every
+    successful response, slow ones included, so after a lasting latency step it catches up and the
+    limit grows back instead of staying at `min_limit`.
+
+    :param initial_limit: Starting number of concurrent requests.
+    :param min_limit: Lower bound of the limit.
+    :param max_limit: Upper bound of the limit, normally the connection pool size.
+    :param decrease_factor: Multiplier applied to the limit on congestion.
+    :param latency_tolerance: Latency above baseline * tolerance is treated as congestion.
+    :param critical_reserve: Slots of the limit that only CRITICAL requests may use, so failover calls
+                             find a free connection even while background traffic saturates the rest.
+
+    Waiting requests are admitted by priority: no request takes a slot while a request of a higher
+    RequestPriority is waiting for one.
+    """
+
+    def __init__(self, initial_limit=10, min_limit=1, max_limit=10, decrease_factor=0.7, latency_tolerance=2.0,
+                 critical_reserve=1):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.critical_reserve = critical_reserve
+        self._waiting = [0] * len(RequestPriority)
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._baseline_latency = None
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self):
+        return int(self._limit)
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def _can_admit(self, priority):
+        limit = int(self._limit)
+        if priority != RequestPriority.CRITICAL:
+            limit = max(1, limit - self.critical_reserve)
+        return self._in_flight < limit and not any(self._waiting[:priority])
+
+    def acquire(self, timeout=None, priority=RequestPriority.NORMAL):
+        """
+        Wait for a free slot. Returns False if `timeout` seconds elapse first.
+
+        :param priority: RequestPriority of the request; higher priority waiters are admitted first.
+        """
+        with self._condition:
+            self._waiting[priority] += 1
+            try:
+                admitted = self._condition.wait_for(lambda: self._can_admit(priority), timeout=timeout)
+            finally:
+                self._waiting[priority] -= 1
+            if admitted:
+                self._in_flight += 1
+            if any(self._waiting[priority + 1:]):
+                # Lower priority waiters were held back by this one
+                self._condition.notify_all()
+            return admitted
+
+    def release(self, latency, success=True):
+        """
+        Free a slot and feed the outcome of the request back into the limit.
+
+        :param latency: Duration of the request in seconds.
+        :param success: False for 429/5xx responses and connection failures.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            baseline = self._baseline_latency
+            congested = not success or (baseline is not None and latency > baseline * self.latency_tolerance)
+            if success:
+                # Slowly tracking average of successful latencies; it moves on slow responses too
+                self._baseline_latency = latency if baseline is None else baseline * 0.95 + latency * 0.05
+            if congested:
+                now = time.monotonic()
+                if now - self._last_decrease >= (baseline or 0):
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                    self._last_decrease = now
+                    logger.debug("AdaptiveConcurrencyLimiter: congestion (latency=%.3fs, success=%s), limit -> %.2f",
+                                 latency, success, self._limit)
+            else:
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+
+    def snapshot(self):
+        """Current state of the limiter, for logging and monitoring."""
+        with self._condition:
+            return {
+                'limit': int(self._limit),
+                'in_flight': self._in_flight,
+                'baseline_latency': self._baseline_latency,
+                'waiting': {priority.name.lower(): self._waiting[priority] for priority in RequestPriority},
+            }
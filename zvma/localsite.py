@@ -9,143 +9,61 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
 
+logger = logging.getLogger(__name__)
+
 class LocalSite:
-    def __init__(self, zvm_address, token):
-        self.zvm_address = zvm_address
-        self.token = token
-        self.headers = {
+    def __init__(self, client):
+        self.client = client
+        self.zvm_address = client.zvm_address
+
+    @property
+    def token(self):
+        return self.client.token
+
+    @property
+    def headers(self):
+        return {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
 
     def get_local_site(self):
-        logging.info("LocalSite.get_local_site: Fetching local site information...")
-        url = f"https://{self.zvm_address}/v1/localsite"
-        try:
-            response = requests.get(url, headers=self.headers, verify=False)
-            response.raise_for_status()
-            logging.info("LocalSite.get_local_site: Successfully retrieved local site information.")
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        logger.info("LocalSite.get_local_site: Fetching local site information...")
+        response = self.client.api.get_local_site_all(verify=False)
+        logger.info("LocalSite.get_local_site: Successfully retrieved local site information.")
+        return response.json()
 
     def get_pairing_statuses(self):
-        logging.info("LocalSite.get_pairing_statuses: Fetching pairing statuses...")
-        url = f"https://{self.zvm_address}/v1/localsite/pairingstatuses"
-        try:
-            response = requests.get(url, headers=self.headers, verify=False)
-            response.raise_for_status()
-            logging.info("LocalSite.get_pairing_statuses: Successfully retrieved pairing statuses.")
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        logger.info("LocalSite.get_pairing_statuses: Fetching pairing statuses...")
+        response = self.client.api.get_local_site_pairing_status_all(verify=False)
+        logger.info("LocalSite.get_pairing_statuses: Successfully retrieved pairing statuses.")
+        return response.json()
 
     def send_usage(self):
-        logging.info("LocalSite.send_usage: Sending local site billing usage...")
-        url = f"https://{self.zvm_address}/v1/localsite/billing/sendUsage"
-        try:
-            response = requests.post(url, headers=self.headers, verify=False)
-            response.raise_for_status()
-            if response.content.strip():
-                logging.info("LocalSite.send_usage: Successfully sent billing usage data.")
-                return response.json()
-            else:
-                logging.info("LocalSite.send_usage: Successfully sent billing usage data. No content returned.")
-                return None
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
-
-    def get_login_banner(self):
-        logging.info("LocalSite.get_login_banner: Fetching login banner settings...")
-        url = f"https://{self.zvm_address}/v1/localsite/settings/loginBanner"
-        try:
-            response = requests.get(url, headers=self.headers, verify=False)
-            response.raise_for_status()
-            logging.info("LocalSite.get_login_banner: Successfully retrieved login banner settings.")
+        logger.info("LocalSite.send_usage: Sending local site billing usage...")
+        response = self.client.api.send_local_site_billing_usage_data(verify=False)
+        if response.content.strip():
+            logger.info("LocalSite.send_usage: Successfully sent billing usage data.")
             return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        else:
+            logger.info("LocalSite.send_usage: Successfully sent billing usage data. No content returned.")
+            return None
 
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+    def get_login_banner(self):
+        logger.info("LocalSite.get_login_banner: Fetching login banner settings...")
+        response = self.client.api.get_local_site_login_banner(verify=False)
+        logger.info("LocalSite.get_login_banner: Successfully retrieved login banner settings.")
+        return response.json()
 
     def set_login_banner(self, is_enabled, banner_text):
-        logging.info("LocalSite.set_login_banner: Setting login banner settings...")
-        url = f"https://{self.zvm_address}/v1/localsite/settings/loginBanner"
+        logger.info("LocalSite.set_login_banner: Setting login banner settings...")
         payload = {
             "isLoginBannerEnabled": is_enabled,
             "loginBanner": banner_text
         }
-        try:
-            response = requests.put(url, headers=self.headers, json=payload, verify=False)
-            response.raise_for_status()
-            logging.info("LocalSite.set_login_banner: Successfully set login banner settings.")
-            return response
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        response = self.client.api.edit_local_site_login_banner(body=payload, verify=False)
+        logger.info("LocalSite.set_login_banner: Successfully set login banner settings.")
+        return response
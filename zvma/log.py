@@ -0,0 +1,96 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Logging helpers of the zvma package.
+
+Every module logs through `logging.getLogger(__name__)`, i.e. a child of the 'zvma' logger, with
+%-style arguments that are only formatted when a handler actually emits the record. The 'zvma'
+logger has a NullHandler, so the library is silent unless the application configures logging:
+
+    logging.basicConfig(level=logging.INFO)                 # everything, including zvma
+    logging.getLogger('zvma').setLevel(logging.WARNING)     # or just quieten the library
+
+Request and response bodies are logged with `log_payload`, which costs one level check when the
+level is disabled, and is sampled and truncated when it is enabled.
+"""
+
+import json
+import logging
+import random
+
+DEFAULT_PAYLOAD_MAX_CHARS = 2000
+
+_settings = {'sample_rate': 1.0, 'max_chars': DEFAULT_PAYLOAD_MAX_CHARS}
+
+
+def configure_payload_logging(sample_rate=None, max_chars=None):
+    """
+    Tune payload logging.
+
+    :param sample_rate: Fraction (0..1) of payloads that are logged when the level is enabled.
+    :param max_chars: Payloads are cut to this many characters; None keeps the current setting.
+    """
+    if sample_rate is not None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        _settings['sample_rate'] = sample_rate
+    if max_chars is not None:
+        _settings['max_chars'] = max_chars
+
+
+class Payload:
+    """Log argument rendering a JSON payload, truncated to `max_chars`, only when the record is formatted."""
+    __slots__ = ('value', 'max_chars')
+
+    def __init__(self, value, max_chars=DEFAULT_PAYLOAD_MAX_CHARS):
+        self.value = value
+        self.max_chars = max_chars
+
+    def __str__(self):
+        value = self.value
+        if isinstance(value, list):
+            # Encode large lists item by item and stop once the cap is reached
+            parts, size = [], 0
+            for item in value:
+                parts.append(_dumps(item))
+                size += len(parts[-1]) + 2
+                if size > self.max_chars:
+                    break
+            text = '[' + ', '.join(parts) + (']' if len(parts) == len(value) else '')
+            remaining = f'{len(value) - len(parts)} more items' if len(parts) < len(value) else None
+        else:
+            text, remaining = _dumps(value), None
+        if len(text) > self.max_chars:
+            remaining = remaining or f'{len(text) - self.max_chars} more characters'
+            text = text[:self.max_chars]
+        return f'{text}... ({remaining})' if remaining else text
+
+
+def _dumps(value):
+    try:
+        return json.dumps(value, default=str)
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+def log_payload(logger, message, value, level=logging.DEBUG):
+    """
+    Log `message % payload` at `level` if the level is enabled and the payload is sampled.
+
+    :param message: Format string with a single %s for the payload.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    sample_rate = _settings['sample_rate']
+    if sample_rate < 1 and random.random() >= sample_rate:
+        return
+    logger.log(level, message, Payload(value, _settings['max_chars']), stacklevel=2)
@@ -0,0 +1,263 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import threading
+from bisect import bisect_left
+from collections import Counter
+from urllib.parse import urlsplit
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DEFAULT_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+
+# Literal path segments of the ZVM API (from the Swagger definition and the resource classes).
+# Any other segment is an identifier or a name and is replaced with {id} in endpoint templates.
+STATIC_SEGMENTS = frozenset((
+    'alerts', 'api', 'auth', 'basic', 'billing', 'bootgroup', 'browse', 'catalog', 'categories',
+    'changerecoveryvra', 'checkpoints', 'cleanup', 'cloneabort', 'clonestart', 'clusters', 'commit',
+    'copyvpgsettings', 'datastoreclusters', 'datastores', 'datetimeargument', 'deleteretentionsets',
+    'devices', 'diskencryptionkeys', 'dismiss', 'dismissevent', 'download', 'encryptiondetection',
+    'encryptionkeys', 'entities', 'entitytypes', 'events', 'execute', 'exportedsettings', 'exportsettings',
+    'failover', 'failovercommit', 'failovercommitpolicies', 'failoverrollback', 'failovershutdownpolicies',
+    'failovertest', 'failoverteststop', 'files', 'flrs', 'folders', 'forcesync', 'fullretentionsets',
+    'generatetoken', 'health', 'helpidentifiers', 'hostclusters', 'hosts', 'import', 'incrementals',
+    'ipconfigurationtypes', 'items', 'journal', 'keyscontainers', 'levels', 'license', 'localsite',
+    'loginbanner', 'ltr', 'managedidentities', 'management', 'metrics', 'move', 'movecommit', 'moverollback',
+    'networks', 'nics', 'openid-connect', 'orgvdcs', 'output', 'pairingstatuses', 'pause', 'peersites',
+    'pointsintime', 'potentials', 'priorities', 'priority', 'protocol', 'publiccloud', 'realms',
+    'recommendation', 'recovery', 'recoveryscripts', 'reports', 'repositories', 'repository',
+    'resourcegroups', 'resourcepools', 'resources', 'restore', 'restorecommit', 'restorerollback', 'resume',
+    'retentionabort', 'retentionpolicies', 'retentionsets', 'retentionstart', 'scratch', 'scripting',
+    'securitygroups', 'sendusage', 'serverdatetime', 'serverdatetimelocal', 'serverdatetimeutc',
+    'serviceprofiles', 'sessions', 'settings', 'state', 'statistics', 'stats', 'statuses', 'storagepolicies',
+    'subnets', 'substatuses', 'suspected', 'tasks', 'token', 'tweaks', 'types', 'undismiss', 'upgrade', 'v1',
+    'v1.0', 'validate', 'validorgvdcs', 'vcd', 'vcdvapps', 'virtualizationsites', 'virtualnetworks', 'vm',
+    'vminstancetypes', 'vms', 'vmswithoutmorefid', 'volumes', 'vpgs', 'vpgsettings', 'vpgsinfo', 'vras',
+    'zerto', 'zorgs', 'zsspsessions', 'zvmtweaks'
+))
+
+
+def endpoint_template(url):
+    """
+    Reduce a request URL to its endpoint template, e.g.
+    https://zvm/v1/vpgs/8a2f.../checkpoints?startDate=... -> /v1/vpgs/{id}/checkpoints
+    """
+    segments = urlsplit(url).path.strip('/').split('/')
+    return '/' + '/'.join(segment if segment.lower() in STATIC_SEGMENTS else '{id}' for segment in segments if segment)
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """[(upper bound, cumulative count)] including the +Inf bucket."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class EndpointStats:
+    """Counters and histograms of one (ZVM, method, endpoint template) combination."""
+
+    def __init__(self, latency_buckets, size_buckets):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.status_codes = Counter()
+        self.latency = _Histogram(latency_buckets)
+        self.response_size = _Histogram(size_buckets)
+        self.wire_bytes = 0
+
+    def as_dict(self):
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'status_codes': dict(self.status_codes),
+            'latency_sum': self.latency.sum,
+            'latency_buckets': self.latency.cumulative(),
+            'response_bytes': self.response_size.sum,
+            'response_size_buckets': self.response_size.cumulative(),
+            'wire_bytes': self.wire_bytes,
+        }
+
+
+class ClientMetrics:
+    """
+    Thread-safe per-endpoint request metrics recorded by the transport.
+
+    Every completed API call (after retries) is counted under its ZVM host, HTTP method and
+    endpoint template with its final status code ('error' when no response was received),
+    whole-call latency, decoded response size, bytes received on the wire and number of retries.
+
+    :param latency_buckets: Upper bounds in seconds of the latency histogram buckets.
+    :param size_buckets: Upper bounds in bytes of the response size histogram buckets.
+    """
+
+    def __init__(self, latency_buckets=DEFAULT_LATENCY_BUCKETS, size_buckets=DEFAULT_SIZE_BUCKETS):
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, url, status, latency, response_bytes=0, retries=0, wire_bytes=None, template=None):
+        """
+        Record one API call.
+
+        :param status: Final HTTP status code, or None if the call failed without a response.
+        :param response_bytes: Size of the decoded response body.
+        :param wire_bytes: Size of the body as received, before gzip/br decoding; defaults to `response_bytes`.
+        :param template: Endpoint template of `url` if already known.
+        """
+        key = (urlsplit(url).netloc, method, template or endpoint_template(url))
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = EndpointStats(self.latency_buckets, self.size_buckets)
+            stats.requests += 1
+            stats.retries += retries
+            stats.status_codes[status if status is not None else 'error'] += 1
+            if status is None or status >= 400:
+                stats.errors += 1
+            stats.latency.observe(latency)
+            stats.response_size.observe(response_bytes)
+            stats.wire_bytes += response_bytes if wire_bytes is None else wire_bytes
+
+    def snapshot(self):
+        """Return {(zvm, method, endpoint): stats dict} for all endpoints called so far."""
+        with self._lock:
+            return {key: stats.as_dict() for key, stats in self._endpoints.items()}
+
+    def transfer_summary(self):
+        """
+        Bandwidth saved by response compression across all endpoints.
+
+        :return: {'wire_bytes': ..., 'decoded_bytes': ..., 'compression_ratio': decoded / wire (None before any traffic)}
+        """
+        with self._lock:
+            wire = sum(stats.wire_bytes for stats in self._endpoints.values())
+            decoded = sum(stats.response_size.sum for stats in self._endpoints.values())
+        return {'wire_bytes': wire, 'decoded_bytes': decoded, 'compression_ratio': decoded / wire if wire else None}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def _after_fork_in_child(self):
+        # A forked child reports its own calls only
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def to_prometheus(self, prefix='zvma'):
+        """Render the metrics in the Prometheus text exposition format."""
+        return render_prometheus([self], prefix)
+
+    def _prometheus_samples(self, prefix):
+        """Yield (family, sample line) for every sample, family by family in FAMILIES order."""
+        snapshot = self.snapshot()
+
+        def labels(key, **extra):
+            zvm, method, endpoint = key
+            pairs = {'zvm': zvm, 'method': method, 'endpoint': endpoint, **extra}
+            return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs.items()) + '}'
+
+        for key, stats in snapshot.items():
+            for status, count in sorted(stats['status_codes'].items(), key=lambda item: str(item[0])):
+                yield 'requests_total', f'{prefix}_requests_total{labels(key, status=status)} {count}'
+        for key, stats in snapshot.items():
+            yield 'request_retries_total', f'{prefix}_request_retries_total{labels(key)} {stats["retries"]}'
+        for key, stats in snapshot.items():
+            yield 'response_wire_bytes_total', f'{prefix}_response_wire_bytes_total{labels(key)} {stats["wire_bytes"]}'
+        for name, field in (('request_duration_seconds', 'latency'), ('response_size_bytes', 'response_size')):
+            for key, stats in snapshot.items():
+                for bound, count in stats[f'{field}_buckets']:
+                    le = '+Inf' if bound == float('inf') else f'{bound:g}'
+                    yield name, f'{prefix}_{name}_bucket{labels(key, le=le)} {count}'
+                total = stats['latency_sum'] if field == 'latency' else stats['response_bytes']
+                yield name, f'{prefix}_{name}_sum{labels(key)} {total}'
+                yield name, f'{prefix}_{name}_count{labels(key)} {stats["requests"]}'
+
+
+# Metric families of the exposition: (name, type, help text)
+FAMILIES = (
+    ('requests_total', 'counter', 'ZVM API calls by final status code.'),
+    ('request_retries_total', 'counter', 'Retried attempts of ZVM API calls.'),
+    ('response_wire_bytes_total', 'counter', 'Response body bytes received before content decoding.'),
+    ('request_duration_seconds', 'histogram', 'Latency of ZVM API calls including retries.'),
+    ('response_size_bytes', 'histogram', 'Size of ZVM API response bodies.'),
+)
+
+
+def render_prometheus(sources, prefix='zvma'):
+    """
+    Render several ClientMetrics as one Prometheus exposition, grouping the samples of all sources
+    by metric family so each family's HELP and TYPE lines appear once.
+    """
+    samples = {name: [] for name, _, _ in FAMILIES}
+    for source in sources:
+        for name, line in source._prometheus_samples(prefix):
+            samples[name].append(line)
+    lines = []
+    for name, kind, help_text in FAMILIES:
+        lines.append(f'# HELP {prefix}_{name} {help_text}')
+        lines.append(f'# TYPE {prefix}_{name} {kind}')
+        lines.extend(samples[name])
+    return '\n'.join(lines) + '\n'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def start_prometheus_exporter(metrics, port=9464, address='127.0.0.1'):
+    """
+    Serve `metrics` (a ClientMetrics, or a list of them) in the Prometheus text format on
+    http://address:port/metrics from a daemon thread. Listens on the loopback interface unless
+    `address` says otherwise, e.g. '0.0.0.0' for a scraper on another host.
+
+    :return: The running http.server instance; call shutdown() to stop it.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    sources = metrics if isinstance(metrics, (list, tuple)) else [metrics]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?', 1)[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = render_prometheus(sources).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((address, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,293 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+# Generated from 10.0_U6_Swagger.json by tools/generate_models.py; do not edit by hand.
+
+"""
+Slotted response models of the core ZVM entities.
+
+Resource methods return them instead of dicts when called with `as_models=True`. Fields use
+snake_case names of the swagger properties, status-like fields are parsed into the enums of
+zvma.common (values the enum does not know are kept as-is), and other nested objects stay dicts.
+Only the fields of the swagger schema are kept; `to_dict()` rebuilds the API representation.
+"""
+
+from enum import Enum
+from .common import ZertoAlertEntity, ZertoAlertHelpIdentifier, ZertoAlertLevel, ZertoEventCategory, ZertoEventType, ZertoTaskStates, ZertoTaskTypes, ZertoVPGPriority, ZertoVPGStatus, ZertoVPGSubstatus
+
+
+def _by_value(enum):
+    members = {member.value: member for member in enum}
+    return lambda value: members.get(value, value)
+
+
+def _by_name(enum):
+    members = dict(enum.__members__)
+    return lambda value: members.get(value, value) if isinstance(value, str) else value
+
+
+_value_ZertoTaskStates = _by_value(ZertoTaskStates)
+_name_ZertoTaskTypes = _by_name(ZertoTaskTypes)
+_value_ZertoVPGStatus = _by_value(ZertoVPGStatus)
+_value_ZertoVPGSubstatus = _by_value(ZertoVPGSubstatus)
+_value_ZertoVPGPriority = _by_value(ZertoVPGPriority)
+_name_ZertoAlertLevel = _by_name(ZertoAlertLevel)
+_name_ZertoAlertEntity = _by_name(ZertoAlertEntity)
+_name_ZertoAlertHelpIdentifier = _by_name(ZertoAlertHelpIdentifier)
+_value_ZertoEventType = _by_value(ZertoEventType)
+_name_ZertoEventCategory = _by_name(ZertoEventCategory)
+
+
+class Model:
+    """Base class of the generated models."""
+    __slots__ = ()
+    _keys = ()
+    _named_enums = frozenset()
+
+    @classmethod
+    def from_dict(cls, data):
+        raise NotImplementedError
+
+    @classmethod
+    def from_list(cls, items):
+        """Convert a list response; None (e.g. a failed lookup) becomes an empty list."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items or ()]
+
+    def to_dict(self):
+        """The entity as the API represents it, with PascalCase keys."""
+        data = {}
+        for slot, key in zip(self.__slots__, self._keys):
+            value = getattr(self, slot)
+            if isinstance(value, Enum):
+                value = value.name if slot in self._named_enums else value.value
+            elif isinstance(value, Model):
+                value = value.to_dict()
+            data[key] = value
+        return data
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    def __repr__(self):
+        fields = ', '.join(f'{slot}={getattr(self, slot)!r}' for slot in self.__slots__)
+        return f'{self.__class__.__name__}({fields})'
+
+
+def convert(model, result):
+    """Convert a response (a list of entities or a single one) into `model` instances."""
+    if isinstance(result, list):
+        return model.from_list(result)
+    if isinstance(result, dict) and result:
+        return model.from_dict(result)
+    return result
+
+
+class TaskStatus(Model):
+    """State and progress of a task. (Zerto.Zvm.Api.Interfaces.Tasks.TaskStatusApi)"""
+    __slots__ = ('state', 'progress',)
+    _keys = ('State', 'Progress',)
+
+    @classmethod
+    def from_dict(cls, data):
+        self = cls.__new__(cls)
+        get = data.get
+        self.state = _value_ZertoTaskStates(get('State'))
+        self.progress = get('Progress')
+        return self
+
+
+class Task(Model):
+    """Task as returned by GET /v1/tasks. (Zerto.Zvm.Api.Interfaces.Tasks.TaskApi)"""
+    __slots__ = ('task_identifier', 'link', 'type', 'status', 'initiated_by', 'started', 'completed', 'complete_reason', 'is_cancellable', 'related_entities', 'generation',)
+    _keys = ('TaskIdentifier', 'Link', 'Type', 'Status', 'InitiatedBy', 'Started', 'Completed', 'CompleteReason', 'IsCancellable', 'RelatedEntities', 'Generation',)
+    _named_enums = frozenset(('type',))
+
+    @classmethod
+    def from_dict(cls, data):
+        self = cls.__new__(cls)
+        get = data.get
+        self.task_identifier = get('TaskIdentifier')
+        self.link = get('Link')
+        self.type = _name_ZertoTaskTypes(get('Type'))
+        status = get('Status')
+        self.status = TaskStatus.from_dict(status) if isinstance(status, dict) else status
+        self.initiated_by = get('InitiatedBy')
+        self.started = get('Started')
+        self.completed = get('Completed')
+        self.complete_reason = get('CompleteReason')
+        self.is_cancellable = get('IsCancellable')
+        self.related_entities = get('RelatedEntities')
+        self.generation = get('Generation')
+        return self
+
+
+class VPG(Model):
+    """VPG as returned by VPGs.list_vpgs. (Zerto.Zvm.Api.Interfaces.Vpgs.VpgApi)"""
+    __slots__ = ('vpg_identifier', 'progress_percentage', 'zorg', 'priority', 'vms_count', 'provisioned_storage_in_mb', 'used_storage_in_mb', 'iops', 'throughput_in_mb', 'actual_rpo', 'configured_rpo_seconds', 'last_test', 'vpg_name', 'vpg_description', 'vpg_type', 'link', 'protected_site_name', 'protected_site', 'recovery_site_name', 'recovery_site', 'entities', 'status', 'status_description', 'sub_status', 'sub_status_description', 'active_processes_api', 'service_profile', 'backup_enabled', 'fail_safe_history', 'history_status_api', 'alert_status',)
+    _keys = ('VpgIdentifier', 'ProgressPercentage', 'Zorg', 'Priority', 'VmsCount', 'ProvisionedStorageInMB', 'UsedStorageInMB', 'IOPs', 'ThroughputInMB', 'ActualRPO', 'ConfiguredRpoSeconds', 'LastTest', 'VpgName', 'VpgDescription', 'VpgType', 'Link', 'ProtectedSiteName', 'ProtectedSite', 'RecoverySiteName', 'RecoverySite', 'Entities', 'Status', 'StatusDescription', 'SubStatus', 'SubStatusDescription', 'ActiveProcessesApi', 'ServiceProfile', 'BackupEnabled', 'FailSafeHistory', 'HistoryStatusApi', 'AlertStatus',)
+
+    @classmethod
+    def from_dict(cls, data):
+        self = cls.__new__(cls)
+        get = data.get
+        self.vpg_identifier = get('VpgIdentifier')
+        self.progress_percentage = get('ProgressPercentage')
+        self.zorg = get('Zorg')
+        self.priority = _value_ZertoVPGPriority(get('Priority'))
+        self.vms_count = get('VmsCount')
+        self.provisioned_storage_in_mb = get('ProvisionedStorageInMB')
+        self.used_storage_in_mb = get('UsedStorageInMB')
+        self.iops = get('IOPs')
+        self.throughput_in_mb = get('ThroughputInMB')
+        self.actual_rpo = get('ActualRPO')
+        self.configured_rpo_seconds = get('ConfiguredRpoSeconds')
+        self.last_test = get('LastTest')
+        self.vpg_name = get('VpgName')
+        self.vpg_description = get('VpgDescription')
+        self.vpg_type = get('VpgType')
+        self.link = get('Link')
+        self.protected_site_name = get('ProtectedSiteName')
+        self.protected_site = get('ProtectedSite')
+        self.recovery_site_name = get('RecoverySiteName')
+        self.recovery_site = get('RecoverySite')
+        self.entities = get('Entities')
+        self.status = _value_ZertoVPGStatus(get('Status'))
+        self.status_description = get('StatusDescription')
+        self.sub_status = _value_ZertoVPGSubstatus(get('SubStatus'))
+        self.sub_status_description = get('SubStatusDescription')
+        self.active_processes_api = get('ActiveProcessesApi')
+        self.service_profile = get('ServiceProfile')
+        self.backup_enabled = get('BackupEnabled')
+        self.fail_safe_history = get('FailSafeHistory')
+        self.history_status_api = get('HistoryStatusApi')
+        self.alert_status = get('AlertStatus')
+        return self
+
+
+class VM(Model):
+    """Protected VM as returned by VMs.list_vms. (Zerto.Zvm.Api.Interfaces.Vms.VmApi)"""
+    __slots__ = ('vm_identifier', 'vpg_identifier', 'link', 'organization_name', 'priority', 'provisioned_storage_in_mb', 'used_storage_in_mb', 'cpu_cores_num', 'memory_size_in_mb', 'journal_used_storage_mb', 'journal_warning_threshold', 'journal_hard_limit', 'iops', 'throughput_in_mb', 'outgoing_band_width_in_mbps', 'actual_rpo', 'last_test', 'vpg_name', 'vm_name', 'volumes', 'nics', 'protected_site_name', 'recovery_site_name', 'entities', 'status', 'sub_status', 'protected_site', 'recovery_site', 'enabled_actions', 'is_vm_exists', 'recovery_host_identifier', 'recovery_host_name', 'owning_host_identifier', 'owning_host_name', 'owning_datastore_identifier', 'owning_datastore_name', 'guest_os', 'vm_network_information', 'hardware_version', 'is_agent_installed', 'platform_information',)
+    _keys = ('VmIdentifier', 'VpgIdentifier', 'Link', 'OrganizationName', 'Priority', 'ProvisionedStorageInMB', 'UsedStorageInMB', 'CpuCoresNum', 'MemorySizeInMB', 'JournalUsedStorageMb', 'JournalWarningThreshold', 'JournalHardLimit', 'IOPs', 'ThroughputInMB', 'OutgoingBandWidthInMbps', 'ActualRPO', 'LastTest', 'VpgName', 'VmName', 'Volumes', 'Nics', 'ProtectedSiteName', 'RecoverySiteName', 'Entities', 'Status', 'SubStatus', 'ProtectedSite', 'RecoverySite', 'EnabledActions', 'IsVmExists', 'RecoveryHostIdentifier', 'RecoveryHostName', 'OwningHostIdentifier', 'OwningHostName', 'OwningDatastoreIdentifier', 'OwningDatastoreName', 'GuestOs', 'VmNetworkInformation', 'HardwareVersion', 'IsAgentInstalled', 'PlatformInformation',)
+
+    @classmethod
+    def from_dict(cls, data):
+        self = cls.__new__(cls)
+        get = data.get
+        self.vm_identifier = get('VmIdentifier')
+        self.vpg_identifier = get('VpgIdentifier')
+        self.link = get('Link')
+        self.organization_name = get('OrganizationName')
+        self.priority = _value_ZertoVPGPriority(get('Priority'))
+        self.provisioned_storage_in_mb = get('ProvisionedStorageInMB')
+        self.used_storage_in_mb = get('UsedStorageInMB')
+        self.cpu_cores_num = get('CpuCoresNum')
+        self.memory_size_in_mb = get('MemorySizeInMB')
+        self.journal_used_storage_mb = get('JournalUsedStorageMb')
+        self.journal_warning_threshold = get('JournalWarningThreshold')
+        self.journal_hard_limit = get('JournalHardLimit')
+        self.iops = get('IOPs')
+        self.throughput_in_mb = get('ThroughputInMB')
+        self.outgoing_band_width_in_mbps = get('OutgoingBandWidthInMbps')
+        self.actual_rpo = get('ActualRPO')
+        self.last_test = get('LastTest')
+        self.vpg_name = get('VpgName')
+        self.vm_name = get('VmName')
+        self.volumes = get('Volumes')
+        self.nics = get('Nics')
+        self.protected_site_name = get('ProtectedSiteName')
+        self.recovery_site_name = get('RecoverySiteName')
+        self.entities = get('Entities')
+        self.status = _value_ZertoVPGStatus(get('Status'))
+        self.sub_status = _value_ZertoVPGSubstatus(get('SubStatus'))
+        self.protected_site = get('ProtectedSite')
+        self.recovery_site = get('RecoverySite')
+        self.enabled_actions = get('EnabledActions')
+        self.is_vm_exists = get('IsVmExists')
+        self.recovery_host_identifier = get('RecoveryHostIdentifier')
+        self.recovery_host_name = get('RecoveryHostName')
+        self.owning_host_identifier = get('OwningHostIdentifier')
+        self.owning_host_name = get('OwningHostName')
+        self.owning_datastore_identifier = get('OwningDatastoreIdentifier')
+        self.owning_datastore_name = get('OwningDatastoreName')
+        self.guest_os = get('GuestOs')
+        self.vm_network_information = get('VmNetworkInformation')
+        self.hardware_version = get('HardwareVersion')
+        self.is_agent_installed = get('IsAgentInstalled')
+        self.platform_information = get('PlatformInformation')
+        return self
+
+
+class Alert(Model):
+    """Alert as returned by Alerts.get_alerts. (Zerto.Zvm.Api.Interfaces.Alerts.AlertApi)"""
+    __slots__ = ('alert_identifier', 'link', 'level', 'entity', 'is_dismissed', 'help_identifier', 'site', 'description', 'turned_on', 'affected_vpgs', 'affected_zorgs', 'generation',)
+    _keys = ('AlertIdentifier', 'Link', 'Level', 'Entity', 'IsDismissed', 'HelpIdentifier', 'Site', 'Description', 'TurnedOn', 'AffectedVpgs', 'AffectedZorgs', 'Generation',)
+    _named_enums = frozenset(('entity', 'help_identifier', 'level',))
+
+    @classmethod
+    def from_dict(cls, data):
+        self = cls.__new__(cls)
+        get = data.get
+        self.alert_identifier = get('AlertIdentifier')
+        self.link = get('Link')
+        self.level = _name_ZertoAlertLevel(get('Level'))
+        self.entity = _name_ZertoAlertEntity(get('Entity'))
+        self.is_dismissed = get('IsDismissed')
+        self.help_identifier = _name_ZertoAlertHelpIdentifier(get('HelpIdentifier'))
+        self.site = get('Site')
+        self.description = get('Description')
+        self.turned_on = get('TurnedOn')
+        self.affected_vpgs = get('AffectedVpgs')
+        self.affected_zorgs = get('AffectedZorgs')
+        self.generation = get('Generation')
+        return self
+
+
+class Event(Model):
+    """Event as returned by Events.list_events. (Zerto.Zvm.Api.Interfaces.Events.EventApi)"""
+    __slots__ = ('event_identifier', 'link', 'description', 'occurred_on', 'event_type', 'help_link', 'event_completed_successfully', 'entity_type', 'event_category', 'user_name', 'related_entities',)
+    _keys = ('EventIdentifier', 'Link', 'Description', 'OccurredOn', 'EventType', 'HelpLink', 'EventCompletedSuccessfully', 'EntityType', 'EventCategory', 'UserName', 'RelatedEntities',)
+    _named_enums = frozenset(('event_category',))
+
+    @classmethod
+    def from_dict(cls, data):
+        self = cls.__new__(cls)
+        get = data.get
+        self.event_identifier = get('EventIdentifier')
+        self.link = get('Link')
+        self.description = get('Description')
+        self.occurred_on = get('OccurredOn')
+        self.event_type = _value_ZertoEventType(get('EventType'))
+        self.help_link = get('HelpLink')
+        self.event_completed_successfully = get('EventCompletedSuccessfully')
+        self.entity_type = get('EntityType')
+        self.event_category = _name_ZertoEventCategory(get('EventCategory'))
+        self.user_name = get('UserName')
+        self.related_entities = get('RelatedEntities')
+        return self
+
+
+class Checkpoint(Model):
+    """Checkpoint as returned by VPGs.list_checkpoints. (Zerto.Zvm.Api.Interfaces.Vpgs.CheckpointApi)"""
+    __slots__ = ('checkpoint_identifier', 'time_stamp', 'tag', 'type',)
+    _keys = ('CheckpointIdentifier', 'TimeStamp', 'Tag', 'Type',)
+
+    @classmethod
+    def from_dict(cls, data):
+        self = cls.__new__(cls)
+        get = data.get
+        self.checkpoint_identifier = get('CheckpointIdentifier')
+        self.time_stamp = get('TimeStamp')
+        self.tag = get('Tag')
+        self.type = get('Type')
+        return self
@@ -9,11 +9,11 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
-import time
 from .tasks import Tasks
 
+logger = logging.getLogger(__name__)
+
 class PeerSites:
     def __init__(self, client):
         self.client = client
@@ -26,32 +26,9 @@ class PeerSites:
         Returns:
             list: List of peer sites
         """
-        url = f"https://{self.client.zvm_address}/v1/peersites"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info("PeerSites.get_peer_sites: Fetching all peer sites...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        logger.info("PeerSites.get_peer_sites: Fetching all peer sites...")
+        response = self.client.api.get_peer_all()
+        return response.json()
 
     def pair_site(self, hostname, token, port=9071, sync=True):
         """
@@ -66,41 +43,27 @@ class PeerSites:
         Returns:
             dict: Pairing result if sync=False, or final task status if sync=True
         """
-        url = f"https://{self.client.zvm_address}/v1/peersites"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
         pairing_data = {
             "hostName": hostname,
             "port": port,
             "token": token
         }
+
+        logger.info("PeerSites.pair_site: Pairing with site %s at port %s...", hostname, port)
+        response = self.client.api.start_pair(body=pairing_data)
         
-        logging.info(f"PeerSites.pair_site: Pairing with site {hostname} at port {port}...")
-        try:
-            response = requests.post(url, headers=headers, json=pairing_data, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            
-            if not sync:
-                return response.json() if response.content else None
+        if not sync:
+            return response.json() if response.content else None
 
-            # Get the task identifier from the response
-            task_id = response.json()
-            logging.info(f"PeerSites.pair_site pairing submitted, task_id={task_id}")
+        # Get the task identifier from the response
+        task_id = response.json()
+        logger.info("PeerSites.pair_site pairing submitted, task_id=%s", task_id)
 
-            if sync:
-                # Wait for task completion
-                self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
-                return task_id
+        if sync:
+            # Wait for task completion
+            self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
             return task_id
-                
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error pairing site: {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                logging.error(f"Response content: {e.response.text}")
-            raise
+        return task_id
 
     def delete_peer_site(self, site_identifier, sync=True):
         """
@@ -110,45 +73,21 @@ class PeerSites:
             site_identifier (str): The identifier of the peer site to delete
             sync (bool, optional): Wait for the pairing task to complete. Defaults to True.
         """
-        url = f"https://{self.client.zvm_address}/v1/peersites/{site_identifier}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"PeerSites.delete_peer_site: Deleting peer site {site_identifier}...")
-        try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
+        logger.info("PeerSites.delete_peer_site: Deleting peer site %s...", site_identifier)
+        response = self.client.api.start_unpair(site_identifier)
 
-            if not sync:
-                return response.json() if response.content else None
+        if not sync:
+            return response.json() if response.content else None
 
-            # Get the task identifier from the response
-            task_id = response.json()
-            logging.info(f"PeerSites.delete_peer_site unpairing submitted, task_id={task_id}")
+        # Get the task identifier from the response
+        task_id = response.json()
+        logger.info("PeerSites.delete_peer_site unpairing submitted, task_id=%s", task_id)
 
-            if sync:
-                # Wait for task completion
-                self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
-                return task_id
+        if sync:
+            # Wait for task completion
+            self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
             return task_id
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        return task_id
 
     def get_pairing_statuses(self):
         """
@@ -157,32 +96,9 @@ class PeerSites:
         Returns:
             list: List of possible pairing statuses
         """
-        url = f"https://{self.client.zvm_address}/v1/peersites/pairingstatuses"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info("PeerSites.get_pairing_statuses: Fetching pairing statuses...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        logger.info("PeerSites.get_pairing_statuses: Fetching pairing statuses...")
+        response = self.client.api.get_peer_status_all()
+        return response.json()
 
     def generate_token(self):
         """
@@ -191,85 +107,25 @@ class PeerSites:
         Returns:
             str: Generated pairing token
         """
-        url = f"https://{self.client.zvm_address}/v1/peersites/generatetoken"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info("PeerSites.generate_token: Generating pairing token...")
-        try:
-            response = requests.post(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json() if response.content else None
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        logger.info("PeerSites.generate_token: Generating pairing token...")
+        response = self.client.api.get_pairing_token()
+        return response.json() if response.content else None
 
     def get_peer_site(self, site_identifier):
-        logging.info(f"PeerSites.get_peer_site: Fetching peer site information for site identifier: {site_identifier}...")
-        url = f"https://{self.client.zvm_address}/v1/peersites/{site_identifier}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            logging.info(f"PeerSites.get_peer_site: Successfully retrieved peer site information for site identifier: {site_identifier}.")
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        logger.info("PeerSites.get_peer_site: Fetching peer site information for site identifier: %s...",
+                    site_identifier)
+        response = self.client.api.get_peer(site_identifier)
+        logger.info("PeerSites.get_peer_site: Successfully retrieved peer site information for site identifier: %s.",
+                    site_identifier)
+        return response.json()
 
     def get_peer_site_types(self):
-        logging.info("PeerSites.get_peer_site_types: Fetching peer site information for site types...")
+        logger.info("PeerSites.get_peer_site_types: Fetching peer site information for site types...")
         url = f"https://{self.client.zvm_address}/v1/peersites/types"
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            logging.info("PeerSites.get_peer_site_types: Successfully retrieved peer site types information.")
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        logger.info("PeerSites.get_peer_site_types: Successfully retrieved peer site types information.")
+        return response.json()
@@ -0,0 +1,72 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import contextlib
+import contextvars
+import functools
+from enum import IntEnum
+
+
+class RequestPriority(IntEnum):
+    """Priority class of an API request; lower values are served first when the ZVM is busy."""
+    CRITICAL = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_current = contextvars.ContextVar('zvma_request_priority', default=RequestPriority.NORMAL)
+
+
+def get_priority(value):
+    """Resolve a RequestPriority, its name ('critical', 'normal', 'background') or its value."""
+    if isinstance(value, str):
+        try:
+            return RequestPriority[value.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown request priority {value!r}, expected one of "
+                             f"{[priority.name.lower() for priority in RequestPriority]}") from None
+    return RequestPriority(value)
+
+
+def current_priority():
+    """Priority of requests made by the current thread or task."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def request_priority(value):
+    """
+    Send every API request made inside the block with priority `value`.
+
+    The setting follows contextvars, so it applies to the current thread or asyncio task and to
+    calls submitted to a client batch from inside the block.
+    """
+    token = _current.set(get_priority(value))
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def with_priority(value):
+    """Decorator running a resource method, and every request it makes, with priority `value`."""
+    value = get_priority(value)
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            token = _current.set(value)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                _current.reset(token)
+        return wrapper
+    return decorator
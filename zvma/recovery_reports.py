@@ -9,9 +9,9 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
-import json
+
+logger = logging.getLogger(__name__)
 
 class RecoveryReports:
     def __init__(self, client):
@@ -36,63 +36,17 @@ class RecoveryReports:
             dict: The response from the ZVM API containing recovery report details.
         """
 
-        logging.info(f'RecoveryReports.get_recovery_reports recovery_operation_identifier: {recovery_operation_identifier}, \
-                     start_time: {start_time}, end_time: {end_time}, page_number: {page_number}, \
-                     page_size: {page_size}, vpg_name: {vpg_name}, recovery_type: {recovery_type}, state: {state}')
+        logger.info('RecoveryReports.get_recovery_reports recovery_operation_identifier: %s,                      start_time: %s, end_time: %s, page_number: %s,                      page_size: %s, vpg_name: %s, recovery_type: %s, state: %s',
+                    recovery_operation_identifier, start_time, end_time, page_number, page_size, vpg_name, recovery_type, state)
 
-        # Determine the URL based on whether recoveryOperationIdentifier is provided
+        # A specific recovery operation takes no query parameters
         if recovery_operation_identifier:
-            base_url = f"https://{self.client.zvm_address}/v1/reports/recovery/{recovery_operation_identifier}"
-            params = None  # No query parameters for this endpoint
+            response = self.client.api.get_recovery_report(recovery_operation_identifier)
         else:
-            base_url = f"https://{self.client.zvm_address}/v1/reports/recovery"
-            # Parameters for the request
-            params = {
-                "startTime": start_time,
-                "endTime": end_time,
-                "pageNumber": page_number,
-                "pageSize": page_size,
-            }
-
-            # Optional parameters
-            if vpg_name:
-                params["vpgName"] = vpg_name
-            if recovery_type:
-                params["recoveryType"] = recovery_type
-            if state:
-                params["state"] = state
-
-        # Headers for the request
-        headers = {
-            "Authorization": f"Bearer {self.client.token}",
-            "Accept": "application/json",
-        }
-
-        try:
-            response = requests.get(base_url, headers=headers, params=params, verify=self.client.verify_certificate)
-
-            if response.status_code == 200:
-                # logging.info(f"Successfully retrieved recovery reports = {json.dumps(response.json(), indent=4)}")
-                return response.json()
-            else:
-                logging.error(f"Failed to fetch recovery reports. Status Code: {response.status_code}, Response: {response.text}")
-                response.raise_for_status()
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+            response = self.client.api.get_recovery_report_all(
+                start_time=start_time, end_time=end_time, page_number=page_number, page_size=page_size,
+                vpg_name=vpg_name or None, recovery_type=recovery_type or None, state=state or None)
+        return response.json()
 
     def list_resource_reports(self, start_time=None, end_time=None, page_number=None, page_size=None, 
                             zorg_name=None, vpg_name=None, vm_name=None, protected_site_name=None, 
@@ -124,83 +78,54 @@ class RecoveryReports:
         Returns:
             list: A list of resource reports based on the provided filters.
         """
-        logging.info(f"list_resource_reports(start_time={start_time}, end_time={end_time}, page_number={page_number}, "
-                    f"page_size={page_size}, zorg_name={zorg_name}, vpg_name={vpg_name}, vm_name={vm_name}, "
-                    f"protected_site_name={protected_site_name}, protected_cluster_name={protected_cluster_name}, "
-                    f"protected_host_name={protected_host_name}, protected_org_vdc={protected_org_vdc}, "
-                    f"protected_vcd_org={protected_vcd_org}, recovery_site_name={recovery_site_name}, "
-                    f"recovery_cluster_name={recovery_cluster_name}, recovery_host_name={recovery_host_name}, "
-                    f"recovery_org_vdc={recovery_org_vdc}, recovery_vcd_org={recovery_vcd_org})")
-
-        uri = f"https://{self.client.zvm_address}/v1/reports/resources"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
+        response = self.client.api.get_resource_report_all(**self._resource_report_filters(
+            start_time=start_time, end_time=end_time, page_number=page_number, page_size=page_size,
+            zorg_name=zorg_name, vpg_name=vpg_name, vm_name=vm_name, protected_site_name=protected_site_name,
+            protected_cluster_name=protected_cluster_name, protected_host_name=protected_host_name,
+            protected_org_vdc=protected_org_vdc, protected_vcd_org=protected_vcd_org,
+            recovery_site_name=recovery_site_name, recovery_cluster_name=recovery_cluster_name,
+            recovery_host_name=recovery_host_name, recovery_org_vdc=recovery_org_vdc, recovery_vcd_org=recovery_vcd_org))
+        reports = response.json()
+
+        if not reports:
+            logger.warning("No resource reports found.")
+            return []
+
+        return reports
+
+    def iter_resource_reports(self, **filters):
+        """
+        Iterate over resource reports one at a time.
+
+        Streaming variant of list_resource_reports: the response is parsed incrementally,
+        so memory use stays flat however many reports match the filters.
 
-        # Building query parameters
-        params = {}
-        if start_time:
-            params['startTime'] = start_time
-        if end_time:
-            params['endTime'] = end_time
-        if page_number is not None:
-            params['pageNumber'] = page_number
-        if page_size is not None:
-            params['pageSize'] = page_size
-        if zorg_name:
-            params['zorgName'] = zorg_name
-        if vpg_name:
-            params['vpgName'] = vpg_name
-        if vm_name:
-            params['vmName'] = vm_name
-        if protected_site_name:
-            params['protectedSiteName'] = protected_site_name
-        if protected_cluster_name:
-            params['protectedClusterName'] = protected_cluster_name
-        if protected_host_name:
-            params['protectedHostName'] = protected_host_name
-        if protected_org_vdc:
-            params['protectedOrgVdc'] = protected_org_vdc
-        if protected_vcd_org:
-            params['protectedVcdOrg'] = protected_vcd_org
-        if recovery_site_name:
-            params['recoverySiteName'] = recovery_site_name
-        if recovery_cluster_name:
-            params['recoveryClusterName'] = recovery_cluster_name
-        if recovery_host_name:
-            params['recoveryHostName'] = recovery_host_name
-        if recovery_org_vdc:
-            params['recoveryOrgVdc'] = recovery_org_vdc
-        if recovery_vcd_org:
-            params['recoveryVcdOrg'] = recovery_vcd_org
-
-        try:
-            response = requests.get(uri, headers=headers, params=params, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            reports = response.json()
-
-            if not reports:
-                logging.warning("No resource reports found.")
-                return []
-
-            return reports
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        Args:
+            **filters: The same keyword arguments as list_resource_reports.
+
+        Yields:
+            dict: One resource report at a time.
+        """
+        return self.client.api.iter_json('get_resource_report_all', **self._resource_report_filters(**filters))
+
+    def _resource_report_filters(self, start_time=None, end_time=None, page_number=None, page_size=None,
+                                 zorg_name=None, vpg_name=None, vm_name=None, protected_site_name=None,
+                                 protected_cluster_name=None, protected_host_name=None, protected_org_vdc=None,
+                                 protected_vcd_org=None, recovery_site_name=None, recovery_cluster_name=None,
+                                 recovery_host_name=None, recovery_org_vdc=None, recovery_vcd_org=None):
+        """Keyword arguments of client.api.get_resource_report_all; empty filters are left out of the query."""
+        logger.info("list_resource_reports(start_time=%s, end_time=%s, page_number=%s, page_size=%s, zorg_name=%s, vpg_name=%s, vm_name=%s, protected_site_name=%s, protected_cluster_name=%s, protected_host_name=%s, protected_org_vdc=%s, protected_vcd_org=%s, recovery_site_name=%s, recovery_cluster_name=%s, recovery_host_name=%s, recovery_org_vdc=%s, recovery_vcd_org=%s)",
+                    start_time, end_time, page_number, page_size, zorg_name, vpg_name, vm_name, protected_site_name, protected_cluster_name, protected_host_name, protected_org_vdc, protected_vcd_org, recovery_site_name, recovery_cluster_name, recovery_host_name, recovery_org_vdc, recovery_vcd_org)
+        return {
+            'start_time': start_time or None, 'end_time': end_time or None,
+            'page_number': page_number, 'page_size': page_size,
+            'zorg_name': zorg_name or None, 'vpg_name': vpg_name or None, 'vm_name': vm_name or None,
+            'protected_site_name': protected_site_name or None, 'protected_cluster_name': protected_cluster_name or None,
+            'protected_host_name': protected_host_name or None, 'protected_org_vdc': protected_org_vdc or None,
+            'protected_vcd_org': protected_vcd_org or None, 'recovery_site_name': recovery_site_name or None,
+            'recovery_cluster_name': recovery_cluster_name or None, 'recovery_host_name': recovery_host_name or None,
+            'recovery_org_vdc': recovery_org_vdc or None, 'recovery_vcd_org': recovery_vcd_org or None,
+        }
 
     def get_latest_failover_test_report(self, vpg_name):
         """
@@ -212,44 +137,27 @@ class RecoveryReports:
         Returns:
             dict: The most recent failover test report for the VPG, or None if no reports found.
         """
-        logging.info(f"RecoveryReports.get_latest_failover_test_report VPG: {vpg_name}")
+        logger.info("RecoveryReports.get_latest_failover_test_report VPG: %s", vpg_name)
         
-        try:
-            # Get all failover test reports for this VPG
-            reports = self.get_recovery_reports(
-                vpg_name=vpg_name,
-                recovery_type="FailoverTest",
-                page_size=1000  # Adjust if you need more reports
-            )
-            
-            if not reports:
-                logging.warning(f"No failover test reports found for VPG: {vpg_name}")
-                return None
-            
-            # Sort reports by StartTime in descending order and get the first one
-            sorted_reports = sorted(
-                reports,
-                key=lambda x: x["General"].get("EndTime", ""),
-                reverse=True
-            )
-            
-            if sorted_reports:
-                return sorted_reports[0]
-            
+        # Get all failover test reports for this VPG
+        reports = self.get_recovery_reports(
+            vpg_name=vpg_name,
+            recovery_type="FailoverTest",
+            page_size=1000  # Adjust if you need more reports
+        )
+        
+        if not reports:
+            logger.warning("No failover test reports found for VPG: %s", vpg_name)
             return None
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        
+        # Sort reports by StartTime in descending order and get the first one
+        sorted_reports = sorted(
+            reports,
+            key=lambda x: x["General"].get("EndTime", ""),
+            reverse=True
+        )
+        
+        if sorted_reports:
+            return sorted_reports[0]
+        
+        return None
@@ -9,8 +9,7 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
-import logging
+from .cache import cached_response
 
 class RecoveryScripts:
     def __init__(self, client):
@@ -22,72 +21,22 @@ class RecoveryScripts:
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        return response.json()
     def get_recovery_script(self, script_identifier):
         url = f"https://{self.client.zvm_address}/v1/recoveryscripts/{script_identifier}"
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        return response.json()
+    @cached_response()
     def get_recovery_script_types(self):
         url = f"https://{self.client.zvm_address}/v1/recoveryscripts/types"
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        return response.json()
@@ -0,0 +1,81 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Retry settings for the request pipeline.
+
+    Only idempotent requests are retried: a GET/PUT/DELETE that hit a transient status
+    (429, 502, 503, 504), a connection reset or a timeout. Delays grow exponentially with
+    full jitter and a `Retry-After` header sent by the ZVM takes precedence.
+
+    :param max_retries: Maximum number of retries after the first attempt.
+    :param backoff_factor: Base delay in seconds; attempt N waits up to backoff_factor * 2**N.
+    :param max_backoff: Upper bound for a single delay in seconds.
+    :param retry_statuses: HTTP status codes that are considered transient.
+    :param retry_methods: HTTP methods that are safe to retry.
+    """
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, max_backoff=30,
+                 retry_statuses=RETRY_STATUSES, retry_methods=IDEMPOTENT_METHODS):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+
+    def is_retryable_method(self, method, idempotent=None):
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.retry_methods
+
+    def is_retryable_status(self, status_code):
+        return status_code in self.retry_statuses
+
+    def get_backoff(self, attempt, response=None):
+        """
+        Seconds to wait before retry number `attempt` (0-based).
+
+        :param response: The failed response, if any; its Retry-After header is honoured.
+        """
+        retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+
+class NoRetry(RetryPolicy):
+    """Policy that never retries."""
+
+    def __init__(self):
+        super().__init__(max_retries=0)
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,525 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+# Generated from 10.0_U6_Swagger.json by tools/generate_schemas.py; do not edit by hand.
+
+"""Request schemas of the VPG settings API, reduced to what zvma.validation checks."""
+
+ROOTS = ['Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsApi']
+
+SCHEMAS = {
+    'Zerto.Api.Interfaces.LTR.LtrDailySchedulerPolicyApi': {
+        'type': 'object',
+        'properties': {
+            'enabled': {'type': 'boolean'},
+            'retentionDuration': {'$ref': 'Zerto.Api.Interfaces.LTR.LtrDurationApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Api.Interfaces.LTR.LtrDurationApi': {
+        'type': 'object',
+        'properties': {
+            'count': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'durationType': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Api.Interfaces.LTR.LtrMonthlySchedulerPolicyApi': {
+        'type': 'object',
+        'properties': {
+            'enabled': {'type': 'boolean'},
+            'dayOfWeek': {'type': 'string', 'nullable': True},
+            'weekOfMonth': {'type': 'string', 'nullable': True},
+            'dayOfMonth': {'type': 'string', 'nullable': True},
+            'retentionType': {'type': 'string', 'nullable': True},
+            'retentionDuration': {'$ref': 'Zerto.Api.Interfaces.LTR.LtrDurationApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Api.Interfaces.LTR.LtrRetryApi': {
+        'type': 'object',
+        'properties': {
+            'enabled': {'type': 'boolean', 'nullable': True},
+            'number': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'intervalInMinutes': {'type': 'integer', 'format': 'int32', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Api.Interfaces.LTR.LtrSchedulerPolicyApi': {
+        'type': 'object',
+        'properties': {
+            'daily': {'$ref': 'Zerto.Api.Interfaces.LTR.LtrDailySchedulerPolicyApi'},
+            'weekly': {'$ref': 'Zerto.Api.Interfaces.LTR.LtrWeeklySchedulerPolicyApi'},
+            'monthly': {'$ref': 'Zerto.Api.Interfaces.LTR.LtrMonthlySchedulerPolicyApi'},
+            'yearly': {'$ref': 'Zerto.Api.Interfaces.LTR.LtrYearlySchedulerPolicyApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Api.Interfaces.LTR.LtrWeeklySchedulerPolicyApi': {
+        'type': 'object',
+        'properties': {
+            'enabled': {'type': 'boolean'},
+            'dayOfWeek': {'type': 'string', 'nullable': True},
+            'retentionType': {'type': 'string', 'nullable': True},
+            'retentionDuration': {'$ref': 'Zerto.Api.Interfaces.LTR.LtrDurationApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Api.Interfaces.LTR.LtrYearlySchedulerPolicyApi': {
+        'type': 'object',
+        'properties': {
+            'enabled': {'type': 'boolean'},
+            'dayOfWeek': {'type': 'string', 'nullable': True},
+            'dayOfYear': {'type': 'string', 'nullable': True},
+            'monthOfYear': {'type': 'string', 'nullable': True},
+            'dayOfMonth': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'retentionDuration': {'$ref': 'Zerto.Api.Interfaces.LTR.LtrDurationApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.PublicCloudEncryptionSettingsRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'encryptionType': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.PublicCloudEncryptionTypeApi'},
+            'diskEncryptionKey': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.PublicCloudEncryptionTypeApi': {
+        'type': 'integer',
+        'format': 'int32',
+        'enum': [0, 1, -1],
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsApi': {
+        'type': 'object',
+        'properties': {
+            'vpgIdentifier': {'type': 'string', 'nullable': True},
+            'vpgSettingsIdentifier': {'type': 'string', 'nullable': True},
+            'basic': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsBasicApi'},
+            'scripting': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScriptsApi'},
+            'bootGroups': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsBootGroupsApi'},
+            'journal': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsJournalApi'},
+            'scratch': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScratchApi'},
+            'longTermRetention': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsLtrApi'},
+            'recovery': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsRecoveryApi'},
+            'networks': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsNetworksApi'},
+            'vms': {'type': 'array', 'nullable': True, 'items': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmApi'}},
+            'protected': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsProtectedApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsBasicApi': {
+        'type': 'object',
+        'properties': {
+            'name': {'type': 'string', 'nullable': True},
+            'vpgType': {'type': 'string', 'nullable': True},
+            'rpoInSeconds': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'testIntervalInMinutes': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'journalHistoryInHours': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'priority': {'type': 'string', 'nullable': True},
+            'useWanCompression': {'type': 'boolean', 'nullable': True},
+            'serviceProfileIdentifier': {'type': 'string', 'nullable': True},
+            'zorgIdentifier': {'type': 'string', 'nullable': True},
+            'protectedSiteIdentifier': {'type': 'string', 'nullable': True},
+            'recoverySiteIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsBootGroupApi': {
+        'type': 'object',
+        'properties': {
+            'bootGroupIdentifier': {'type': 'string', 'nullable': True},
+            'name': {'type': 'string', 'nullable': True},
+            'bootDelayInSeconds': {'type': 'integer', 'format': 'int32', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsBootGroupsApi': {
+        'type': 'object',
+        'properties': {
+            'bootGroups': {'type': 'array', 'nullable': True, 'items': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsBootGroupApi'}},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsHypervisorNetworkApi': {
+        'type': 'object',
+        'properties': {
+            'defaultNetworkIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsJournalApi': {
+        'type': 'object',
+        'properties': {
+            'limitation': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsJournalLimitationApi'},
+            'datastoreIdentifier': {'type': 'string', 'nullable': True},
+            'datastoreClusterIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsJournalLimitationApi': {
+        'type': 'object',
+        'properties': {
+            'hardLimitInMB': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'hardLimitInPercent': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'warningThresholdInMB': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'warningThresholdInPercent': {'type': 'integer', 'format': 'int32', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsLtrApi': {
+        'type': 'object',
+        'properties': {
+            'enabled': {'type': 'boolean'},
+            'repositoryIdentifier': {'type': 'string', 'nullable': True},
+            'retentionRunTime': {'type': 'string', 'nullable': True},
+            'schedulerPolicy': {'$ref': 'Zerto.Api.Interfaces.LTR.LtrSchedulerPolicyApi'},
+            'retry': {'$ref': 'Zerto.Api.Interfaces.LTR.LtrRetryApi'},
+            'indexing': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsLtrVmIndexingApi'},
+            'compression': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsLtrVmIndexingApi': {
+        'type': 'object',
+        'properties': {
+            'vms': {'type': 'array', 'nullable': True, 'items': {'type': 'string'}},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsNetworkApi': {
+        'type': 'object',
+        'properties': {
+            'vcd': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVcdNetworkApi'},
+            'hypervisor': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsHypervisorNetworkApi'},
+            'publicCloud': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsPublicCloudNetworkApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsNetworksApi': {
+        'type': 'object',
+        'properties': {
+            'failover': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsNetworkApi'},
+            'failoverTest': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsNetworkApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsProtectedApi': {
+        'type': 'object',
+        'properties': {
+            'vcd': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVcdProtectedApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsPublicCloudInfoRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'vmInstanceType': {'type': 'string', 'nullable': True},
+            'azure': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsPublicCloudProviderInfoRecoveryApi'},
+            'encryption': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.PublicCloudEncryptionSettingsRecoveryApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsPublicCloudNetworkApi': {
+        'type': 'object',
+        'properties': {
+            'virtualNetworkIdentifier': {'type': 'string', 'nullable': True},
+            'subnetIdentifier': {'type': 'string', 'nullable': True},
+            'securityGroupIdentifiers': {'type': 'array', 'nullable': True, 'items': {'type': 'string'}},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsPublicCloudProviderInfoRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'recoveryDiskType': {'type': 'string', 'nullable': True},
+            'recoveryResourceGroup': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsPublicCloudRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'failover': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsPublicCloudInfoRecoveryApi'},
+            'failoverTest': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsPublicCloudInfoRecoveryApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'defaultHostIdentifier': {'type': 'string', 'nullable': True},
+            'defaultHostClusterIdentifier': {'type': 'string', 'nullable': True},
+            'defaultDatastoreIdentifier': {'type': 'string', 'nullable': True},
+            'defaultDatastoreClusterIdentifier': {'type': 'string', 'nullable': True},
+            'defaultFolderIdentifier': {'type': 'string', 'nullable': True},
+            'resourcePoolIdentifier': {'type': 'string', 'nullable': True},
+            'vcd': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVcdRecoveryApi'},
+            'publicCloud': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsPublicCloudRecoveryApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScratchApi': {
+        'type': 'object',
+        'properties': {
+            'limitation': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScratchLimitationApi'},
+            'datastoreIdentifier': {'type': 'string', 'nullable': True},
+            'datastoreClusterIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScratchLimitationApi': {
+        'type': 'object',
+        'properties': {
+            'hardLimitInMB': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'hardLimitInPercent': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'warningThresholdInMB': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'warningThresholdInPercent': {'type': 'integer', 'format': 'int32', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScriptApi': {
+        'type': 'object',
+        'properties': {
+            'command': {'type': 'string', 'nullable': True},
+            'parameters': {'type': 'string', 'nullable': True},
+            'timeoutInSeconds': {'type': 'integer', 'format': 'int32', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScriptsApi': {
+        'type': 'object',
+        'properties': {
+            'preRecovery': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScriptApi'},
+            'postRecovery': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScriptApi'},
+            'postBackup': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScriptApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVcdNetworkApi': {
+        'type': 'object',
+        'properties': {
+            'copyNATRules': {'type': 'string', 'nullable': True},
+            'isEnableGuestCustomization': {'type': 'boolean', 'nullable': True},
+            'mapping': {'type': 'array', 'nullable': True, 'items': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVcdNetworksMappingApi'}},
+            'defaultRecoveryOrgVdcNetworkIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVcdNetworksMappingApi': {
+        'type': 'object',
+        'properties': {
+            'protectedOrgVdcNetworkIdentifier': {'type': 'string', 'nullable': True},
+            'recoveryOrgVdcNetworkIdentifier': {'type': 'string', 'nullable': True},
+            'reverseTestOrgVdcNetworkIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVcdProtectedApi': {
+        'type': 'object',
+        'properties': {
+            'vcdVappIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVcdRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'orgVdcIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmApi': {
+        'type': 'object',
+        'properties': {
+            'vmIdentifier': {'type': 'string', 'nullable': True},
+            'recovery': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmRecoveryApi'},
+            'bootGroupIdentifier': {'type': 'string', 'nullable': True},
+            'journal': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmJournalApi'},
+            'scratch': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsScratchApi'},
+            'volumes': {'type': 'array', 'nullable': True, 'items': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVolumeApi'}},
+            'nics': {'type': 'array', 'nullable': True, 'items': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicApi'}},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmJournalApi': {
+        'type': 'object',
+        'properties': {
+            'limitation': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmJournalLimitationApi'},
+            'datastoreIdentifier': {'type': 'string', 'nullable': True},
+            'datastoreClusterIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmJournalLimitationApi': {
+        'type': 'object',
+        'properties': {
+            'hardLimitInMB': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'hardLimitInPercent': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'warningThresholdInMB': {'type': 'integer', 'format': 'int32', 'nullable': True},
+            'warningThresholdInPercent': {'type': 'integer', 'format': 'int32', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicApi': {
+        'type': 'object',
+        'properties': {
+            'nicIdentifier': {'type': 'string', 'nullable': True},
+            'failoverTest': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicNetworkApi'},
+            'failover': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicNetworkApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicHypervisorIpConfig': {
+        'type': 'object',
+        'properties': {
+            'staticIp': {'type': 'string', 'nullable': True},
+            'subnetMask': {'type': 'string', 'nullable': True},
+            'gateway': {'type': 'string', 'nullable': True},
+            'primaryDns': {'type': 'string', 'nullable': True},
+            'secondaryDns': {'type': 'string', 'nullable': True},
+            'isDhcp': {'type': 'boolean', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicHypervisorNetworkApi': {
+        'type': 'object',
+        'properties': {
+            'networkIdentifier': {'type': 'string', 'nullable': True},
+            'shouldReplaceMacAddress': {'type': 'boolean', 'nullable': True},
+            'dnsSuffix': {'type': 'string', 'nullable': True},
+            'ipConfig': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicHypervisorIpConfig'},
+            'shouldReplaceIpConfiguration': {'type': 'boolean', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicNetworkApi': {
+        'type': 'object',
+        'properties': {
+            'hypervisor': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicHypervisorNetworkApi'},
+            'vcd': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicVcdNetworkApi'},
+            'publicCloud': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicPublicCloudNetworkApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicPublicCloudNetworkApi': {
+        'type': 'object',
+        'properties': {
+            'subnetIdentifier': {'type': 'string', 'nullable': True},
+            'securityGroupIdentifiers': {'type': 'array', 'nullable': True, 'items': {'type': 'string'}},
+            'privateIP': {'type': 'string', 'nullable': True},
+            'isPrimary': {'type': 'boolean'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmNicVcdNetworkApi': {
+        'type': 'object',
+        'properties': {
+            'isResetMacAddress': {'type': 'boolean', 'nullable': True},
+            'isPrimary': {'type': 'boolean', 'nullable': True},
+            'isConnected': {'type': 'boolean', 'nullable': True},
+            'ipMode': {'type': 'string', 'nullable': True},
+            'ipAddress': {'type': 'string', 'nullable': True},
+            'recoveryOrgVdcNetworkIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmPublicCloudInfoRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'vmInstanceType': {'type': 'string', 'nullable': True},
+            'azure': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmPublicCloudProviderInfoRecoveryApi'},
+            'virtualNetworkIdentifier': {'type': 'string', 'nullable': True},
+            'encryption': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.PublicCloudEncryptionSettingsRecoveryApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmPublicCloudProviderInfoRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'recoveryDiskType': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmPublicCloudRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'failover': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmPublicCloudInfoRecoveryApi'},
+            'failoverTest': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmPublicCloudInfoRecoveryApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'hostIdentifier': {'type': 'string', 'nullable': True},
+            'hostClusterIdentifier': {'type': 'string', 'nullable': True},
+            'datastoreIdentifier': {'type': 'string', 'nullable': True},
+            'datastoreClusterIdentifier': {'type': 'string', 'nullable': True},
+            'folderIdentifier': {'type': 'string', 'nullable': True},
+            'resourcePoolIdentifier': {'type': 'string', 'nullable': True},
+            'vcd': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVcdRecoveryApi'},
+            'publicCloud': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmPublicCloudRecoveryApi'},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVcdRecoveryApi': {
+        'type': 'object',
+        'properties': {
+            'storagePolicyIdentifier': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVolumeApi': {
+        'type': 'object',
+        'properties': {
+            'volumeIdentifier': {'type': 'string', 'nullable': True},
+            'vcd': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVolumeVcdApi'},
+            'preseed': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVolumePreseedApi'},
+            'rdm': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVolumeRdmApi'},
+            'datastore': {'$ref': 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVolumeDatastoreApi'},
+            'volumeSyncSettings': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVolumeDatastoreApi': {
+        'type': 'object',
+        'properties': {
+            'datastoreClusterIdentifier': {'type': 'string', 'nullable': True},
+            'datastoreIdentifier': {'type': 'string', 'nullable': True},
+            'isThin': {'type': 'boolean', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVolumePreseedApi': {
+        'type': 'object',
+        'properties': {
+            'datastoreIdentifier': {'type': 'string', 'nullable': True},
+            'path': {'type': 'string', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVolumeRdmApi': {
+        'type': 'object',
+        'properties': {
+            'deviceIdentifier': {'type': 'string', 'nullable': True},
+            'isPhysical': {'type': 'boolean', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+    'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsVmVolumeVcdApi': {
+        'type': 'object',
+        'properties': {
+            'isThin': {'type': 'boolean', 'nullable': True},
+        },
+        'additionalProperties': False,
+    },
+}
@@ -9,10 +9,11 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 class DateTimeFormat(Enum):
     """Enum for date time format options"""
     DEFAULT = ""  # Returns full server time info
@@ -20,6 +21,12 @@ class DateTimeFormat(Enum):
     UTC = "serverDateTimeUtc"  # Returns UTC time
     ARGUMENT = "dateTimeArgument"  # Returns date time argument format
 
+_OPERATIONS = {
+    DateTimeFormat.LOCAL: 'system_date_time_service_get_date_time_local',
+    DateTimeFormat.UTC: 'system_date_time_service_get_date_time_utc',
+    DateTimeFormat.ARGUMENT: 'system_date_time_service_post',
+}
+
 class ServerDateTime:
     def __init__(self, client):
         self.client = client
@@ -47,26 +54,18 @@ class ServerDateTime:
                 - UTC: UTC time string
                 - ARGUMENT: Date time argument format string
         """
-        logging.info(f"ServerDateTime.get_server_date_time: Fetching server date and time in {format.name} format...")
-        
-        # Build the URL based on the format
-        base_url = f"https://{self.client.zvm_address}/v1/serverDateTime"
-        url = base_url if format == DateTimeFormat.DEFAULT else f"{base_url}/{format.value}"
+        logger.info("ServerDateTime.get_server_date_time: Fetching server date and time in %s format...", format.name)
         
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            server_time = response.json()
-            logging.info(f"Successfully retrieved server date and time in {format.name} format")
-            return server_time
-
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to get server date and time: {e}")
-            if hasattr(e.response, 'text'):
-                logging.error(f"Error response: {e.response.text}")
-            raise 
\ No newline at end of file
+        if format == DateTimeFormat.DEFAULT:
+            # The full server time info is not part of the swagger, so the endpoint layer has no method for it
+            url = f"https://{self.client.zvm_address}/v1/serverDateTime"
+            headers = {
+                'Content-Type': 'application/json',
+                'Authorization': f'Bearer {self.client.token}'
+            }
+            response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        else:
+            response = getattr(self.client.api, _OPERATIONS[format])()
+        server_time = response.json()
+        logger.info("Successfully retrieved server date and time in %s format", format.name)
+        return server_time
\ No newline at end of file
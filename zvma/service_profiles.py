@@ -9,9 +9,10 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
 
+logger = logging.getLogger(__name__)
+
 class ServiceProfiles:
     def __init__(self, client):
         self.client = client
@@ -33,29 +34,12 @@ class ServiceProfiles:
                 - testInterval: Test interval period
                 - description: Service profile description
         """
-        logging.info(f"ServiceProfiles.get_service_profiles: Fetching service profiles...")
-        
-        url = f"https://{self.client.zvm_address}/v1/serviceprofiles"
+        logger.info("ServiceProfiles.get_service_profiles: Fetching service profiles...")
         
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        params = {}
         if site_identifier:
-            params['siteIdentifier'] = site_identifier
-            logging.info(f"Filtering service profiles for site: {site_identifier}")
-
-        try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            profiles = response.json()
-            logging.info(f"Successfully retrieved {len(profiles)} service profiles")
-            return profiles
+            logger.info("Filtering service profiles for site: %s", site_identifier)
 
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to get service profiles: {e}")
-            if hasattr(e.response, 'text'):
-                logging.error(f"Error response: {e.response.text}")
-            raise 
\ No newline at end of file
+        response = self.client.api.get_service_profile_all(site_identifier=site_identifier or None)
+        profiles = response.json()
+        logger.info("Successfully retrieved %s service profiles", len(profiles))
+        return profiles
\ No newline at end of file
@@ -9,8 +9,7 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
-import logging
+from .cache import cached_response
 
 class Sessions:
     def __init__(self, client):
@@ -22,13 +21,8 @@ class Sessions:
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to get sessions: {e}")
-            raise
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        return response.json()
 
     def get_session(self, session_identifier):
         url = f"https://{self.client.zvm_address}/v1/sessions/{session_identifier}"
@@ -36,24 +30,15 @@ class Sessions:
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to get session: {e}")
-            raise
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        return response.json()
 
+    @cached_response()
     def get_session_types(self):
         url = f"https://{self.client.zvm_address}/v1/sessions/types"
         headers = {
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.client.token}'
         }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to get session types: {e}")
-            raise
\ No newline at end of file
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        return response.json()
\ No newline at end of file
@@ -0,0 +1,104 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import json
+import re
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# A complete JSON string, a bracket, or a lone quote opening a string that is not complete yet
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]|"', re.DOTALL)
+_SCALAR = re.compile(rb'[^,\]\s]+')
+_SEPARATORS = re.compile(rb'[\s,]*')
+_WHITESPACE = re.compile(rb'\s*')
+
+
+def _find_value_end(buffer, pos, final):
+    """Return the offset just past the JSON value starting at `pos`, or None if `buffer` does not hold all of it yet."""
+    first = buffer[pos:pos + 1]
+    if first in (b'{', b'['):
+        depth = 0
+        for match in _TOKEN.finditer(buffer, pos):
+            token = match.group()
+            if token == b'"':
+                return None
+            if token in (b'{', b'['):
+                depth += 1
+            elif token in (b'}', b']'):
+                depth -= 1
+                if depth == 0:
+                    return match.end()
+        return None
+    if first == b'"':
+        match = _TOKEN.match(buffer, pos)
+        return match.end() if match.group() != b'"' else None
+    match = _SCALAR.match(buffer, pos)
+    if match is None or (match.end() == len(buffer) and not final):
+        return None
+    return match.end()
+
+
+def iter_json_array(chunks, loads=json.loads):
+    """
+    Incrementally parse a JSON array from an iterable of byte chunks, yielding one element at a time.
+
+    Only the element being parsed and the unread part of the current chunk are held in memory, so
+    peak memory depends on the size of the largest entity rather than on the length of the array.
+    A body that is not an array (e.g. a single entity) is decoded whole and yielded once.
+
+    :param chunks: Iterable of bytes, e.g. requests.Response.iter_content().
+    :param loads: Function decoding a single JSON value from bytes, normally the client codec's `loads`.
+    """
+    buffer = b''
+    pos = 0
+    in_array = None
+    final = False
+    chunks = iter(chunks)
+
+    while True:
+        if in_array is None:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer):
+                in_array = buffer[pos:pos + 1] == b'['
+                pos += 1 if in_array else 0
+        if in_array:
+            while True:
+                pos = _SEPARATORS.match(buffer, pos).end()
+                if pos >= len(buffer):
+                    break
+                if buffer[pos:pos + 1] == b']':
+                    return
+                end = _find_value_end(buffer, pos, final)
+                if end is None:
+                    break
+                yield loads(buffer[pos:end])
+                pos = end
+
+        if final:
+            if in_array:
+                raise ValueError("Unexpected end of JSON array")
+            if buffer[pos:].strip():
+                value = loads(buffer[pos:])
+                if isinstance(value, list):
+                    yield from value
+                else:
+                    yield value
+            return
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            final = True
+            continue
+        if in_array:
+            buffer = buffer[pos:] + chunk
+            pos = 0
+        else:
+            buffer += chunk
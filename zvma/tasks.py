@@ -9,49 +9,82 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
 import time
 from .common import ZertoTaskStates
+from . import models
+from . import tracing
+
+logger = logging.getLogger(__name__)
 
 class Tasks:
     def __init__(self, client):
         self.client = client
 
+    def list_tasks(self, started_before_date=None, started_after_date=None, completed_before_date=None,
+                   completed_after_date=None, task_type=None, status=None, as_models=False):
+        """
+        Fetches the tasks run on this site, optionally filtered by start/completion dates, type and status.
+
+        :param started_before_date: Tasks started before this date-time.
+        :param started_after_date: Tasks started after this date-time.
+        :param completed_before_date: Tasks completed before this date-time.
+        :param completed_after_date: Tasks completed after this date-time.
+        :param task_type: The task type, see get_task_type_all on client.api for the accepted values.
+        :param status: The task status.
+        :param as_models: Return zvma.models.Task instances instead of dicts.
+        :return: List of tasks.
+        """
+        logger.debug('list_tasks(zvm_address=%s, task_type=%s, status=%s)', self.client.zvm_address, task_type, status)
+        response = self.client.api.get_task_all(started_before_date, started_after_date, completed_before_date,
+                                                completed_after_date, task_type, status)
+        tasks = response.json() or []
+        return models.convert(models.Task, tasks) if as_models else tasks
+
+    def get_task(self, task_identifier, as_models=False):
+        """
+        Fetches the details of one task.
+
+        :param task_identifier: The identifier of the task.
+        :param as_models: Return a zvma.models.Task instance instead of a dict.
+        :return: The task.
+        """
+        logger.debug('get_task(zvm_address=%s, task_identifier=%s)', self.client.zvm_address, task_identifier)
+        task = self.client.api.get_task(task_identifier).json()
+        return models.convert(models.Task, task) if as_models else task
+
+    @tracing.traced
     def wait_for_task_completion(self, task_identifier, timeout=600, interval=5, expected_task_state: ZertoTaskStates = ZertoTaskStates.Completed):
-        logging.debug(f'wait_for_task_completion(zvm_address={self.client.zvm_address}, task_identifier={task_identifier}, timeout={timeout}, interval={interval})')
+        logger.debug('wait_for_task_completion(zvm_address=%s, task_identifier=%s, timeout=%s, interval=%s)',
+                     self.client.zvm_address, task_identifier, timeout, interval)
         start_time = time.time()
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
 
+        iteration = 0
         while True:
             # Check if we've exceeded the timeout
             if time.time() - start_time > timeout:
-                logging.error(f'Task ID={task_identifier} timed out after {timeout} seconds')
+                logger.error('Task ID=%s timed out after %s seconds', task_identifier, timeout)
                 raise TimeoutError(f"Task did not complete within {timeout} seconds")
 
-            url = f"https://{self.client.zvm_address}/v1/tasks/{task_identifier}"
-            try:
-                response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-                response.raise_for_status()
+            iteration += 1
+            with tracing.span('Tasks.wait_for_task_completion.poll', **{'zvma.task_identifier': task_identifier,
+                                                                         'zvma.poll.iteration': iteration}) as poll_span:
+                response = self.client.api.get_task(task_identifier)
                 task_info = response.json()
 
                 state = task_info.get("Status", {}).get("State", -1)
                 progress = task_info.get("Status", {}).get("Progress", 0)
-                logging.debug(f'Task response: status={ZertoTaskStates.get_name_by_value(state)}, progress={progress}')
-
-                if state == expected_task_state.value and progress == 100:
-                    logging.info("Task completed successfully.")
-                    time.sleep(interval)
-                    return task_info
-                elif state == ZertoTaskStates.InProgress.value:
-                    time.sleep(interval)
-                    continue
-                else:
-                    logging.error(f'Task ID={task_identifier} failed. task state={ZertoTaskStates.get_name_by_value(state)}')
-                    raise Exception(f"Task failed: {task_info.get('CompleteReason', 'No reason provided')}")
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Request failed: {e}")
-                raise
\ No newline at end of file
+                tracing.set_attributes(poll_span, **{'zvma.task.state': state, 'zvma.task.progress': progress})
+            logger.debug('Task response: status=%s, progress=%s', ZertoTaskStates.get_name_by_value(state), progress)
+
+            if state == expected_task_state.value and progress == 100:
+                logger.info("Task completed successfully.")
+                tracing.sleep(interval)
+                return task_info
+            elif state == ZertoTaskStates.InProgress.value:
+                tracing.sleep(interval)
+                continue
+            else:
+                logger.error('Task ID=%s failed. task state=%s',
+                             task_identifier, ZertoTaskStates.get_name_by_value(state))
+                raise Exception(f"Task failed: {task_info.get('CompleteReason', 'No reason provided')}")
\ No newline at end of file
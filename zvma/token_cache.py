@@ -0,0 +1,128 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_directory():
+    """$XDG_CACHE_HOME/zvma, ~/.cache/zvma by default."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'zvma')
+
+
+class FileTokenCache:
+    """
+    On-disk cache of Keycloak bearer tokens shared by all processes of a user.
+
+    Tokens are stored per ZVM address and client_id in files readable only by their owner
+    (mode 0600 in a 0700 directory); client secrets are never written. A lock file per entry
+    serialises refreshes, so when many processes start together only the first one asks
+    Keycloak for a token and the others reuse it.
+
+    :param directory: Cache directory, created if missing. Defaults to default_cache_directory().
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or default_cache_directory()
+
+    def _path(self, zvm_address, client_id, suffix):
+        key = hashlib.sha256(f'{zvm_address}\0{client_id}'.encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.directory, f'token-{key}{suffix}')
+
+    @contextlib.contextmanager
+    def lock(self, zvm_address, client_id):
+        """Hold the cross-process lock of one cache entry."""
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        fd = os.open(self._path(zvm_address, client_id, '.lock'), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:  # pragma: no cover - Windows
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            os.close(fd)
+
+    def load(self, zvm_address, client_id):
+        """
+        Return the cached {'access_token', 'expires_in', 'expires_at'} entry, or None if there is no
+        usable entry. `expires_at` is a time.time() timestamp.
+        """
+        path = self._path(zvm_address, client_id, '.json')
+        try:
+            with open(path, 'rb') as cache_file:
+                info = os.fstat(cache_file.fileno())
+                if info.st_mode & (stat.S_IRWXG | stat.S_IRWXO) or (hasattr(os, 'getuid') and info.st_uid != os.getuid()):
+                    logger.warning("FileTokenCache: ignoring %s, it is accessible to other users", path)
+                    return None
+                entry = json.loads(cache_file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("FileTokenCache: ignoring unreadable %s: %s", path, e)
+            return None
+        if (not isinstance(entry, dict) or entry.get('zvm_address') != zvm_address
+                or entry.get('client_id') != client_id or not entry.get('access_token')):
+            return None
+        return entry
+
+    def store(self, zvm_address, client_id, access_token, expires_in):
+        """Write a token that expires `expires_in` seconds from now, replacing the entry atomically."""
+        entry = {'zvm_address': zvm_address, 'client_id': client_id, 'access_token': access_token,
+                 'expires_in': expires_in, 'expires_at': time.time() + expires_in}
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.token-')  # created with mode 0600
+        try:
+            with os.fdopen(fd, 'w') as temp_file:
+                json.dump(entry, temp_file)
+            os.replace(temp_path, self._path(zvm_address, client_id, '.json'))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+
+    def clear(self, zvm_address, client_id):
+        """Remove the cached token of one ZVM address and client_id."""
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path(zvm_address, client_id, '.json'))
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.directory!r})'
+
+
+def get_token_cache(token_cache):
+    """Resolve the `token_cache` client argument: None/False, True (default directory), a directory path or a cache object."""
+    if not token_cache:
+        return None
+    if token_cache is True:
+        return FileTokenCache()
+    if isinstance(token_cache, (str, os.PathLike)):
+        return FileTokenCache(os.fspath(token_cache))
+    return token_cache
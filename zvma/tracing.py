@@ -0,0 +1,72 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import contextlib
+import functools
+import time
+from .metrics import endpoint_template
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - optional dependency
+    otel_trace = None
+
+TRACER_NAME = 'zvma'
+
+_NO_SPAN = contextlib.nullcontext()
+
+
+def span(name, **attributes):
+    """
+    Start an OpenTelemetry span named `name` as a child of the current span.
+
+    Returns a context manager yielding the span, or yielding None when the opentelemetry-api
+    package is not installed. Spans are only exported if the application configured a
+    TracerProvider; otherwise OpenTelemetry makes them no-ops.
+    Attributes whose value is None are skipped.
+    """
+    if otel_trace is None:
+        return _NO_SPAN
+    attributes = {key: value for key, value in attributes.items() if value is not None}
+    return otel_trace.get_tracer(TRACER_NAME).start_as_current_span(name, attributes=attributes)
+
+
+def http_span(method, url, template=None):
+    """Span covering one API call through the transport, retries included."""
+    if otel_trace is None:
+        return _NO_SPAN
+    return span(f'HTTP {method}', **{'http.request.method': method, 'url.full': url,
+                                     'url.template': template or endpoint_template(url)})
+
+
+def traced(method):
+    """Run a resource method inside a span named after it, e.g. 'VPGs.create_vpg'."""
+    if otel_trace is None:
+        return method
+    name = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with span(name, **{'zvma.zvm_address': self.client.zvm_address}):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def sleep(seconds):
+    """time.sleep() recorded as a 'zvma.sleep' span, so poll intervals show up in traces."""
+    with span('zvma.sleep', **{'zvma.sleep.seconds': seconds}):
+        time.sleep(seconds)
+
+
+def set_attributes(current_span, **attributes):
+    """Set attributes on a span returned by `span()`; does nothing when tracing is unavailable."""
+    if current_span is not None:
+        current_span.set_attributes({key: value for key, value in attributes.items() if value is not None})
@@ -0,0 +1,448 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service.
+# The author and Zerto further disclaim all implied warranties including, without limitation,
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation,
+# production or delivery of the scripts be liable for any damages whatsoever (including,
+# without limitation, damages for loss of business profits, business interruption, loss of business
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages.
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+import os
+import requests
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from .exceptions import error_for_status, ZVMAError, ZVMAConnectionError, ZVMATimeoutError, ZVMADeadlineExceededError
+from .retry import RetryPolicy
+from .limiter import AdaptiveConcurrencyLimiter
+from .breaker import CircuitBreaker
+from .codec import get_codec, encode_json_body, JSONCodec
+from .streaming import iter_json_array, DEFAULT_CHUNK_SIZE
+from .metrics import ClientMetrics
+from .coalesce import SingleFlight
+from . import tracing
+from . import forksafe
+from .priority import RequestPriority, get_priority, current_priority
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_TIMEOUT = 60
+# Gateway errors a restarting ZVM answers with; they count as failures for the circuit breaker
+BREAKER_FAILURE_STATUSES = frozenset((502, 503, 504))
+
+
+class Transport:
+    """
+    Pooled HTTP transport and request pipeline shared by a ZVMAClient and all of its resource classes.
+
+    Wraps a single requests.Session so that TCP/TLS connections to the ZVM are kept
+    alive and reused across API calls instead of being re-established per request.
+    Every call goes through `request`, which injects the current token, retries transient
+    failures of idempotent calls according to the retry policy, enforces an optional
+    per-call deadline and turns error statuses into typed zvma.exceptions errors.
+
+    The transport is fork-aware: in a child process it drops the connections inherited from the
+    parent and starts with a fresh pool, limiters and locks.
+
+    :param verify_certificate: Default value for the `verify` argument of every request.
+    :param pool_connections: Number of per-host connection pools to cache.
+    :param pool_maxsize: Maximum number of connections kept alive per host.
+    :param pool_block: If True, block when all `pool_maxsize` connections to a host are busy
+                       instead of opening extra, non-reusable connections.
+    :param session: Optional pre-configured requests.Session to use instead of a new one.
+    :param auth: Optional token owner (normally the ZVMAClient) exposing a `token` property and a
+                 `refresh_token(stale_token)` method. Requests carrying an Authorization header
+                 always get the current token, and a 401 response is replayed once after a refresh.
+    :param retry_policy: RetryPolicy deciding which failures are retried and how long to wait.
+    :param timeout: Default timeout in seconds for a single HTTP attempt.
+    :param deadline: Default time budget in seconds for a whole call, retries included. None disables it.
+    :param adaptive_concurrency: Cap concurrent requests per ZVM host with an AdaptiveConcurrencyLimiter
+                                 bounded by `pool_maxsize`. True (default) uses default settings, a dict is
+                                 passed as keyword arguments to the limiter, False disables limiting.
+    :param codec: JSON codec used for `json=` request bodies and `response.json()`; see zvma.codec.get_codec.
+    :param metrics: ClientMetrics recording per-endpoint counts, latencies, sizes, retries and status codes.
+                    True (default) creates one, False or None disables recording.
+    :param coalesce: Let identical GET requests that are in flight at the same time share one network call
+                     and one decoded result (default True). The shared result is the same object for every
+                     caller, so treat results as read-only or disable coalescing.
+    :param http_backend: 'requests' (default) or 'httpx', which negotiates HTTP/2 multiplexing and compressed
+                         responses; see zvma.http2.HTTPXSession. Ignored when `session` is given.
+    :param http2: With the 'httpx' backend, force HTTP/2 on (True) or off (False). None uses it when 'h2' is installed.
+    :param circuit_breaker: Fail calls fast with ZVMACircuitOpenError while a ZVM host is down, using a
+                            zvma.breaker.CircuitBreaker per host that probes for recovery in the background.
+                            True (default) uses default settings, a dict is passed as keyword arguments to
+                            the breaker, False disables it.
+    """
+
+    def __init__(self, verify_certificate=True, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False, session=None, auth=None,
+                 retry_policy=None, timeout=DEFAULT_TIMEOUT, deadline=None, adaptive_concurrency=True,
+                 codec='auto', metrics=True, coalesce=True, http_backend='requests', http2=None,
+                 circuit_breaker=True):
+        if http_backend not in ('requests', 'httpx'):
+            raise ValueError(f"Unknown http_backend {http_backend!r}, expected 'requests' or 'httpx'")
+        self.verify_certificate = verify_certificate
+        self.auth = auth
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.timeout = timeout
+        self.deadline = deadline
+        self.adaptive_concurrency = adaptive_concurrency
+        self.codec = get_codec(codec)
+        self.metrics = ClientMetrics() if metrics is True else (metrics or None)
+        self.coalesce = coalesce
+        self.http_backend = http_backend
+        self.http2 = http2
+        self.single_flight = SingleFlight()
+        self.limiters = {}
+        self._limiters_lock = threading.Lock()
+        self.circuit_breaker = circuit_breaker
+        self.breakers = {}
+        self._owns_session = session is None
+        self.session = session if session is not None else self._create_session()
+        self._pid = os.getpid()
+        forksafe.register(self)
+
+    def _after_fork_in_child(self):
+        """Replace state inherited from the parent process: its sockets must not be shared and its locks may be held."""
+        self._pid = os.getpid()
+        if self._owns_session:
+            self.session = self._create_session()
+        else:
+            for adapter in getattr(self.session, 'adapters', {}).values():
+                adapter.poolmanager.clear()
+        self.limiters = {}
+        self._limiters_lock = threading.Lock()
+        # Probe threads of the parent do not exist here
+        self.breakers = {}
+        self.single_flight = SingleFlight()
+        if self.metrics is not None:
+            self.metrics._after_fork_in_child()
+
+    def _create_session(self):
+        logger.debug('Transport._create_session(http_backend=%s, pool_connections=%s, pool_maxsize=%s, pool_block=%s)',
+                     self.http_backend, self.pool_connections, self.pool_maxsize, self.pool_block)
+        if self.http_backend == 'httpx':
+            from .http2 import HTTPXSession
+            return HTTPXSession(verify_certificate=self.verify_certificate, pool_maxsize=self.pool_maxsize,
+                                http2=self.http2)
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize,
+                              pool_block=self.pool_block)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def request(self, method, url, deadline=None, idempotent=None, raise_for_status=True, coalesce=None,
+                limited=True, priority=None, template=None, **kwargs):
+        """
+        Send a request through the pipeline.
+
+        Accepts the same keyword arguments as requests.request; `verify` and `timeout` default
+        to the transport settings.
+
+        :param deadline: Time budget in seconds for this call including retries; overrides the transport default.
+        :param idempotent: Force (True) or forbid (False) retries regardless of the HTTP method,
+                           e.g. for POST endpoints that only read data.
+        :param raise_for_status: Raise a ZVMAHTTPError subclass for 4xx/5xx responses.
+        :param coalesce: Override the transport `coalesce` setting for this call.
+        :param limited: Count the call against the host concurrency limit. Token requests bypass the limit,
+                        because they are made by threads that may already hold a request slot.
+        :param priority: RequestPriority (or its name) deciding the order in which waiting calls get a slot.
+                         Defaults to the priority of the calling context; see zvma.priority.request_priority.
+        :param template: Endpoint template of `url` (see zvma.metrics.endpoint_template) when the caller
+                         already knows it, as the generated endpoint layer does; saves deriving it per call.
+        :return: The requests.Response of the final attempt.
+        """
+        if self._pid != os.getpid():
+            # Forked without os.register_at_fork support
+            self._after_fork_in_child()
+        priority = get_priority(priority) if priority is not None else current_priority()
+        coalesce = coalesce if coalesce is not None else self.coalesce
+        key = self._coalesce_key(method, url, kwargs) if coalesce else None
+        if key is None:
+            return self._request(method, url, deadline, idempotent, raise_for_status, limited, priority, template,
+                                 **kwargs)
+        # A critical call must not wait on an identical background call still queued for a slot
+        key += (priority,)
+
+        def leader_request():
+            return self._share_decoded(self._request(method, url, deadline, idempotent, False, limited, priority,
+                                                     template, **kwargs))
+
+        wait_timeout = deadline if deadline is not None else self.deadline
+        try:
+            response, shared = self.single_flight.do(key, leader_request, timeout=wait_timeout)
+        except TimeoutError:
+            raise ZVMADeadlineExceededError(f"{method} {url} did not complete within the {wait_timeout}s deadline")
+        if shared:
+            logger.debug("Transport.request: %s %s shared an identical in-flight request", method, url)
+        if raise_for_status:
+            self.raise_for_status(method, url, response)
+        return response
+
+    @staticmethod
+    def _coalesce_key(method, url, kwargs):
+        """Identity of a request for coalescing, or None if it must not be coalesced."""
+        if method != 'GET' or kwargs.get('stream'):
+            return None
+        params = kwargs.get('params') or {}
+        if not isinstance(params, dict):
+            return None
+        headers = kwargs.get('headers') or {}
+        # The token is injected per attempt, so only the presence of an Authorization header matters
+        return (url,
+                tuple(sorted((key, str(value)) for key, value in params.items() if value is not None)),
+                tuple(sorted((key.lower(), value if key.lower() != 'authorization' else None)
+                             for key, value in headers.items())),
+                kwargs.get('verify'), str(kwargs.get('timeout')))
+
+    @staticmethod
+    def _share_decoded(response):
+        """Decode the body of a response shared by coalesced callers only once."""
+        decode = response.json
+        lock = threading.Lock()
+        decoded = []
+
+        def json(**kwargs):
+            with lock:
+                if not decoded:
+                    decoded.append(decode(**kwargs))
+            return decoded[0]
+
+        response.json = json
+        return response
+
+    def _request(self, method, url, deadline, idempotent, raise_for_status, limited, priority, template, **kwargs):
+        kwargs.setdefault('verify', self.verify_certificate)
+        kwargs.setdefault('timeout', self.timeout)
+        encode_json_body(self.codec, kwargs)
+        attempt_timeout = kwargs['timeout']
+        deadline = deadline if deadline is not None else self.deadline
+        started = time.monotonic()
+        expires_at = started + deadline if deadline else None
+        policy = self.retry_policy
+        retryable = policy.is_retryable_method(method, idempotent)
+        breaker = self.get_breaker(url)
+        attempt = 0
+        response = None
+
+        with tracing.http_span(method, url, template) as current_span:
+            try:
+                while True:
+                    response = None
+                    if expires_at is not None:
+                        remaining = expires_at - time.monotonic()
+                        if remaining <= 0:
+                            raise ZVMADeadlineExceededError(f"{method} {url} did not complete within the {deadline}s deadline")
+                        if attempt_timeout is None or isinstance(attempt_timeout, (int, float)):
+                            kwargs['timeout'] = remaining if attempt_timeout is None else min(attempt_timeout, remaining)
+                    if breaker is not None:
+                        breaker.before_call()
+
+                    try:
+                        if limited:
+                            response = self._send_limited(method, url, expires_at, priority, **kwargs)
+                        else:
+                            response = self._send(method, url, **kwargs)
+                    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                        if breaker is not None and not isinstance(e, ZVMAError):
+                            breaker.record_failure(e)
+                        if retryable and attempt < policy.max_retries and self._backoff(method, url, attempt, expires_at, reason=e):
+                            attempt += 1
+                            continue
+                        error_class = ZVMATimeoutError if isinstance(e, requests.exceptions.Timeout) else ZVMAConnectionError
+                        logger.error("%s %s failed after %s attempt(s): %s", method, url, attempt + 1, e)
+                        raise error_class(str(e), request=e.request) from e
+
+                    if breaker is not None:
+                        if response.status_code in BREAKER_FAILURE_STATUSES:
+                            breaker.record_failure(f"status {response.status_code}")
+                        else:
+                            breaker.record_success()
+                    if (retryable and attempt < policy.max_retries and policy.is_retryable_status(response.status_code)
+                            and self._backoff(method, url, attempt, expires_at, response=response)):
+                        response.close()
+                        attempt += 1
+                        continue
+
+                    self._attach_codec(response)
+                    if raise_for_status:
+                        self.raise_for_status(method, url, response)
+                    return response
+            finally:
+                if self.metrics is not None:
+                    self._record_metrics(method, url, started, attempt, response, kwargs.get('stream'), template)
+                tracing.set_attributes(current_span, **{
+                    'http.response.status_code': response.status_code if response is not None else None,
+                    'http.request.resend_count': attempt or None})
+
+    def _record_metrics(self, method, url, started, retries, response, stream, template=None):
+        if response is None:
+            status, size, wire_size = None, 0, 0
+        else:
+            status = response.status_code
+            # Streamed bodies are not read here; rely on the Content-Length header for them
+            size = int(response.headers.get('Content-Length') or 0) if stream else len(response.content or b'')
+            wire_size = size if stream else self._wire_bytes(response, size)
+        self.metrics.record(method, url, status, time.monotonic() - started, size, retries, wire_bytes=wire_size,
+                            template=template)
+
+    @staticmethod
+    def _wire_bytes(response, default):
+        """Body bytes received before content decoding (gzip, br, ...), as counted by urllib3 or httpx."""
+        try:
+            wire_size = response.raw.tell()
+        except (AttributeError, OSError, ValueError):
+            return default
+        return wire_size if isinstance(wire_size, int) and wire_size > 0 else default
+
+    def _attach_codec(self, response):
+        """Make `response.json()` decode with the transport codec instead of the standard library."""
+        codec = self.codec
+        if type(codec) is not JSONCodec and isinstance(response, requests.Response):
+            response.json = lambda **kwargs: codec.loads(response.content)
+
+    def get_limiter(self, url):
+        """Return the concurrency limiter of the ZVM host addressed by `url`, or None if limiting is disabled."""
+        if not self.adaptive_concurrency:
+            return None
+        host = urlsplit(url).netloc
+        limiter = self.limiters.get(host)
+        if limiter is None:
+            with self._limiters_lock:
+                limiter = self.limiters.get(host)
+                if limiter is None:
+                    settings = {'initial_limit': self.pool_maxsize, 'max_limit': self.pool_maxsize}
+                    if isinstance(self.adaptive_concurrency, dict):
+                        settings.update(self.adaptive_concurrency)
+                    limiter = self.limiters[host] = AdaptiveConcurrencyLimiter(**settings)
+        return limiter
+
+    def get_breaker(self, url):
+        """Return the circuit breaker of the ZVM host addressed by `url`, or None if breakers are disabled."""
+        if not self.circuit_breaker:
+            return None
+        parts = urlsplit(url)
+        breaker = self.breakers.get(parts.netloc)
+        if breaker is None:
+            with self._limiters_lock:
+                breaker = self.breakers.get(parts.netloc)
+                if breaker is None:
+                    settings = dict(self.circuit_breaker) if isinstance(self.circuit_breaker, dict) else {}
+                    settings.setdefault('probe', lambda: self._probe(f"{parts.scheme}://{parts.netloc}"))
+                    breaker = self.breakers[parts.netloc] = CircuitBreaker(parts.netloc, **settings)
+        return breaker
+
+    def _probe(self, base_url):
+        """Recovery probe of a circuit breaker: True once the ZVM answers without a gateway error."""
+        timeout = min(5, self.timeout) if isinstance(self.timeout, (int, float)) else 5
+        response = self.session.request('GET', f"{base_url}/v1/localsite", verify=self.verify_certificate,
+                                        timeout=timeout)
+        response.close()
+        return response.status_code not in BREAKER_FAILURE_STATUSES
+
+    def health(self):
+        """Return {host: circuit breaker state dict} for every ZVM host called so far."""
+        return {host: breaker.snapshot() for host, breaker in list(self.breakers.items())}
+
+    def _send_limited(self, method, url, expires_at, priority=RequestPriority.NORMAL, **kwargs):
+        limiter = self.get_limiter(url)
+        if limiter is None:
+            return self._send(method, url, **kwargs)
+
+        wait_timeout = max(0.0, expires_at - time.monotonic()) if expires_at is not None else None
+        if not limiter.acquire(timeout=wait_timeout, priority=priority):
+            raise ZVMADeadlineExceededError(f"{method} {url} timed out waiting for a free request slot")
+        started = time.monotonic()
+        try:
+            response = self._send(method, url, **kwargs)
+        except Exception:
+            limiter.release(time.monotonic() - started, success=False)
+            raise
+        limiter.release(time.monotonic() - started,
+                        success=response.status_code != 429 and response.status_code < 500)
+        return response
+
+    def _send(self, method, url, **kwargs):
+        headers = kwargs.get('headers')
+        if self.auth is None or not headers or 'Authorization' not in headers:
+            return self.session.request(method, url, **kwargs)
+
+        token = self.auth.token
+        kwargs['headers'] = {**headers, 'Authorization': f'Bearer {token}'}
+        response = self.session.request(method, url, **kwargs)
+        if response.status_code != 401:
+            return response
+
+        logger.warning("Transport.request: %s %s returned 401, refreshing token and retrying once", method, url)
+        response.close()
+        token = self.auth.refresh_token(stale_token=token)
+        kwargs['headers'] = {**headers, 'Authorization': f'Bearer {token}'}
+        return self.session.request(method, url, **kwargs)
+
+    def _backoff(self, method, url, attempt, expires_at, response=None, reason=None):
+        """Sleep before the next attempt. Returns False if the wait would overrun the deadline."""
+        delay = self.retry_policy.get_backoff(attempt, response)
+        if expires_at is not None and time.monotonic() + delay >= expires_at:
+            return False
+        reason = reason if reason is not None else f"status {response.status_code}"
+        logger.warning("%s %s attempt %s failed (%s), retrying in %.2fs", method, url, attempt + 1, reason, delay)
+        tracing.sleep(delay)
+        return True
+
+    @staticmethod
+    def raise_for_status(method, url, response):
+        """Log an error response once and raise the matching ZVMAHTTPError subclass."""
+        if response.status_code < 400:
+            return
+        try:
+            message = response.json().get('Message', 'No detailed error message available')
+        except (ValueError, AttributeError):
+            message = response.text[:1000]
+        logger.error("HTTPError: %s %s - %s %s - %s", method, url, response.status_code, response.reason, message)
+        error_class = error_for_status(response.status_code)
+        raise error_class(f"{response.status_code} {response.reason} for {method} {url}: {message}",
+                          response=response, method=method, url=url)
+
+    def iter_json(self, method, url, chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+        """
+        Send a request and yield the elements of the JSON array in the response body one at a time.
+
+        The body is streamed and parsed incrementally with the transport codec, so memory use stays
+        flat regardless of the number of entities. The connection returns to the pool once the
+        generator is exhausted or closed.
+
+        :param chunk_size: Number of bytes read from the socket at a time.
+        """
+        response = self.request(method, url, stream=True, **kwargs)
+        try:
+            yield from iter_json_array(response.iter_content(chunk_size=chunk_size), loads=self.codec.loads)
+        finally:
+            response.close()
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def close(self):
+        for breaker in list(self.breakers.values()):
+            breaker.stop()
+        self.session.close()
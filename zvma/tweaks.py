@@ -9,12 +9,13 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
-import json
+from .log import log_payload
 from typing import Dict, List, Optional, Any
 from zvma.common import ZertoTweakType
 
+logger = logging.getLogger(__name__)
+
 class Tweaks:
     def __init__(self, client):
         self.client = client
@@ -31,7 +32,7 @@ class Tweaks:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"Tweaks.list_tweaks(zvm_address={self.client.zvm_address}, tweak_name={tweak_name})")
+        logger.info("Tweaks.list_tweaks(zvm_address=%s, tweak_name=%s)", self.client.zvm_address, tweak_name)
         
         # Build URL based on whether a specific tweak is requested
         base_url = f"https://{self.client.zvm_address}/management/api/tweaks/v1.0/zvmTweaks"
@@ -42,30 +43,16 @@ class Tweaks:
             'Authorization': f'Bearer {self.client.token}'
         }
         
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            
-            # If a specific tweak was requested, wrap the result in a list for consistent return type
-            if tweak_name:
-                result = [result]
-                
-            logging.info(f"Successfully retrieved {len(result)} ZVM tweak(s)")
-            logging.debug(f"Tweaks.list_tweaks result: {json.dumps(result, indent=4)}")
-            return result
+        response = self.client.transport.get(url, headers=headers, verify=self.client.verify_certificate)
+        result = response.json()
+        
+        # If a specific tweak was requested, wrap the result in a list for consistent return type
+        if tweak_name:
+            result = [result]
             
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("Successfully retrieved %s ZVM tweak(s)", len(result))
+        log_payload(logger, "Tweaks.list_tweaks result: %s", result)
+        return result
 
     def set_tweak(self, tweak_name: str, value: Any, tweak_type: ZertoTweakType = ZertoTweakType.ZVM, comment: str = "Changed from API") -> Dict:
         """Set a ZVM tweak value.
@@ -82,7 +69,8 @@ class Tweaks:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"Tweaks.set_tweak(zvm_address={self.client.zvm_address}, tweak_name={tweak_name}, value={value}, type={tweak_type.value})")
+        logger.info("Tweaks.set_tweak(zvm_address=%s, tweak_name=%s, value=%s, type=%s)",
+                    self.client.zvm_address, tweak_name, value, tweak_type.value)
         
         url = f"https://{self.client.zvm_address}/management/api/tweaks/v1/zvmTweaks"
         headers = {
@@ -97,42 +85,25 @@ class Tweaks:
             "comment": comment
         }
         
-        logging.info(f"Tweaks.set_tweak payload: {payload}")
-        logging.info(f"Tweaks.set_tweak url: {url}")
+        logger.info("Tweaks.set_tweak payload: %s", payload)
+        logger.info("Tweaks.set_tweak url: %s", url)
+        
+        response = self.client.transport.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
+        
+        # Log the raw response for debugging
+        logger.debug("Raw response status: %s", response.status_code)
+        logger.debug("Raw response headers: %s", dict(response.headers))
+        logger.debug("Raw response content: %s", response.text)
         
         try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            
-            # Log the raw response for debugging
-            logging.debug(f"Raw response status: {response.status_code}")
-            logging.debug(f"Raw response headers: {dict(response.headers)}")
-            logging.debug(f"Raw response content: {response.text}")
-            
-            response.raise_for_status()
-            
-            try:
-                result = response.json()
-                logging.info(f"Successfully updated tweak {tweak_name}")
-                logging.debug(f"Tweaks.set_tweak result: {json.dumps(result, indent=4)}")
-                return result
-            except ValueError:
-                # If response is not JSON but request was successful
-                logging.info(f"Successfully updated tweak {tweak_name} (no JSON response)")
-                return {"status": "success", "name": tweak_name}
-            
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error setting tweak {tweak_name}")
-            if hasattr(e, 'response') and e.response is not None:
-                logging.error(f"Status code: {e.response.status_code}")
-                logging.error(f"Response text: {e.response.text}")
-                try:
-                    error_json = e.response.json()
-                    logging.error(f"Error details: {json.dumps(error_json, indent=2)}")
-                except ValueError:
-                    logging.error("Could not parse error response as JSON")
-            else:
-                logging.error(f"Request failed: {str(e)}")
-            raise
+            result = response.json()
+            logger.info("Successfully updated tweak %s", tweak_name)
+            log_payload(logger, "Tweaks.set_tweak result: %s", result)
+            return result
+        except ValueError:
+            # If response is not JSON but request was successful
+            logger.info("Successfully updated tweak %s (no JSON response)", tweak_name)
+            return {"status": "success", "name": tweak_name}
 
     def delete_tweak(self, tweak_name: str) -> None:
         """Delete a ZVM tweak.
@@ -143,7 +114,7 @@ class Tweaks:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"Tweaks.delete_tweak(zvm_address={self.client.zvm_address}, tweak_name={tweak_name})")
+        logger.info("Tweaks.delete_tweak(zvm_address=%s, tweak_name=%s)", self.client.zvm_address, tweak_name)
         
         url = f"https://{self.client.zvm_address}/management/api/tweaks/v1/zvmTweaks/{tweak_name}"
         headers = {
@@ -151,29 +122,13 @@ class Tweaks:
             'Authorization': f'Bearer {self.client.token}'
         }
         
-        logging.info(f"Tweaks.delete_tweak url: {url}")
+        logger.info("Tweaks.delete_tweak url: %s", url)
         
-        try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
-            
-            # Log the raw response for debugging
-            logging.debug(f"Raw response status: {response.status_code}")
-            logging.debug(f"Raw response headers: {dict(response.headers)}")
-            logging.debug(f"Raw response content: {response.text}")
-            
-            response.raise_for_status()
-            logging.info(f"Successfully deleted tweak {tweak_name}")
-            
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error deleting tweak {tweak_name}")
-            if hasattr(e, 'response') and e.response is not None:
-                logging.error(f"Status code: {e.response.status_code}")
-                logging.error(f"Response text: {e.response.text}")
-                try:
-                    error_json = e.response.json()
-                    logging.error(f"Error details: {json.dumps(error_json, indent=2)}")
-                except ValueError:
-                    logging.error("Could not parse error response as JSON")
-            else:
-                logging.error(f"Request failed: {str(e)}")
-            raise
\ No newline at end of file
+        response = self.client.transport.delete(url, headers=headers, verify=self.client.verify_certificate)
+        
+        # Log the raw response for debugging
+        logger.debug("Raw response status: %s", response.status_code)
+        logger.debug("Raw response headers: %s", dict(response.headers))
+        logger.debug("Raw response content: %s", response.text)
+        
+        logger.info("Successfully deleted tweak %s", tweak_name)
\ No newline at end of file
@@ -0,0 +1,214 @@
+# Legal Disclaimer
+# This script is an example script and is not supported under any Zerto support program or service. 
+# The author and Zerto further disclaim all implied warranties including, without limitation, 
+# any implied warranties of merchantability or of fitness for a particular purpose.
+# In no event shall Zerto, its authors or anyone else involved in the creation, 
+# production or delivery of the scripts be liable for any damages whatsoever (including, 
+# without limitation, damages for loss of business profits, business interruption, loss of business 
+# information, or other pecuniary loss) arising out of the use of or the inability to use the sample 
+# scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
+# The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
+
+"""
+Local validation of VPG settings payloads against the swagger request schemas (zvma/schemas.py).
+
+Each schema is compiled once, on first use, into nested closures that check types, nullability,
+enums, int32 ranges and unknown fields. A typical payload validates in microseconds, before any
+HTTP call, and every problem is reported at once. Field names are matched case-insensitively, like
+the ZVM does, so PascalCase payloads ('Basic', 'RpoInSeconds') validate against the camelCase schema.
+
+The ZVM returns and accepts fields the swagger does not declare (e.g. 'IsSwap' on volumes,
+'DefaultResourcePoolIdentifier' on recovery), so unknown fields are only warnings unless `strict`.
+"""
+
+import difflib
+import logging
+import threading
+from .exceptions import ZVMAValidationError
+from .schemas import SCHEMAS
+
+VPG_SETTINGS_SCHEMA = 'Zerto.Zvm.Api.Interfaces.VpgSettings.VpgSettingsApi'
+_VPG_SETTINGS_NAMESPACE = 'Zerto.Zvm.Api.Interfaces.VpgSettings.'
+_INT32_MIN, _INT32_MAX = -2 ** 31, 2 ** 31 - 1
+
+# Schema name -> compiled validate(value, path, errors), shared by all validators
+_compiled = {}
+# Schema name -> validator returned by get_validator
+_validators = {}
+_compile_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
+def _join(parent, key):
+    if isinstance(key, int):
+        return f"{parent}[{key}]"
+    return f"{parent}.{key}" if parent else str(key) or '<payload>'
+
+
+def _type_name(value):
+    return 'null' if value is None else type(value).__name__
+
+
+# Compiled validators have the signature validate(value, parent, key, errors, unknown): `parent` is the
+# path of the enclosing value and `key` the field name or index, joined only when a message needs it.
+# Unknown fields go to `unknown`, which is `errors` itself in strict mode.
+
+def _compile_reference(name, compiled):
+    validator = compiled.get(name)
+    if validator is None:
+        # Placeholder for schemas that (indirectly) refer to themselves
+        slot = []
+        compiled[name] = lambda value, parent, key, errors, unknown: slot[0](value, parent, key, errors, unknown)
+        slot.append(_compile(SCHEMAS[name], compiled))
+        validator = compiled[name] = slot[0]
+    return validator
+
+
+def _compile_object(schema, compiled):
+    properties = {name.lower(): _compile(property_schema, compiled)
+                  for name, property_schema in schema.get('properties', {}).items()}
+    names = list(schema.get('properties', {}))
+    closed = schema.get('additionalProperties') is False
+
+    def validate_object(value, parent, key, errors, unknown):
+        if not isinstance(value, dict):
+            errors.append(f"{_join(parent, key)}: expected an object, got {_type_name(value)}")
+            return
+        path = _join(parent, key) if key != '' else ''
+        for field, item in value.items():
+            validate = properties.get(field.lower()) if isinstance(field, str) else None
+            if validate is not None:
+                validate(item, path, field, errors, unknown)
+            elif closed:
+                close = difflib.get_close_matches(str(field), names, n=1, cutoff=0.6)
+                unknown.append(f"{_join(path, field)}: unknown field" + (f" (did you mean '{close[0]}'?)" if close else ''))
+    return validate_object
+
+
+def _compile_array(schema, compiled):
+    validate_item = _compile(schema.get('items', {}), compiled)
+
+    def validate_array(value, parent, key, errors, unknown):
+        if not isinstance(value, (list, tuple)):
+            errors.append(f"{_join(parent, key)}: expected an array, got {_type_name(value)}")
+            return
+        path = _join(parent, key)
+        for index, item in enumerate(value):
+            validate_item(item, path, index, errors, unknown)
+    return validate_array
+
+
+def _compile_scalar(schema):
+    kind = schema.get('type')
+    enum = frozenset(schema['enum']) if 'enum' in schema else None
+
+    if kind == 'string':
+        def validate_string(value, parent, key, errors, unknown):
+            if value.__class__ is not str and not isinstance(value, str):
+                errors.append(f"{_join(parent, key)}: expected a string, got {_type_name(value)}")
+            elif enum is not None and value not in enum:
+                errors.append(f"{_join(parent, key)}: {value!r} is not one of {sorted(enum)}")
+        return validate_string
+
+    if kind == 'integer':
+        low, high = (_INT32_MIN, _INT32_MAX) if schema.get('format') == 'int32' else (None, None)
+
+        def validate_integer(value, parent, key, errors, unknown):
+            if value.__class__ is not int and (not isinstance(value, int) or isinstance(value, bool)):
+                if enum is not None and isinstance(value, str):
+                    # Integer enums may also be sent by name
+                    return
+                errors.append(f"{_join(parent, key)}: expected an integer, got {_type_name(value)}")
+            elif low is not None and not low <= value <= high:
+                errors.append(f"{_join(parent, key)}: {value} is out of the int32 range")
+            elif enum is not None and value not in enum:
+                errors.append(f"{_join(parent, key)}: {value!r} is not one of {sorted(enum)}")
+        return validate_integer
+
+    if kind == 'number':
+        def validate_number(value, parent, key, errors, unknown):
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                errors.append(f"{_join(parent, key)}: expected a number, got {_type_name(value)}")
+        return validate_number
+
+    if kind == 'boolean':
+        def validate_boolean(value, parent, key, errors, unknown):
+            if value is not True and value is not False:
+                errors.append(f"{_join(parent, key)}: expected a boolean, got {_type_name(value)}")
+        return validate_boolean
+
+    return lambda value, parent, key, errors, unknown: None
+
+
+def _compile(schema, compiled):
+    """Compile `schema` into validate(value, parent, key, errors, unknown), appending messages to the lists."""
+    if '$ref' in schema:
+        validator = _compile_reference(schema['$ref'], compiled)
+        # OpenAPI 3.0 cannot mark a $ref nullable; the ZVM accepts null for nested sections
+        nullable = True
+    else:
+        kind = schema.get('type')
+        if kind == 'object' or 'properties' in schema:
+            validator = _compile_object(schema, compiled)
+        elif kind == 'array':
+            validator = _compile_array(schema, compiled)
+        else:
+            validator = _compile_scalar(schema)
+        nullable = schema.get('nullable', False)
+
+    def validate(value, parent, key, errors, unknown):
+        if value is not None:
+            validator(value, parent, key, errors, unknown)
+        elif not nullable:
+            errors.append(f"{_join(parent, key)}: must not be null")
+    return validate
+
+
+def get_validator(schema=VPG_SETTINGS_SCHEMA):
+    """
+    Return a compiled validator for a schema of zvma/schemas.py, compiling it on first use.
+
+    :param schema: Full schema name, or its name in the VpgSettings namespace, e.g. 'VpgSettingsBasicApi'.
+    :return: Function validator(payload, strict=False, warnings=None) returning the list of error messages
+             (empty if valid). Unknown fields are errors if `strict`, otherwise appended to `warnings`.
+    """
+    name = schema if schema in SCHEMAS else _VPG_SETTINGS_NAMESPACE + schema
+    validator = _validators.get(name)
+    if validator is None:
+        if name not in SCHEMAS:
+            raise KeyError(f"Unknown schema {schema!r}")
+        with _compile_lock:
+            validate = _compile_reference(name, _compiled)
+
+            def validator(payload, strict=False, warnings=None):
+                errors = []
+                if strict:
+                    unknown = errors
+                else:
+                    unknown = warnings if warnings is not None else []
+                validate(payload, '', '', errors, unknown)
+                return errors
+            validator = _validators.setdefault(name, validator)
+    return validator
+
+
+def validate_vpg_settings(payload, strict=False, warnings=None):
+    """
+    Validate a full VPG settings payload (Basic, Journal, Recovery, Networks, ...); returns all errors.
+    Unknown fields are errors if `strict`, otherwise they are appended to the `warnings` list if given.
+    """
+    return get_validator(VPG_SETTINGS_SCHEMA)(payload, strict, warnings)
+
+
+def check_vpg_settings(payload, strict=False):
+    """
+    Raise ZVMAValidationError listing every problem if `payload` is not a valid VPG settings payload.
+    Unless `strict`, unknown fields are logged as warnings and the payload is still accepted.
+    """
+    warnings = []
+    errors = validate_vpg_settings(payload, strict, warnings)
+    if warnings:
+        logger.warning("Fields not in the VPG settings schema, sent as is: %s", "; ".join(warnings))
+    if errors:
+        raise ZVMAValidationError("Invalid VPG settings payload", errors)
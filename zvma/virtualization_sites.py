@@ -9,9 +9,10 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
 
+logger = logging.getLogger(__name__)
+
 class VirtualizationSites:
     def __init__(self, client):
         self.client = client
@@ -31,33 +32,13 @@ class VirtualizationSites:
         Returns:
             dict or list: Site details if site_identifier is provided, otherwise array of all sites
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites"
         if site_identifier:
-            url = f"{url}/{site_identifier}"
-            logging.info(f"VirtualizationSites.get_virtualization_sites: Fetching site {site_identifier}...")
+            logger.info("VirtualizationSites.get_virtualization_sites: Fetching site %s...", site_identifier)
+            response = self.client.api.get_virtualization_site(site_identifier)
         else:
-            logging.info("VirtualizationSites.get_virtualization_sites: Fetching all virtualization sites...")
-
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise 
+            logger.info("VirtualizationSites.get_virtualization_sites: Fetching all virtualization sites...")
+            response = self.client.api.get_virtualization_site_all()
+        return response.json()
 
     def get_virtualization_site_vms(self, site_identifier):
         """
@@ -75,28 +56,28 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/vms"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_vms: Fetching VMs for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise 
+        logger.info("VirtualizationSites.get_virtualization_site_vms: Fetching VMs for site %s...", site_identifier)
+        response = self.client.api.get_virtualization_site_vm_all(site_identifier)
+        return response.json()
+
+    def iter_virtualization_site_vms(self, site_identifier):
+        """
+        Iterate over the unprotected VMs of the specified site one at a time. (Auth)
+
+        Streaming variant of get_virtualization_site_vms: the response is parsed incrementally,
+        so memory use stays flat however many VMs the site has.
+
+        Args:
+            site_identifier (str): The identifier of the site to get VMs from.
+
+        Yields:
+            dict: One unprotected VM at a time
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        logger.info("VirtualizationSites.iter_virtualization_site_vms: Streaming VMs for site %s...", site_identifier)
+        return self.client.api.iter_json('get_virtualization_site_vm_all', site_identifier)
 
     def get_virtualization_site_vcd_vapps(self, site_identifier):
         """
@@ -114,28 +95,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/vcdvapps"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_vcd_vapps: Fetching VCD vApps for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_vcd_vapps: Fetching VCD vApps for site %s...",
+                    site_identifier)
+        response = self.client.api.get_virtualization_site_vm_vcd_vapp_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_datastores(self, site_identifier):
         """
@@ -153,28 +116,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/datastores"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_datastores: Fetching datastores for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_datastores: Fetching datastores for site %s...",
+                    site_identifier)
+        response = self.client.api.get_virtualization_site_datastore_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_folders(self, site_identifier):
         """
@@ -192,28 +137,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/folders"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_folders: Fetching folders for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_folders: Fetching folders for site %s...",
+                    site_identifier)
+        response = self.client.api.get_virtualization_site_folder_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_datastore_clusters(self, site_identifier):
         """
@@ -231,28 +158,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/datastoreclusters"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_datastore_clusters: Fetching datastore clusters for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_datastore_clusters: Fetching datastore clusters for site %s...",
+                    site_identifier)
+        response = self.client.api.get_virtualization_site_datastore_cluster_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_resource_pools(self, site_identifier):
         """
@@ -270,28 +179,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/resourcepools"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_resource_pools: Fetching resource pools for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_resource_pools: Fetching resource pools for site %s...",
+                    site_identifier)
+        response = self.client.api.get_virtualization_site_resource_pool_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_org_vdcs(self, site_identifier):
         """
@@ -309,28 +200,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/orgvdcs"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_org_vdcs: Fetching org VDCs for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_org_vdcs: Fetching org VDCs for site %s...",
+                    site_identifier)
+        response = self.client.api.get_virtualization_site_org_vdc_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_networks(self, site_identifier):
         """
@@ -348,28 +221,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/networks"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_networks: Fetching networks for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_networks: Fetching networks for site %s...",
+                    site_identifier)
+        response = self.client.api.get_virtualization_site_network_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_hosts(self, site_identifier, host_identifier=None):
         """
@@ -390,33 +245,15 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/hosts"
         if host_identifier:
-            url = f"{url}/{host_identifier}"
-            logging.info(f"VirtualizationSites.get_virtualization_site_hosts: Fetching host {host_identifier} from site {site_identifier}...")
+            logger.info("VirtualizationSites.get_virtualization_site_hosts: Fetching host %s from site %s...",
+                        host_identifier, site_identifier)
+            response = self.client.api.get_virtualization_site_host(site_identifier, host_identifier)
         else:
-            logging.info(f"VirtualizationSites.get_virtualization_site_hosts: Fetching all hosts for site {site_identifier}...")
-
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+            logger.info("VirtualizationSites.get_virtualization_site_hosts: Fetching all hosts for site %s...",
+                        site_identifier)
+            response = self.client.api.get_virtualization_site_host_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_repositories(self, site_identifier):
         """
@@ -434,28 +271,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/repositories"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_repositories: Fetching repositories for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_repositories: Fetching repositories for site %s...",
+                    site_identifier)
+        response = self.client.api.get_virtualization_site_repository_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_host_clusters(self, site_identifier):
         """
@@ -473,28 +292,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/hostclusters"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_host_clusters: Fetching host clusters for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_host_clusters: Fetching host clusters for site %s...",
+                    site_identifier)
+        response = self.client.api.get_virtualization_site_host_cluster_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_org_vdc_networks(self, site_identifier, org_vdc_identifier):
         """
@@ -513,28 +314,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/orgvdcs/{org_vdc_identifier}/networks"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_org_vdc_networks: Fetching networks for org VDC {org_vdc_identifier} in site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_org_vdc_networks: Fetching networks for org VDC %s in site %s...",
+                    org_vdc_identifier, site_identifier)
+        response = self.client.api.get_virtualization_site_org_vdc_network_all(site_identifier, org_vdc_identifier)
+        return response.json()
 
     def get_virtualization_site_org_vdc_storage_policies(self, site_identifier, org_vdc_identifier):
         """
@@ -553,28 +336,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/orgvdcs/{org_vdc_identifier}/storagepolicies"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_org_vdc_storage_policies: Fetching storage policies for org VDC {org_vdc_identifier} in site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_org_vdc_storage_policies: Fetching storage policies for org VDC %s in site %s...",
+                    org_vdc_identifier, site_identifier)
+        response = self.client.api.get_virtualization_site_storage_policy_all(site_identifier, org_vdc_identifier)
+        return response.json()
 
     def get_virtualization_site_devices(self, site_identifier, host_identifier=None, device_name=None):
         """
@@ -598,36 +363,11 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/devices"
-        
-        # Add query parameters if provided
-        params = {}
-        if host_identifier:
-            params['hostIdentifier'] = host_identifier
-        if device_name:
-            params['deviceName'] = device_name
-            
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_devices: Fetching devices for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_devices: Fetching devices for site %s...",
+                    site_identifier)
+        response = self.client.api.get_virtualization_site_device_all(
+            site_identifier, host_identifier=host_identifier or None, device_name=device_name or None)
+        return response.json()
 
     def get_virtualization_site_public_cloud_networks(self, site_identifier):
         """
@@ -645,28 +385,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/publiccloud/virtualNetworks"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_public_cloud_networks: Fetching public cloud virtual networks for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_public_cloud_networks: Fetching public cloud virtual networks for site %s...",
+                    site_identifier)
+        response = self.client.api.get_public_cloud_network_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_public_cloud_subnets(self, site_identifier):
         """
@@ -684,28 +406,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/publiccloud/subnets"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_public_cloud_subnets: Fetching public cloud subnets for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_public_cloud_subnets: Fetching public cloud subnets for site %s...",
+                    site_identifier)
+        response = self.client.api.get_public_cloud_subnet_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_public_cloud_security_groups(self, site_identifier):
         """
@@ -723,28 +427,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/publiccloud/securityGroups"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_public_cloud_security_groups: Fetching public cloud security groups for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_public_cloud_security_groups: Fetching public cloud security groups for site %s...",
+                    site_identifier)
+        response = self.client.api.get_public_cloud_security_group_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_public_cloud_vm_instance_types(self, site_identifier):
         """
@@ -762,28 +448,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/publiccloud/vmInstanceTypes"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_public_cloud_vm_instance_types: Fetching VM instance types for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_public_cloud_vm_instance_types: Fetching VM instance types for site %s...",
+                    site_identifier)
+        response = self.client.api.get_public_cloud_vm_instance_type_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_public_cloud_resource_groups(self, site_identifier):
         """
@@ -801,28 +469,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/publiccloud/resourceGroups"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_public_cloud_resource_groups: Fetching resource groups for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_public_cloud_resource_groups: Fetching resource groups for site %s...",
+                    site_identifier)
+        response = self.client.api.get_public_cloud_resource_groups_all(site_identifier)
+        return response.json()
 
     def get_virtualization_site_public_cloud_keys_containers(self, site_identifier):
         """
@@ -840,28 +490,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/publiccloud/keyscontainers"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_public_cloud_keys_containers: Fetching keys containers for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_public_cloud_keys_containers: Fetching keys containers for site %s...",
+                    site_identifier)
+        response = self.client.api.get_public_cloud_keys_containers(site_identifier)
+        return response.json()
 
     def get_virtualization_site_public_cloud_encryption_keys(self, site_identifier, encryption_key_id=None):
         """
@@ -882,33 +514,15 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/publiccloud/encryptionkeys"
         if encryption_key_id:
-            url = f"{url}/{encryption_key_id}"
-            logging.info(f"VirtualizationSites.get_virtualization_site_public_cloud_encryption_keys: Fetching encryption key {encryption_key_id} for site {site_identifier}...")
+            logger.info("VirtualizationSites.get_virtualization_site_public_cloud_encryption_keys: Fetching encryption key %s for site %s...",
+                        encryption_key_id, site_identifier)
+            response = self.client.api.get_public_cloud_encryption_key(site_identifier, encryption_key_id)
         else:
-            logging.info(f"VirtualizationSites.get_virtualization_site_public_cloud_encryption_keys: Fetching all encryption keys for site {site_identifier}...")
-
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+            logger.info("VirtualizationSites.get_virtualization_site_public_cloud_encryption_keys: Fetching all encryption keys for site %s...",
+                        site_identifier)
+            response = self.client.api.get_public_cloud_encryption_keys_all(site_identifier, None)
+        return response.json()
 
     def get_virtualization_site_public_cloud_managed_identities(self, site_identifier):
         """
@@ -926,28 +540,10 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/publiccloud/managedidentities"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_public_cloud_managed_identities: Fetching managed identities for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VirtualizationSites.get_virtualization_site_public_cloud_managed_identities: Fetching managed identities for site %s...",
+                    site_identifier)
+        response = self.client.api.get_public_cloud_managed_identities(site_identifier)
+        return response.json()
 
     def get_virtualization_site_public_cloud_disk_encryption_keys(self, site_identifier):
         """
@@ -965,25 +561,7 @@ class VirtualizationSites:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/virtualizationsites/{site_identifier}/publiccloud/diskencryptionkeys"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VirtualizationSites.get_virtualization_site_public_cloud_disk_encryption_keys: Fetching disk encryption keys for site {site_identifier}...")
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
\ No newline at end of file
+        logger.info("VirtualizationSites.get_virtualization_site_public_cloud_disk_encryption_keys: Fetching disk encryption keys for site %s...",
+                    site_identifier)
+        response = self.client.api.get_public_cloud_disk_encryption_keys(site_identifier)
+        return response.json()
\ No newline at end of file
@@ -9,9 +9,12 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
-import json
+from . import models
+from .lazy import lazy_response
+from .log import log_payload
+
+logger = logging.getLogger(__name__)
 
 class VMs:
     def __init__(self, client):
@@ -21,7 +24,8 @@ class VMs:
                  
                  protected_site_type=None, recovery_site_type=None, protected_site_identifier=None, 
                  recovery_site_identifier=None, organization_name=None, priority=None, 
-                 vpg_identifier=None, include_backuped_vms=None, include_mounted_vms=True):
+                 vpg_identifier=None, include_backuped_vms=None, include_mounted_vms=True, as_models=False,
+                 lazy=False):
         """
         Get information about protected virtual machines. If vm_identifier is provided,
         returns details about a specific VM, otherwise returns a filtered list of VMs. (Auth)
@@ -41,6 +45,10 @@ class VMs:
             vpg_identifier (str, optional): The identifier of the VPG (used with vm_identifier)
             include_backuped_vms (bool, optional): Include VMs in backup targets
             include_mounted_vms (bool, optional): Include mounted VMs in the response
+            as_models (bool, optional): Return zvma.models.VM instances instead of dicts
+            lazy (bool, optional): Return a zvma.lazy.LazyList (or LazyRecord) over the raw response that
+                decodes fields only when they are read. Saves memory on very large responses but is slower
+                than a full decode, so leave it off unless memory is the problem
         
         Returns:
             dict or list: Details of a specific VM if vm_identifier is provided,
@@ -49,60 +57,58 @@ class VMs:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        # Build the URL based on whether we're getting a specific VM or listing VMs
-        base_url = f"https://{self.client.zvm_address}/v1/vms"
-        url = f"{base_url}/{vm_identifier}" if vm_identifier else base_url
-        
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        # Build params based on whether we're getting a specific VM or listing VMs
+        operation, args, kwargs = self._list_vms_call(
+            vm_identifier=vm_identifier, vpg_name=vpg_name, vm_name=vm_name, status=status,
+            sub_status=sub_status, protected_site_type=protected_site_type, recovery_site_type=recovery_site_type,
+            protected_site_identifier=protected_site_identifier, recovery_site_identifier=recovery_site_identifier,
+            organization_name=organization_name, priority=priority, vpg_identifier=vpg_identifier,
+            include_backuped_vms=include_backuped_vms, include_mounted_vms=include_mounted_vms)
+        response = getattr(self.client.api, operation)(*args, **kwargs)
+        if lazy:
+            return lazy_response(response.content, self.client.transport.codec.loads)
+        return models.convert(models.VM, response.json()) if as_models else response.json()
+
+    def iter_vms(self, as_models=False, **filters):
+        """
+        Iterate over protected virtual machines one at a time. (Auth)
+
+        Streaming variant of list_vms for large sites: the response is parsed incrementally,
+        so memory use stays flat however many VMs the site protects.
+
+        Args:
+            as_models (bool, optional): Yield zvma.models.VM instances instead of dicts
+            **filters: The same keyword arguments as list_vms
+
+        Yields:
+            dict: One protected VM at a time
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        operation, args, kwargs = self._list_vms_call(**filters)
+        vms = self.client.api.iter_json(operation, *args, **kwargs)
+        return map(models.VM.from_dict, vms) if as_models else vms
+
+    def _list_vms_call(self, vm_identifier=None, vpg_name=None, vm_name=None, status=None, sub_status=None,
+                       protected_site_type=None, recovery_site_type=None, protected_site_identifier=None,
+                       recovery_site_identifier=None, organization_name=None, priority=None,
+                       vpg_identifier=None, include_backuped_vms=None, include_mounted_vms=True):
+        """Return the client.api operation, positional and keyword arguments for list_vms/iter_vms."""
+        # A specific VM or a filtered list of VMs
         if vm_identifier:
-            params = {
-                'vpgIdentifier': vpg_identifier,
-                'includeBackupedVms': include_backuped_vms,
-                'includeMountedVms': include_mounted_vms
-            }
-            log_msg = f"VMs.list_vms: Fetching VM {vm_identifier}"
-        else:
-            params = {
-                'vpgName': vpg_name,
-                'vmName': vm_name,
-                'status': status,
-                'subStatus': sub_status,
-                'protectedSiteType': protected_site_type,
-                'recoverySiteType': recovery_site_type,
-                'protectedSiteIdentifier': protected_site_identifier,
-                'recoverySiteIdentifier': recovery_site_identifier,
-                'organizationName': organization_name,
-                'priority': priority,
-                'vmIdentifier': vm_identifier,
-                'includeBackupedVms': include_backuped_vms,
-                'includeMountedVms': include_mounted_vms
-            }
-            log_msg = "VMs.list_vms: Fetching VMs"
-        
-        # Remove None values from params
-        params = {k: v for k, v in params.items() if v is not None}
-        
-        logging.info(f"{log_msg} with params: {params}")
-        try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+            logger.info("VMs.list_vms: Fetching VM %s with vpg_identifier=%s, include_backuped_vms=%s, include_mounted_vms=%s",
+                        vm_identifier, vpg_identifier, include_backuped_vms, include_mounted_vms)
+            return 'get_vm', (vm_identifier,), {
+                'vpg_identifier': vpg_identifier, 'include_backuped_vms': include_backuped_vms,
+                'include_mounted_vms': include_mounted_vms}
+        kwargs = {
+            'vpg_name': vpg_name, 'vm_name': vm_name, 'status': status, 'sub_status': sub_status,
+            'protected_site_type': protected_site_type, 'recovery_site_type': recovery_site_type,
+            'protected_site_identifier': protected_site_identifier, 'recovery_site_identifier': recovery_site_identifier,
+            'organization_name': organization_name, 'priority': priority,
+            'include_backuped_vms': include_backuped_vms, 'include_mounted_vms': include_mounted_vms}
+        logger.info("VMs.list_vms: Fetching VMs with filters: %s", {k: v for k, v in kwargs.items() if v is not None})
+        return 'get_vm_all', (), kwargs
 
     def restore_vm(self, vm_identifier, vpg_identifier, restored_vm_name, checkpoint_identifier, 
                   journal_vm_restore_settings, commit_policy=0, shutdown_policy=0, 
@@ -156,12 +162,6 @@ class VMs:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/vms/{vm_identifier}/Restore"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
         data = {
             "vpgIdentifier": vpg_identifier,
             "restoredVmName": restored_vm_name,
@@ -171,23 +171,10 @@ class VMs:
             "timeToWaitBeforeContinueInSeconds": time_to_wait_before_continue_in_seconds,
             "journalVMRestoreSettings": journal_vm_restore_settings
         }
-        logging.info(f"VMs.restore_vm: Restoring VM {vm_identifier} from checkpoint {checkpoint_identifier}")
-        logging.info(f"VMs.restore_vm: Data: {json.dumps(data, indent=2)}")
-        try:
-            response = requests.post(url, headers=headers, json=data, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json() if response.content else None
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VMs.restore_vm: Restoring VM %s from checkpoint %s", vm_identifier, checkpoint_identifier)
+        log_payload(logger, "VMs.restore_vm: Data: %s", data)
+        response = self.client.api.restore_vm(vm_identifier, body=data)
+        return response.json() if response.content else None
 
     def restore_vm_commit(self, vm_identifier):
         """
@@ -202,28 +189,9 @@ class VMs:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/vms/{vm_identifier}/RestoreCommit"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VMs.restore_vm_commit: Committing restored VM {vm_identifier}")
-        try:
-            response = requests.post(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json() if response.content else None
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VMs.restore_vm_commit: Committing restored VM %s", vm_identifier)
+        response = self.client.api.commit_vm(vm_identifier)
+        return response.json() if response.content else None
 
     def restore_vm_rollback(self, vm_identifier):
         """
@@ -238,28 +206,9 @@ class VMs:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/vms/{vm_identifier}/RestoreRollback"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        logging.info(f"VMs.restore_vm_rollback: Rolling back restored VM {vm_identifier}")
-        try:
-            response = requests.post(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json() if response.content else None
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VMs.restore_vm_rollback: Rolling back restored VM %s", vm_identifier)
+        response = self.client.api.rollback_vm(vm_identifier)
+        return response.json() if response.content else None
 
     def list_vm_points_in_time(self, vm_identifier, vpg_identifier=None, start_date=None, end_date=None):
         """
@@ -277,36 +226,10 @@ class VMs:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/vms/{vm_identifier}/pointsInTime"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        params = {
-            'vpgIdentifier': vpg_identifier,
-            'startDate': start_date,
-            'endDate': end_date
-        }
-        # Remove None values from params
-        params = {k: v for k, v in params.items() if v is not None}
-        
-        logging.info(f"VMs.list_vm_points_in_time: Fetching points in time for VM {vm_identifier}")
-        try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VMs.list_vm_points_in_time: Fetching points in time for VM %s", vm_identifier)
+        response = self.client.api.points_in_time(vm_identifier, vpg_identifier=vpg_identifier,
+                                                  start_date=start_date, end_date=end_date)
+        return response.json()
 
     def list_vm_points_in_time_stats(self, vm_identifier, vpg_identifier=None):
         """
@@ -323,27 +246,6 @@ class VMs:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/vms/{vm_identifier}/pointsInTime/stats"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        params = {'vpgIdentifier': vpg_identifier} if vpg_identifier else {}
-        
-        logging.info(f"VMs.list_vm_points_in_time_stats: Fetching points in time stats for VM {vm_identifier}")
-        try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
\ No newline at end of file
+        logger.info("VMs.list_vm_points_in_time_stats: Fetching points in time stats for VM %s", vm_identifier)
+        response = self.client.api.points_in_time_stats(vm_identifier, vpg_identifier=vpg_identifier or None)
+        return response.json()
\ No newline at end of file
@@ -1,6 +1,6 @@
-import requests
 import logging
-import json
+
+logger = logging.getLogger(__name__)
 
 class Volumes:
     def __init__(self, client):
@@ -25,35 +25,27 @@ class Volumes:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/volumes"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        params = {
-            'volumeType': volume_type,
-            'vpgIdentifier': vpg_identifier,
-            'datastoreIdentifier': datastore_identifier,
-            'protectedVmIdentifier': protected_vm_identifier,
-            'owningVmIdentifier': owning_vm_identifier
-        }
-        # Remove None values from params
-        params = {k: v for k, v in params.items() if v is not None}
-        
-        logging.info("Volumes.list_volumes: Fetching volumes information")
-        try:
-            response = requests.get(url, headers=headers, params=params, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise 
\ No newline at end of file
+        logger.info("Volumes.list_volumes: Fetching volumes information")
+        response = self.client.api.get_volume_all(
+            volume_type=volume_type, vpg_identifier=vpg_identifier, datastore_identifier=datastore_identifier,
+            protected_vm_identifier=protected_vm_identifier, owning_vm_identifier=owning_vm_identifier)
+        return response.json()
+
+    def iter_volumes(self, **filters):
+        """
+        Iterate over volumes one at a time. (Auth)
+
+        Streaming variant of list_volumes: the response is parsed incrementally,
+        so memory use stays flat however many volumes the site has.
+
+        Args:
+            **filters: The same keyword arguments as list_volumes
+
+        Yields:
+            dict: One volume information object at a time
+
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+        """
+        logger.info("Volumes.iter_volumes: Streaming volumes information")
+        return self.client.api.iter_json('get_volume_all', **filters)
@@ -9,13 +9,18 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
 import time
-import json
 from .tasks import Tasks
+from . import models, tracing
+from .lazy import LazyList, lazy_response
+from .log import log_payload
+from .validation import check_vpg_settings
+from .priority import RequestPriority, with_priority
 from .common import ZertoVPGStatus, ZertoVPGSubstatus, ZertoProtectedSiteType, ZertoRecoverySiteType, ZertoVPGPriority
-from typing import Optional, Union, Dict, List
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
 
 class VPGs:
     def __init__(self, client):
@@ -35,7 +40,9 @@ class VPGs:
                   zorg_identifier: str = None,
                   priority: ZertoVPGPriority = None,
                   service_profile_identifier: str = None,
-                  backup_enabled: bool = None) -> Dict | List[Dict]:
+                  backup_enabled: bool = None,
+                  as_models: bool = False,
+                  lazy: bool = False) -> Dict | List[Dict]:
         """
         Get information about VPGs. If vpg_identifier or vpg_name is provided, returns a single VPG.
         Otherwise, returns a list of VPGs that match the filter criteria.
@@ -54,146 +61,122 @@ class VPGs:
             priority: Filter by VPG priority
             service_profile_identifier: Filter by service profile ID
             backup_enabled: Deprecated parameter
+            as_models: Return zvma.models.VPG instances instead of dicts
+            lazy: Return a zvma.lazy.LazyList (or LazyRecord) over the raw response that decodes fields
+                only when they are read. Saves memory on very large responses but is slower than a full
+                decode, so leave it off unless memory is the problem
 
         Returns:
             Dict: When vpg_identifier or vpg_name is provided
             List[Dict]: When filtering VPGs without specific identifier
         """
-        # Construct the base URL
-        if vpg_identifier:
-            url = f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}"
-        else:
-            url = f"https://{self.client.zvm_address}/v1/vpgs"
-
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
         # Only include query parameters if we're not getting a specific VPG
         params = {}
         if not vpg_identifier:
             params = {
                 'name': vpg_name,
                 'status': status.get_name_by_value(status.value) if status else None,
-                'subStatus': sub_status.get_name_by_value(sub_status.value) if sub_status else None,
-                'protectedSiteType': protected_site_type.get_name_by_value(protected_site_type.value) if protected_site_type else None,
-                'recoverySiteType': recovery_site_type.get_name_by_value(recovery_site_type.value) if recovery_site_type else None,
-                'protectedSiteIdentifier': protected_site_identifier,
-                'recoverySiteIdentifier': recovery_site_identifier,
-                'organizationName': organization_name,
-                'zorgIdentifier': zorg_identifier,
+                'sub_status': sub_status.get_name_by_value(sub_status.value) if sub_status else None,
+                'protected_site_type': protected_site_type.get_name_by_value(protected_site_type.value) if protected_site_type else None,
+                'recovery_site_type': recovery_site_type.get_name_by_value(recovery_site_type.value) if recovery_site_type else None,
+                'protected_site_identifier': protected_site_identifier,
+                'recovery_site_identifier': recovery_site_identifier,
+                'organization_name': organization_name,
+                'zorg_identifier': zorg_identifier,
                 'priority': priority.get_name_by_value(priority.value) if priority else None,
-                'serviceProfileIdentifier': service_profile_identifier,
-                'backupEnabled': backup_enabled
+                'service_profile_identifier': service_profile_identifier,
+                'backup_enabled': backup_enabled
             }
             # Remove None values from params
             params = {k: v for k, v in params.items() if v is not None}
 
-        logging.info(f"VPGs.list_vpgs: Fetching VPGs with parameters:")
-        if vpg_identifier:
-            logging.info(f"  vpg_identifier: {vpg_identifier}")
-        for key, value in params.items():
-            logging.info(f"  {key}: {value}")
-
-        try:
-            response = requests.get(
-                url, 
-                headers=headers, 
-                params=params, 
-                verify=self.client.verify_certificate,
-                timeout=30
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            # If we're querying by name, return the first matching VPG
-            if vpg_name and isinstance(result, list):
-                matching_vpg = next((vpg for vpg in result if vpg.get("VpgName") == vpg_name), None)
-                if matching_vpg:
-                    logging.info(f"Successfully retrieved VPG details for {vpg_name}")
-                    return matching_vpg
-                logging.warning(f"No VPG found with name {vpg_name}")
-                return {}
-            
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("VPGs.list_vpgs: Fetching VPGs with parameters:")
             if vpg_identifier:
-                logging.info(f"Successfully retrieved VPG details for {vpg_identifier}")
-            else:
-                logging.info(f"Successfully retrieved {len(result)} VPGs")
-            
-            return result
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+                logger.debug("  vpg_identifier: %s", vpg_identifier)
+            for key, value in params.items():
+                logger.debug("  %s: %s", key, value)
 
+        if vpg_identifier:
+            response = self.client.api.get_vpg(vpg_identifier, timeout=30)
+        else:
+            response = self.client.api.get_vpg_all(timeout=30, **params)
+        if lazy:
+            return self.__lazy_vpgs(response, vpg_name)
+        result = response.json()
+        
+        # If we're querying by name, return the first matching VPG
+        if vpg_name and isinstance(result, list):
+            matching_vpg = next((vpg for vpg in result if vpg.get("VpgName") == vpg_name), None)
+            if matching_vpg:
+                logger.debug("Successfully retrieved VPG details for %s", vpg_name)
+                return models.convert(models.VPG, matching_vpg) if as_models else matching_vpg
+            logger.warning("No VPG found with name %s", vpg_name)
+            return {}
+        
+        if vpg_identifier:
+            logger.debug("Successfully retrieved VPG details for %s", vpg_identifier)
+        else:
+            logger.debug("Successfully retrieved %s VPGs", len(result))
+        
+        return models.convert(models.VPG, result) if as_models else result
+
+    def __lazy_vpgs(self, response, vpg_name):
+        result = lazy_response(response.content, self.client.transport.codec.loads)
+        if vpg_name and isinstance(result, LazyList):
+            names = result.column("VpgName")
+            if vpg_name in names:
+                return result[names.index(vpg_name)]
+            logger.warning("No VPG found with name %s", vpg_name)
+            return {}
+        return result
+
+    @tracing.traced
     def commit_vpg(self, vpg_settings_id, vpg_name, sync=False, expected_status=ZertoVPGStatus.Initializing, timeout=30, interval=5):
-        logging.info(f'VPGs.commit_vpg(zvm_address={self.client.zvm_address}, vpg_settings_id={vpg_settings_id}, vpg_name={vpg_name}, sync={sync})')
-        commit_uri = f"https://{self.client.zvm_address}/v1/vpgSettings/{vpg_settings_id}/commit"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        try:
-            response = requests.post(commit_uri, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            task_id = response.json()
-            logging.info(f"VPGSettings {vpg_settings_id} successfully committed, {vpg_name} is created, task_id={task_id}")
-
-            if sync:
-                # Wait for task completion
-                self.tasks.wait_for_task_completion(task_id, timeout=timeout, interval=interval)
-                logging.debug('sleeping 5 seconds ...')
-                self.wait_for_vpg_ready(vpg_name=vpg_name, timeout=30, interval=5, expected_status=expected_status)
-                return task_id
+        logger.debug('VPGs.commit_vpg(zvm_address=%s, vpg_settings_id=%s, vpg_name=%s, sync=%s)',
+                     self.client.zvm_address, vpg_settings_id, vpg_name, sync)
+        response = self.client.api.start_vpg_setting_commit(vpg_settings_id)
+        task_id = response.json()
+        logger.info("VPGSettings %s successfully committed, %s is created, task_id=%s",
+                    vpg_settings_id, vpg_name, task_id)
+
+        if sync:
+            # Wait for task completion
+            self.tasks.wait_for_task_completion(task_id, timeout=timeout, interval=interval)
+            logger.debug('sleeping 5 seconds ...')
+            self.wait_for_vpg_ready(vpg_name=vpg_name, timeout=30, interval=5, expected_status=expected_status)
             return task_id
+        return task_id
 
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
-
+    @tracing.traced
     def create_vpg(self, basic, journal, recovery, networks, sync=True, status: ZertoVPGStatus = ZertoVPGStatus.Initializing, timeout=30, interval=5):
         vpg_name = basic.get("Name")
-        logging.info(f'VPGs.create_vpg(zvm_address={self.client.zvm_address}, vpg_name={vpg_name}, sync={sync})')
+        logger.info('VPGs.create_vpg(zvm_address=%s, vpg_name=%s, sync=%s)', self.client.zvm_address, vpg_name, sync)
         vpg_settings_id = self.create_vpg_settings(basic, journal, recovery, networks, vpg_identifier=None)
         return self.commit_vpg(vpg_settings_id, vpg_name, sync, expected_status=status, timeout=timeout, interval=interval)
 
+    @tracing.traced
     def wait_for_vpg_ready(self, vpg_name, timeout=180, interval=5, expected_status=ZertoVPGStatus.Initializing):
-        logging.debug(f'VPGs.wait_for_vpg_ready(zvm_address={self.client.zvm_address}, vpg_name={vpg_name}, timeout={timeout}, interval={interval}, expected_status={ZertoVPGStatus.get_name_by_value(expected_status.value)})')
+        logger.debug('VPGs.wait_for_vpg_ready(zvm_address=%s, vpg_name=%s, timeout=%s, interval=%s, expected_status=%s)',
+                     self.client.zvm_address, vpg_name, timeout, interval, ZertoVPGStatus.get_name_by_value(expected_status.value))
         start_time = time.time()
 
+        iteration = 0
         while True:
-            time.sleep(interval)
-            vpg_info = self.list_vpgs(vpg_name=vpg_name)
+            tracing.sleep(interval)
+            iteration += 1
+            with tracing.span('VPGs.wait_for_vpg_ready.poll', **{'zvma.vpg_name': vpg_name, 'zvma.poll.iteration': iteration}):
+                vpg_info = self.list_vpgs(vpg_name=vpg_name)
             # get status and convert string into enum
-            logging.debug(f"VPG status: {vpg_info.get('Status')}")
+            logger.debug("VPG status: %s", vpg_info.get('Status'))
             vpg_status: ZertoVPGStatus = ZertoVPGStatus(vpg_info.get("Status"))
-            logging.debug(f"Checking VPG status for {vpg_name}: Expected status = {ZertoVPGStatus.get_name_by_value(expected_status.value)}, Current status = {ZertoVPGStatus.get_name_by_value(vpg_status.value)}")
+            logger.debug("Checking VPG status for %s: Expected status = %s, Current status = %s",
+                         vpg_name, ZertoVPGStatus.get_name_by_value(expected_status.value), ZertoVPGStatus.get_name_by_value(vpg_status.value))
 
             # If VPG is in the expected status or passed the Initializing status too quickly and is in another status
             if vpg_status == expected_status or (expected_status == ZertoVPGStatus.Initializing and vpg_status.value > ZertoVPGStatus.Initializing.value):
-                logging.info(f"VPG {vpg_name} is now in the expected state: {ZertoVPGStatus.get_name_by_value(vpg_status.value)}")
+                logger.info("VPG %s is now in the expected state: %s",
+                            vpg_name, ZertoVPGStatus.get_name_by_value(vpg_status.value))
                 return vpg_info
 
             # Check if the timeout has been reached
@@ -202,89 +185,44 @@ class VPGs:
                 raise TimeoutError(f"VPG {vpg_name} did not reach the {ZertoVPGStatus.get_name_by_value(expected_status.value)} state within the allotted time. Current status: {ZertoVPGStatus.get_name_by_value(vpg_status.value)}")
 
     def add_vm_to_vpg(self, vpg_name, vm_list_payload):
-        logging.info(f'VPGs.add_vm_to_vpg(zvm_address={self.client.zvm_address}, vpg_name={vpg_name})')
+        logger.info('VPGs.add_vm_to_vpg(zvm_address=%s, vpg_name=%s)', self.client.zvm_address, vpg_name)
         vpg = self.list_vpgs(vpg_name=vpg_name)
         
         if not vpg:
-            logging.error(f"VPG with name '{vpg_name}' not found.")
+            logger.error("VPG with name '%s' not found.", vpg_name)
             return
 
         vpg_identifier = vpg['VpgIdentifier']
-        logging.info(f"Found VPG '{vpg_name}' with Identifier: {vpg_identifier}")
+        logger.info("Found VPG '%s' with Identifier: %s", vpg_name, vpg_identifier)
 
         new_vpg_settings_id = self.create_vpg_settings(basic=None, journal=None, recovery=None, networks=None, vpg_identifier=vpg_identifier)
 
-        logging.info(f"Adding VMs to VPGSettings ID: {new_vpg_settings_id}")
-        logging.debug(f"VM List Payload: {json.dumps(vm_list_payload, indent=4)}")
-        vms_uri = f"https://{self.client.zvm_address}/v1/vpgSettings/{new_vpg_settings_id}/vms"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        try:
-            response = requests.post(vms_uri, headers=headers, json=vm_list_payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            logging.info(f"Successfully added VMs to VPG {new_vpg_settings_id}.")
-            self.commit_vpg(new_vpg_settings_id, vpg_name, sync=True, expected_status=ZertoVPGStatus.Initializing)
-            return 
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        logger.info("Adding VMs to VPGSettings ID: %s", new_vpg_settings_id)
+        log_payload(logger, "VM List Payload: %s", vm_list_payload)
+        response = self.client.api.new_vpg_setting_vm(new_vpg_settings_id, body=vm_list_payload)
+        logger.info("Successfully added VMs to VPG %s.", new_vpg_settings_id)
+        self.commit_vpg(new_vpg_settings_id, vpg_name, sync=True, expected_status=ZertoVPGStatus.Initializing)
+        return 
 
     def remove_vm_from_vpg(self, vpg_name, vm_identifier):
-        logging.info(f'VPGs.remove_vm_from_vpg(zvm_address={self.client.zvm_address}, vpg_name={vpg_name}, vm_identifier={vm_identifier})')
+        logger.info('VPGs.remove_vm_from_vpg(zvm_address=%s, vpg_name=%s, vm_identifier=%s)',
+                    self.client.zvm_address, vpg_name, vm_identifier)
         vpg = self.list_vpgs(vpg_name=vpg_name)
 
         if not vpg:
-            logging.error(f"VPG with name '{vpg_name}' not found.")
+            logger.error("VPG with name '%s' not found.", vpg_name)
             return
 
         vpg_id = vpg['VpgIdentifier']
-        logging.info(f"Found VPG '{vpg_name}' with Identifier: {vpg_id}")
+        logger.info("Found VPG '%s' with Identifier: %s", vpg_name, vpg_id)
 
         new_vpg_settings_id = self.create_vpg_settings(basic=None, journal=None, recovery=None, networks=None, vpg_identifier=vpg_id)
-        remove_vm_uri = f"https://{self.client.zvm_address}/v1/vpgSettings/{new_vpg_settings_id}/vms/{vm_identifier}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        try:
-            response = requests.delete(remove_vm_uri, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            logging.info(f"VM {vm_identifier} successfully removed from VPG '{vpg_name}' (ID: {new_vpg_settings_id}).")
-            self.commit_vpg(new_vpg_settings_id, vpg_name, sync=True, expected_status=ZertoVPGStatus.Initializing)
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        response = self.client.api.remove_vpg_setting_vm(new_vpg_settings_id, vm_identifier)
+        logger.info("VM %s successfully removed from VPG '%s' (ID: %s).", vm_identifier, vpg_name, new_vpg_settings_id)
+        self.commit_vpg(new_vpg_settings_id, vpg_name, sync=True, expected_status=ZertoVPGStatus.Initializing)
 
+    @tracing.traced
+    @with_priority(RequestPriority.CRITICAL)
     def failover_test(self, vpg_name, checkpoint_identifier=None, vm_name_list=None, sync=True):
         """
         Initiate a failover test for a given VPG by its name.
@@ -295,18 +233,13 @@ class VPGs:
         :param options: Optional parameters for the failover test.
         :return: Response from the Zerto API.
         """
-        logging.info(f'VPGs.failover_test(zvm_address={self.client.zvm_address}, vpg_name={vpg_name}, checkpoint_identifier={checkpoint_identifier}, vm_name_list={vm_name_list}, sync={sync})')
+        logger.info('VPGs.failover_test(zvm_address=%s, vpg_name=%s, checkpoint_identifier=%s, vm_name_list=%s, sync=%s)',
+                    self.client.zvm_address, vpg_name, checkpoint_identifier, vm_name_list, sync)
 
         # Retrieve the VPG identifier using the VPG name
         vpg_info = self.list_vpgs(vpg_name=vpg_name)
         vpg_identifier = vpg_info['VpgIdentifier']
-        logging.debug(f"Found VPG '{vpg_name}' with Identifier: {vpg_identifier}")
-
-        url = f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}/FailoverTest"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
+        logger.debug("Found VPG '%s' with Identifier: %s", vpg_name, vpg_identifier)
 
         payload = {}
         if checkpoint_identifier: payload['CheckpointIdentifier'] = checkpoint_identifier
@@ -317,41 +250,25 @@ class VPGs:
             for vm in vm_name_list:
                 vm_info = self.list_vms(vm_name=vm)
                 if not vm_info:
-                    logging.error (f'failover_test vm={vm} not found')
+                    logger.error('failover_test vm=%s not found', vm)
                     return
                 vm_identifier_list.append(vm_info[0]['VmIdentifier'])
         
         payload['VmIdentifiers'] = vm_identifier_list
 
-        try:
-            logging.info(f"Initiating failover test for VPG '{vpg_name}', payload={payload}")
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            task_id = response.json()
-
-            logging.info(f"Failover test initiated for VPG {vpg_name}, task_id = {task_id}")
-
-            if sync:
-                # Wait for task completion
-                self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        logger.info("Initiating failover test for VPG '%s', payload=%s", vpg_name, payload)
+        response = self.client.api.start_vpg_failover_test(vpg_identifier, body=payload)
+        task_id = response.json()
 
+        logger.info("Failover test initiated for VPG %s, task_id = %s", vpg_name, task_id)
+
+        if sync:
+            # Wait for task completion
+            self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
+        return response.json()
+
+    @tracing.traced
+    @with_priority(RequestPriority.CRITICAL)
     def stop_failover_test(self, vpg_name, failoverTestSuccess=True, failoverTestSummary=None, sync=True):
         """
         Stop a failover test for a given VPG by its name.
@@ -360,53 +277,32 @@ class VPGs:
         :param sync: wait until task is completed.
 
         """
-        logging.info(f'VPGs.stop_failover_test(zvm_address={self.client.zvm_address}, vpg_name={vpg_name}, sync={sync})')
+        logger.info('VPGs.stop_failover_test(zvm_address=%s, vpg_name=%s, sync=%s)',
+                    self.client.zvm_address, vpg_name, sync)
 
         # Retrieve the VPG identifier using the VPG name
         vpg_info = self.list_vpgs(vpg_name=vpg_name)
         vpg_identifier = vpg_info['VpgIdentifier']
-        logging.info(f"Found VPG '{vpg_name}' with Identifier: {vpg_identifier}")
-
-        url = f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}/FailoverTestStop"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
+        logger.info("Found VPG '%s' with Identifier: %s", vpg_name, vpg_identifier)
 
         body = {
             "FailoverTestSuccess": failoverTestSuccess,
             "FailoverTestSummary": failoverTestSummary
         }
 
-        try:
-            logging.info(f"Stopping failover test for VPG '{vpg_name}'...")
-            response = requests.post(url, headers=headers, json=body, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            task_id = response.json()
-
-            logging.info(f"Failover test stopping for VPG {vpg_name}, task_id = {task_id}")
-
-            if sync:
-                # Wait for task completion
-                self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        logger.info("Stopping failover test for VPG '%s'...", vpg_name)
+        response = self.client.api.stop_vpg_failover_test(vpg_identifier, body=body)
+        task_id = response.json()
+
+        logger.info("Failover test stopping for VPG %s, task_id = %s", vpg_name, task_id)
 
+        if sync:
+            # Wait for task completion
+            self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
+        return response.json()
+
+    @tracing.traced
+    @with_priority(RequestPriority.CRITICAL)
     def rollback_failover(self, vpg_name, sync=True):
         """
         Rollback failover for a given VPG by its name.
@@ -415,47 +311,24 @@ class VPGs:
         :param sync: wait until task is completed.
 
         """
-        logging.info(f'VPGs.rollback_failover(zvm_address={self.client.zvm_address}, vpg_name={vpg_name}, sync={sync})')
+        logger.info('VPGs.rollback_failover(zvm_address=%s, vpg_name=%s, sync=%s)',
+                    self.client.zvm_address, vpg_name, sync)
 
         # Retrieve the VPG identifier using the VPG name
         vpg_info = self.list_vpgs(vpg_name=vpg_name)
         vpg_identifier = vpg_info['VpgIdentifier']
-        logging.info(f"Found VPG '{vpg_name}' with Identifier: {vpg_identifier}")
+        logger.info("Found VPG '%s' with Identifier: %s", vpg_name, vpg_identifier)
 
-        url = f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}/FailoverRollback"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
+        logger.info("Rollback failover for VPG '%s'...", vpg_name)
+        response = self.client.api.start_vpg_failover_rollback(vpg_identifier)
+        task_id = response.json()
+
+        logger.info("Rollback faolover for VPG %s, task_id = %s", vpg_name, task_id)
 
-        try:
-            logging.info(f"Rollback failover for VPG '{vpg_name}'...")
-            response = requests.post(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            task_id = response.json()
-
-            logging.info(f"Rollback faolover for VPG {vpg_name}, task_id = {task_id}")
-
-            if sync:
-                # Wait for task completion
-                self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
-            return response.json()
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        if sync:
+            # Wait for task completion
+            self.tasks.wait_for_task_completion(task_id, timeout=30, interval=5)
+        return response.json()
 
     def delete_vpg(self, vpg_name, force=False, keep_recovery_volumes=True):
         """
@@ -464,140 +337,67 @@ class VPGs:
         :param vpg_name: The name of the VPG to delete.
         :return: Success message if deleted, else an error message.
         """
-        logging.info(f"VPGs.delete_vpg(zvm_address={self.client.zvm_address}, vpg_name={vpg_name}, force={force}, keep_recovery_volumes={keep_recovery_volumes})")
+        logger.info("VPGs.delete_vpg(zvm_address=%s, vpg_name=%s, force=%s, keep_recovery_volumes=%s)",
+                    self.client.zvm_address, vpg_name, force, keep_recovery_volumes)
 
         # Step 1: Retrieve the VPG details using the VPG name
         vpg = self.list_vpgs(vpg_name=vpg_name)
 
         if not vpg:
-            logging.error(f"No VPG found with the name '{vpg_name}'.")
+            logger.error("No VPG found with the name '%s'.", vpg_name)
             return
 
         # Get the VPG Identifier
         vpg_identifier = vpg.get("VpgIdentifier")
         if not vpg_identifier:
-            logging.error(f"Could not retrieve Identifier for VPG '{vpg_name}'.")
+            logger.error("Could not retrieve Identifier for VPG '%s'.", vpg_name)
             return
 
-        # Step 2: Construct the DELETE request URL
-        delete_vpg_uri = f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}"
-
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
         payload = {
             "keepRecoveryVolumes": force,
             "force": keep_recovery_volumes
         }
 
-        try:
-            # Step 3: Send DELETE request
-            response = requests.delete(delete_vpg_uri, headers=headers, json=payload, verify=self.client.verify_certificate)
-
-            response.raise_for_status()  # Ensure the request was successful
-            logging.info(f"Successfully deleted VPG '{vpg_name}' (ID: {vpg_identifier}).")
-            return f"VPG '{vpg_name}' deleted successfully."
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
+        # Step 2: Send DELETE request
+        response = self.client.api.start_vpg_delete(vpg_identifier, body=payload)
+
+        logger.info("Successfully deleted VPG '%s' (ID: %s).", vpg_name, vpg_identifier)
+        return f"VPG '{vpg_name}' deleted successfully."
 
     # Added methods from VPGSettings
     def list_vpg_settings(self):
-        url = f"https://{self.client.zvm_address}/v1/vpgs/settings"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to list VPG settings: {e}")
-            raise
+        response = self.client.api.get_vpg_setting_all()
+        return response.json()
 
     def get_vpg_settings_by_id(self, vpg_settings_id):
-        url = f"https://{self.client.zvm_address}/v1/vpgSettings/{vpg_settings_id}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to get VPG settings by ID: {e}")
-            raise
-
-    def update_vpg_settings(self, vpg_settings_id, payload):
-        url = f"https://{self.client.zvm_address}/v1/vpgSettings/{vpg_settings_id}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        logging.info(f"VPGs.update_vpg_settings: Updating VPG settings for ID: {vpg_settings_id}")
-        logging.debug(f"VPGs.update_vpg_settings: Payload: {json.dumps(payload, indent=4)}")
-        try:
-            response = requests.put(url, json=payload, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        response = self.client.api.get_vpg_setting(vpg_settings_id)
+        return response.json()
+
+    def update_vpg_settings(self, vpg_settings_id, payload, validate=True, strict=False):
+        """
+        Replace the settings of a VPG settings draft. With `validate`, the payload is checked against
+        the swagger schema first and ZVMAValidationError lists every problem without calling the ZVM.
+        Fields the schema does not declare are only logged as warnings unless `strict`.
+        """
+        if validate:
+            check_vpg_settings(payload, strict)
+        logger.info("VPGs.update_vpg_settings: Updating VPG settings for ID: %s", vpg_settings_id)
+        log_payload(logger, "VPGs.update_vpg_settings: Payload: %s", payload)
+        response = self.client.api.edit_vpg_setting(vpg_settings_id, body=payload)
+        return response
 
     def delete_vpg_settings(self, vpg_settings_id):
-        url = f"https://{self.client.zvm_address}/v1/vpgs/settings/{vpg_settings_id}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
-    def create_vpg_settings(self, basic, journal, recovery, networks, vpg_identifier=None):
-        logging.info(f'VPGs.create_vpg_settings(zvm_address={self.client.zvm_address}, vpg_identifier={vpg_identifier})')
-        vpg_settings_uri = f"https://{self.client.zvm_address}/v1/vpgSettings"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
+        response = self.client.api.remove_vpg_setting(vpg_settings_id)
+        return response.json()
+
+    def create_vpg_settings(self, basic, journal, recovery, networks, vpg_identifier=None, validate=True, strict=False):
+        """
+        Create a VPG settings draft. With `validate`, the payload is checked against the swagger schema
+        first and ZVMAValidationError lists every problem without calling the ZVM, so no draft is left behind.
+        Fields the schema does not declare are only logged as warnings unless `strict`.
+        """
+        logger.info('VPGs.create_vpg_settings(zvm_address=%s, vpg_identifier=%s)',
+                    self.client.zvm_address, vpg_identifier)
 
         payload = {}
         if vpg_identifier:
@@ -610,30 +410,16 @@ class VPGs:
             payload["Recovery"] = recovery
         if networks:
             payload["Networks"] = networks
+        if validate:
+            check_vpg_settings(payload, strict)
+
+        log_payload(logger, "VPGs.create_vpg_settings: Payload: %s", payload)
+        response = self.client.api.new_vpg_setting(body=payload)
+        vpg_settings_id = response.json()
+        logger.info("VPG Settings ID: %s created", vpg_settings_id)
+        return vpg_settings_id
 
-        logging.debug(f"VPGs.create_vpg_settings: Payload: {json.dumps(payload, indent=4)}")
-        try:
-            response = requests.post(vpg_settings_uri, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            vpg_settings_id = response.json()
-            logging.info(f"VPG Settings ID: {vpg_settings_id} created")
-            return vpg_settings_id
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise
-
-    def list_checkpoints(self, vpg_name, start_date=None, endd_date=None, checkpoint_date_str=None, latest=None):
+    def list_checkpoints(self, vpg_name, start_date=None, endd_date=None, checkpoint_date_str=None, latest=None, as_models=False):
         """
         Fetches a list of checkpoints for a specified Virtual Protection Group (VPG).
         
@@ -644,6 +430,7 @@ class VPGs:
             checkpoint_date_str (str): A specific date string in the format 'Month Day, Year HH:MM:SS AM/PM'
                                     (e.g., 'November 13, 2024 1:43:02 PM') to search for an exact checkpoint.
             latest (bool): If True, returns the checkpoint with the most recent timestamp.
+            as_models (bool): Return zvma.models.Checkpoint instances instead of dicts.
 
         Returns:
             dict: A single checkpoint that matches `checkpoint_date_str` or the latest checkpoint if `latest=True`.
@@ -653,54 +440,31 @@ class VPGs:
         Raises:
             SystemExit: If a request exception occurs during the API call.
         """        
-        logging.info(f'VPGs.list_checkpoints(vpg_name={vpg_name}, start_date={start_date}, endd_date={endd_date}, checkpoint_date_str={checkpoint_date_str}, latest={latest})')
+        logger.info('VPGs.list_checkpoints(vpg_name=%s, start_date=%s, endd_date=%s, checkpoint_date_str=%s, latest=%s)',
+                    vpg_name, start_date, endd_date, checkpoint_date_str, latest)
         vpgid = (self.list_vpgs(vpg_name=vpg_name))['VpgIdentifier']
-        vpgs_uri = f"https://{self.client.zvm_address}/v1/vpgs/{vpgid}/checkpoints"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
+        response = self.client.api.get_vpg_checkpoint_all(vpgid, start_date=start_date, end_date=endd_date)
+        checkpoints = response.json()
+
+        if not checkpoints:
+            logger.warning("No checkpoints found.")
+            return []
+
+        if checkpoint_date_str:
+            check_point_timestamp = self.__convert_datetime_to_timestamp(date_str = checkpoint_date_str)
+            matching_checkpoints = next((checkpoint for checkpoint in checkpoints if checkpoint.get("TimeStamp") == check_point_timestamp), None)
+            if not check_point_timestamp:
+                logger.warning("No checkpoint %s found", checkpoint_date_str)
+                return {}
+            return models.convert(models.Checkpoint, matching_checkpoints) if as_models else matching_checkpoints
+        
+        if latest:
+            # Find the checkpoint with the most recent timestamp
+            latest_checkpoint = max(checkpoints, key=lambda x: x.get("TimeStamp"))
+            logger.debug("Latest checkpoint found: %s", latest_checkpoint)
+            return models.convert(models.Checkpoint, latest_checkpoint) if as_models else latest_checkpoint
 
-        params = {
-            "startDate": start_date,
-            "endDate": endd_date
-        }
-        try:
-            response = requests.get(vpgs_uri, headers=headers, params=params, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            checkpoints = response.json()
-
-            if not checkpoints:
-                logging.warning("No checkpoints found.")
-                return []
-
-            if checkpoint_date_str:
-                check_point_timestamp = self.__convert_datetime_to_timestamp(date_str = checkpoint_date_str)
-                matching_checkpoints = next((checkpoint for checkpoint in checkpoints if checkpoint.get("TimeStamp") == check_point_timestamp), None)
-                if not check_point_timestamp:
-                    logging.warning(f"No checkpoint {checkpoint_date_str} found")
-                    return {}
-                return matching_checkpoints
-            
-            if latest:
-                # Find the checkpoint with the most recent timestamp
-                latest_checkpoint = max(checkpoints, key=lambda x: x.get("TimeStamp"))
-                logging.debug(f"Latest checkpoint found: {latest_checkpoint}")
-                return latest_checkpoint  
-
-            return checkpoints
-
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        return models.convert(models.Checkpoint, checkpoints) if as_models else checkpoints
 
     def create_checkpoint(self, checkpoint_name: str, vpg_identifier: str = None, vpg_name: str = None) -> str:
         """
@@ -727,45 +491,18 @@ class VPGs:
             if not vpg:
                 raise ValueError(f"VPG with name '{vpg_name}' not found")
             vpg_identifier = vpg.get('VpgIdentifier')
-            logging.info(f"Found VPG identifier '{vpg_identifier}' for VPG name '{vpg_name}'")
-
-        url = f"https://{self.client.zvm_address}/v1/vpgs/{vpg_identifier}/checkpoints"
-        
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
+            logger.info("Found VPG identifier '%s' for VPG name '%s'", vpg_identifier, vpg_name)
 
         data = {
             "CheckpointName": checkpoint_name
         }
 
-        logging.info(f"VPGs.create_checkpoint: Creating checkpoint '{checkpoint_name}' for VPG {vpg_identifier}")
-
-        try:
-            response = requests.post(
-                url,
-                headers=headers,
-                json=data,
-                verify=self.client.verify_certificate,
-                timeout=30
-            )
-            response.raise_for_status()
-            task_id = response.json()
-            logging.info(f"Successfully initiated checkpoint creation, task_id={task_id}")
-            return task_id
+        logger.info("VPGs.create_checkpoint: Creating checkpoint '%s' for VPG %s", checkpoint_name, vpg_identifier)
 
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        response = self.client.api.start_vpg_tagged_checkpoint_insert(vpg_identifier, body=data, timeout=30)
+        task_id = response.json()
+        logger.info("Successfully initiated checkpoint creation, task_id=%s", task_id)
+        return task_id
 
     def export_vpg_settings(self, vpg_names: List[str]) -> dict:
         """
@@ -787,37 +524,17 @@ class VPGs:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/vpgSettings/exportSettings"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
         payload = {
             "vpgNames": vpg_names
         }
 
-        logging.info(f"VPGs.export_vpg_settings: Exporting settings for VPGs: {vpg_names}")
-        
-        try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully exported settings for {len(vpg_names)} VPGs at {result.get('timeStamp')}")
-            logging.debug(f"Export result: {json.dumps(result, indent=2)}")
-            return result
+        logger.info("VPGs.export_vpg_settings: Exporting settings for VPGs: %s", vpg_names)
         
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        response = self.client.api.export_settings(body=payload)
+        result = response.json()
+        logger.info("Successfully exported settings for %s VPGs at %s", len(vpg_names), result.get('timeStamp'))
+        log_payload(logger, "Export result: %s", result)
+        return result
 
     def list_exported_vpg_settings(self) -> List[Dict]:
         """
@@ -834,33 +551,13 @@ class VPGs:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/vpgSettings/exportedSettings"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
-        logging.debug("Fetching list of exported VPG settings")
-        
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Found {len(result)} exported settings files")
-            logging.debug(f"Exported settings list: {json.dumps(result, indent=2)}")
-            return result
+        logger.debug("Fetching list of exported VPG settings")
         
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        response = self.client.api.get_exported_settings_info()
+        result = response.json()
+        logger.info("Found %s exported settings files", len(result))
+        log_payload(logger, "Exported settings list: %s", result)
+        return result
 
     def read_exported_vpg_settings(self, timestamp: str, vpg_names: List[str] = None) -> dict:
         """
@@ -878,39 +575,19 @@ class VPGs:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        url = f"https://{self.client.zvm_address}/v1/vpgSettings/exportedSettings/{timestamp}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
         payload = {}
         if vpg_names:
             payload['vpgNames'] = vpg_names
 
-        logging.info(f"VPGs.read_exported_vpg_settings: Reading exported VPG settings for timestamp: {timestamp}")
+        logger.info("VPGs.read_exported_vpg_settings: Reading exported VPG settings for timestamp: %s", timestamp)
         if vpg_names:
-            logging.debug(f"Filtering for VPGs: {vpg_names}")
+            logger.debug("Filtering for VPGs: %s", vpg_names)
         
-        try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.debug(f"VPGs.read_exported_vpg_settings: result: {json.dumps(result, indent=4)}")
-            
-            return result
-            
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        response = self.client.api.get_exported_settings(timestamp, body=payload, idempotent=True)
+        result = response.json()
+        log_payload(logger, "VPGs.read_exported_vpg_settings: result: %s", result)
+        
+        return result
 
     def import_vpg_settings(self, settings: Dict) -> dict:
         """
@@ -936,12 +613,6 @@ class VPGs:
             requests.exceptions.RequestException: If the API request fails
             ValueError: If settings dictionary is missing required fields
         """
-        url = f"https://{self.client.zvm_address}/v1/vpgSettings/import"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-
         # Validate input settings
         if not isinstance(settings, dict):
             raise ValueError("Settings must be a dictionary")
@@ -953,43 +624,30 @@ class VPGs:
             "ExportedVpgSettingsApi": settings['ExportedVpgSettingsApi']
         }
 
-        logging.info(f"VPGs.import_vpg_settings: Importing settings for {len(settings['ExportedVpgSettingsApi'])} VPGs")
+        logger.info("VPGs.import_vpg_settings: Importing settings for %s VPGs", len(settings['ExportedVpgSettingsApi']))
         
-        try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.debug(f"VPGs.import_vpg_settings: result: {json.dumps(result, indent=4)}")
-            
-            # Log validation failures
-            if result.get('validationFailedResults'):
-                for failure in result['validationFailedResults']:
-                    logging.error(f"Validation failed for VPG '{failure['vpgName']}': {', '.join(failure['errorMessages'])}")
-            
-            # Log import failures
-            if result.get('importFailedResults'):
-                for failure in result['importFailedResults']:
-                    logging.error(f"Import failed for VPG '{failure['vpgName']}': {failure['errorMessage']}")
-            
-            # Log successful imports
-            if result.get('importTaskIdentifiers'):
-                for task in result['importTaskIdentifiers']:
-                    logging.info(f"Import initiated for VPG '{task['vpgName']}' with task ID: {task['taskIdentifier']}")
-            
-            logging.debug(f"Import result: {json.dumps(result, indent=2)}")
-            
-            return result
-            
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        response = self.client.api.import_vpg(body=payload)
+        result = response.json()
+        log_payload(logger, "VPGs.import_vpg_settings: result: %s", result)
+        
+        # Log validation failures
+        if result.get('validationFailedResults'):
+            for failure in result['validationFailedResults']:
+                logger.error("Validation failed for VPG '%s': %s",
+                             failure['vpgName'], ', '.join(failure['errorMessages']))
+        
+        # Log import failures
+        if result.get('importFailedResults'):
+            for failure in result['importFailedResults']:
+                logger.error("Import failed for VPG '%s': %s", failure['vpgName'], failure['errorMessage'])
+        
+        # Log successful imports
+        if result.get('importTaskIdentifiers'):
+            for task in result['importTaskIdentifiers']:
+                logger.info("Import initiated for VPG '%s' with task ID: %s", task['vpgName'], task['taskIdentifier'])
+        
+        log_payload(logger, "Import result: %s", result)
+        
+        return result
 
   
\ No newline at end of file
@@ -9,10 +9,13 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
-import json
-from typing import Dict, List, Optional
+from .log import log_payload
+from typing import Dict, List
+from .cache import cached_response
+from . import tracing
+
+logger = logging.getLogger(__name__)
 
 class VRA:
     def __init__(self, client):
@@ -20,31 +23,14 @@ class VRA:
 
     def list_vras(self) -> List[Dict]:
         """List all VRAs."""
-        logging.info(f"VRA.list_vras(zvm_address={self.client.zvm_address})")
-        url = f"https://{self.client.zvm_address}/v1/vras"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully retrieved {len(result)} VRAs")
-            logging.debug(f"VRA.list_vras result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
+        logger.info("VRA.list_vras(zvm_address=%s)", self.client.zvm_address)
+        response = self.client.api.get_vra_all()
+        result = response.json()
+        logger.info("Successfully retrieved %s VRAs", len(result))
+        log_payload(logger, "VRA.list_vras result: %s", result)
+        return result
+
+    @tracing.traced
     def create_vra(self, payload: Dict, sync: bool = True) -> Dict:
         """Create a new VRA.
         
@@ -58,35 +44,17 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.create_vra(zvm_address={self.client.zvm_address}, sync={sync})")
-        logging.debug(f"VRA.create_vra payload: {json.dumps(payload, indent=4)}")
-        url = f"https://{self.client.zvm_address}/v1/vras"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            task_id = response.json()
-            logging.info("Successfully initiated VRA creation")
-            logging.debug(f"VRA.create_vra task_id: {task_id}")
-
-            if sync:
-                # Wait for task completion
-                self.client.tasks.wait_for_task_completion(task_id, timeout=300, interval=5)
-            return task_id
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VRA.create_vra(zvm_address=%s, sync=%s)", self.client.zvm_address, sync)
+        log_payload(logger, "VRA.create_vra payload: %s", payload)
+        response = self.client.api.start_vra_install(body=payload)
+        task_id = response.json()
+        logger.info("Successfully initiated VRA creation")
+        logger.debug("VRA.create_vra task_id: %s", task_id)
+
+        if sync:
+            # Wait for task completion
+            self.client.tasks.wait_for_task_completion(task_id, timeout=300, interval=5)
+        return task_id
 
     def get_vra(self, vra_identifier: str) -> Dict:
         """
@@ -101,31 +69,14 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.get_vra(zvm_address={self.client.zvm_address}, vra_identifier={vra_identifier})")
-        url = f"https://{self.client.zvm_address}/v1/vras/{vra_identifier}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully retrieved VRA information for identifier: {vra_identifier}")
-            logging.debug(f"VRA.get_vra result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
+        logger.info("VRA.get_vra(zvm_address=%s, vra_identifier=%s)", self.client.zvm_address, vra_identifier)
+        response = self.client.api.get_vra(vra_identifier)
+        result = response.json()
+        logger.info("Successfully retrieved VRA information for identifier: %s", vra_identifier)
+        log_payload(logger, "VRA.get_vra result: %s", result)
+        return result
+
+    @tracing.traced
     def delete_vra(self, vra_identifier: str, sync: bool = True) -> Dict:
         """
         Delete a specific VRA.
@@ -140,35 +91,18 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.delete_vra(zvm_address={self.client.zvm_address}, vra_identifier={vra_identifier})")
-        url = f"https://{self.client.zvm_address}/v1/vras/{vra_identifier}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            task_id = response.json()
-            logging.info(f"Successfully initiated deletion of VRA with identifier: {vra_identifier}")
-            logging.debug(f"VRA.delete_vra task_id: {task_id}")
-
-            if sync:
-                # Wait for task completion
-                self.client.tasks.wait_for_task_completion(task_id, timeout=300, interval=5)
-            return task_id
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
+        logger.info("VRA.delete_vra(zvm_address=%s, vra_identifier=%s)", self.client.zvm_address, vra_identifier)
+        response = self.client.api.start_vra_uninstall(vra_identifier)
+        task_id = response.json()
+        logger.info("Successfully initiated deletion of VRA with identifier: %s", vra_identifier)
+        logger.debug("VRA.delete_vra task_id: %s", task_id)
+
+        if sync:
+            # Wait for task completion
+            self.client.tasks.wait_for_task_completion(task_id, timeout=300, interval=5)
+        return task_id
+
+    @tracing.traced
     def update_vra(self, vra_identifier: str, payload: Dict, sync: bool = True) -> Dict:
         """
         Update a specific VRA's configuration.
@@ -184,36 +118,19 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.update_vra(zvm_address={self.client.zvm_address}, vra_identifier={vra_identifier})")
-        logging.debug(f"VRA.update_vra payload: {json.dumps(payload, indent=4)}")
-        url = f"https://{self.client.zvm_address}/v1/vras/{vra_identifier}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.put(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            task_id = response.json()
-            logging.info(f"Successfully initiated update for VRA with identifier: {vra_identifier}")
-            logging.debug(f"VRA.update_vra task_id: {task_id}")
-
-            if sync:
-                # Wait for task completion
-                self.client.tasks.wait_for_task_completion(task_id, timeout=300, interval=5)
-            return task_id
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
+        logger.info("VRA.update_vra(zvm_address=%s, vra_identifier=%s)", self.client.zvm_address, vra_identifier)
+        log_payload(logger, "VRA.update_vra payload: %s", payload)
+        response = self.client.api.start_vra_edit(vra_identifier, body=payload)
+        task_id = response.json()
+        logger.info("Successfully initiated update for VRA with identifier: %s", vra_identifier)
+        logger.debug("VRA.update_vra task_id: %s", task_id)
+
+        if sync:
+            # Wait for task completion
+            self.client.tasks.wait_for_task_completion(task_id, timeout=300, interval=5)
+        return task_id
+
+    @tracing.traced
     def create_vra_cluster(self, payload: Dict, sync: bool = True) -> Dict:
         """
         Create a new VRA cluster.
@@ -228,35 +145,17 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.create_vra_cluster(zvm_address={self.client.zvm_address})")
-        logging.debug(f"VRA.create_vra_cluster payload: {json.dumps(payload, indent=4)}")
-        url = f"https://{self.client.zvm_address}/v1/vras/clusters"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            task_id = response.json()
-            logging.info("Successfully initiated VRA cluster creation")
-            logging.debug(f"VRA.create_vra_cluster task_id: {task_id}")
-
-            if sync:
-                # Wait for task completion
-                self.client.tasks.wait_for_task_completion(task_id, timeout=300, interval=5)
-            return task_id
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VRA.create_vra_cluster(zvm_address=%s)", self.client.zvm_address)
+        log_payload(logger, "VRA.create_vra_cluster payload: %s", payload)
+        response = self.client.api.start_vras_on_cluster_install(body=payload)
+        task_id = response.json()
+        logger.info("Successfully initiated VRA cluster creation")
+        logger.debug("VRA.create_vra_cluster task_id: %s", task_id)
+
+        if sync:
+            # Wait for task completion
+            self.client.tasks.wait_for_task_completion(task_id, timeout=300, interval=5)
+        return task_id
 
     def delete_vra_cluster(self, cluster_identifier: str) -> Dict:
         """
@@ -271,30 +170,13 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.delete_vra_cluster(zvm_address={self.client.zvm_address}, cluster_identifier={cluster_identifier})")
-        url = f"https://{self.client.zvm_address}/v1/vras/clusters/{cluster_identifier}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully deleted VRA cluster with identifier: {cluster_identifier}")
-            logging.debug(f"VRA.delete_vra_cluster result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VRA.delete_vra_cluster(zvm_address=%s, cluster_identifier=%s)",
+                    self.client.zvm_address, cluster_identifier)
+        response = self.client.api.start_cluster_vras_uninstall(cluster_identifier)
+        result = response.json()
+        logger.info("Successfully deleted VRA cluster with identifier: %s", cluster_identifier)
+        log_payload(logger, "VRA.delete_vra_cluster result: %s", result)
+        return result
 
     def update_vra_cluster(self, cluster_identifier: str, payload: Dict) -> Dict:
         """
@@ -310,31 +192,14 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.update_vra_cluster(zvm_address={self.client.zvm_address}, cluster_identifier={cluster_identifier})")
-        logging.debug(f"VRA.update_vra_cluster payload: {json.dumps(payload, indent=4)}")
-        url = f"https://{self.client.zvm_address}/v1/vras/clusters/{cluster_identifier}"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.put(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully updated VRA cluster with identifier: {cluster_identifier}")
-            logging.debug(f"VRA.update_vra_cluster result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VRA.update_vra_cluster(zvm_address=%s, cluster_identifier=%s)",
+                    self.client.zvm_address, cluster_identifier)
+        log_payload(logger, "VRA.update_vra_cluster payload: %s", payload)
+        response = self.client.api.start_cluster_vras_upgrade(cluster_identifier, json=payload)
+        result = response.json()
+        logger.info("Successfully updated VRA cluster with identifier: %s", cluster_identifier)
+        log_payload(logger, "VRA.update_vra_cluster result: %s", result)
+        return result
 
     def cleanup_vras(self) -> Dict:
         """
@@ -346,30 +211,12 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.cleanup_vras(zvm_address={self.client.zvm_address})")
-        url = f"https://{self.client.zvm_address}/v1/vras/cleanup"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.delete(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info("Successfully cleaned up VRAs")
-            logging.debug(f"VRA.cleanup_vras result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VRA.cleanup_vras(zvm_address=%s)", self.client.zvm_address)
+        response = self.client.api.start_vra_cleanup()
+        result = response.json()
+        logger.info("Successfully cleaned up VRAs")
+        log_payload(logger, "VRA.cleanup_vras result: %s", result)
+        return result
 
     def upgrade_vra(self, vra_identifier: str) -> Dict:
         """
@@ -384,30 +231,12 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.upgrade_vra(zvm_address={self.client.zvm_address}, vra_identifier={vra_identifier})")
-        url = f"https://{self.client.zvm_address}/v1/vras/{vra_identifier}/upgrade"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.post(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully initiated upgrade for VRA with identifier: {vra_identifier}")
-            logging.debug(f"VRA.upgrade_vra result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VRA.upgrade_vra(zvm_address=%s, vra_identifier=%s)", self.client.zvm_address, vra_identifier)
+        response = self.client.api.start_vra_upgrade(vra_identifier)
+        result = response.json()
+        logger.info("Successfully initiated upgrade for VRA with identifier: %s", vra_identifier)
+        log_payload(logger, "VRA.upgrade_vra result: %s", result)
+        return result
 
     def get_vra_cluster_settings(self, cluster_identifier: str) -> Dict:
         """
@@ -422,30 +251,13 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.get_vra_cluster_settings(zvm_address={self.client.zvm_address}, cluster_identifier={cluster_identifier})")
-        url = f"https://{self.client.zvm_address}/v1/vras/clusters/{cluster_identifier}/settings"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully retrieved VRA cluster settings for identifier: {cluster_identifier}")
-            logging.debug(f"VRA.get_vra_cluster_settings result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VRA.get_vra_cluster_settings(zvm_address=%s, cluster_identifier=%s)",
+                    self.client.zvm_address, cluster_identifier)
+        response = self.client.api.get_vra_cluster_settings(cluster_identifier)
+        result = response.json()
+        logger.info("Successfully retrieved VRA cluster settings for identifier: %s", cluster_identifier)
+        log_payload(logger, "VRA.get_vra_cluster_settings result: %s", result)
+        return result
 
     def create_vra_cluster_settings(self, cluster_identifier: str, payload: Dict) -> Dict:
         """
@@ -461,32 +273,16 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.create_vra_cluster_settings(zvm_address={self.client.zvm_address}, cluster_identifier={cluster_identifier})")
-        logging.debug(f"VRA.create_vra_cluster_settings payload: {json.dumps(payload, indent=4)}")
-        url = f"https://{self.client.zvm_address}/v1/vras/clusters/{cluster_identifier}/settings"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully created VRA cluster settings for identifier: {cluster_identifier}")
-            logging.debug(f"VRA.create_vra_cluster_settings result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
+        logger.info("VRA.create_vra_cluster_settings(zvm_address=%s, cluster_identifier=%s)",
+                    self.client.zvm_address, cluster_identifier)
+        log_payload(logger, "VRA.create_vra_cluster_settings payload: %s", payload)
+        response = self.client.api.start_set_vra_cluster_settings(cluster_identifier, body=payload)
+        result = response.json()
+        logger.info("Successfully created VRA cluster settings for identifier: %s", cluster_identifier)
+        log_payload(logger, "VRA.create_vra_cluster_settings result: %s", result)
+        return result
+
+    @cached_response()
     def list_vra_statuses(self) -> List[Dict]:
         """
         List all VRA statuses.
@@ -497,31 +293,14 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.list_vra_statuses(zvm_address={self.client.zvm_address})")
-        url = f"https://{self.client.zvm_address}/v1/vras/statuses"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully retrieved VRA statuses")
-            logging.debug(f"VRA.list_vra_statuses result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-
+        logger.info("VRA.list_vra_statuses(zvm_address=%s)", self.client.zvm_address)
+        response = self.client.api.get_vra_status_all()
+        result = response.json()
+        logger.info("Successfully retrieved VRA statuses")
+        log_payload(logger, "VRA.list_vra_statuses result: %s", result)
+        return result
+
+    @cached_response()
     def list_ip_configuration_types(self) -> List[Dict]:
         """
         List all IP configuration types.
@@ -532,30 +311,12 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.list_ip_configuration_types(zvm_address={self.client.zvm_address})")
-        url = f"https://{self.client.zvm_address}/v1/vras/ipconfigurationtypes"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info("Successfully retrieved IP configuration types")
-            logging.debug(f"VRA.list_ip_configuration_types result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VRA.list_ip_configuration_types(zvm_address=%s)", self.client.zvm_address)
+        response = self.client.api.get_vra_configuration_type_all()
+        result = response.json()
+        logger.info("Successfully retrieved IP configuration types")
+        log_payload(logger, "VRA.list_ip_configuration_types result: %s", result)
+        return result
 
     def list_potential_recovery_vras(self, vra_identifier: str) -> List[Dict]:
         """
@@ -570,30 +331,13 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.list_potential_recovery_vras(zvm_address={self.client.zvm_address}, vra_identifier={vra_identifier})")
-        url = f"https://{self.client.zvm_address}/v1/vras/{vra_identifier}/changerecoveryvra/potentials"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully retrieved potential recovery VRAs for identifier: {vra_identifier}")
-            logging.debug(f"VRA.list_potential_recovery_vras result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VRA.list_potential_recovery_vras(zvm_address=%s, vra_identifier=%s)",
+                    self.client.zvm_address, vra_identifier)
+        response = self.client.api.get_vra_change_recovery_host_potential(vra_identifier)
+        result = response.json()
+        logger.info("Successfully retrieved potential recovery VRAs for identifier: %s", vra_identifier)
+        log_payload(logger, "VRA.list_potential_recovery_vras result: %s", result)
+        return result
 
     def execute_recovery_vra_change(self, vra_identifier: str, payload: Dict) -> Dict:
         """
@@ -609,60 +353,27 @@ class VRA:
         Raises:
             requests.exceptions.RequestException: If the API request fails
         """
-        logging.info(f"VRA.execute_recovery_vra_change(zvm_address={self.client.zvm_address}, vra_identifier={vra_identifier})")
-        logging.debug(f"VRA.execute_recovery_vra_change payload: {json.dumps(payload, indent=4)}")
-        url = f"https://{self.client.zvm_address}/v1/vras/{vra_identifier}/changerecoveryvra/execute"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            result = response.json()
-            logging.info(f"Successfully executed recovery VRA change for identifier: {vra_identifier}")
-            logging.debug(f"VRA.execute_recovery_vra_change result: {json.dumps(result, indent=4)}")
-            return result
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
+        logger.info("VRA.execute_recovery_vra_change(zvm_address=%s, vra_identifier=%s)",
+                    self.client.zvm_address, vra_identifier)
+        log_payload(logger, "VRA.execute_recovery_vra_change payload: %s", payload)
+        response = self.client.api.start_vra_change_recovery_host(vra_identifier, body=payload)
+        result = response.json()
+        logger.info("Successfully executed recovery VRA change for identifier: %s", vra_identifier)
+        log_payload(logger, "VRA.execute_recovery_vra_change result: %s", result)
+        return result
 
     def validate_recovery_vra_change(self, vra_identifier, payload):
-        logging.info(f"VRA.validate_recovery_vra_change: Validating recovery VRA change for identifier: {vra_identifier}...")
-        url = f"https://{self.client.zvm_address}/v1/vras/{vra_identifier}/changerecoveryvra/validate"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            logging.info(f"VRA.validate_recovery_vra_change: Successfully validated recovery VRA change for identifier: {vra_identifier}.")
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logging.error(f"VRA.validate_recovery_vra_change: Failed to validate recovery VRA change for identifier {vra_identifier}: {e}")
-            raise
+        logger.info("VRA.validate_recovery_vra_change: Validating recovery VRA change for identifier: %s...",
+                    vra_identifier)
+        response = self.client.api.test_vra_change_recovery_host_setting(vra_identifier, body=payload, idempotent=True)
+        logger.info("VRA.validate_recovery_vra_change: Successfully validated recovery VRA change for identifier: %s.",
+                    vra_identifier)
+        return response.json()
 
     def recommend_recovery_vra_change(self, vra_identifier, payload):
-        logging.info(f"VRA.recommend_recovery_vra_change: Recommending recovery VRA change for identifier: {vra_identifier}...")
-        url = f"https://{self.client.zvm_address}/v1/vras/{vra_identifier}/changerecoveryvra/recommendation"
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        try:
-            response = requests.post(url, headers=headers, json=payload, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            logging.info(f"VRA.recommend_recovery_vra_change: Successfully recommended recovery VRA change for identifier: {vra_identifier}.")
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logging.error(f"VRA.recommend_recovery_vra_change: Failed to recommend recovery VRA change for identifier {vra_identifier}: {e}")
-            raise
\ No newline at end of file
+        logger.info("VRA.recommend_recovery_vra_change: Recommending recovery VRA change for identifier: %s...",
+                    vra_identifier)
+        response = self.client.api.get_vra_change_recovery_host_recommendation(vra_identifier, body=payload, idempotent=True)
+        logger.info("VRA.recommend_recovery_vra_change: Successfully recommended recovery VRA change for identifier: %s.",
+                    vra_identifier)
+        return response.json()
\ No newline at end of file
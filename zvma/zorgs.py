@@ -9,9 +9,10 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
-import requests
 import logging
 
+logger = logging.getLogger(__name__)
+
 class Zorgs:
     def __init__(self, client):
         self.client = client
@@ -27,33 +28,10 @@ class Zorgs:
             dict/list: ZORG information. Returns a list of all ZORGs if no identifier is provided,
                       or details of a specific ZORG if identifier is provided.
         """
-        url = f"https://{self.client.zvm_address}/v1/zorgs"
         if zorg_identifier:
-            url = f"{url}/{zorg_identifier}"
-            logging.info(f"Zorgs.get_zorgs: Fetching ZORG {zorg_identifier}...")
+            logger.info("Zorgs.get_zorgs: Fetching ZORG %s...", zorg_identifier)
+            response = self.client.api.get_zorg(zorg_identifier)
         else:
-            logging.info("Zorgs.get_zorgs: Fetching all ZORGs...")
-
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self.client.token}'
-        }
-        
-        try:
-            response = requests.get(url, headers=headers, verify=self.client.verify_certificate)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if e.response is not None:
-                logging.error(f"HTTPError: {e.response.status_code} - {e.response.reason}")
-                try:
-                    error_details = e.response.json()
-                    logging.error(f"Error Message: {error_details.get('Message', 'No detailed error message available')}")
-                except ValueError:
-                    logging.error(f"Response content: {e.response.text}")
-            else:
-                logging.error("HTTPError occurred with no response attached.")
-            raise
-        except Exception as e:
-            logging.error(f"Unexpected error: {e}")
-            raise 
\ No newline at end of file
+            logger.info("Zorgs.get_zorgs: Fetching all ZORGs...")
+            response = self.client.api.get_zorg_all()
+        return response.json()
\ No newline at end of file
@@ -9,78 +9,224 @@
 # scripts or documentation, even if the author or Zerto has been advised of the possibility of such damages. 
 # The entire risk arising out of the use or performance of the sample scripts and documentation remains with you.
 
+import importlib
 import requests
 import logging
-import ssl
-
-# Configure logging with timestamp format
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-
-# Import all necessary classes
-from .tasks import Tasks
-from .vpgs import VPGs
-# from .vpg_settings import VPGSettings
-from .vms import VMs
-from .failover import Failover
-from .alerts import Alerts
-from .peersites import PeerSites
-from .events import Events
-from .repositories import Repositories
-from .sessions import Sessions
-from .recoveryscripts import RecoveryScripts
-from .encryptiondetection import EncryptionDetection
-from .zorgs import Zorgs
-from .localsite import LocalSite
-from .datastores import Datastores
-from .vras import VRA
-from .recovery_reports import RecoveryReports
-from .license import License
-from .service_profiles import ServiceProfiles
-from .server_date_time import ServerDateTime
-from .virtualization_sites import VirtualizationSites
-from .volumes import Volumes
-from .tweaks import Tweaks
-# Disable SSL warnings for self-signed certificates
-context = ssl._create_unverified_context()
+import threading
+import time
+
+from .transport import Transport, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, DEFAULT_TIMEOUT
+from .cache import TTLCache, DEFAULT_CACHE_MAXSIZE
+from .token_cache import get_token_cache
+from .batch import Batch, create_executor
+from .priority import request_priority
+from . import forksafe
+
+logger = logging.getLogger(__name__)
+
+# Refresh the token this many seconds before Keycloak says it expires
+DEFAULT_TOKEN_REFRESH_MARGIN = 60
+
+
+class _Resource:
+    """
+    Resource namespace on ZVMAClient (client.vpgs, client.vras, ...) whose module is imported
+    and instantiated on first access, so importing zvma and creating a client stay cheap.
+    """
+
+    def __init__(self, module, class_name):
+        self.module = module
+        self.class_name = class_name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+        resource_class = getattr(importlib.import_module(f'.{self.module}', __package__), self.class_name)
+        # Cache on the instance; later lookups bypass this descriptor
+        return client.__dict__.setdefault(self.name, resource_class(client))
+
 
 class ZVMAClient:
-    def __init__(self, zvm_address, client_id, client_secret, verify_certificate=True):
+    """
+    Client for the ZVM REST API.
+
+    A ZVMAClient is thread-safe and meant to be shared: create one per ZVM and use it from any
+    number of threads. Token refresh is serialised by a lock and shared by all threads, resource
+    namespaces (client.vpgs, ...) are stateless and created once, and the connection pool, response
+    cache, metrics and concurrency limiter are internally synchronised. Pass `max_workers` with the
+    size of your thread pool so every worker can keep its own pooled connection.
+    Objects returned by coalesced GET requests are shared between threads and must not be mutated.
+    Closing the client while other threads still use it is not supported.
+
+    The client is also fork-aware and picklable: a forked child gets a fresh connection pool but
+    keeps the token, and a pickled client carries its settings and token to a worker process.
+    """
+
+    tasks = _Resource('tasks', 'Tasks')
+    vpgs = _Resource('vpgs', 'VPGs')
+    vms = _Resource('vms', 'VMs')
+    failover = _Resource('failover', 'Failover')
+    alerts = _Resource('alerts', 'Alerts')
+    peersites = _Resource('peersites', 'PeerSites')
+    events = _Resource('events', 'Events')
+    repositories = _Resource('repositories', 'Repositories')
+    sessions = _Resource('sessions', 'Sessions')
+    recoveryscripts = _Resource('recoveryscripts', 'RecoveryScripts')
+    zorgs = _Resource('zorgs', 'Zorgs')
+    encryptiondetection = _Resource('encryptiondetection', 'EncryptionDetection')
+    localsite = _Resource('localsite', 'LocalSite')
+    datastores = _Resource('datastores', 'Datastores')
+    vras = _Resource('vras', 'VRA')
+    recovery_reports = _Resource('recovery_reports', 'RecoveryReports')
+    license = _Resource('license', 'License')
+    service_profiles = _Resource('service_profiles', 'ServiceProfiles')
+    server_date_time = _Resource('server_date_time', 'ServerDateTime')
+    virtualization_sites = _Resource('virtualization_sites', 'VirtualizationSites')
+    volumes = _Resource('volumes', 'Volumes')
+    tweaks = _Resource('tweaks', 'Tweaks')
+    api = _Resource('endpoints', 'Endpoints')
+
+    def __init__(self, zvm_address, client_id, client_secret, verify_certificate=True,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False,
+                 token_refresh_margin=DEFAULT_TOKEN_REFRESH_MARGIN, retry_policy=None, timeout=DEFAULT_TIMEOUT,
+                 deadline=None, adaptive_concurrency=True, cache_maxsize=DEFAULT_CACHE_MAXSIZE, cache_ttls=None,
+                 codec='auto', metrics=True, coalesce=True, max_workers=None, http_backend='requests', http2=None,
+                 token_cache=None, circuit_breaker=True):
         self.zvm_address = zvm_address
         self.client_id = client_id
         self.client_secret = client_secret
         self.verify_certificate = verify_certificate
-        self.token = None
+        # Constructor arguments needed to rebuild the client when it is unpickled in another process
+        self._settings = dict(zvm_address=zvm_address, client_id=client_id, client_secret=client_secret,
+                              verify_certificate=verify_certificate, pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize, pool_block=pool_block,
+                              token_refresh_margin=token_refresh_margin, retry_policy=retry_policy,
+                              timeout=timeout, deadline=deadline, adaptive_concurrency=adaptive_concurrency,
+                              cache_maxsize=cache_maxsize, cache_ttls=cache_ttls, coalesce=coalesce,
+                              max_workers=max_workers, http_backend=http_backend, http2=http2,
+                              circuit_breaker=circuit_breaker)
+        # Opt-in token store shared with other processes; True uses ~/.cache/zvma
+        self.token_cache = get_token_cache(token_cache)
+        self.max_workers = max_workers
+        if max_workers is not None:
+            # Enough keep-alive connections for every worker thread, and never more than the pool can hold
+            pool_maxsize = max(pool_maxsize, max_workers)
+            pool_block = True
+        # One keep-alive connection pool shared by every resource class
+        self.transport = Transport(verify_certificate=verify_certificate,
+                                   pool_connections=pool_connections,
+                                   pool_maxsize=pool_maxsize,
+                                   pool_block=pool_block,
+                                   auth=self,
+                                   retry_policy=retry_policy,
+                                   timeout=timeout,
+                                   deadline=deadline,
+                                   adaptive_concurrency=adaptive_concurrency,
+                                   codec=codec,
+                                   metrics=metrics,
+                                   coalesce=coalesce,
+                                   http_backend=http_backend,
+                                   http2=http2,
+                                   circuit_breaker=circuit_breaker)
+        # Responses of static lookup endpoints; cache_maxsize=0 disables caching
+        self.cache = TTLCache(maxsize=cache_maxsize, ttl_overrides=cache_ttls) if cache_maxsize else None
+        self.token_refresh_margin = token_refresh_margin
+        self._token = None
+        self._token_expires_at = None
+        self._token_lock = threading.Lock()
         self.token_expiry = None
-        self.__get_keycloak_token()
-        self.tasks = Tasks(self)
-        self.vpgs = VPGs(self)
-        # self.vpg_settings = VPGSettings(self)
-        self.vms = VMs(self)
-        self.failover = Failover(self)
-        self.alerts = Alerts(self)
-        self.peersites = PeerSites(self)
-        self.events = Events(self)
-        self.repositories = Repositories(self)
-        self.sessions = Sessions(self)
-        self.recoveryscripts = RecoveryScripts(self)
-        self.zorgs = Zorgs(self)
-        self.encryptiondetection = EncryptionDetection(self)
-        self.localsite = LocalSite(self.zvm_address, self.token)
-        self.datastores = Datastores(self)
-        self.vras = VRA(self)
-        self.recovery_reports = RecoveryReports(self)
-        self.license = License(self)
-        self.service_profiles = ServiceProfiles(self)
-        self.server_date_time = ServerDateTime(self)
-        self.virtualization_sites = VirtualizationSites(self)
-        self.volumes = Volumes(self)
-        self.tweaks = Tweaks(self)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        forksafe.register(self)
+
+    def _after_fork_in_child(self):
+        # The token stays valid in the child; only the locks inherited from the parent are replaced
+        self._token_lock = threading.Lock()
+        # Worker threads do not survive a fork
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        if self.cache is not None:
+            self.cache._after_fork_in_child()
+
+    def __getstate__(self):
+        """
+        Pickle the settings, credentials and current token, but no sockets, locks or cached responses,
+        so a worker process can unpickle the client and call the ZVM without another Keycloak login.
+        The pickle contains the client secret and must only be handed to trusted processes.
+        """
+        with self._token_lock:
+            token, token_expiry, expires_at = self._token, self.token_expiry, self._token_expires_at
+        settings = dict(self._settings, codec=self.transport.codec, metrics=self.transport.metrics is not None,
+                        token_cache=self.token_cache)
+        # Monotonic clocks are per process: carry the expiry as wall-clock time
+        token_expires_at = time.time() + (expires_at - time.monotonic()) if expires_at is not None else None
+        return {'settings': settings, 'token': token, 'token_expiry': token_expiry,
+                'token_expires_at': token_expires_at}
+
+    def __setstate__(self, state):
+        self.__init__(**state['settings'])
+        expires_at = state['token_expires_at']
+        self.token_expiry = state['token_expiry']
+        self._token_expires_at = time.monotonic() + (expires_at - time.time()) if expires_at is not None else None
+        self._token = state['token']
+
+    @property
+    def token(self):
+        """
+        The current bearer token. Refreshed just in time when it is missing or about to expire,
+        so resource classes reading `client.token` always get a usable token.
+        """
+        if self._token is None or self._token_needs_refresh():
+            self.refresh_token(stale_token=self._token)
+        return self._token
+
+    def _token_needs_refresh(self):
+        if self._token_expires_at is None:
+            return False
+        return time.monotonic() >= self._token_expires_at - self.token_refresh_margin
+
+    def refresh_token(self, stale_token=None):
+        """
+        Fetch a new token from Keycloak. Concurrent callers share a single refresh: a caller
+        passing the `stale_token` it observed skips the request if another thread already
+        replaced that token with a fresh one. With a `token_cache`, a token cached on disk by
+        another process is reused while it is valid, and the Keycloak request is made under
+        the cache's file lock so that concurrent processes refresh only once.
+
+        :param stale_token: The token the caller found to be expired or rejected.
+        :return: The current token.
+        """
+        with self._token_lock:
+            if self._token is not None and self._token != stale_token and not self._token_needs_refresh():
+                return self._token
+            if self.token_cache is None:
+                return self.__get_keycloak_token()
+            with self.token_cache.lock(self.zvm_address, self.client_id):
+                if self.__load_cached_token(stale_token):
+                    return self._token
+                token = self.__get_keycloak_token()
+                if self.token_expiry:
+                    self.token_cache.store(self.zvm_address, self.client_id, token, self.token_expiry)
+                return token
+
+    def __load_cached_token(self, stale_token):
+        entry = self.token_cache.load(self.zvm_address, self.client_id)
+        if entry is None or entry['access_token'] in (stale_token, self._token):
+            return False
+        remaining = entry['expires_at'] - time.time()
+        if remaining <= self.token_refresh_margin:
+            return False
+        logger.info("Reusing cached token for %s, expires in %.0f seconds.", self.zvm_address, remaining)
+        self.token_expiry = entry['expires_in']
+        self._token_expires_at = time.monotonic() + remaining
+        self._token = entry['access_token']
+        return True
+
     def __get_keycloak_token(self):
-        logging.debug(f'__get_keycloak_token(zvm_address={self.zvm_address})')
+        logger.debug('__get_keycloak_token(zvm_address=%s)', self.zvm_address)
         keycloak_uri = f"https://{self.zvm_address}/auth/realms/zerto/protocol/openid-connect/token"
         headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         body = {
@@ -91,19 +237,108 @@ class ZVMAClient:
         }
 
         try:
-            logging.info("Connecting to Keycloak to get token...")
-            response = requests.post(keycloak_uri, headers=headers, data=body, verify=self.verify_certificate)
-            response.raise_for_status()
+            logger.debug("Connecting to Keycloak to get token...")
+            response = self.transport.post(keycloak_uri, headers=headers, data=body, verify=self.verify_certificate,
+                                           idempotent=True, limited=False)
             token_data = response.json()
-            self.token = token_data.get('access_token')
             self.token_expiry = token_data.get('expires_in')  # Store expiration time
-            logging.info(f"Successfully retrieved token.")
-            logging.info(f"Token expiration details:")
-            logging.info(f"- Expires in: {self.token_expiry} seconds")
-            logging.info(f"- Requested expiration: {body['expires_in']} seconds")
+            # Publish the expiry before the token so lock-free readers never pair a new token with an old expiry
+            self._token_expires_at = time.monotonic() + self.token_expiry if self.token_expiry else None
+            self._token = token_data.get('access_token')
+            logger.info("Successfully retrieved token.")
+            logger.debug("Token expiration details:")
+            logger.debug("- Expires in: %s seconds", self.token_expiry)
+            logger.debug("- Requested expiration: %s seconds", body['expires_in'])
             if self.token_expiry != body['expires_in']:
-                logging.warning(f"Server provided different expiration time than requested!")
-            return self.token
+                logger.warning("Server provided different expiration time than requested!")
+            return self._token
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error retrieving token: {e}")
-            raise
\ No newline at end of file
+            logger.error("Error retrieving token: %s", e)
+            raise
+
+    @property
+    def metrics(self):
+        """Per-endpoint request metrics (zvma.metrics.ClientMetrics), or None if disabled."""
+        return self.transport.metrics
+
+    def authenticate(self):
+        """
+        Fetch a token now instead of on the first API call, e.g. to fail fast on bad credentials.
+        The client otherwise authenticates lazily when the first request needs a token.
+
+        :return: The current token.
+        """
+        return self.refresh_token(stale_token=self._token)
+
+    def health(self):
+        """
+        Circuit breaker state of this client's ZVM: {'state': 'closed' | 'open' | 'half_open', 'healthy': bool,
+        'consecutive_failures': int, 'last_error': str or None, 'open_for': seconds or None}.
+        """
+        breaker = self.transport.get_breaker(f"https://{self.zvm_address}/")
+        if breaker is None:
+            return {'state': 'closed', 'healthy': True, 'consecutive_failures': 0, 'last_error': None, 'open_for': None}
+        return breaker.snapshot()
+
+    def is_healthy(self):
+        """False while the circuit breaker of this client's ZVM is open, i.e. calls would fail fast."""
+        return self.health()['healthy']
+
+    def invalidate_cache(self, endpoint=None):
+        """
+        Drop cached responses of static lookup endpoints.
+
+        :param endpoint: Endpoint name such as 'Alerts.get_alert_levels'; None clears everything.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+
+    @property
+    def executor(self):
+        """
+        Thread pool shared by all batches of this client, created on first use with `max_workers`
+        threads (`pool_maxsize` when max_workers is not set).
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = create_executor(self.max_workers or self.transport.pool_maxsize)
+        return self._executor
+
+    def batch(self):
+        """
+        Run many API calls concurrently on the shared executor.
+
+        Usage:
+            with client.batch() as batch:
+                for site in client.peersites.get_peer_sites():
+                    batch.virtualization_sites.get_virtualization_site_networks(site['SiteIdentifier'])
+                    batch.submit(my_function, site)
+            results = batch.results()
+
+        :return: A zvma.batch.Batch; its calls return concurrent.futures.Future objects.
+        """
+        return Batch(self, self.executor)
+
+    def priority(self, value):
+        """
+        Context manager sending the requests made inside it with RequestPriority `value`
+        ('critical', 'normal' or 'background'), e.g. to keep dashboard polling behind failover calls:
+
+            with client.priority('background'):
+                alerts = client.alerts.get_alerts()
+        """
+        return request_priority(value)
+
+    def close(self):
+        """Release the pooled connections and worker threads held by this client."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()